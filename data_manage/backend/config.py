@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -16,7 +17,14 @@ class Settings(BaseSettings):
     REDIS_URL: str = "redis://localhost:6379/0"
 
     DATA_DIR: Path = Path("./data")
+    LOCK_DIR: Optional[Path] = None
     MAX_FILE_SIZE: int = 100 * 1024 * 1024
+    PREVIEW_MAX_MEMORY: int = 256 * 1024 * 1024
+    SHARED_CACHE: bool = True
+    SHARED_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024
+    SEARCH_INDEX_VALUES: bool = True
+    SEARCH_REFRESH_SECONDS: float = 30.0
+    SEARCH_MAX_RESULTS: int = 1000
 
     SHARE_LINK_EXPIRE_DAYS: int = 7
     SHARE_LINK_SALT: str = "share-salt-change-in-production"
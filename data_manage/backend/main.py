@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
 import sys
 
@@ -14,10 +15,22 @@ from database import Base, engine
 from models import file_permission, file_provenance, share_link, team, user  # noqa: F401
 from routers import activity, audit, auth, files, permissions, provenance, share, users
 
-Base.metadata.create_all(bind=engine)
-settings.DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-app = FastAPI(title=settings.APP_NAME, debug=settings.DEBUG, docs_url="/docs", redoc_url="/redoc")
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Schema creation and data-dir setup run at server start, not at import.
+    Base.metadata.create_all(bind=engine)
+    settings.DATA_DIR.mkdir(parents=True, exist_ok=True)
+    yield
+
+
+app = FastAPI(
+    title=settings.APP_NAME,
+    debug=settings.DEBUG,
+    docs_url="/docs",
+    redoc_url="/redoc",
+    lifespan=lifespan,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -1,7 +1,22 @@
+from functools import lru_cache
 from pathlib import Path
+import logging
 import math
+import threading
+import time
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile
+import anyio
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+)
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 
@@ -17,11 +32,54 @@ import sys
 ROOT_DIR = Path(__file__).resolve().parents[2]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
-from data_manager import DataManager
+from data_manager import (
+    CancellationToken,
+    DataManager,
+    OperationCancelledError,
+    SearchIndex,
+    SharedCache,
+)
 
 router = APIRouter(prefix="/files", tags=["Files"])
-settings.DATA_DIR.mkdir(parents=True, exist_ok=True)
-dm = DataManager(str(settings.DATA_DIR))
+logger = logging.getLogger(__name__)
+
+# One search index refresh at a time per worker, and when the last one finished
+_search_refresh_lock = threading.Lock()
+_search_refreshed_at = 0.0
+
+
+@lru_cache(maxsize=1)
+def get_data_manager() -> DataManager:
+    """Build the shared DataManager on first use rather than at import.
+
+    With SHARED_CACHE on, server workers on one host share loaded frames.
+    LOCK_DIR moves lock files out of a read-only DATA_DIR.
+    """
+    shared_cache = (
+        SharedCache(max_bytes=settings.SHARED_CACHE_MAX_BYTES) if settings.SHARED_CACHE else False
+    )
+    dm = DataManager(str(settings.DATA_DIR), lock_dir=settings.LOCK_DIR, shared_cache=shared_cache)
+    dm.search_index = SearchIndex(dm, values=settings.SEARCH_INDEX_VALUES)
+    return dm
+
+
+def refresh_search_index(force: bool = False) -> None:
+    """Update the search index, at most every SEARCH_REFRESH_SECONDS unless forced.
+
+    Run as a background task, so searches never wait for an update.
+    """
+    global _search_refreshed_at
+    if not force and time.monotonic() - _search_refreshed_at < settings.SEARCH_REFRESH_SECONDS:
+        return
+    if not _search_refresh_lock.acquire(blocking=False):
+        return
+    try:
+        get_data_manager().search_index.update()
+        _search_refreshed_at = time.monotonic()
+    except Exception:
+        logger.exception("Search index refresh failed")
+    finally:
+        _search_refresh_lock.release()
 
 
 def _sanitize_json_value(value):
@@ -61,9 +119,53 @@ def list_files(
     return {"path": path, "files": files}
 
 
+@router.get("/search")
+def search_files(
+    background_tasks: BackgroundTasks,
+    q: str = Query(..., min_length=1),
+    field: Optional[List[str]] = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    offset: int = Query(default=0, ge=0),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    # The index is refreshed after the response; results may trail recent changes.
+    background_tasks.add_task(refresh_search_index)
+    # The best SEARCH_MAX_RESULTS matches among files the user may view: pages of
+    # ranked matches are filtered until one more than that is found or none remain.
+    dm = get_data_manager()
+    visible = []
+    scanned = 0
+    while len(visible) <= settings.SEARCH_MAX_RESULTS:
+        try:
+            page = dm.search(
+                q, fields=field, limit=settings.SEARCH_MAX_RESULTS, offset=scanned, refresh=False
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        visible.extend(
+            result
+            for result in page
+            if check_file_permission(db, current_user.id, result["path"], PermissionLevel.VIEW)
+        )
+        scanned += len(page)
+        if len(page) < settings.SEARCH_MAX_RESULTS:
+            break
+    truncated = len(visible) > settings.SEARCH_MAX_RESULTS
+    visible = visible[: settings.SEARCH_MAX_RESULTS]
+    return {
+        "query": q,
+        "offset": offset,
+        "total": len(visible),
+        "truncated": truncated,
+        "results": visible[offset : offset + limit],
+    }
+
+
 @router.post("/upload")
 async def upload_file(
     request: Request,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     path: str = Query(default=""),
     current_user: User = Depends(get_current_user),
@@ -123,6 +225,7 @@ async def upload_file(
         details={"filename": file.filename, "size": len(contents)},
     )
     db.commit()
+    background_tasks.add_task(refresh_search_index, force=True)
 
     return {"message": "File uploaded", "path": rel_path}
 
@@ -136,8 +239,22 @@ def preview_file(
 ):
     if not check_file_permission(db, current_user.id, file_path, PermissionLevel.VIEW):
         raise HTTPException(status_code=403, detail="No permission to view this file")
+    cancel = CancellationToken()
+
+    def stop_if_disconnected(bytes_done, bytes_total, rows):
+        # Sync endpoints run in a worker thread; stop reading once the client has gone.
+        if anyio.from_thread.run(request.is_disconnected):
+            cancel.cancel("client disconnected")
+
     try:
-        df = dm.load(file_path)
+        # Budgeted so a huge file yields its leading rows instead of exhausting the worker.
+        df = get_data_manager().load(
+            file_path,
+            max_memory=settings.PREVIEW_MAX_MEMORY,
+            on_exceed="head",
+            progress=stop_if_disconnected,
+            cancel=cancel,
+        )
         columns = [
             {
                 "name": str(col),
@@ -159,8 +276,43 @@ def preview_file(
         response = {
             "columns": columns,
             "data": df.head(100).to_dict(orient="records"),
-            "total_rows": len(df),
-            "metadata": {},
+            "total_rows": df.attrs.get("row_count_estimate") or len(df),
+            "metadata": {"truncated": df.attrs.get("truncated", False)},
+        }
+        return _sanitize_json_value(response)
+    except OperationCancelledError as e:
+        raise HTTPException(status_code=499, detail=str(e)) from e
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+@router.get("/rows/{file_path:path}")
+def read_file_rows(
+    request: Request,
+    file_path: str,
+    start: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=1000),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    if not check_file_permission(db, current_user.id, file_path, PermissionLevel.VIEW):
+        raise HTTPException(status_code=403, detail="No permission to view this file")
+    try:
+        df = get_data_manager().read_rows(file_path, start, start + limit)
+        log_file_access(
+            db=db,
+            file_path=file_path,
+            user_id=current_user.id,
+            action="view",
+            ip_address=request.client.host if request.client else None,
+            user_agent=request.headers.get("user-agent"),
+            details={"start": start, "limit": limit},
+        )
+        db.commit()
+        response = {
+            "start": start,
+            "stop": start + len(df),
+            "data": df.to_dict(orient="records"),
         }
         return _sanitize_json_value(response)
     except Exception as e:
@@ -195,6 +347,7 @@ def download_file(
 @router.delete("/{file_path:path}")
 def delete_file(
     request: Request,
+    background_tasks: BackgroundTasks,
     file_path: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -226,5 +379,6 @@ def delete_file(
         user_agent=request.headers.get("user-agent"),
     )
     db.commit()
+    background_tasks.add_task(refresh_search_index, force=True)
 
     return {"message": "File deleted"}
@@ -1,20 +1,41 @@
 """Data Manager - Unified multi-format data handling."""
 
 from .manager import DataManager
+from .query import LazyFrame, col
+from .contracts import SchemaContract
+from .progress import CancellationToken
+from .search import SearchIndex
+from .shared_cache import SharedCache
 from .exceptions import (
     DataManagerError,
     UnsupportedFormatError,
     DataLoadError,
     DataSaveError,
     FileNotFoundError,
+    LockError,
+    LockTimeoutError,
+    MemoryBudgetError,
+    ContractViolationError,
+    OperationCancelledError,
 )
 
 __version__ = "1.0.0"
 __all__ = [
     "DataManager",
+    "LazyFrame",
+    "col",
+    "SchemaContract",
+    "SharedCache",
+    "CancellationToken",
+    "SearchIndex",
     "DataManagerError",
     "UnsupportedFormatError",
     "DataLoadError",
     "DataSaveError",
     "FileNotFoundError",
+    "LockError",
+    "LockTimeoutError",
+    "MemoryBudgetError",
+    "ContractViolationError",
+    "OperationCancelledError",
 ]
@@ -0,0 +1,7 @@
+"""Entry point for ``python -m data_manager``."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
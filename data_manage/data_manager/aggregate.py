@@ -0,0 +1,334 @@
+"""Out-of-core grouped aggregation.
+
+:class:`GroupAggregator` reduces each incoming chunk to partial aggregates
+with ``pa.Table.group_by`` and merges the partials as it goes. If the
+partials outgrow ``AGGREGATE_MEMORY_BUDGET_BYTES``, they are hash-partitioned
+by group key and spilled to Arrow IPC files. A key always maps to the same
+partition, so at the end each partition can be combined independently. Only
+one partition's groups are in memory at a time.
+
+``approx_distinct`` uses a HyperLogLog sketch stored sparsely as
+``(keys..., register, rank)`` rows. Sketches therefore merge with the same
+group-by machinery as the numeric partials.
+"""
+
+from __future__ import annotations
+
+import logging
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union
+
+from .utils import hash_key_columns
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# Aggregations supported by LazyFrame.agg and DataManager.aggregate
+AGGREGATIONS = ("sum", "count", "mean", "min", "max", "approx_distinct")
+
+# Per-chunk partial aggregates behind each exact aggregation, and how partials combine
+_PARTIALS = {
+    "sum": ("sum",),
+    "count": ("count",),
+    "mean": ("sum", "count"),
+    "min": ("min",),
+    "max": ("max",),
+}
+_COMBINE = {"sum": "sum", "count": "sum", "min": "min", "max": "max"}
+
+# Partial tables of one kind held before they are folded into one
+_COMBINE_EVERY = 64
+
+_PARTIALS_KIND = "partials"
+_REGISTER = "__register"
+_RANK = "__rank"
+
+
+def normalize_aggs(aggs: Dict[str, Union[str, Sequence[str]]]) -> List[Tuple[str, str]]:
+    """Flatten ``{"col": "sum" | ["sum", "mean"]}`` into (column, function) pairs."""
+    if not aggs:
+        raise ValueError("At least one aggregation is required, e.g. {'amount': 'sum'}")
+    pairs = []
+    for column, functions in aggs.items():
+        for function in [functions] if isinstance(functions, str) else functions:
+            if function not in AGGREGATIONS:
+                raise ValueError(
+                    f"Unsupported aggregation: '{function}'. "
+                    f"Supported: {', '.join(AGGREGATIONS)}"
+                )
+            pairs.append((column, function))
+    if not pairs:
+        raise ValueError(f"No aggregation functions given for: {', '.join(aggs)}")
+    return pairs
+
+
+def _hash_values(series: pd.Series) -> np.ndarray:
+    """64-bit value hashes that agree across chunks whose numeric dtypes differ."""
+    import pandas as pd
+
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        series = series.astype("float64")
+    return pd.util.hash_pandas_object(series, index=False).to_numpy()
+
+
+def hll_sketch(table: pa.Table, keys: List[str], column: str, precision: int) -> pa.Table:
+    """Reduce one chunk to sparse HyperLogLog registers per group.
+
+    Each non-null value is hashed; the top ``precision`` bits pick a register
+    and the position of the first set bit in the rest is its rank. Only the
+    maximum rank per (group, register) is kept.
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    table = table.select(keys + [column])
+    table = table.filter(pc.is_valid(table.column(column)))
+    if table.num_rows == 0:
+        hashes = np.empty(0, dtype=np.uint64)
+    else:
+        hashes = _hash_values(table.column(column).to_pandas())
+
+    bits = 64 - precision
+    registers = (hashes >> np.uint64(bits)).astype(np.int32)
+    rest = hashes & np.uint64((1 << bits) - 1)
+    with np.errstate(divide="ignore"):
+        leading_zeros = bits - 1 - np.floor(np.log2(rest.astype(np.float64)))
+    ranks = np.where(rest == 0, bits + 1, leading_zeros + 1).astype(np.int8)
+
+    sketch = table.select(keys).append_column(_REGISTER, pa.array(registers, pa.int32()))
+    sketch = sketch.append_column(_RANK, pa.array(ranks, pa.int8()))
+    merged = sketch.group_by(keys + [_REGISTER]).aggregate([(_RANK, "max")])
+    return merged.select(keys + [_REGISTER, f"{_RANK}_max"]).rename_columns(
+        keys + [_REGISTER, _RANK]
+    )
+
+
+def hll_estimate(sketch: pa.Table, keys: List[str], precision: int, name: str) -> pd.DataFrame:
+    """Turn merged sparse registers into a distinct-count estimate per group."""
+    import numpy as np
+    import pandas as pd
+
+    m = 1 << precision
+    alpha = 0.7213 / (1 + 1.079 / m)
+    df = sketch.to_pandas()
+    df["__inverse"] = np.ldexp(1.0, -df[_RANK].astype(np.int64).to_numpy())
+
+    if keys:
+        grouped = df.groupby(keys, dropna=False, sort=False)["__inverse"].agg(["sum", "size"])
+        grouped = grouped.reset_index()
+    else:
+        grouped = pd.DataFrame({"sum": [df["__inverse"].sum()], "size": [len(df)]})
+
+    zeros = m - grouped["size"].to_numpy()
+    raw = alpha * m * m / (grouped["sum"].to_numpy() + zeros)
+    with np.errstate(divide="ignore"):
+        linear = m * np.log(m / np.maximum(zeros, 1))
+    estimate = np.where((raw <= 2.5 * m) & (zeros > 0), linear, raw)
+    estimate = np.where(grouped["size"].to_numpy() == 0, 0, estimate)
+
+    out = grouped[keys].copy() if keys else pd.DataFrame(index=[0])
+    out[name] = np.rint(estimate).astype(np.int64)
+    return out
+
+
+class GroupAggregator:
+    """Fold per-chunk grouped aggregates into running totals, spilling to disk.
+
+    Args:
+        keys: Group-by columns (empty for a single global result).
+        aggs: (column, function) pairs from :func:`normalize_aggs`.
+        memory_budget: Bytes of partial state kept in memory before spilling
+            (defaults to ``AGGREGATE_MEMORY_BUDGET_BYTES``).
+        spill_dir: Directory for spill files (defaults to the system temp dir).
+    """
+
+    def __init__(
+        self,
+        keys: List[str],
+        aggs: List[Tuple[str, str]],
+        memory_budget: Optional[int] = None,
+        spill_dir: Optional[Union[str, Path]] = None,
+    ):
+        from .config import (
+            AGGREGATE_MEMORY_BUDGET_BYTES,
+            AGGREGATE_SPILL_PARTITIONS,
+            HLL_PRECISION,
+        )
+
+        self.keys = keys
+        self.aggs = aggs
+        self.memory_budget = memory_budget or AGGREGATE_MEMORY_BUDGET_BYTES
+        self.partitions = AGGREGATE_SPILL_PARTITIONS
+        self.precision = HLL_PRECISION
+        self.spill_dir = spill_dir
+        self.spilled_bytes = 0
+
+        self.partial_specs: List[Tuple[str, str]] = []
+        self.sketch_columns: List[str] = []
+        for column, function in aggs:
+            if function == "approx_distinct":
+                if column not in self.sketch_columns:
+                    self.sketch_columns.append(column)
+                continue
+            for partial in _PARTIALS[function]:
+                if (column, partial) not in self.partial_specs:
+                    self.partial_specs.append((column, partial))
+
+        self._kinds: List[str] = ([_PARTIALS_KIND] if self.partial_specs else []) + [
+            f"sketch{i}" for i in range(len(self.sketch_columns))
+        ]
+        self._state: Dict[str, List[pa.Table]] = {kind: [] for kind in self._kinds}
+        self._spill_files: Dict[Tuple[str, int], List[Path]] = {}
+        self._tempdir: Optional[tempfile.TemporaryDirectory] = None
+
+    @property
+    def partial_columns(self) -> List[str]:
+        return [f"{column}_{partial}" for column, partial in self.partial_specs]
+
+    def _reduce(self, kind: str, table: pa.Table) -> pa.Table:
+        if kind == _PARTIALS_KIND:
+            partial = table.group_by(self.keys).aggregate(self.partial_specs)
+            return partial.select(self.keys + self.partial_columns)
+        column = self.sketch_columns[int(kind[len("sketch") :])]
+        return hll_sketch(table, self.keys, column, self.precision)
+
+    def _combine(self, kind: str, tables: List[pa.Table]) -> pa.Table:
+        """Merge partial tables of one kind into a single table of the same layout."""
+        import pyarrow as pa
+
+        merged = pa.concat_tables(tables, promote_options="permissive")
+        if kind == _PARTIALS_KIND:
+            names = self.partial_columns
+            specs = [
+                (name, _COMBINE[partial]) for name, (_, partial) in zip(names, self.partial_specs)
+            ]
+            group_keys = self.keys
+        else:
+            names = [_RANK]
+            specs = [(_RANK, "max")]
+            group_keys = self.keys + [_REGISTER]
+        combined = merged.group_by(group_keys).aggregate(specs)
+        outputs = [f"{name}_{function}" for name, function in specs]
+        return combined.select(group_keys + outputs).rename_columns(group_keys + names)
+
+    def _state_bytes(self) -> int:
+        return sum(table.nbytes for tables in self._state.values() for table in tables)
+
+    def add(self, table: pa.Table) -> None:
+        """Reduce one chunk to partial aggregates, spilling if over budget."""
+        for kind in self._kinds:
+            tables = self._state[kind]
+            tables.append(self._reduce(kind, table))
+            if len(tables) >= _COMBINE_EVERY:
+                self._state[kind] = [self._combine(kind, tables)]
+
+        if self.keys and self._state_bytes() > self.memory_budget:
+            for kind in self._kinds:
+                if len(self._state[kind]) > 1:
+                    self._state[kind] = [self._combine(kind, self._state[kind])]
+            if self._state_bytes() > self.memory_budget:
+                self._spill()
+
+    def _partition_ids(self, table: pa.Table) -> np.ndarray:
+        return hash_key_columns(table, self.keys) % self.partitions
+
+    def _spill(self) -> None:
+        """Hash-partition all in-memory partials by key and write them to disk."""
+        import numpy as np
+        import pyarrow.feather as feather
+
+        if self._tempdir is None:
+            self._tempdir = tempfile.TemporaryDirectory(prefix="dm-agg-", dir=self.spill_dir)
+        directory = Path(self._tempdir.name)
+
+        for kind in self._kinds:
+            for table in self._state[kind]:
+                ids = self._partition_ids(table)
+                for partition in np.unique(ids):
+                    part = table.take(np.flatnonzero(ids == partition))
+                    files = self._spill_files.setdefault((kind, int(partition)), [])
+                    path = directory / f"{kind}-{int(partition)}-{len(files)}.arrow"
+                    feather.write_feather(part, path)
+                    files.append(path)
+                    self.spilled_bytes += part.nbytes
+            self._state[kind] = []
+        logger.debug("Spilled aggregation state to %s", directory)
+
+    def _finalize(self, state: Dict[str, List[pa.Table]], empty: pa.Table) -> pd.DataFrame:
+        """Combine one partition's partials (or all of them) into final output rows."""
+        import pandas as pd
+
+        frames = []
+        for kind in self._kinds:
+            tables = state[kind] or [self._reduce(kind, empty)]
+            combined = self._combine(kind, tables)
+            if kind == _PARTIALS_KIND:
+                frames.append(finalize_aggregates(combined.to_pandas(), self.keys, self.aggs))
+            else:
+                column = self.sketch_columns[int(kind[len("sketch") :])]
+                name = f"{column}_approx_distinct"
+                frames.append(hll_estimate(combined, self.keys, self.precision, name))
+
+        result = frames[0]
+        for frame in frames[1:]:
+            if self.keys:
+                result = result.merge(frame, on=self.keys, how="outer")
+            else:
+                result = pd.concat([result.reset_index(drop=True), frame], axis=1)
+        for column in self.sketch_columns:
+            name = f"{column}_approx_distinct"
+            result[name] = result[name].fillna(0).astype("int64")
+        return result
+
+    def result(self, empty: pa.Table) -> pd.DataFrame:
+        """Finish aggregation; ``empty`` is a zero-row table with the input schema."""
+        import pandas as pd
+        import pyarrow.feather as feather
+
+        try:
+            if not self._spill_files:
+                frames = [self._finalize(self._state, empty)]
+            else:
+                self._spill()
+                frames = []
+                for partition in range(self.partitions):
+                    state = {
+                        kind: [
+                            feather.read_table(path)
+                            for path in self._spill_files.get((kind, partition), [])
+                        ]
+                        for kind in self._kinds
+                    }
+                    if any(state.values()):
+                        frames.append(self._finalize(state, empty))
+        finally:
+            if self._tempdir is not None:
+                self._tempdir.cleanup()
+                self._tempdir = None
+
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        names = [f"{column}_{function}" for column, function in self.aggs]
+        df = df[self.keys + list(dict.fromkeys(names))]
+        return df.sort_values(self.keys, ignore_index=True) if self.keys else df
+
+
+def finalize_aggregates(
+    df: pd.DataFrame, keys: List[str], aggs: List[Tuple[str, str]]
+) -> pd.DataFrame:
+    """Turn combined partial columns into the requested ``<column>_<function>`` outputs."""
+    out = df[keys].copy()
+    for column, function in aggs:
+        name = f"{column}_{function}"
+        if function == "approx_distinct":
+            continue
+        if function == "mean":
+            out[name] = df[f"{column}_sum"] / df[f"{column}_count"]
+        else:
+            out[name] = df[name]
+    return out
@@ -0,0 +1,144 @@
+"""Command line interface: ``python -m data_manager {convert,info,verify,search}``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config import DEFAULT_BASE_PATH
+
+
+def _print_progress(done: int, total: int, result: Dict[str, Any]) -> None:
+    width = len(str(total))
+    line = f"[{done:>{width}}/{total}] {result['status']:<9} {result['source']}"
+    if result.get("target"):
+        line += f" -> {result['target']}"
+    if result["status"] == "failed":
+        line += f": {result['error']}"
+    else:
+        line += f" ({result['bytes_read'] / (1024 * 1024):.1f} MB, {result['seconds']:.2f}s)"
+    print(line, file=sys.stderr, flush=True)
+
+
+def _print_summary(summary: Dict[str, Any], statuses: List[str]) -> None:
+    counts = ", ".join(f"{summary.get(status, 0)} {status}" for status in statuses)
+    print(
+        f"{summary['files']} files: {counts} in {summary['seconds']:.1f}s "
+        f"({summary['files_per_second']:.1f} files/s, {summary['mb_per_second']:.1f} MB/s)"
+    )
+    for source, error in summary["failures"]:
+        print(f"FAILED {source}: {error}")
+
+
+def _convert(args: argparse.Namespace) -> int:
+    from .convert import convert_tree
+
+    summary = convert_tree(
+        args.base_path,
+        args.pattern,
+        args.to,
+        output_base=args.output,
+        workers=args.workers,
+        force=args.force,
+        progress=None if args.quiet else _print_progress,
+    )
+    _print_summary(summary, ["converted", "skipped", "failed"])
+    return 1 if summary.get("failed") else 0
+
+
+def _info(args: argparse.Namespace) -> int:
+    from .convert import list_data_files
+    from .manager import DataManager
+
+    dm = DataManager(args.base_path)
+    for filename in list_data_files(dm.base_path, args.pattern):
+        info = dm.get_info(filename)
+        print(json.dumps({"file": filename, **info}, default=str))
+    return 0
+
+
+def _verify(args: argparse.Namespace) -> int:
+    from .convert import verify_tree
+
+    summary = verify_tree(
+        args.base_path,
+        args.pattern,
+        workers=args.workers,
+        progress=None if args.quiet else _print_progress,
+    )
+    _print_summary(summary, ["ok", "failed"])
+    return 1 if summary.get("failed") else 0
+
+
+def _search(args: argparse.Namespace) -> int:
+    from .manager import DataManager
+    from .search import SearchIndex
+
+    dm = DataManager(args.base_path)
+    dm.search_index = SearchIndex(dm, values=args.values or None)
+    for result in dm.search(args.query, fields=args.field, limit=args.limit, refresh=True):
+        print(json.dumps(result))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m data_manager", description="Bulk operations on data file trees."
+    )
+    parser.add_argument(
+        "-b",
+        "--base-path",
+        type=Path,
+        default=DEFAULT_BASE_PATH,
+        help=f"directory the patterns are relative to (default: {DEFAULT_BASE_PATH})",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="log progress details")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    convert = subparsers.add_parser("convert", help="convert matching files to another format")
+    convert.add_argument("pattern", help='glob pattern, e.g. "**/*.csv"')
+    convert.add_argument("--to", required=True, help="target format, e.g. parquet")
+    convert.add_argument("-o", "--output", type=Path, help="output base path (default: in place)")
+    convert.add_argument("-j", "--workers", type=int, help="worker processes (default: CPUs)")
+    convert.add_argument(
+        "--force", action="store_true", help="convert files already converted and unchanged"
+    )
+    convert.add_argument("-q", "--quiet", action="store_true", help="no per-file progress")
+    convert.set_defaults(handler=_convert)
+
+    info = subparsers.add_parser("info", help="print file info as JSON lines")
+    info.add_argument("pattern", nargs="?", default="**/*", help="glob pattern")
+    info.set_defaults(handler=_info)
+
+    verify = subparsers.add_parser("verify", help="check that matching files read in full")
+    verify.add_argument("pattern", nargs="?", default="**/*", help="glob pattern")
+    verify.add_argument("-j", "--workers", type=int, help="worker processes (default: CPUs)")
+    verify.add_argument("-q", "--quiet", action="store_true", help="no per-file progress")
+    verify.set_defaults(handler=_verify)
+
+    search = subparsers.add_parser(
+        "search", help="find files by path, column name or cell value (as JSON lines)"
+    )
+    search.add_argument("query", help="words every matching file contains")
+    search.add_argument(
+        "-f",
+        "--field",
+        action="append",
+        choices=["path", "column", "value"],
+        help="only match in this field (repeatable; default: all)",
+    )
+    search.add_argument("-n", "--limit", type=int, help="most results shown")
+    search.add_argument("--values", action="store_true", help="also index string cell values")
+    search.set_defaults(handler=_search)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command line with ``argv`` (defaults to ``sys.argv[1:]``); returns the exit code."""
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    return args.handler(args)
@@ -1,7 +1,7 @@
 """Configuration and constants."""
 
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 # Default base path
 DEFAULT_BASE_PATH = Path("./data")
@@ -20,7 +20,7 @@ SUPPORTED_READ_FORMATS = frozenset(
     }
 )
 
-SUPPORTED_WRITE_FORMATS = frozenset({".csv", ".json", ".xlsx", ".parquet", ".feather"})
+SUPPORTED_WRITE_FORMATS = frozenset({".csv", ".json", ".jsonl", ".xlsx", ".parquet", ".feather"})
 
 # Default reader kwargs per format
 READER_DEFAULTS: Dict[str, Dict] = {
@@ -34,14 +34,159 @@ READER_DEFAULTS: Dict[str, Dict] = {
     ".pkl": {},
 }
 
+# Rows per Parquet row group: small enough for statistics to prune, large
+# enough to keep per-group overhead low
+PARQUET_ROW_GROUP_ROWS = 256 * 1024
+
 # Default writer kwargs per format
 WRITER_DEFAULTS: Dict[str, Dict] = {
     ".csv": {"index": False, "encoding": "utf-8"},
     ".json": {"orient": "records", "indent": 2},
+    ".jsonl": {
+        "orient": "records",
+        "lines": True,
+        "date_format": "iso",
+        "force_ascii": False,
+    },
     ".xlsx": {"index": False, "engine": "openpyxl"},
-    ".parquet": {"compression": "snappy", "index": False},
+    ".parquet": {"compression": "snappy", "index": False, "row_group_size": PARQUET_ROW_GROUP_ROWS},
     ".feather": {"compression": "lz4"},
 }
 
+# Threads writing the targets of one DataManager.save_many call (None: one per target)
+SAVE_MANY_MAX_WORKERS: Optional[int] = None
+
+# Rows per batch for chunked reads (iter_chunks and the streaming JSON parser)
+DEFAULT_CHUNK_SIZE = 50_000
+
+# Characters read per refill of the streaming JSON parser buffer, and the most
+# characters it buffers while a record fails to parse before calling the input
+# malformed
+JSON_STREAM_BLOCK_SIZE = 1024 * 1024
+JSON_STREAM_MAX_RECORD_CHARS = 64 * 1024 * 1024
+
+# CSV files at least this large are parsed as byte ranges in worker processes,
+# with no range smaller than CSV_MIN_RANGE_BYTES
+CSV_PARALLEL_THRESHOLD_BYTES = 256 * 1024 * 1024
+CSV_MIN_RANGE_BYTES = 32 * 1024 * 1024
+
+# Worker processes for parallel CSV parsing (None: one per CPU)
+CSV_MAX_WORKERS: Optional[int] = None
+
+# Bytes read per step when counting quotes and aligning CSV byte ranges to records
+CSV_SCAN_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Rows converted per step of the streaming .xlsx reader and writer
+EXCEL_ROW_BATCH_SIZE = 10_000
+
+# Excel's hard row limit per worksheet (header included); longer frames are split
+EXCEL_MAX_ROWS = 1_048_576
+
+# Worker processes for parallel multi-sheet loads (None: one per CPU, capped at sheet count)
+EXCEL_MAX_WORKERS: Optional[int] = None
+
+# Row-offset index sidecars (random access into text formats)
+ROW_INDEX_FORMATS = frozenset({".csv", ".jsonl"})
+ROW_INDEX_SUFFIX = ".idx.json"
+ROW_INDEX_STRIDE = 1_000
+ROW_INDEX_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Out-of-core aggregation: partial state kept in memory before spilling to disk,
+# number of key-hash partitions spilled state is split into, and HyperLogLog
+# precision for approx_distinct (2**p registers, ~1.04 / sqrt(2**p) error)
+AGGREGATE_MEMORY_BUDGET_BYTES = 256 * 1024 * 1024
+AGGREGATE_SPILL_PARTITIONS = 16
+HLL_PRECISION = 12
+
+# Out-of-core joins: build-side bytes held in memory before both inputs are
+# hash-partitioned to disk, and the number of partitions they are split into
+JOIN_MEMORY_BUDGET_BYTES = 512 * 1024 * 1024
+JOIN_SPILL_PARTITIONS = 32
+
+# Parquet optimisation (DataManager.optimize): output file size, highest
+# distinct-to-row ratio still dictionary-encoded, memory per sorted range and
+# sort-key values sampled to choose range boundaries
+PARQUET_TARGET_FILE_BYTES = 256 * 1024 * 1024
+PARQUET_DICTIONARY_MAX_RATIO = 0.5
+PARQUET_SORT_MEMORY_BYTES = 256 * 1024 * 1024
+PARQUET_SORT_SAMPLE_ROWS = 100_000
+
+# Key index sidecars for DataManager.lookup: per-row-group bloom filters sized
+# at BLOOM_BITS_PER_KEY bits per row with BLOOM_PROBES hash probes (~1% false
+# positives at 10 bits and 7 probes)
+KEY_INDEX_SUFFIX = ".keyidx.arrow"
+KEY_INDEX_BLOOM_BITS_PER_KEY = 10
+KEY_INDEX_BLOOM_PROBES = 7
+
+# Dataset versioning: whether DataManager.save records versions by default,
+# the store directory under base_path, and the average rows per shared Parquet
+# chunk (a power of two; chunks hold a quarter to four times as many)
+VERSIONING_ENABLED = False
+VERSION_STORE_DIR = ".versions"
+VERSION_CHUNK_ROWS = 64 * 1024
+
+# Memory governor (DataManager max_memory): default budget per load in bytes
+# (None for no limit), bytes of a CSV parsed to estimate its row size, assumed
+# expansion of compressed text, DataFrame bytes per file byte for formats
+# without a cheaper estimate, the share of the budget one iter_chunks chunk
+# may use when no chunksize is given, and how often a budgeted load samples
+# resident memory for memory_peak_bytes
+MAX_MEMORY_BYTES: Optional[int] = None
+MEMORY_SNIFF_BYTES = 1024 * 1024
+MEMORY_COMPRESSION_RATIO = 5.0
+MEMORY_SIZE_FACTORS: Dict[str, float] = {
+    ".json": 2.0,
+    ".jsonl": 2.0,
+    ".xlsx": 10.0,
+    ".xls": 5.0,
+    ".pkl": 1.5,
+}
+MEMORY_CHUNK_FRACTION = 0.25
+MEMORY_PEAK_SAMPLE_SECONDS = 0.005
+
+# Remote storage (fsspec URL as base_path): local cache root, bytes per cached
+# block, most bytes fetched by one range request, and concurrent requests
+STORAGE_CACHE_DIR = Path.home() / ".cache" / "data_manager"
+STORAGE_BLOCK_SIZE = 4 * 1024 * 1024
+STORAGE_MAX_RANGE_BYTES = 32 * 1024 * 1024
+STORAGE_MAX_WORKERS = 8
+
+# Reader-writer file locks: lock file directory under base_path (DataManager
+# lock_dir overrides it), default wait before LockTimeoutError (None waits
+# forever) and first retry interval
+LOCK_DIR = ".locks"
+LOCK_TIMEOUT_SECONDS: Optional[float] = 60.0
+LOCK_POLL_INTERVAL_SECONDS = 0.005
+
+# Cross-process shared-memory frame cache (DataManager shared_cache): whether
+# loads use it by default, its directory (None: /dev/shm/data_manager where
+# available, else under the temp directory) and the byte budget beyond which
+# least recently used entries no process holds are evicted
+SHARED_CACHE_ENABLED = False
+SHARED_CACHE_DIR: Optional[Path] = None
+SHARED_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+# Shortest interval between two progress callbacks of one operation
+PROGRESS_INTERVAL_SECONDS = 0.1
+
+# Bulk conversion (python -m data_manager convert): state file under the output
+# base path recording converted files and their checksums, worker processes
+# (None: one per CPU) and completed files between state file writes
+CONVERT_STATE_FILE = ".convert_state.json"
+CONVERT_MAX_WORKERS: Optional[int] = None
+CONVERT_STATE_FLUSH_EVERY = 100
+
+# Schema contracts: offending values listed per violation in the report
+CONTRACT_EXAMPLE_VALUES = 5
+
+# Search index (DataManager.search): directory under base_path, whether string
+# cell values are indexed by default, longest token indexed, value tokens
+# indexed per file and default number of results
+SEARCH_INDEX_DIR = ".search"
+SEARCH_INDEX_VALUES = False
+SEARCH_MAX_TOKEN_LENGTH = 64
+SEARCH_MAX_VALUE_TOKENS = 200_000
+SEARCH_RESULTS_LIMIT = 50
+
 # Metadata sidecar suffix
 METADATA_SUFFIX = ".meta.json"
@@ -0,0 +1,233 @@
+"""Schema contracts: expected columns, dtypes and values of a dataset.
+
+A contract is built from a mapping of column name to rules::
+
+    SchemaContract({
+        "id": {"dtype": "integer", "nullable": False, "unique": True, "min": 1},
+        "status": {"dtype": "string", "categories": ["open", "closed"]},
+        "amount": {"dtype": "float", "min": 0.0, "max": 1e6},
+    }, strict=True)
+
+Rules per column (all optional):
+
+* ``dtype``: a pandas dtype name (``"int64"``) or a kind: ``"integer"``,
+  ``"float"``, ``"numeric"``, ``"string"``, ``"bool"``, ``"datetime"`` or
+  ``"category"``.
+* ``nullable``: False forbids missing values.
+* ``min`` / ``max``: inclusive value bounds.
+* ``categories``: allowed values.
+* ``unique``: True forbids duplicate values.
+
+Every rule is checked with one vectorised operation per column, and the
+result is a report rather than an exception. For Parquet, footer
+statistics settle ``nullable``, ``min`` and ``max`` without reading rows
+whenever every row group has them and they are within bounds.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow.parquet as pq
+
+RULES = frozenset({"dtype", "nullable", "min", "max", "categories", "unique"})
+
+
+def _dtype_matches(dtype: Any, expected: str) -> bool:
+    import pandas as pd
+
+    types = pd.api.types
+    kinds = {
+        "integer": types.is_integer_dtype,
+        "float": types.is_float_dtype,
+        "numeric": lambda t: types.is_numeric_dtype(t) and not types.is_bool_dtype(t),
+        "string": types.is_string_dtype,
+        "bool": types.is_bool_dtype,
+        "datetime": types.is_datetime64_any_dtype,
+        "category": lambda t: isinstance(t, pd.CategoricalDtype),
+    }
+    if expected in kinds:
+        return bool(kinds[expected](dtype))
+    try:
+        return dtype == pd.api.types.pandas_dtype(expected)
+    except TypeError:
+        return str(dtype) == expected
+
+
+def _examples(values: pd.Series) -> List[Any]:
+    from .config import CONTRACT_EXAMPLE_VALUES
+
+    return values.drop_duplicates().head(CONTRACT_EXAMPLE_VALUES).astype(object).tolist()
+
+
+class SchemaContract:
+    """Expected columns of a dataset, validated as a whole.
+
+    Args:
+        columns: Column name to rules (see the module docstring).
+        strict: Also report columns the contract does not name.
+        enforce: Make ``DataManager`` raise ContractViolationError on
+            violations instead of only reporting them.
+
+    Raises:
+        ValueError: If a rule is unknown.
+    """
+
+    def __init__(
+        self,
+        columns: Mapping[str, Mapping[str, Any]],
+        strict: bool = False,
+        enforce: bool = False,
+    ):
+        for name, rules in columns.items():
+            unknown = set(rules) - RULES
+            if unknown:
+                raise ValueError(f"Unknown rules for column {name!r}: {sorted(unknown)}")
+        self.columns = {name: dict(rules) for name, rules in columns.items()}
+        self.strict = strict
+        self.enforce = enforce
+
+    @classmethod
+    def from_dict(cls, spec: Mapping[str, Any]) -> SchemaContract:
+        """Build from ``{"columns": {...}, "strict": ..., "enforce": ...}`` (e.g. parsed JSON)."""
+        return cls(spec["columns"], spec.get("strict", False), spec.get("enforce", False))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"columns": self.columns, "strict": self.strict, "enforce": self.enforce}
+
+    def proven_by_statistics(self, metadata: List[pq.FileMetaData]) -> Set[Tuple[str, str]]:
+        """(column, rule) pairs that Parquet footer statistics show to hold.
+
+        Args:
+            metadata: Footers of every file of the dataset.
+        """
+        proven: Set[Tuple[str, str]] = set()
+        for name, rules in self.columns.items():
+            lows, highs, nulls = [], [], 0
+            complete = True
+            for file_metadata in metadata:
+                for i in range(file_metadata.num_row_groups):
+                    row_group = file_metadata.row_group(i)
+                    chunk = next(
+                        (
+                            row_group.column(j)
+                            for j in range(row_group.num_columns)
+                            if row_group.column(j).path_in_schema == name
+                        ),
+                        None,
+                    )
+                    stats = chunk.statistics if chunk is not None else None
+                    if stats is None or not stats.has_null_count:
+                        complete = False
+                        break
+                    nulls += stats.null_count
+                    if stats.has_min_max:
+                        lows.append(stats.min)
+                        highs.append(stats.max)
+                    elif stats.null_count < row_group.num_rows:
+                        complete = False
+                        break
+                if not complete:
+                    break
+            if not complete:
+                continue
+            if rules.get("nullable") is False and nulls == 0:
+                proven.add((name, "nullable"))
+            try:
+                if "min" in rules and (not lows or min(lows) >= rules["min"]):
+                    proven.add((name, "min"))
+                if "max" in rules and (not highs or max(highs) <= rules["max"]):
+                    proven.add((name, "max"))
+            except TypeError:
+                # Statistics of another type than the bound (e.g. timestamps vs strings)
+                pass
+        return proven
+
+    def validate(
+        self,
+        df: pd.DataFrame,
+        skip: Optional[Set[Tuple[str, str]]] = None,
+        columns: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Check ``df`` against the contract.
+
+        Args:
+            df: Frame to check.
+            skip: (column, rule) pairs already known to hold.
+            columns: Only check these columns (a projected load).
+
+        Returns:
+            Report with ``valid``, ``rows``, ``violations`` (each with
+            ``column``, ``rule``, ``count`` of offending rows or None, and
+            ``examples`` of offending values or a ``detail``) and
+            ``proven_by_statistics`` (rules settled without reading rows).
+        """
+        skip = skip or set()
+        violations: List[Dict[str, Any]] = []
+        for name, rules in self.columns.items():
+            if columns is not None and name not in columns:
+                continue
+            if name not in df.columns:
+                violations.append({"column": name, "rule": "missing", "count": None})
+                continue
+            series = df[name]
+            if "dtype" in rules and not _dtype_matches(series.dtype, rules["dtype"]):
+                violations.append(
+                    {
+                        "column": name,
+                        "rule": "dtype",
+                        "count": None,
+                        "detail": f"expected {rules['dtype']}, found {series.dtype}",
+                    }
+                )
+            missing = series.isna()
+            masks = {}
+            if rules.get("nullable") is False and (name, "nullable") not in skip:
+                masks["nullable"] = missing
+            present = series[~missing]
+            try:
+                if "min" in rules and (name, "min") not in skip:
+                    masks["min"] = present < rules["min"]
+                if "max" in rules and (name, "max") not in skip:
+                    masks["max"] = present > rules["max"]
+            except TypeError as e:
+                violations.append(
+                    {"column": name, "rule": "min/max", "count": None, "detail": str(e)}
+                )
+            if "categories" in rules:
+                masks["categories"] = ~present.isin(rules["categories"])
+            if rules.get("unique"):
+                masks["unique"] = present.duplicated()
+
+            for rule, mask in masks.items():
+                count = int(mask.sum())
+                if not count:
+                    continue
+                values = series if rule == "nullable" else present
+                violation = {"column": name, "rule": rule, "count": count}
+                if rule != "nullable":
+                    violation["examples"] = _examples(values[mask])
+                violations.append(violation)
+
+        if self.strict:
+            for name in df.columns:
+                if name not in self.columns:
+                    violations.append({"column": str(name), "rule": "unexpected", "count": None})
+
+        return {
+            "valid": not violations,
+            "rows": len(df),
+            "violations": violations,
+            "proven_by_statistics": sorted(f"{column}.{rule}" for column, rule in skip),
+        }
+
+
+def summarize(report: Dict[str, Any]) -> str:
+    """One-line description of a report's violations."""
+    parts = []
+    for violation in report["violations"]:
+        count = f" ({violation['count']} rows)" if violation["count"] is not None else ""
+        parts.append(f"{violation['column']}: {violation['rule']}{count}")
+    return "; ".join(parts) or "no violations"
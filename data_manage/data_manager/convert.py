@@ -0,0 +1,289 @@
+"""Bulk conversion and verification of file trees.
+
+:func:`convert_tree` converts every file matching a glob pattern to another
+format, one file per task in a process pool. Outputs keep the relative path
+of their source with the new suffix. A state file under the output base
+path (``CONVERT_STATE_FILE``) records the checksums of each converted source
+and output, so an interrupted run resumes where it stopped: a file is
+skipped when neither its source nor its output changed since it was
+converted.
+
+:func:`verify_tree` reads every matching file in full and compares it with
+the output checksum in the state file, where one is recorded.
+
+Both back the ``python -m data_manager`` command line.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from .metadata import calculate_checksum
+from .utils import is_data_file
+
+if TYPE_CHECKING:
+    from .manager import DataManager
+
+logger = logging.getLogger(__name__)
+
+Progress = Callable[[int, int, Dict[str, Any]], None]
+
+# One DataManager per base path and worker process
+_managers: Dict[Path, DataManager] = {}
+
+
+def _manager(base_path: Path) -> DataManager:
+    from .manager import DataManager
+
+    if base_path not in _managers:
+        _managers[base_path] = DataManager(base_path)
+    return _managers[base_path]
+
+
+def list_data_files(base_path: Path, pattern: str) -> List[str]:
+    """Relative POSIX paths of the data files under ``base_path`` matching ``pattern``."""
+    return sorted(
+        path.relative_to(base_path).as_posix()
+        for path in _manager(base_path).list_files(pattern)
+        if is_data_file(path)
+    )
+
+
+def load_state(base_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Conversion records under ``base_path``, keyed by output path."""
+    from .config import CONVERT_STATE_FILE
+
+    state_path = base_path / CONVERT_STATE_FILE
+    if not state_path.exists():
+        return {}
+    with open(state_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save_state(base_path: Path, state: Dict[str, Dict[str, Any]]) -> None:
+    from .config import CONVERT_STATE_FILE
+
+    state_path = base_path / CONVERT_STATE_FILE
+    temp_path = state_path.with_name(f"{state_path.name}.{os.getpid()}.tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(temp_path, state_path)
+
+
+def _convert_one(
+    source_base: Path,
+    output_base: Path,
+    source: str,
+    target: str,
+    previous: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Convert one file, or skip it if ``previous`` shows it is up to date."""
+    started = time.perf_counter()
+    source_path = source_base / source
+    target_path = output_base / target
+    result: Dict[str, Any] = {
+        "source": source,
+        "target": target,
+        "bytes_read": source_path.stat().st_size,
+    }
+    try:
+        source_checksum = calculate_checksum(source_path)
+        if (
+            previous is not None
+            and previous["source_checksum"] == source_checksum
+            and target_path.is_file()
+            and calculate_checksum(target_path) == previous["output_checksum"]
+        ):
+            result.update(status="skipped", output_checksum=previous["output_checksum"])
+        else:
+            df = _manager(source_base).load(source)
+            _manager(output_base).save(df, target)
+            result.update(status="converted", rows=len(df))
+            result["output_checksum"] = calculate_checksum(target_path)
+        result["source_checksum"] = source_checksum
+        result["bytes_written"] = target_path.stat().st_size
+    except Exception as e:
+        result.update(status="failed", error=f"{type(e).__name__}: {e}")
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+
+def _verify_one(base_path: Path, filename: str, expected: Optional[str]) -> Dict[str, Any]:
+    """Read ``filename`` in full and compare it with its ``expected`` checksum."""
+    started = time.perf_counter()
+    result: Dict[str, Any] = {
+        "source": filename,
+        "bytes_read": (base_path / filename).stat().st_size,
+    }
+    try:
+        if expected is not None and calculate_checksum(base_path / filename) != expected:
+            raise ValueError("checksum differs from the one recorded at conversion")
+        result["rows"] = sum(len(chunk) for chunk in _manager(base_path).iter_chunks(filename))
+        result["status"] = "ok"
+    except Exception as e:
+        result.update(status="failed", error=f"{type(e).__name__}: {e}")
+    result["seconds"] = time.perf_counter() - started
+    return result
+
+
+def _run(
+    function: Callable[..., Dict[str, Any]],
+    tasks: List[Tuple[Any, ...]],
+    workers: Optional[int],
+    on_result: Callable[[Dict[str, Any]], None],
+) -> None:
+    """Run ``function(*task)`` for every task, in a process pool unless one worker suffices."""
+    from .config import CONVERT_MAX_WORKERS
+
+    workers = min(workers or CONVERT_MAX_WORKERS or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        for task in tasks:
+            on_result(function(*task))
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(function, *task) for task in tasks]
+        try:
+            for future in as_completed(futures):
+                on_result(future.result())
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def _summary(results: List[Dict[str, Any]], seconds: float) -> Dict[str, Any]:
+    counts: Dict[str, int] = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    processed = [r for r in results if r["status"] not in ("skipped", "failed")]
+    bytes_read = sum(r["bytes_read"] for r in processed)
+    return {
+        "files": len(results),
+        **counts,
+        "bytes_read": bytes_read,
+        "bytes_written": sum(r.get("bytes_written", 0) for r in processed),
+        "seconds": seconds,
+        "files_per_second": len(processed) / seconds if seconds else 0.0,
+        "mb_per_second": bytes_read / (1024 * 1024) / seconds if seconds else 0.0,
+        "failures": [(r["source"], r["error"]) for r in results if r["status"] == "failed"],
+    }
+
+
+def convert_tree(
+    source_base: Path,
+    pattern: str,
+    to: str,
+    output_base: Optional[Path] = None,
+    workers: Optional[int] = None,
+    force: bool = False,
+    progress: Optional[Progress] = None,
+) -> Dict[str, Any]:
+    """Convert every data file under ``source_base`` matching ``pattern`` to format ``to``.
+
+    Args:
+        source_base: Local base path of the source files.
+        pattern: Glob pattern relative to ``source_base`` (e.g. ``"**/*.csv"``).
+        to: Target suffix, e.g. ``".parquet"``.
+        output_base: Base path of the outputs (defaults to ``source_base``).
+        workers: Worker processes (defaults to ``CONVERT_MAX_WORKERS``).
+        force: Convert files even if the state file shows them up to date.
+        progress: Called with (completed, total, result) after every file.
+
+    Returns:
+        Summary with ``files``, per-status counts (``converted``,
+        ``skipped``, ``failed``), ``bytes_read`` and ``bytes_written`` of
+        the converted files, ``seconds``, ``files_per_second``,
+        ``mb_per_second`` and ``failures`` as (source, error) pairs.
+
+    Raises:
+        UnsupportedFormatError: If ``to`` is not a supported write format.
+    """
+    from .config import CONVERT_STATE_FLUSH_EVERY, SUPPORTED_WRITE_FORMATS
+    from .exceptions import UnsupportedFormatError
+
+    suffix = to.lower() if to.startswith(".") else f".{to.lower()}"
+    if suffix not in SUPPORTED_WRITE_FORMATS:
+        raise UnsupportedFormatError(suffix, list(SUPPORTED_WRITE_FORMATS))
+    source_base = Path(source_base).resolve()
+    output_base = Path(output_base).resolve() if output_base else source_base
+    output_base.mkdir(parents=True, exist_ok=True)
+
+    state = {} if force else load_state(output_base)
+    tasks = []
+    for source in list_data_files(source_base, pattern):
+        if Path(source).suffix.lower() == suffix:
+            continue
+        target = Path(source).with_suffix(suffix).as_posix()
+        previous = state.get(target)
+        if previous is not None and previous.get("source") != source:
+            previous = None
+        tasks.append((source_base, output_base, source, target, previous))
+
+    results: List[Dict[str, Any]] = []
+
+    def on_result(result: Dict[str, Any]) -> None:
+        results.append(result)
+        if result["status"] != "failed":
+            state[result["target"]] = {
+                "source": result["source"],
+                "source_checksum": result["source_checksum"],
+                "output_checksum": result["output_checksum"],
+            }
+        if len(results) % CONVERT_STATE_FLUSH_EVERY == 0:
+            _save_state(output_base, state)
+        if progress is not None:
+            progress(len(results), len(tasks), result)
+
+    started = time.perf_counter()
+    try:
+        _run(_convert_one, tasks, workers, on_result)
+    finally:
+        # Keep what finished, so an interrupted run resumes from here.
+        _save_state(output_base, state)
+    summary = _summary(results, time.perf_counter() - started)
+    logger.info(
+        "Converted %s, skipped %s, failed %s of %s files",
+        summary.get("converted", 0),
+        summary.get("skipped", 0),
+        summary.get("failed", 0),
+        summary["files"],
+    )
+    return summary
+
+
+def verify_tree(
+    base_path: Path,
+    pattern: str,
+    workers: Optional[int] = None,
+    progress: Optional[Progress] = None,
+) -> Dict[str, Any]:
+    """Check that every data file under ``base_path`` matching ``pattern`` reads in full.
+
+    Files written by :func:`convert_tree` must also still match their
+    recorded checksum.
+
+    Returns:
+        Summary as from :func:`convert_tree`, with ``ok`` and ``failed`` counts.
+    """
+    base_path = Path(base_path).resolve()
+    state = load_state(base_path)
+    tasks = [
+        (base_path, filename, state.get(filename, {}).get("output_checksum"))
+        for filename in list_data_files(base_path, pattern)
+    ]
+    results: List[Dict[str, Any]] = []
+
+    def on_result(result: Dict[str, Any]) -> None:
+        results.append(result)
+        if progress is not None:
+            progress(len(results), len(tasks), result)
+
+    started = time.perf_counter()
+    _run(_verify_one, tasks, workers, on_result)
+    return _summary(results, time.perf_counter() - started)
@@ -0,0 +1,204 @@
+"""Chunked, hash-based comparison of two datasets.
+
+Each side is streamed once. Every row is reduced to 64-bit hashes (of its key
+columns and of its remaining columns, via ``utils.hash_rows``), so
+memory holds about 24 bytes per row whatever the row width. Matching happens
+on those hashes:
+
+* With ``key``: rows pair up by key. Keys only in ``b`` are added, keys only
+  in ``a`` are removed, and pairs whose value hashes differ are changed.
+* Without a key: rows are compared as multisets of whole-row hashes, so
+  ``changed`` is always 0.
+
+Per-column change masks need the actual values. A second pass reads back
+only the rows that differ.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .utils import hash_rows
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+# Values of the ``_change`` column in a delta frame
+CHANGE_ADDED = "added"
+CHANGE_REMOVED = "removed"
+CHANGE_CHANGED = "changed"
+
+
+def _peek_columns(tables: Iterator[pa.Table]) -> Tuple[List[str], Iterator[pa.Table]]:
+    """Column names of a table stream, and the stream with its first table put back."""
+    first = next(tables, None)
+    if first is None:
+        return [], iter(())
+    return first.column_names, itertools.chain([first], tables)
+
+
+def _hash_rows(tables: Iterator[pa.Table], keys: List[str], values: List[str]) -> pd.DataFrame:
+    """Per-row key hash, value hash and row number for a stream of tables."""
+    import numpy as np
+    import pandas as pd
+
+    parts = []
+    offset = 0
+    for table in tables:
+        if not table.num_rows:
+            continue
+        part = {"row": np.arange(offset, offset + table.num_rows)}
+        if keys:
+            part["key"] = hash_rows(table, keys)
+        part["value"] = hash_rows(table, values) if values else np.zeros(table.num_rows, np.uint64)
+        parts.append(pd.DataFrame(part))
+        offset += table.num_rows
+    if not parts:
+        columns = ["row", "key", "value"] if keys else ["row", "value"]
+        return pd.DataFrame({c: np.array([], np.uint64) for c in columns})
+    return pd.concat(parts, ignore_index=True)
+
+
+def _take_rows(tables: Iterator[pa.Table], rows: np.ndarray, columns: List[str]) -> pa.Table:
+    """Collect the rows numbered ``rows`` (sorted) from a stream, in stream order."""
+    import numpy as np
+    import pyarrow as pa
+
+    taken = []
+    offset = 0
+    for table in tables:
+        end = offset + table.num_rows
+        lo, hi = np.searchsorted(rows, [offset, end])
+        if hi > lo:
+            taken.append(table.select(columns).take(pa.array(rows[lo:hi] - offset)))
+        offset = end
+        if hi == len(rows):
+            break
+    return pa.concat_tables(taken, promote_options="permissive") if taken else None
+
+
+def _check_unique(hashes: pd.DataFrame, side: str, keys: List[str]) -> None:
+    if hashes["key"].duplicated().any():
+        raise ValueError(f"Key {keys} is not unique in {side}")
+
+
+def diff_tables(
+    a: Callable[[], Iterator[pa.Table]],
+    b: Callable[[], Iterator[pa.Table]],
+    keys: Optional[List[str]] = None,
+    delta: bool = False,
+) -> Tuple[Dict[str, Any], Optional[pd.DataFrame]]:
+    """Compare two table streams (each factory may be called twice).
+
+    Returns:
+        A summary dict (row counts, ``added``/``removed``/``changed``/
+        ``unchanged``, ``columns_added``/``columns_removed`` and
+        ``changed_by_column``), and with ``delta`` a DataFrame of the
+        differing rows: key columns, a ``_change`` column, every compared
+        column with its new value (old for removed rows), and for changed
+        rows ``<column>_old`` plus a boolean ``<column>_changed`` mask.
+    """
+    import numpy as np
+    import pandas as pd
+
+    keys = list(keys or [])
+    columns_a, tables_a = _peek_columns(a())
+    columns_b, tables_b = _peek_columns(b())
+    for side, columns in (("a", columns_a), ("b", columns_b)):
+        missing = [k for k in keys if columns and k not in columns]
+        if missing:
+            raise ValueError(f"Key columns {missing} not in {side}")
+    common = [c for c in columns_b if c in columns_a]
+    values = [c for c in common if c not in keys]
+
+    hashes_a = _hash_rows(tables_a, keys, values if keys else common)
+    hashes_b = _hash_rows(tables_b, keys, values if keys else common)
+
+    if keys:
+        _check_unique(hashes_a, "a", keys)
+        _check_unique(hashes_b, "b", keys)
+        in_b = hashes_a["key"].isin(hashes_b["key"])
+        in_a = hashes_b["key"].isin(hashes_a["key"])
+        removed_rows = hashes_a.loc[~in_b, "row"]
+        added_rows = hashes_b.loc[~in_a, "row"]
+        both = hashes_a[in_b].merge(hashes_b[in_a], on="key", suffixes=("_a", "_b"))
+        changed_pairs = both[both["value_a"] != both["value_b"]]
+        changed_a = changed_pairs["row_a"].to_numpy(np.int64)
+        changed_b = changed_pairs["row_b"].to_numpy(np.int64)
+        unchanged = len(both) - len(changed_pairs)
+    else:
+        # Multiset difference: the k-th copy of a row is unmatched when the
+        # other side has fewer than k copies.
+        counts_a = hashes_a["value"].value_counts()
+        counts_b = hashes_b["value"].value_counts()
+        occurrence_a = hashes_a.groupby("value").cumcount()
+        occurrence_b = hashes_b.groupby("value").cumcount()
+        other_a = hashes_a["value"].map(counts_b).fillna(0)
+        other_b = hashes_b["value"].map(counts_a).fillna(0)
+        removed_rows = hashes_a.loc[occurrence_a >= other_a, "row"]
+        added_rows = hashes_b.loc[occurrence_b >= other_b, "row"]
+        changed_a = changed_b = np.array([], np.int64)
+        unchanged = len(hashes_a) - len(removed_rows)
+
+    summary: Dict[str, Any] = {
+        "rows_a": len(hashes_a),
+        "rows_b": len(hashes_b),
+        "added": len(added_rows),
+        "removed": len(removed_rows),
+        "changed": len(changed_a),
+        "unchanged": int(unchanged),
+        "columns_added": [c for c in columns_b if c not in columns_a],
+        "columns_removed": [c for c in columns_a if c not in columns_b],
+        "changed_by_column": {c: 0 for c in values} if keys else {},
+    }
+    if not len(changed_a) and not delta:
+        return summary, None
+
+    # Second pass: read back only rows that differ.
+    rows_a = np.sort(np.concatenate([changed_a, removed_rows.to_numpy(np.int64)]))
+    rows_b = np.sort(np.concatenate([changed_b, added_rows.to_numpy(np.int64)]))
+    wanted_a = _take_rows(a(), rows_a, common) if len(rows_a) else None
+    wanted_b = _take_rows(b(), rows_b, common) if len(rows_b) else None
+    frame_a = wanted_a.to_pandas() if wanted_a is not None else pd.DataFrame(columns=common)
+    frame_b = wanted_b.to_pandas() if wanted_b is not None else pd.DataFrame(columns=common)
+    frame_a.index = rows_a
+    frame_b.index = rows_b
+
+    old = frame_a.loc[changed_a].reset_index(drop=True)
+    new = frame_b.loc[changed_b].reset_index(drop=True)
+    masks = {}
+    for column in values if keys else []:
+        differs = ~(old[column].eq(new[column]) | (old[column].isna() & new[column].isna()))
+        masks[column] = differs.to_numpy(bool)
+        summary["changed_by_column"][column] = int(differs.sum())
+    if not delta:
+        return summary, None
+
+    pieces = []
+    if len(added_rows):
+        pieces.append(
+            frame_b.loc[np.sort(added_rows.to_numpy(np.int64))].assign(_change=CHANGE_ADDED)
+        )
+    if len(removed_rows):
+        pieces.append(
+            frame_a.loc[np.sort(removed_rows.to_numpy(np.int64))].assign(_change=CHANGE_REMOVED)
+        )
+    if len(new):
+        changed = new.assign(_change=CHANGE_CHANGED)
+        for column in values:
+            changed[f"{column}_old"] = old[column].to_numpy()
+            changed[f"{column}_changed"] = masks[column]
+        pieces.append(changed)
+
+    ordered = keys + ["_change"] + [c for c in common if c not in keys]
+    ordered += [f"{c}_{suffix}" for c in values for suffix in ("old", "changed")] if keys else []
+    if not pieces:
+        return summary, pd.DataFrame(columns=ordered)
+    result = pd.concat(pieces, ignore_index=True)
+    for column in ordered:
+        if column not in result.columns:
+            result[column] = pd.NA
+    return summary, result[ordered]
@@ -1,5 +1,7 @@
 """Custom exceptions for Data Manager."""
 
+from typing import Optional
+
 
 class DataManagerError(Exception):
     """Base exception for Data Manager."""
@@ -22,6 +24,20 @@ class DataLoadError(DataManagerError):
         super().__init__(f"Failed to load '{path}': {reason}")
 
 
+class MemoryBudgetError(DataLoadError):
+    """Raised when a load is estimated to exceed the memory budget."""
+
+    def __init__(self, path: str, estimate: int, budget: int):
+        self.estimate = estimate
+        self.budget = budget
+        super().__init__(
+            path,
+            f"estimated {estimate / 1024 ** 2:.1f} MiB in memory exceeds the "
+            f"{budget / 1024 ** 2:.1f} MiB budget; select columns, use "
+            f"on_exceed='head' or iterate with iter_chunks",
+        )
+
+
 class DataSaveError(DataManagerError):
     """Raised when data saving fails."""
 
@@ -34,3 +50,44 @@ class FileNotFoundError(DataManagerError):
 
     def __init__(self, path: str):
         super().__init__(f"File not found: {path}")
+
+
+class LockTimeoutError(DataManagerError):
+    """Raised when a file lock is not acquired within the timeout."""
+
+    def __init__(self, path: str, mode: str, timeout: float):
+        self.path = path
+        self.mode = mode
+        self.timeout = timeout
+        super().__init__(f"Timed out after {timeout}s waiting for {mode} lock on '{path}'")
+
+
+class LockError(DataManagerError):
+    """Raised when the lock files for a write cannot be created."""
+
+    def __init__(self, path: str, mode: str, reason: str):
+        self.path = path
+        self.mode = mode
+        super().__init__(f"Cannot take {mode} lock on '{path}': {reason}")
+
+
+class ContractViolationError(DataManagerError):
+    """Raised when data violates an enforced schema contract."""
+
+    def __init__(self, path: str, report: dict):
+        self.path = path
+        self.report = report
+        columns = sorted({v["column"] for v in report["violations"]})
+        super().__init__(
+            f"'{path}' violates its schema contract: {len(report['violations'])} "
+            f"violation(s) in {', '.join(columns)}"
+        )
+
+
+class OperationCancelledError(DataManagerError):
+    """Raised when an operation stops because its cancellation token was cancelled."""
+
+    def __init__(self, operation: str, reason: Optional[str] = None):
+        self.operation = operation
+        self.reason = reason
+        super().__init__(f"{operation} cancelled" + (f": {reason}" if reason else ""))
@@ -0,0 +1,211 @@
+"""Row-offset index sidecars for random access into CSV and JSONL files.
+
+The index records the byte offset of every ``ROW_INDEX_STRIDE``-th record, so
+a window of rows is read by seeking to the nearest indexed record and parsing
+at most ``stride - 1`` extra rows. CSV scanning is quote-aware: newlines inside
+quoted fields do not end a record. Blank lines are not records, since pandas
+skips them too.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .utils import sniff_compression
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+
+
+def index_path_for(path: Path) -> Path:
+    """Return the sidecar path holding the row index of ``path``."""
+    from .config import ROW_INDEX_SUFFIX
+
+    return path.with_suffix(path.suffix + ROW_INDEX_SUFFIX)
+
+
+def build_row_index(path: Path, stride: Optional[int] = None) -> Dict[str, Any]:
+    """Scan ``path`` once and write its row-offset index sidecar.
+
+    The MD5 checksum is computed in the same pass, so it matches
+    ``metadata.calculate_checksum`` without a second read.
+    """
+    import numpy as np
+
+    from .config import ROW_INDEX_BLOCK_SIZE, ROW_INDEX_FORMATS, ROW_INDEX_STRIDE
+
+    suffix = path.suffix.lower()
+    if suffix not in ROW_INDEX_FORMATS:
+        raise ValueError(f"Row index not supported for '{suffix}' files")
+    if sniff_compression(path) is not None:
+        raise ValueError("Row index requires an uncompressed file")
+
+    stride = stride or ROW_INDEX_STRIDE
+    quote_aware = suffix == ".csv"
+    # CSV record 0 is the header; data row d is record d + 1.
+    header_records = 1 if suffix == ".csv" else 0
+
+    checksum = hashlib.md5()
+    offsets = []
+    records = 0
+    # Absolute position of the last record boundary (-1: none yet), so the
+    # record in progress starts at ``boundary + 1``.
+    boundary = -1
+    in_quotes = False
+    position = 0
+    last_byte = b""
+
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(ROW_INDEX_BLOCK_SIZE), b""):
+            checksum.update(block)
+            data = np.frombuffer(block, dtype=np.uint8)
+            newlines = np.flatnonzero(data == 0x0A)
+            if quote_aware:
+                quotes = np.flatnonzero(data == 0x22)
+                parity = (np.searchsorted(quotes, newlines) + in_quotes) % 2
+                newlines = newlines[parity == 0]
+                in_quotes = bool((len(quotes) + in_quotes) % 2)
+
+            # Records ended by this block's newlines; blank ones ("" or "\r"),
+            # which pandas skips, get no row number.
+            ends = newlines + position
+            starts = np.concatenate(([boundary], ends))[:-1] + 1
+            previous = data[np.maximum(newlines - 1, 0)]
+            if len(newlines) and newlines[0] == 0:
+                previous[0] = last_byte[0] if last_byte else 0
+            lengths = ends - starts
+            filled = (lengths > 1) | ((lengths == 1) & (previous != 0x0D))
+            rows = records + np.cumsum(filled) - 1 - header_records
+            keep = filled & (rows >= 0) & (rows % stride == 0)
+            offsets.extend(starts[keep].tolist())
+
+            records += int(filled.sum())
+            if len(ends):
+                boundary = int(ends[-1])
+            position += len(block)
+            last_byte = block[-1:]
+
+    # A final record without a trailing newline
+    tail = position - boundary - 1
+    if tail > 1 or (tail == 1 and last_byte != b"\r"):
+        row = records - header_records
+        if row >= 0 and row % stride == 0:
+            offsets.append(boundary + 1)
+        records += 1
+    row_count = max(records - header_records, 0)
+
+    stat = path.stat()
+    index = {
+        "version": INDEX_VERSION,
+        "format": suffix,
+        "checksum": checksum.hexdigest(),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "stride": stride,
+        "row_count": row_count,
+        "offsets": offsets,
+    }
+    _write_index(path, index)
+    logger.debug("Indexed %s rows of %s (stride %s)", row_count, path, stride)
+    return index
+
+
+def _write_index(path: Path, index: Dict[str, Any]) -> None:
+    with open(index_path_for(path), "w", encoding="utf-8") as f:
+        json.dump(index, f)
+
+
+def load_row_index(path: Path) -> Optional[Dict[str, Any]]:
+    """Load the row index sidecar of ``path``, or None if absent or unreadable."""
+    index_path = index_path_for(path)
+    if not index_path.exists():
+        return None
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return index if index.get("version") == INDEX_VERSION else None
+
+
+def get_row_index(path: Path, stride: Optional[int] = None) -> Dict[str, Any]:
+    """Return a current row index for ``path``, rebuilding it when the file changed.
+
+    Size and mtime are checked first; when only the mtime moved, the checksum
+    decides whether the content (and so the index) actually changed.
+    """
+    from .metadata import calculate_checksum
+
+    index = load_row_index(path)
+    if index is not None and (stride is None or index["stride"] == stride):
+        stat = path.stat()
+        if index["size"] == stat.st_size and index["mtime_ns"] == stat.st_mtime_ns:
+            return index
+        if index["size"] == stat.st_size and index["checksum"] == calculate_checksum(path):
+            index["mtime_ns"] = stat.st_mtime_ns
+            _write_index(path, index)
+            return index
+    return build_row_index(path, stride)
+
+
+def read_indexed_rows(
+    path: Path,
+    start: int,
+    stop: int,
+    index: Optional[Dict[str, Any]] = None,
+    names: Optional[List[str]] = None,
+    **kwargs,
+) -> pd.DataFrame:
+    """Read rows ``[start, stop)`` of a CSV or JSONL file through its row index.
+
+    When reading several windows of the same file, pass ``index`` (from
+    ``get_row_index``) to skip re-validating the sidecar and, for CSV,
+    ``names`` (the header's column names) to skip re-reading the header.
+    """
+    import pandas as pd
+
+    from .config import READER_DEFAULTS
+
+    if index is None:
+        index = get_row_index(path)
+    stop = min(stop, index["row_count"])
+    suffix = path.suffix.lower()
+
+    if suffix == ".csv":
+        defaults = READER_DEFAULTS[".csv"].copy()
+        defaults.pop("low_memory", None)
+        defaults.update(kwargs)
+        defaults.pop("header", None)
+        if names is None:
+            names = list(pd.read_csv(path, nrows=0, **defaults).columns)
+    if start >= stop:
+        if names is None and index["row_count"]:
+            with open(path, "rb") as f:
+                names = list(json.loads(f.readline()))
+        return pd.DataFrame(columns=names)
+
+    stride = index["stride"]
+    skip = start % stride
+    with open(path, "rb") as f:
+        f.seek(index["offsets"][start // stride])
+        if suffix == ".csv":
+            df = pd.read_csv(f, header=None, names=names, nrows=skip + stop - start, **defaults)
+        else:
+            records = (line for line in f if line not in (b"\n", b"\r\n", b"\r"))
+            lines = b"".join(islice(records, skip, skip + stop - start))
+            df = pd.read_json(io.BytesIO(lines), lines=True, orient="records", **kwargs)
+            skip = 0
+
+    df = df.iloc[skip:]
+    df.index = pd.RangeIndex(start, start + len(df))
+    return df
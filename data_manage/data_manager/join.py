@@ -0,0 +1,424 @@
+"""Out-of-core hash joins.
+
+:class:`HashJoin` loads the build side (the smaller input) into memory as one
+Arrow table and indexes its keys once. It then streams the probe side chunk
+by chunk, looking each chunk's keys up in that index and taking the matching
+rows of both sides. Rows of the build side that an outer join must keep are
+tracked by row number and emitted once the probe side is exhausted.
+
+If the build side outgrows ``JOIN_MEMORY_BUDGET_BYTES`` while loading, both
+inputs are hash-partitioned by key into Arrow IPC files (a grace hash join).
+Matching keys always land in the same partition, so each partition pair is
+then joined in memory on its own.
+
+Key columns are cast to one type per key before either path, chosen from the
+first chunk of each side: integers stay int64, mixed integers and floats
+become float64 and any other mix becomes string. Null keys never match, as
+in SQL.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import tempfile
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .utils import hash_key_columns
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# Join types accepted by DataManager.join
+JOIN_TYPES = ("inner", "left", "right", "outer")
+
+
+def key_types(schemas: Iterable[pa.Schema], keys: List[str]) -> Dict[str, pa.DataType]:
+    """The type each key column is cast to on both sides; keys only null so far are left out."""
+    import pyarrow as pa
+
+    targets: Dict[str, pa.DataType] = {}
+    for key in keys:
+        types = set()
+        for schema in schemas:
+            type_ = schema.field(key).type
+            if pa.types.is_dictionary(type_):
+                type_ = type_.value_type
+            if not pa.types.is_null(type_):
+                types.add(type_)
+        if len(types) == 1:
+            targets[key] = types.pop()
+        elif types and all(pa.types.is_integer(t) for t in types):
+            targets[key] = pa.int64()
+        elif types and all(pa.types.is_integer(t) or pa.types.is_floating(t) for t in types):
+            targets[key] = pa.float64()
+        elif types:
+            targets[key] = pa.string()
+    return targets
+
+
+def normalize_keys(table: pa.Table, targets: Dict[str, pa.DataType]) -> pa.Table:
+    """Cast the key columns of ``table`` to their ``targets`` types."""
+    for key, target in targets.items():
+        index = table.schema.get_field_index(key)
+        if table.schema.field(index).type != target:
+            table = table.set_column(index, key, table.column(key).cast(target))
+    return table
+
+
+def _key_values(column: pa.ChunkedArray) -> Tuple[np.ndarray, np.ndarray]:
+    """Values of a key column for a pandas index lookup, and which of them are not null."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    array = column.combine_chunks()
+    valid = array.is_valid().to_numpy(zero_copy_only=False)
+    if pa.types.is_integer(array.type):
+        # Nulls are masked by ``valid``; filling them keeps integers exact.
+        array = pc.fill_null(array, 0)
+    return array.to_numpy(zero_copy_only=False), valid
+
+
+class KeyIndex:
+    """Hash index of a build table's key columns, built once and probed per chunk.
+
+    Each key column is factorized into a ``pd.Index`` of its distinct values,
+    whose hash table pandas builds on first lookup and keeps. Several keys
+    are combined one at a time into dense group codes. Build rows are sorted
+    by group, so the matches of a probe row are one contiguous run.
+    """
+
+    def __init__(self, build: pa.Table, keys: List[str]):
+        import numpy as np
+        import pandas as pd
+
+        self.keys = keys
+        self._levels: List[pd.Index] = []
+        self._groups: List[pd.Index] = []
+        codes: Optional[np.ndarray] = None
+        for key in keys:
+            values, valid = _key_values(build.column(key))
+            key_codes = np.full(len(values), -1, dtype=np.int64)
+            key_codes[valid], uniques = pd.factorize(values[valid])
+            self._levels.append(pd.Index(uniques))
+            if codes is None:
+                codes = key_codes
+                continue
+            valid = (codes >= 0) & (key_codes >= 0)
+            combined = codes * len(uniques) + key_codes
+            codes = np.full(len(codes), -1, dtype=np.int64)
+            codes[valid], groups = pd.factorize(combined[valid])
+            self._groups.append(pd.Index(groups))
+
+        groups = len(self._groups[-1]) if self._groups else len(self._levels[0])
+        rows = np.flatnonzero(codes >= 0)
+        self._order = rows[np.argsort(codes[rows], kind="stable")]
+        self._counts = np.bincount(codes[rows], minlength=groups)
+        self._starts = np.cumsum(self._counts) - self._counts
+
+    def _codes(self, probe: pa.Table) -> np.ndarray:
+        """Group code of each probe row, -1 where its key is null or not in the build side."""
+        import numpy as np
+
+        codes: Optional[np.ndarray] = None
+        for level, (key, index) in enumerate(zip(self.keys, self._levels)):
+            values, valid = _key_values(probe.column(key))
+            key_codes = np.full(len(values), -1, dtype=np.int64)
+            key_codes[valid] = index.get_indexer(values[valid])
+            if codes is None:
+                codes = key_codes
+                continue
+            valid = (codes >= 0) & (key_codes >= 0)
+            combined = codes * len(index) + key_codes
+            codes = np.full(len(codes), -1, dtype=np.int64)
+            codes[valid] = self._groups[level - 1].get_indexer(combined[valid])
+        return codes
+
+    def match(self, probe: pa.Table) -> Tuple[np.ndarray, np.ndarray]:
+        """Row numbers of every matching (probe, build) pair."""
+        import numpy as np
+
+        if not len(self._counts):
+            none = np.zeros(0, dtype=np.int64)
+            return none, none
+        codes = self._codes(probe)
+        found = codes >= 0
+        counts = np.where(found, self._counts[np.where(found, codes, 0)], 0)
+        probe_rows = np.repeat(np.arange(len(codes)), counts)
+        run_starts = np.repeat(self._starts[np.where(found, codes, 0)], counts)
+        offsets = np.arange(len(probe_rows)) - np.repeat(np.cumsum(counts) - counts, counts)
+        return probe_rows, self._order[run_starts + offsets]
+
+
+def _take(table: pa.Table, rows: np.ndarray) -> pa.Table:
+    """Rows of ``table``, with an all-null row wherever ``rows`` is -1."""
+    import numpy as np
+    import pyarrow as pa
+
+    missing = rows < 0
+    indices = pa.array(np.where(missing, 0, rows), type=pa.int64(), mask=missing)
+    return table.take(indices)
+
+
+class HashJoin:
+    """Join two streams of Arrow tables, spilling both to disk if needed.
+
+    Args:
+        keys: Join key columns, present on both sides.
+        how: One of ``inner``, ``left``, ``right`` or ``outer``.
+        memory_budget: Build-side bytes held in memory before partitioning
+            (defaults to ``JOIN_MEMORY_BUDGET_BYTES``).
+        suffixes: Suffixes for non-key columns present on both sides.
+        spill_dir: Directory for partition files (defaults to the system temp dir).
+    """
+
+    def __init__(
+        self,
+        keys: List[str],
+        how: str = "inner",
+        memory_budget: Optional[int] = None,
+        suffixes: Tuple[str, str] = ("_x", "_y"),
+        spill_dir: Optional[Union[str, Path]] = None,
+    ):
+        from .config import JOIN_MEMORY_BUDGET_BYTES, JOIN_SPILL_PARTITIONS
+
+        if how not in JOIN_TYPES:
+            raise ValueError(f"Unsupported join type {how!r}; expected one of {list(JOIN_TYPES)}")
+        if not keys:
+            raise ValueError("join requires at least one key column")
+        self.keys = keys
+        self.how = how
+        self.memory_budget = memory_budget or JOIN_MEMORY_BUDGET_BYTES
+        self.partitions = JOIN_SPILL_PARTITIONS
+        self.suffixes = suffixes
+        self.spill_dir = spill_dir
+        self.strategy = "in_memory"
+        self.spilled_bytes = 0
+        self.rows_written = 0
+        self._columns: Optional[List[str]] = None
+        self._schemas: Dict[str, pa.Schema] = {}
+
+    def _keeps(self, side: str) -> bool:
+        return self.how in ("outer", side)
+
+    def _combine(
+        self, left: pa.Table, left_rows: np.ndarray, right: pa.Table, right_rows: np.ndarray
+    ) -> pa.Table:
+        """Output rows pairing ``left_rows`` with ``right_rows`` (-1 for no row on that side).
+
+        Keys come from whichever side has the row; non-key columns present
+        on both sides get ``suffixes``.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        left, right = _take(left, left_rows), _take(right, right_rows)
+        left_names = [c for c in left.column_names if c not in self.keys]
+        right_names = [c for c in right.column_names if c not in self.keys]
+        shared = set(left_names) & set(right_names)
+        names, columns = [], []
+        for key in self.keys:
+            names.append(key)
+            columns.append(pc.coalesce(left.column(key), right.column(key)))
+        for table, table_names, suffix in (
+            (left, left_names, self.suffixes[0]),
+            (right, right_names, self.suffixes[1]),
+        ):
+            for name in table_names:
+                names.append(name + suffix if name in shared else name)
+                columns.append(table.column(name))
+        return pa.Table.from_arrays(columns, names=names)
+
+    def _pair(
+        self,
+        build_side: str,
+        build: pa.Table,
+        build_rows: np.ndarray,
+        probe: pa.Table,
+        probe_rows: np.ndarray,
+    ) -> pa.Table:
+        if build_side == "left":
+            return self._combine(build, build_rows, probe, probe_rows)
+        return self._combine(probe, probe_rows, build, build_rows)
+
+    def _emit(self, table: pa.Table, sink: Callable[[pa.Table], None]) -> None:
+        if self._columns is None:
+            self._columns = table.column_names
+        sink(table.select(self._columns))
+        self.rows_written += table.num_rows
+
+    def _join_in_memory(
+        self,
+        build_side: str,
+        build: pa.Table,
+        probe_tables: Iterable[pa.Table],
+        sink: Callable[[pa.Table], None],
+    ) -> None:
+        import numpy as np
+
+        probe_side = "right" if build_side == "left" else "left"
+        keep_build = self._keeps(build_side)
+        keep_probe = self._keeps(probe_side)
+        index = KeyIndex(build, self.keys)
+        matched = np.zeros(build.num_rows, dtype=bool)
+
+        for table in probe_tables:
+            self._schemas.setdefault(probe_side, table.schema)
+            if not table.num_rows:
+                continue
+            probe_rows, build_rows = index.match(table)
+            if keep_build:
+                matched[build_rows] = True
+            if keep_probe:
+                unmatched = np.ones(table.num_rows, dtype=bool)
+                unmatched[probe_rows] = False
+                extra = np.flatnonzero(unmatched)
+                probe_rows = np.concatenate([probe_rows, extra])
+                build_rows = np.concatenate([build_rows, np.full(len(extra), -1)])
+            if len(probe_rows):
+                self._emit(self._pair(build_side, build, build_rows, table, probe_rows), sink)
+
+        if keep_build and not matched.all():
+            unmatched_rows = np.flatnonzero(~matched)
+            probe_schema = self._schemas.get(probe_side)
+            if probe_schema is None:
+                self._emit(build.take(unmatched_rows), sink)
+            else:
+                none = np.full(len(unmatched_rows), -1)
+                probe = probe_schema.empty_table()
+                self._emit(self._pair(build_side, build, unmatched_rows, probe, none), sink)
+
+    def _normalized(
+        self, build: Iterable[pa.Table], probe: Iterable[pa.Table]
+    ) -> Tuple[Iterator[pa.Table], Iterator[pa.Table]]:
+        """Both streams with their key columns cast to the types of :func:`key_types`.
+
+        Reads the first table of each stream to choose the types, so the
+        in-memory and partitioned paths hash and compare the same values.
+        """
+        streams = [iter(build), iter(probe)]
+        firsts = [next(stream, None) for stream in streams]
+        targets = key_types([t.schema for t in firsts if t is not None], self.keys)
+
+        def cast(first: Optional[pa.Table], rest: Iterator[pa.Table]) -> Iterator[pa.Table]:
+            if first is None:
+                return
+            for table in itertools.chain([first], rest):
+                yield normalize_keys(table, targets)
+
+        return cast(firsts[0], streams[0]), cast(firsts[1], streams[1])
+
+    def _load(self, tables: Iterator[pa.Table]) -> Tuple[List[pa.Table], bool]:
+        """Read build-side tables until exhausted (True) or over budget (False)."""
+        loaded: List[pa.Table] = []
+        size = 0
+        for table in tables:
+            loaded.append(table)
+            size += table.nbytes
+            if size > self.memory_budget:
+                return loaded, False
+        return loaded, True
+
+    def _partition(
+        self, tables: Iterable[pa.Table], directory: Path, side: str
+    ) -> Dict[int, List[Path]]:
+        """Split a stream into per-partition IPC files by key hash."""
+        import numpy as np
+        import pyarrow.feather as feather
+
+        files: Dict[int, List[Path]] = {}
+        for table in tables:
+            self._schemas.setdefault(side, table.schema)
+            if not table.num_rows:
+                continue
+            ids = hash_key_columns(table, self.keys) % self.partitions
+            for partition in np.unique(ids):
+                part = table.take(np.flatnonzero(ids == partition))
+                paths = files.setdefault(int(partition), [])
+                path = directory / f"{side}-{int(partition)}-{len(paths)}.arrow"
+                feather.write_feather(part, path)
+                paths.append(path)
+                self.spilled_bytes += part.nbytes
+        return files
+
+    def run(
+        self,
+        left: Iterable[pa.Table],
+        right: Iterable[pa.Table],
+        sink: Callable[[pa.Table], None],
+        build_side: str = "right",
+    ) -> None:
+        """Join ``left`` with ``right``, passing result tables to ``sink``.
+
+        ``build_side`` names the input expected to be smaller; it is the one
+        held in memory (or partitioned first when it does not fit).
+        """
+        import numpy as np
+        import pyarrow as pa
+        import pyarrow.feather as feather
+
+        build_tables, probe_tables = self._normalized(
+            left if build_side == "left" else right, right if build_side == "left" else left
+        )
+        probe_side = "right" if build_side == "left" else "left"
+
+        loaded, fits = self._load(build_tables)
+        if loaded:
+            self._schemas[build_side] = loaded[0].schema
+
+        if fits:
+            if loaded:
+                build = pa.concat_tables(loaded, promote_options="permissive")
+                self._join_in_memory(build_side, build, probe_tables, sink)
+            elif self._keeps(probe_side):
+                # Nothing to match against: probe rows pass through.
+                for table in probe_tables:
+                    self._schemas.setdefault(probe_side, table.schema)
+                    if table.num_rows:
+                        self._emit(table, sink)
+        else:
+            self.strategy = "partitioned"
+            tempdir = tempfile.TemporaryDirectory(prefix="dm-join-", dir=self.spill_dir)
+            directory = Path(tempdir.name)
+            try:
+                chunks = (table for tables in (loaded, build_tables) for table in tables)
+                build_files = self._partition(chunks, directory, build_side)
+                probe_files = self._partition(probe_tables, directory, probe_side)
+                logger.debug(
+                    "Partitioned join inputs into %s (%s bytes)", directory, self.spilled_bytes
+                )
+                build_schema = self._schemas[build_side]
+                for partition in range(self.partitions):
+                    parts = [feather.read_table(p) for p in build_files.get(partition, [])]
+                    probe_paths = probe_files.get(partition, [])
+                    if not parts and not (probe_paths and self._keeps(probe_side)):
+                        continue
+                    if parts:
+                        build = pa.concat_tables(parts, promote_options="permissive")
+                    else:
+                        build = build_schema.empty_table()
+                    probe = (feather.read_table(p) for p in probe_paths)
+                    self._join_in_memory(build_side, build, probe, sink)
+            finally:
+                tempdir.cleanup()
+
+        if self._columns is None and len(self._schemas) == 2:
+            # No rows matched: still produce the output columns.
+            empty = {side: schema.empty_table() for side, schema in self._schemas.items()}
+            none = np.zeros(0, dtype=np.int64)
+            self._emit(self._combine(empty["left"], none, empty["right"], none), sink)
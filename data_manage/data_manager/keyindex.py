@@ -0,0 +1,321 @@
+"""Key index sidecars for point lookups in Parquet files and datasets.
+
+The index holds one row per (file, row group) with the key column's min, max
+and a bloom filter over its values. It is stored as an Arrow IPC file next to
+the data (``<file>.parquet.keyidx.arrow``, or ``_keyidx.arrow`` inside a
+dataset directory, where dataset readers skip it). A lookup reads only the
+row groups whose range covers a requested key and whose bloom filter may
+contain it.
+
+Keys are hashed with ``utils.hash_key_columns``, so integer and float
+spellings of the same number find the same rows.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from .utils import hash_key_columns, list_parquet_files
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# Dataset directories keep their index inside, under a name readers skip
+_DATASET_INDEX_NAME = "_keyidx.arrow"
+
+
+def key_index_path_for(path: Path) -> Path:
+    """Return the sidecar path holding the key index of a file or dataset directory."""
+    from .config import KEY_INDEX_SUFFIX
+
+    if path.is_dir():
+        return path / _DATASET_INDEX_NAME
+    return path.with_suffix(path.suffix + KEY_INDEX_SUFFIX)
+
+
+def _bloom_positions(hashes: np.ndarray, bits: int, probes: int) -> np.ndarray:
+    """Bit positions for each hash by double hashing; ``bits`` is a power of two."""
+    import numpy as np
+
+    h1 = hashes & np.uint64(0xFFFFFFFF)
+    h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+    steps = np.arange(probes, dtype=np.uint64)
+    return (h1[:, None] + steps[None, :] * h2[:, None]) & np.uint64(bits - 1)
+
+
+def _bloom_filter(hashes: np.ndarray, bits_per_key: int, probes: int) -> bytes:
+    import numpy as np
+
+    bits = 64
+    while bits < len(hashes) * bits_per_key:
+        bits *= 2
+    bitmap = np.zeros(bits, dtype=bool)
+    bitmap[_bloom_positions(hashes, bits, probes).ravel()] = True
+    return np.packbits(bitmap).tobytes()
+
+
+def _bloom_contains(bloom: bytes, hashes: np.ndarray, probes: int) -> np.ndarray:
+    """True for each hash that may be in the filter."""
+    import numpy as np
+
+    bitmap = np.unpackbits(np.frombuffer(bloom, dtype=np.uint8)).astype(bool)
+    return bitmap[_bloom_positions(hashes, len(bitmap), probes)].all(axis=1)
+
+
+def _file_state(path: Path) -> Dict[str, int]:
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _index_file(file_path: Path, key: str) -> Dict[str, list]:
+    """Min, max and bloom filter of ``key`` for every row group of one file."""
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    from .config import KEY_INDEX_BLOOM_BITS_PER_KEY, KEY_INDEX_BLOOM_PROBES
+
+    parquet_file = pq.ParquetFile(file_path)
+    if key not in parquet_file.schema_arrow.names:
+        raise ValueError(f"Key column '{key}' not in {file_path}")
+    entries: Dict[str, list] = {"row_group": [], "min": [], "max": [], "bloom": []}
+    for i in range(parquet_file.num_row_groups):
+        table = parquet_file.read_row_group(i, columns=[key])
+        column = table.column(key)
+        bounds = pc.min_max(column)
+        hashes = hash_key_columns(table.filter(pc.is_valid(column)), [key])
+        entries["row_group"].append(i)
+        entries["min"].append(bounds["min"].as_py())
+        entries["max"].append(bounds["max"].as_py())
+        entries["bloom"].append(
+            _bloom_filter(hashes, KEY_INDEX_BLOOM_BITS_PER_KEY, KEY_INDEX_BLOOM_PROBES)
+        )
+    return entries
+
+
+def _write_key_index(
+    path: Path,
+    key: str,
+    entries: Dict[str, Dict[str, list]],
+    states: Dict[str, Dict[str, int]],
+    key_type: Any,
+) -> pa.Table:
+    """Assemble per-file entries (in file order) into an index table and write it.
+
+    ``states`` holds the size and mtime each file had when it was indexed,
+    including files without row groups (and so without entries).
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    from .config import KEY_INDEX_BLOOM_PROBES
+
+    columns: Dict[str, list] = {"file": [], "row_group": [], "min": [], "max": [], "bloom": []}
+    for name in sorted(entries):
+        columns["file"].extend([name] * len(entries[name]["row_group"]))
+        for field in ("row_group", "min", "max", "bloom"):
+            columns[field].extend(entries[name][field])
+
+    index = pa.table(
+        {
+            "file": pa.array(columns["file"], pa.string()),
+            "row_group": pa.array(columns["row_group"], pa.int32()),
+            "min": pa.array(columns["min"], key_type),
+            "max": pa.array(columns["max"], key_type),
+            "bloom": pa.array(columns["bloom"], pa.binary()),
+        }
+    )
+    info = {
+        "version": INDEX_VERSION,
+        "key": key,
+        "probes": KEY_INDEX_BLOOM_PROBES,
+        "files": {name: states[name] for name in sorted(states)},
+    }
+    index = index.replace_schema_metadata({"keyindex": json.dumps(info)})
+    feather.write_feather(index, key_index_path_for(path), compression="uncompressed")
+    logger.debug("Indexed key %r over %s row groups of %s", key, index.num_rows, path)
+    return index
+
+
+def _key_type(path: Path, key: str) -> Any:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    files = list_parquet_files(path)
+    return pq.read_schema(files[0]).field(key).type if files else pa.null()
+
+
+def build_key_index(path: Path, key: str) -> pa.Table:
+    """Scan the key column of a Parquet file or dataset and write its key index."""
+    root = path if path.is_dir() else path.parent
+    entries, states = {}, {}
+    for file_path in list_parquet_files(path):
+        name = file_path.relative_to(root).as_posix()
+        states[name] = _file_state(file_path)
+        entries[name] = _index_file(file_path, key)
+    return _write_key_index(path, key, entries, states, _key_type(path, key))
+
+
+def update_key_index(path: Path, changed: Iterable[Path]) -> Optional[pa.Table]:
+    """Re-index only ``changed`` files (rewritten, added or deleted) of an indexed dataset.
+
+    Returns None when ``path`` has no key index to update.
+    """
+    import pyarrow.feather as feather
+
+    index_path = key_index_path_for(path)
+    if not index_path.exists():
+        return None
+    index = feather.read_table(index_path)
+    info = key_index_info(index)
+    key = info["key"]
+    states = dict(info["files"])
+    root = path if path.is_dir() else path.parent
+    changed_names = {file_path.relative_to(root).as_posix() for file_path in changed}
+
+    entries: Dict[str, Dict[str, list]] = {}
+    for row in index.to_pylist():
+        if row["file"] in changed_names:
+            continue
+        entry = entries.setdefault(
+            row["file"], {"row_group": [], "min": [], "max": [], "bloom": []}
+        )
+        for field in ("row_group", "min", "max", "bloom"):
+            entry[field].append(row[field])
+    for name in changed_names:
+        states.pop(name, None)
+        if (root / name).exists():
+            states[name] = _file_state(root / name)
+            entries[name] = _index_file(root / name, key)
+    return _write_key_index(path, key, entries, states, _key_type(path, key))
+
+
+def load_key_index(path: Path) -> Optional[pa.Table]:
+    """Load the key index of ``path``, or None if absent, unreadable or stale."""
+    import pyarrow.feather as feather
+
+    index_path = key_index_path_for(path)
+    if not index_path.exists():
+        return None
+    try:
+        index = feather.read_table(index_path)
+        info = key_index_info(index)
+    except (OSError, ValueError, KeyError):
+        return None
+    if info.get("version") != INDEX_VERSION:
+        return None
+
+    root = path if path.is_dir() else path.parent
+    current = {
+        file_path.relative_to(root).as_posix(): _file_state(file_path)
+        for file_path in list_parquet_files(path)
+    }
+    return index if current == info["files"] else None
+
+
+def key_index_info(index: pa.Table) -> Dict[str, Any]:
+    """Return the header (key column, bloom probes, indexed file states) of an index."""
+    return json.loads(index.schema.metadata[b"keyindex"])
+
+
+def get_key_index(path: Path, key: Optional[str] = None) -> pa.Table:
+    """Return a current key index for ``path``, (re)building it when needed.
+
+    ``key`` is required when no index exists yet; a stale index is rebuilt
+    on the key it was built with unless ``key`` names another.
+    """
+    import pyarrow.feather as feather
+
+    index = load_key_index(path)
+    if index is not None and key in (None, key_index_info(index)["key"]):
+        return index
+    if key is None:
+        index_path = key_index_path_for(path)
+        if not index_path.exists():
+            raise ValueError(f"No key index for {path}; pass the key column to build one")
+        key = key_index_info(feather.read_table(index_path))["key"]
+    return build_key_index(path, key)
+
+
+def candidate_row_groups(index: pa.Table, keys: pa.Array) -> Dict[str, List[int]]:
+    """Row groups per file that may hold any of ``keys`` (cast to the key type)."""
+    import numpy as np
+    import pyarrow as pa
+
+    info = key_index_info(index)
+    keys = keys.drop_null()
+    if not len(keys) or not index.num_rows:
+        return {}
+    ordered = np.sort(keys.to_numpy(zero_copy_only=False))
+    hashes = hash_key_columns(pa.table({info["key"]: pa.array(ordered, keys.type)}), [info["key"]])
+
+    has_range = index.column("min").is_valid().to_numpy(zero_copy_only=False)
+    mins = index.column("min").to_numpy(zero_copy_only=False)
+    maxs = index.column("max").to_numpy(zero_copy_only=False)
+    files = index.column("file").to_pylist()
+    row_groups = index.column("row_group").to_pylist()
+    blooms = index.column("bloom")
+
+    candidates: Dict[str, List[int]] = {}
+    for i in np.flatnonzero(has_range):
+        lo = np.searchsorted(ordered, mins[i], side="left")
+        hi = np.searchsorted(ordered, maxs[i], side="right")
+        if hi <= lo:
+            continue
+        if _bloom_contains(blooms[i].as_py(), hashes[lo:hi], info["probes"]).any():
+            candidates.setdefault(files[i], []).append(row_groups[i])
+    return candidates
+
+
+def lookup_rows(
+    path: Path,
+    keys: Iterable[Any],
+    index: pa.Table,
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """Read the rows of ``path`` whose key is in ``keys``, touching only candidate row groups.
+
+    ``row_groups_read`` and ``row_groups_total`` are recorded in attrs.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    info = key_index_info(index)
+    key = info["key"]
+    key_type = index.schema.field("min").type
+    values = pa.array(list(keys))
+    if values.type != key_type and not pa.types.is_null(key_type):
+        values = values.cast(key_type)
+
+    root = path if path.is_dir() else path.parent
+    read_columns = None if columns is None else list(dict.fromkeys([key, *columns]))
+    tables = []
+    candidates = candidate_row_groups(index, values)
+    for name, row_groups in candidates.items():
+        parquet_file = pq.ParquetFile(root / name)
+        table = parquet_file.read_row_groups(row_groups, columns=read_columns)
+        tables.append(table.filter(pc.is_in(table.column(key), value_set=values)))
+
+    if tables:
+        result = pa.concat_tables(tables, promote_options="permissive")
+    else:
+        schema = pq.read_schema(list_parquet_files(path)[0]) if index.num_rows else None
+        result = schema.empty_table() if schema is not None else pa.table({key: values[:0]})
+        if read_columns is not None and schema is not None:
+            result = result.select(read_columns)
+    if columns is not None:
+        result = result.select(columns)
+
+    df = result.to_pandas()
+    df.attrs["row_groups_read"] = sum(len(groups) for groups in candidates.values())
+    df.attrs["row_groups_total"] = index.num_rows
+    return df
@@ -0,0 +1,305 @@
+"""Cross-process reader-writer locks on data files.
+
+Each locked path has two lock files in the lock directory
+(``<base_path>/.locks`` by default), named by a hash of the path:
+
+* ``<hash>.lock``: held shared by readers and exclusively by a writer.
+* ``<hash>.gate``: a turnstile. A waiting writer holds it exclusively, so new
+  readers queue behind the writer instead of starving it.
+
+Locks are ``flock`` locks, so they work across processes and between
+threads, and the OS releases them when a process dies. A lock file is
+unlinked when it is released and no one else holds it; a process that locks
+a file after it was unlinked notices and retries on a fresh one. Where ``fcntl`` is
+unavailable (Windows), ``msvcrt`` locks are used and shared locks are
+exclusive too.
+
+Files without any write permission bits are treated as immutable. Reading
+them takes no lock. Neither do reads when the lock directory cannot be
+created or written (e.g. a read-only data directory without a separate
+``lock_dir``); writes then raise LockError.
+
+Nested acquisitions in the same context (a shared or exclusive lock under an
+exclusive one, or shared under shared) reuse the outer lock. The context is
+the ``contextvars`` context: a thread, an asyncio task, or one call that
+Starlette/anyio runs in a worker thread. A held lock belongs to the
+acquisition itself and not to any thread. So a generator holding a lock can
+be resumed or closed on any thread, and it releases only what it acquired.
+Upgrading a shared lock to exclusive in the same context is not supported
+and raises RuntimeError. For example, finish or close an ``iter_chunks``
+loop over a file before saving to that file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import stat
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, Optional
+
+from .exceptions import LockError, LockTimeoutError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+SHARED = "shared"
+EXCLUSIVE = "exclusive"
+
+
+class _Hold:
+    """One acquired lock; nested acquisitions in its context reuse it while active."""
+
+    __slots__ = ("mode", "active")
+
+    def __init__(self, mode: str):
+        self.mode = mode
+        self.active = True
+
+
+# Locks held in the current context, by lock file. Each acquisition sets a new
+# mapping rather than changing it in place, so copies of a context taken while
+# a lock is held do not see it released or re-acquired elsewhere.
+_held: ContextVar[Dict[Path, _Hold]] = ContextVar("data_manager_held_locks", default={})
+
+
+def is_immutable(path: Path) -> bool:
+    """True for an existing regular file that nobody may write to."""
+    try:
+        mode = path.stat().st_mode
+    except OSError:
+        return False
+    return stat.S_ISREG(mode) and not mode & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _try_lock(handle: IO[bytes], mode: str, blocking: bool) -> bool:
+    """Lock an open lock file; False if non-blocking and it is held elsewhere."""
+    if fcntl is not None:
+        operation = fcntl.LOCK_SH if mode == SHARED else fcntl.LOCK_EX
+        try:
+            fcntl.flock(handle.fileno(), operation | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            return False
+        return True
+    while True:  # pragma: no cover - Windows
+        try:
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            if not blocking:
+                return False
+            time.sleep(0.01)
+
+
+def _unlock(handle: IO[bytes]) -> None:
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    else:  # pragma: no cover - Windows
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _same_file(handle: IO[bytes], path: Path) -> bool:
+    """Whether ``path`` still names the file open as ``handle``."""
+    try:
+        current = os.stat(path)
+    except FileNotFoundError:
+        return False
+    opened = os.fstat(handle.fileno())
+    return (opened.st_dev, opened.st_ino) == (current.st_dev, current.st_ino)
+
+
+def _release(handle: IO[bytes], path: Path) -> None:
+    """Unlock and close a lock file, unlinking it first if no one else holds it.
+
+    Only an exclusive lock proves that; it is tried without blocking, and
+    failing it merely keeps the file. Waiters that opened the file before the
+    unlink retry once they get the lock (see ``LockManager._lock_file``).
+    """
+    try:
+        if _try_lock(handle, EXCLUSIVE, blocking=False):
+            path.unlink()
+    except OSError:
+        pass
+    finally:
+        _unlock(handle)
+        handle.close()
+
+
+class LockManager:
+    """Reader-writer locks for paths, with wait metrics.
+
+    Args:
+        lock_dir: Directory holding the lock files.
+        timeout: Default seconds to wait for a lock (None waits forever).
+
+    Attributes:
+        stats: Per mode: ``acquired``, ``timeouts``, ``wait_seconds`` (total)
+            and ``max_wait_seconds``; plus ``lock_free_reads`` of immutable
+            files and ``unlocked_reads`` taken without a lock because the
+            lock directory was unusable.
+    """
+
+    def __init__(self, lock_dir: Path, timeout: Optional[float] = None):
+        self.lock_dir = lock_dir
+        self.timeout = timeout
+        self.stats: Dict[str, Any] = {
+            mode: {"acquired": 0, "timeouts": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0}
+            for mode in (SHARED, EXCLUSIVE)
+        }
+        self.stats["lock_free_reads"] = 0
+        self.stats["unlocked_reads"] = 0
+        self._stats_lock = threading.Lock()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """A copy of ``stats``."""
+        with self._stats_lock:
+            return {k: dict(v) if isinstance(v, dict) else v for k, v in self.stats.items()}
+
+    def lock_path(self, path: Path) -> Path:
+        digest = hashlib.sha256(str(path).encode()).hexdigest()[:32]
+        return self.lock_dir / f"{digest}.lock"
+
+    def _open(self, path: Path) -> IO[bytes]:
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        handle = open(path, "a+b")
+        if fcntl is None:  # pragma: no cover - Windows locks a byte range
+            handle.seek(0)
+        return handle
+
+    def _lock_file(self, path: Path, mode: str, deadline: Optional[float]) -> Optional[IO[bytes]]:
+        """Open and lock the lock file ``path``; None once ``deadline`` passes.
+
+        A lock taken on a file that was unlinked (or replaced) while waiting
+        protects nothing, so it is dropped and taken again on the current file.
+        """
+        while True:
+            handle = self._open(path)
+            try:
+                if not self._wait(handle, mode, deadline):
+                    handle.close()
+                    return None
+                if _same_file(handle, path):
+                    return handle
+                _unlock(handle)
+            except BaseException:
+                handle.close()
+                raise
+            handle.close()
+
+    def _record(self, mode: str, waited: float, timed_out: bool = False) -> None:
+        with self._stats_lock:
+            stats = self.stats[mode]
+            stats["timeouts" if timed_out else "acquired"] += 1
+            stats["wait_seconds"] += waited
+            stats["max_wait_seconds"] = max(stats["max_wait_seconds"], waited)
+
+    def _wait(self, handle: IO[bytes], mode: str, deadline: Optional[float]) -> bool:
+        """Acquire ``handle`` in ``mode`` with backoff; False once ``deadline`` passes."""
+        from .config import LOCK_POLL_INTERVAL_SECONDS
+
+        if deadline is None:
+            return _try_lock(handle, mode, blocking=True)
+        delay = LOCK_POLL_INTERVAL_SECONDS
+        while not _try_lock(handle, mode, blocking=False):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.1)
+        return True
+
+    @contextmanager
+    def acquire(
+        self, path: Path, mode: str = SHARED, timeout: Optional[float] = -1
+    ) -> Iterator[float]:
+        """Hold a ``mode`` lock on ``path`` for the duration of the block.
+
+        Args:
+            path: Resolved data file or dataset directory path.
+            mode: ``SHARED`` or ``EXCLUSIVE``.
+            timeout: Seconds to wait; -1 uses the manager default, None waits
+                forever.
+
+        Yields:
+            Seconds spent waiting for the lock.
+
+        Raises:
+            LockTimeoutError: If the lock is not acquired in time.
+            LockError: If ``mode`` is exclusive and the lock directory cannot
+                be created or written.
+            RuntimeError: If ``mode`` is exclusive and this context already
+                holds a shared lock on ``path``.
+        """
+        lock_file = self.lock_path(path)
+        outer = _held.get().get(lock_file)
+        if outer is not None and outer.active:
+            if outer.mode == EXCLUSIVE or mode == SHARED:
+                yield 0.0
+                return
+            raise RuntimeError(
+                f"Cannot upgrade a shared lock on {path} to exclusive; "
+                "release the read (e.g. finish iterating the file) before writing it"
+            )
+        if mode == SHARED and is_immutable(path):
+            with self._stats_lock:
+                self.stats["lock_free_reads"] += 1
+            yield 0.0
+            return
+
+        timeout = self.timeout if timeout == -1 else timeout
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        gate_file = lock_file.with_suffix(".gate")
+        handle = None
+        unlocked = False
+        try:
+            # Readers pass the gate briefly; writers hold it until they own the lock.
+            gate = self._lock_file(gate_file, mode, deadline)
+            if gate is not None:
+                try:
+                    handle = self._lock_file(lock_file, mode, deadline)
+                finally:
+                    _release(gate, gate_file)
+        except OSError as e:
+            if mode == EXCLUSIVE:
+                raise LockError(str(path), mode, f"lock directory {self.lock_dir}: {e}") from e
+            with self._stats_lock:
+                self.stats["unlocked_reads"] += 1
+                first = self.stats["unlocked_reads"] == 1
+            log = logger.warning if first else logger.debug
+            log("Reading %s without a lock, the lock directory is unusable: %s", path, e)
+            unlocked = True
+        if unlocked:
+            yield 0.0
+            return
+
+        waited = time.monotonic() - started
+        if handle is None:
+            self._record(mode, waited, timed_out=True)
+            raise LockTimeoutError(str(path), mode, timeout)
+        self._record(mode, waited)
+        if waited > 1.0:
+            logger.info("Waited %.2fs for %s lock on %s", waited, mode, path)
+
+        hold = _Hold(mode)
+        _held.set({**_held.get(), lock_file: hold})
+        try:
+            yield waited
+        finally:
+            # This may run in another thread or context than the acquisition.
+            hold.active = False
+            held = _held.get()
+            if held.get(lock_file) is hold:
+                _held.set({k: v for k, v in held.items() if k != lock_file})
+            _release(handle, lock_file)
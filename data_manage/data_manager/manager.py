@@ -1,17 +1,91 @@
 """Main DataManager class."""
 
+from __future__ import annotations
+
+import fnmatch
 import logging
+import os
+import uuid
+from contextlib import ExitStack, nullcontext
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-import pandas as pd
+from .config import (
+    CONVERT_STATE_FILE,
+    DEFAULT_BASE_PATH,
+    DEFAULT_CHUNK_SIZE,
+    LOCK_DIR,
+    LOCK_TIMEOUT_SECONDS,
+    MAX_MEMORY_BYTES,
+    MEMORY_CHUNK_FRACTION,
+    METADATA_SUFFIX,
+    ROW_INDEX_FORMATS,
+    SAVE_MANY_MAX_WORKERS,
+    SHARED_CACHE_ENABLED,
+    SUPPORTED_READ_FORMATS,
+    SUPPORTED_WRITE_FORMATS,
+    VERSION_STORE_DIR,
+    VERSIONING_ENABLED,
+)
+from .contracts import SchemaContract, summarize
+from .diff import diff_tables
+from .exceptions import (
+    ContractViolationError,
+    DataLoadError,
+    DataSaveError,
+    FileNotFoundError,
+    MemoryBudgetError,
+    OperationCancelledError,
+    UnsupportedFormatError,
+)
+from .index import read_indexed_rows
+from .join import HashJoin
+from .keyindex import (
+    get_key_index,
+    key_index_info,
+    key_index_path_for,
+    load_key_index,
+    lookup_rows,
+)
+from .locking import EXCLUSIVE, SHARED, LockManager
+from .memory import (
+    PeakMemory,
+    concat_chunks,
+    estimate_load_bytes,
+    estimate_parquet_bytes,
+    frame_bytes,
+    read_head_within,
+)
+from .metadata import calculate_checksum, save_sidecar_metadata, with_serializable_attrs
+from .optimize import optimize_parquet
+from .progress import CancellationToken, ProgressCallback, ProgressTracker, tracker_for
+from .query import LazyFrame
+from .readers import CHUNK_READER_MAP, READER_MAP, combine_csv_chunks, read_parquet_rows
+from .sampling import reservoir_sample, sample_feather, sample_indexed, sample_parquet
+from .search import SearchIndex
+from .shared_cache import SharedCache
+from .storage import RemoteStorage, is_url
+from .upsert import upsert_parquet
+from .utils import list_parquet_files, sniff_compression
+from .versions import VersionStore
+from .writers import ARROW_WRITE_FORMATS, WRITER_MAP, ChunkWriter, write_table
 
-from .config import DEFAULT_BASE_PATH, SUPPORTED_READ_FORMATS, SUPPORTED_WRITE_FORMATS
-from .exceptions import DataLoadError, DataSaveError, FileNotFoundError, UnsupportedFormatError
-from .metadata import calculate_checksum, save_sidecar_metadata
-from .readers import READER_MAP
-from .writers import WRITER_MAP
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
 
 logger = logging.getLogger(__name__)
 
@@ -20,75 +94,1084 @@ class DataManager:
     """Unified data manager for multiple file formats.
 
     Attributes:
-        base_path: Root directory for data files.
+        base_path: Root directory for data files; with remote storage, the
+            local directory where writes are staged before upload.
+        storage: Remote storage when constructed with a URL, else None.
+        locks: Cross-process reader-writer locks on local files.
+        versioning: Whether ``save`` and ``upsert`` record dataset versions.
+        version_store: History of saved versions, under ``base_path``.
+        max_memory: Default memory budget in bytes for ``load`` (None: no limit).
+        contracts: Schema contracts by filename glob pattern (see ``set_contract``).
+        shared_cache: Cross-process cache of loaded frames, or None.
+        search_index: Index of file paths, column names and values behind
+            ``search``.
     """
 
-    def __init__(self, base_path: Union[str, Path] = DEFAULT_BASE_PATH):
+    def __init__(
+        self,
+        base_path: Union[str, Path] = DEFAULT_BASE_PATH,
+        versioning: bool = VERSIONING_ENABLED,
+        max_memory: Optional[int] = MAX_MEMORY_BYTES,
+        storage_options: Optional[Dict[str, Any]] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        lock_timeout: Optional[float] = LOCK_TIMEOUT_SECONDS,
+        lock_dir: Optional[Union[str, Path]] = None,
+        shared_cache: Union[bool, SharedCache] = SHARED_CACHE_ENABLED,
+    ):
         """Initialize DataManager.
 
         Args:
-            base_path: Base directory for data operations.
+            base_path: Base directory for data operations, or an fsspec URL
+                (``s3://bucket/data``, ``memory://data``, ``file:///srv/data``).
+            versioning: Record a version on every ``save`` (and single-file
+                ``upsert``), readable later with ``load(version=...)``.
+            max_memory: Bytes a single ``load`` may use, checked against an
+                estimate before reading; also sizes ``iter_chunks`` chunks.
+            storage_options: fsspec filesystem options for a URL base_path.
+            cache_dir: Local block cache for a URL base_path (defaults to
+                ``STORAGE_CACHE_DIR``).
+            lock_timeout: Seconds to wait for a file lock before raising
+                LockTimeoutError (None waits forever).
+            lock_dir: Directory for lock files (defaults to ``LOCK_DIR`` under
+                base_path). Point it elsewhere for a read-only base_path;
+                without a usable lock directory reads take no lock.
+            shared_cache: True (or a SharedCache) to share loaded frames with
+                other processes on this host through shared memory.
+
+        Raises:
+            ValueError: If versioning is requested for a URL base_path.
         """
-        self.base_path = Path(base_path).resolve()
-        self.base_path.mkdir(parents=True, exist_ok=True)
-        logger.info("DataManager initialized with base_path: %s", self.base_path)
+        self.storage: Optional[RemoteStorage] = None
+        if is_url(base_path):
+            if versioning:
+                raise ValueError("Versioning requires a local base_path")
+            self.storage = RemoteStorage(base_path, storage_options, cache_dir)
+            self.base_path = self.storage.staging_dir
+        else:
+            self.base_path = Path(base_path).resolve()
+            self.base_path.mkdir(parents=True, exist_ok=True)
+        self.versioning = versioning
+        self.max_memory = max_memory
+        self.version_store = VersionStore(self.base_path / VERSION_STORE_DIR)
+        self.locks = LockManager(
+            Path(lock_dir).resolve() if lock_dir else self.base_path / LOCK_DIR, lock_timeout
+        )
+        self.contracts: Dict[str, SchemaContract] = {}
+        self.shared_cache: Optional[SharedCache] = None
+        if isinstance(shared_cache, SharedCache):
+            self.shared_cache = shared_cache
+        elif shared_cache:
+            self.shared_cache = SharedCache()
+        self.search_index = SearchIndex(self)
+        logger.info("DataManager initialized with base_path: %s", base_path)
 
-    def load(self, filename: str, **kwargs) -> pd.DataFrame:
+    def load(
+        self,
+        filename: str,
+        version: Optional[int] = None,
+        as_of: Union[datetime, str, None] = None,
+        max_memory: Optional[int] = None,
+        on_exceed: str = "raise",
+        progress: Optional[ProgressCallback] = None,
+        cancel: Optional[CancellationToken] = None,
+        **kwargs,
+    ) -> pd.DataFrame:
         """Load any supported format into a DataFrame.
 
+        With a memory budget (``max_memory`` here or on the manager), the
+        in-memory size is estimated first from Parquet/Feather footers, a
+        parsed CSV sample or the file size. Loads estimated over budget
+        raise, or with ``on_exceed="head"`` stream only the leading rows
+        that fit. Selecting ``columns`` narrows the estimate.
+
+        With ``progress`` or ``cancel``, CSV, JSONL, Parquet, Feather and
+        single-sheet .xlsx files are read chunk by chunk (CSV columns are
+        then typed per chunk, as with ``iter_chunks``), reporting after each
+        chunk and stopping at the next chunk boundary once cancelled.
+        Other loads can only be cancelled before or after the read.
+
         Args:
             filename: Name or relative path of file to load.
+            version: Load this recorded version instead of the current file.
+            as_of: Load the latest version recorded at or before this time
+                (datetime or ISO string).
+            max_memory: Memory budget in bytes for this load, overriding the
+                manager's.
+            on_exceed: ``"raise"`` or ``"head"`` for over-budget loads.
+            progress: Called with (bytes_done, bytes_total, rows) as the
+                read advances.
+            cancel: Token that stops the load when cancelled.
             **kwargs: Format-specific arguments passed to pandas reader.
 
         Returns:
-            pd.DataFrame with metadata in df.attrs.
+            pd.DataFrame with metadata in df.attrs. Excel loads with
+            ``sheet_name=None`` or a list return a dict of DataFrames instead.
+            ``lock_wait_seconds`` records the wait for the shared file lock,
+            and ``contract_report`` the result of a matching schema contract.
+            With a shared cache, ``shared_cache`` is ``"hit"``, ``"stored"``
+            or ``"miss"``; budgeted loads only use entries within budget.
+            Budgeted loads add ``memory_estimate_bytes``, ``memory_bytes``
+            (size of the result), ``memory_peak_bytes`` (highest resident
+            memory growth sampled during the read, at least ``memory_bytes``)
+            and ``truncated`` (plus ``row_count_estimate`` for the whole file
+            when truncated).
 
         Raises:
             FileNotFoundError: If file does not exist.
             UnsupportedFormatError: If format is not supported.
+            ValueError: If the requested version does not exist, or
+                ``on_exceed`` is invalid.
+            MemoryBudgetError: If the load is estimated to exceed the budget
+                and cannot be truncated.
+            LockTimeoutError: If a writer holds the file for too long.
+            ContractViolationError: If the data violates an enforced contract.
+            OperationCancelledError: If ``cancel`` was cancelled.
             DataLoadError: If loading fails.
         """
-        file_path = (self.base_path / filename).resolve()
+        if on_exceed not in ("raise", "head"):
+            raise ValueError(f"on_exceed must be 'raise' or 'head', got {on_exceed!r}")
+        contract = self.contract_for(filename)
+        projection = kwargs.get("columns", kwargs.get("usecols"))
+        if version is not None or as_of is not None:
+            df = self._load_version(filename, version, as_of, **kwargs)
+            self._apply_contract(contract, filename, df, columns=projection)
+            return df
 
+        remote = self._open_remote_columns(filename, kwargs.get("columns"))
+        if remote is None:
+            file_path = self._resolve_read_path(filename)
+            source: Any = file_path
+            location = self.storage.url_for(filename) if self.storage else str(file_path)
+        else:
+            source, metadata = remote
+            file_path = (self.base_path / filename).resolve()
+            location = self.storage.url_for(filename)
+        suffix = file_path.suffix.lower()
+        budget = self.max_memory if max_memory is None else max_memory
+
+        cache_key = None
+        if self.shared_cache is not None and remote is None:
+            cache_key = self.shared_cache.key(file_path, kwargs)
+            cached = self.shared_cache.get(cache_key, budget or None) if cache_key else None
+            if cached is not None:
+                df, entry = cached
+                df.attrs.update(
+                    source_file=location,
+                    loaded_at=datetime.now(),
+                    checksum=entry["checksum"],
+                    lock_wait_seconds=0.0,
+                    shared_cache="hit",
+                    row_count=len(df),
+                )
+                self._apply_contract(contract, location, df, columns=projection)
+                logger.info("Loaded %s rows of %s from the shared cache", len(df), location)
+                return df
+
+        logger.info("Loading %s...", location)
+
+        with self._lock(file_path, SHARED) as lock_wait:
+            estimate, rows = None, None
+            if budget and remote is not None:
+                estimate = estimate_parquet_bytes(metadata, kwargs.get("columns"))
+                rows = metadata.num_rows
+            elif budget:
+                estimate, rows = self._estimate_load(file_path, **kwargs)
+            if remote is not None:
+                tracker = tracker_for(
+                    f"Loading {location}",
+                    progress,
+                    cancel,
+                    self.storage.info(filename)["size"],
+                    metadata.num_rows,
+                )
+            else:
+                tracker = self._read_tracker(
+                    f"Loading {location}", file_path, progress, cancel, rows, **kwargs
+                )
+            peak = PeakMemory()
+            if budget:
+                peak.start()
+            truncated = False
+            try:
+                if estimate is not None and estimate > budget:
+                    if on_exceed == "raise" or suffix not in CHUNK_READER_MAP:
+                        raise MemoryBudgetError(location, estimate, budget)
+                    logger.warning(
+                        "Loading leading rows of %s: estimated %s bytes exceed %s",
+                        location,
+                        estimate,
+                        budget,
+                    )
+                    options = dict(kwargs)
+                    columns = options.pop("columns", None)
+                    chunksize = self._budget_chunksize(estimate, rows, budget)
+                    chunks = CHUNK_READER_MAP[suffix](source, chunksize, columns, **options)
+                    if tracker is not None:
+                        chunks = tracker.track(chunks)
+                    df, truncated = read_head_within(
+                        chunks, budget, ignore_index="index_col" not in options
+                    )
+                elif tracker is not None and self._chunked_load_supported(suffix, kwargs):
+                    options = dict(kwargs)
+                    columns = options.pop("columns", None)
+                    chunks = CHUNK_READER_MAP[suffix](source, None, columns, **options)
+                    if suffix == ".csv":
+                        df = combine_csv_chunks(source, list(tracker.track(chunks)), **kwargs)
+                    else:
+                        df = concat_chunks(tracker.track(chunks))
+                else:
+                    if tracker is not None:
+                        tracker.check()
+                    df = READER_MAP[suffix](source, **kwargs)
+                    if tracker is not None:
+                        tracker.update(0 if isinstance(df, dict) else len(df))
+                        tracker.finish()
+            except (DataLoadError, OperationCancelledError):
+                raise
+            except Exception as e:
+                raise DataLoadError(location, str(e)) from e
+            finally:
+                peak.stop()
+                if remote is not None:
+                    source.close()
+
+            attrs = {
+                "source_file": location,
+                "loaded_at": datetime.now(),
+                "checksum": (
+                    calculate_checksum(file_path, cancel=cancel) if remote is None else None
+                ),
+                "lock_wait_seconds": lock_wait,
+            }
+            proven = set()
+            if contract is not None and suffix == ".parquet":
+                proven = self._contract_statistics(
+                    contract, file_path, metadata if remote is not None else None
+                )
+        if budget:
+            used = frame_bytes(df)
+            attrs.update(
+                memory_estimate_bytes=estimate,
+                memory_bytes=used,
+                memory_peak_bytes=max(used, peak.growth or 0),
+                truncated=truncated,
+            )
+            if truncated:
+                attrs["row_count_estimate"] = rows
+        if isinstance(df, dict):
+            # Multi-sheet Excel loads return one frame per sheet.
+            for sheet, frame in df.items():
+                frame.attrs.update(attrs, sheet_name=sheet, row_count=len(frame))
+            self._apply_contract(contract, location, df, columns=projection)
+            logger.info("Loaded %s sheets from %s", len(df), location)
+            return df
+
+        if cache_key is not None and not truncated:
+            # Published before attrs are set: hits get attrs of their own.
+            stored = self.shared_cache.put(cache_key, df, file_path, checksum=attrs["checksum"])
+            attrs["shared_cache"] = "stored" if stored else "miss"
+        df.attrs.update(attrs, row_count=len(df))
+        self._apply_contract(contract, location, df, proven, projection)
+
+        logger.info("Loaded %s rows from %s", len(df), location)
+        return df
+
+    def set_contract(
+        self, pattern: str, contract: Union[SchemaContract, Dict[str, Any], None]
+    ) -> None:
+        """Attach a schema contract to files matching ``pattern``.
+
+        ``load`` and ``save`` of a matching file validate the data and put
+        the report in ``df.attrs["contract_report"]``. Violations are logged,
+        or raised if the contract enforces them.
+
+        Args:
+            pattern: Filename or glob relative to base_path (``"sales/*.parquet"``).
+            contract: A SchemaContract, its ``to_dict`` form, or None to remove.
+        """
+        if contract is None:
+            self.contracts.pop(pattern, None)
+            return
+        if not isinstance(contract, SchemaContract):
+            contract = SchemaContract.from_dict(contract)
+        self.contracts[pattern] = contract
+
+    def contract_for(self, filename: str) -> Optional[SchemaContract]:
+        """The contract of the first pattern matching ``filename``, if any."""
+        name = Path(filename).as_posix()
+        for pattern, contract in self.contracts.items():
+            if fnmatch.fnmatch(name, pattern):
+                return contract
+        return None
+
+    def _contract_statistics(
+        self,
+        contract: SchemaContract,
+        file_path: Path,
+        metadata: Optional[pq.FileMetaData] = None,
+    ) -> Set[Tuple[str, str]]:
+        """Contract rules settled by the footer statistics of a Parquet file or dataset."""
+        import pyarrow.parquet as pq
+
+        try:
+            footers = (
+                [metadata]
+                if metadata is not None
+                else [pq.read_metadata(path) for path in list_parquet_files(file_path)]
+            )
+        except Exception as e:
+            logger.debug("No statistics for contract checks of %s: %s", file_path, e)
+            return set()
+        return contract.proven_by_statistics(footers)
+
+    def _apply_contract(
+        self,
+        contract: Optional[SchemaContract],
+        location: str,
+        df: Any,
+        proven: Optional[Set[Tuple[str, str]]] = None,
+        columns: Optional[List[str]] = None,
+    ) -> None:
+        """Validate ``df`` (or each sheet of a dict) and record the report in its attrs."""
+        if contract is None:
+            return
+        frames = df.values() if isinstance(df, dict) else [df]
+        for frame in frames:
+            report = contract.validate(frame, proven, columns)
+            frame.attrs["contract_report"] = report
+            if report["valid"]:
+                continue
+            if contract.enforce:
+                raise ContractViolationError(location, report)
+            logger.warning("%s violates its schema contract: %s", location, summarize(report))
+
+    def _open_remote_columns(
+        self, filename: str, columns: Optional[List[str]]
+    ) -> Optional[Tuple[Any, Any]]:
+        """Open a remote Parquet file for a column subset without fetching it whole.
+
+        Only the footer and the selected column chunks are fetched, with
+        concurrent range requests. Returns the cached file object and the
+        Parquet metadata, or None when the load should read a complete local
+        copy instead: local storage, other formats, no column selection, or
+        a file already cached completely.
+        """
+        if self.storage is None or columns is None or not filename.lower().endswith(".parquet"):
+            return None
+        try:
+            if not self.storage.exists(filename) or self.storage.cached_path(filename):
+                return None
+            metadata = self.storage.prefetch_parquet(filename, columns)
+            return self.storage.open(filename), metadata
+        except Exception as e:
+            raise DataLoadError(self.storage.url_for(filename), str(e)) from e
+
+    def _read_tracker(
+        self,
+        operation: str,
+        file_path: Path,
+        progress: Optional[ProgressCallback],
+        cancel: Optional[CancellationToken],
+        rows: Optional[int] = None,
+        **kwargs,
+    ) -> Optional[ProgressTracker]:
+        """Tracker for reading a local file, sized by the file and its (estimated) rows."""
+        if progress is None and cancel is None:
+            return None
+        paths = list_parquet_files(file_path) if file_path.is_dir() else [file_path]
+        if rows is None:
+            try:
+                rows = estimate_load_bytes(file_path, **kwargs)[1]
+            except Exception as e:
+                logger.debug("No row estimate for progress of %s: %s", file_path, e)
+        return ProgressTracker(
+            operation, sum(path.stat().st_size for path in paths), progress, cancel, rows
+        )
+
+    @staticmethod
+    def _chunked_load_supported(suffix: str, kwargs: Dict[str, Any]) -> bool:
+        """Whether a load with these options gives the same frame read chunk by chunk.
+
+        CSV options outside this list (``index_col``, ``skipfooter``,
+        ``engine``, ...) change the result or cannot be read in chunks.
+        ``.xlsx`` always uses the default reader, whose values and dtypes the
+        streaming one does not match.
+        """
+        if suffix == ".csv":
+            return set(kwargs) <= {
+                "comment",
+                "converters",
+                "date_format",
+                "decimal",
+                "delimiter",
+                "dtype",
+                "encoding",
+                "false_values",
+                "header",
+                "keep_default_na",
+                "na_values",
+                "names",
+                "nrows",
+                "parse_dates",
+                "quotechar",
+                "sep",
+                "skiprows",
+                "thousands",
+                "true_values",
+                "usecols",
+            }
+        return suffix in (".jsonl", ".parquet", ".feather") and set(kwargs) <= {"columns"}
+
+    def _estimate_load(self, file_path: Path, **kwargs) -> Tuple[int, Optional[int]]:
+        """Estimated in-memory bytes (and rows, if known) of loading ``file_path``."""
+        try:
+            return estimate_load_bytes(file_path, **kwargs)
+        except Exception as e:
+            raise DataLoadError(str(file_path), f"Could not estimate memory use: {e}") from e
+
+    @staticmethod
+    def _budget_chunksize(estimate: int, rows: Optional[int], budget: int) -> int:
+        """Rows per chunk keeping one chunk within a share of ``budget``."""
+        if not rows or not estimate:
+            return DEFAULT_CHUNK_SIZE
+        fitting = int(budget * MEMORY_CHUNK_FRACTION * rows / estimate)
+        return min(max(fitting, 1), DEFAULT_CHUNK_SIZE)
+
+    def _load_version(
+        self,
+        filename: str,
+        version: Optional[int],
+        as_of: Union[datetime, str, None],
+        **kwargs,
+    ) -> pd.DataFrame:
+        """Load a recorded version of ``filename`` from the version store."""
+        self._require_local("Versioned loads")
+        file_path = (self.base_path / filename).resolve()
         suffix = file_path.suffix.lower()
         if suffix not in SUPPORTED_READ_FORMATS:
             raise UnsupportedFormatError(suffix, list(SUPPORTED_READ_FORMATS))
 
-        if not file_path.exists():
-            raise FileNotFoundError(str(file_path))
+        manifest = self.version_store.resolve(self._dataset_name(file_path), version, as_of)
+        logger.info("Loading version %s of %s...", manifest["version"], file_path)
+        try:
+            df = self.version_store.read(manifest, READER_MAP[manifest["format"]], **kwargs)
+        except Exception as e:
+            raise DataLoadError(str(file_path), str(e)) from e
+
+        attrs = {
+            "source_file": str(file_path),
+            "loaded_at": datetime.now(),
+            "version": manifest["version"],
+            "version_created": datetime.fromisoformat(manifest["created"]),
+        }
+        if isinstance(df, dict):
+            for sheet, frame in df.items():
+                frame.attrs.update(attrs, sheet_name=sheet, row_count=len(frame))
+            return df
+        df.attrs.update(attrs, row_count=len(df))
+        logger.info("Loaded %s rows from version %s", len(df), manifest["version"])
+        return df
+
+    def versions(self, filename: str) -> List[Dict[str, Any]]:
+        """List the recorded versions of a file, oldest first.
+
+        Args:
+            filename: Name or relative path of the file.
+
+        Returns:
+            One dictionary per version with ``version``, ``created``, ``rows``
+            (Parquet only), ``objects`` (data objects referenced) and
+            ``bytes_written`` (new bytes the version added to the store).
+        """
+        file_path = (self.base_path / filename).resolve()
+        return [
+            {
+                "version": manifest["version"],
+                "created": datetime.fromisoformat(manifest["created"]),
+                "rows": manifest["rows"],
+                "objects": len(manifest["objects"]),
+                "bytes_written": manifest["bytes_written"],
+            }
+            for manifest in self.version_store.list_versions(self._dataset_name(file_path))
+        ]
+
+    def _require_local(self, operation: str) -> None:
+        if self.storage is not None:
+            raise ValueError(f"{operation} are not supported with remote storage")
+
+    def _lock(self, path: Path, mode: str = SHARED) -> Any:
+        """Reader-writer lock on a local path; a no-op with remote storage."""
+        if self.storage is not None:
+            return nullcontext(0.0)
+        return self.locks.acquire(path, mode)
+
+    def _iter_locked(self, path: Path, items: Iterator[Any]) -> Iterator[Any]:
+        """Yield from ``items`` while holding a shared lock on ``path``.
+
+        The generator may be resumed and closed on any thread; the lock is
+        released by whichever one finishes it.
+        """
+        with self._lock(path, SHARED):
+            yield from items
+
+    def lock_stats(self) -> Dict[str, Any]:
+        """Lock acquisitions, timeouts and wait times of this manager.
+
+        Returns:
+            Dictionary with ``shared`` and ``exclusive`` entries (``acquired``,
+            ``timeouts``, ``wait_seconds``, ``max_wait_seconds``),
+            ``lock_free_reads`` of immutable files and ``unlocked_reads``
+            without a usable lock directory.
+        """
+        return self.locks.snapshot()
 
-        logger.info("Loading %s...", file_path)
+    def _upload(self, file_path: Path) -> None:
+        """Upload a file staged under base_path, and its metadata sidecar, to remote storage."""
+        sidecar = file_path.with_suffix(file_path.suffix + METADATA_SUFFIX)
+        for path in (file_path, sidecar):
+            if not path.exists():
+                continue
+            name = path.relative_to(self.base_path).as_posix()
+            try:
+                self.storage.upload(path, name)
+            except Exception as e:
+                raise DataSaveError(self.storage.url_for(name), f"Upload error: {e}") from e
+
+    def _dataset_name(self, file_path: Path) -> str:
+        return file_path.relative_to(self.base_path).as_posix()
+
+    def _record_version(self, file_path: Path, table: Optional[pa.Table] = None) -> None:
+        """Add the current content of ``file_path`` to its version history.
+
+        ``table`` is the Parquet data just written, which spares re-reading it.
+        """
+        try:
+            self.version_store.commit(self._dataset_name(file_path), file_path, table)
+        except Exception as e:
+            raise DataSaveError(str(file_path), f"Versioning error: {e}") from e
+
+    def iter_chunks(
+        self,
+        filename: str,
+        chunksize: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+        progress: Optional[ProgressCallback] = None,
+        cancel: Optional[CancellationToken] = None,
+        **kwargs,
+    ) -> Iterator[pd.DataFrame]:
+        """Iterate over a file as DataFrames of at most ``chunksize`` rows.
+
+        CSV, JSON/JSONL, Parquet and Feather are streamed so only one chunk is
+        held in memory at a time; other formats are loaded once and sliced.
+
+        Args:
+            filename: Name or relative path of file to read.
+            chunksize: Rows per chunk (defaults to ``DEFAULT_CHUNK_SIZE``, or
+                fewer when a ``max_memory`` budget needs smaller chunks).
+            columns: Optional subset of columns to read.
+            progress: Called with (bytes_done, bytes_total, rows) after each chunk.
+            cancel: Token that stops the iteration before the next chunk.
+            **kwargs: Format-specific arguments passed to the chunked reader.
+
+        Yields:
+            pd.DataFrame chunks with ``source_file`` and ``chunk_index`` in attrs.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            UnsupportedFormatError: If format is not supported.
+            OperationCancelledError: If ``cancel`` was cancelled.
+            DataLoadError: If reading fails.
+        """
+        file_path = self._resolve_read_path(filename)
+        suffix = file_path.suffix.lower()
+        if chunksize is None and self.max_memory:
+            estimate, rows = self._estimate_load(file_path, columns=columns, **kwargs)
+            chunksize = self._budget_chunksize(estimate, rows, self.max_memory)
+        chunksize = chunksize or DEFAULT_CHUNK_SIZE
+
+        chunk_reader = CHUNK_READER_MAP.get(suffix)
+        if chunk_reader is None:
+            df = self.load(filename, **kwargs)
+            if columns is not None:
+                df = df[columns]
+            chunks: Iterator[pd.DataFrame] = (
+                df.iloc[start : start + chunksize] for start in range(0, len(df), chunksize)
+            )
+        else:
+            chunks = chunk_reader(file_path, chunksize, columns, **kwargs)
+        tracker = self._read_tracker(
+            f"Reading {file_path}", file_path, progress, cancel, columns=columns, **kwargs
+        )
+        if tracker is not None:
+            chunks = tracker.track(chunks)
 
-        reader = READER_MAP[suffix]
         try:
-            df = reader(file_path, **kwargs)
-        except DataLoadError:
+            for index, chunk in enumerate(self._iter_locked(file_path, chunks)):
+                chunk.attrs.update({"source_file": str(file_path), "chunk_index": index})
+                yield chunk
+        except (DataLoadError, OperationCancelledError):
             raise
         except Exception as e:
             raise DataLoadError(str(file_path), str(e)) from e
 
-        df.attrs.update(
-            {
-                "source_file": str(file_path),
-                "loaded_at": datetime.now(),
-                "row_count": len(df),
-                "checksum": calculate_checksum(file_path),
+    def scan(self, filename: str) -> LazyFrame:
+        """Start a lazy query over a file.
+
+        Args:
+            filename: Name or relative path of file to query.
+
+        Returns:
+            LazyFrame; chain ``filter``/``select``/``groupby``/``agg`` and
+            finish with ``collect()`` or ``iter_batches()``.
+
+        Raises:
+            FileNotFoundError: If file does not exist.
+            UnsupportedFormatError: If format is not supported.
+        """
+        self._resolve_read_path(filename)
+        return LazyFrame(self, filename)
+
+    def aggregate(
+        self,
+        filename: str,
+        by: Union[str, List[str], None] = None,
+        aggs: Optional[Dict[str, Union[str, List[str]]]] = None,
+        memory_budget: Optional[int] = None,
+        chunksize: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """Group and aggregate a file of any size without loading it.
+
+        Chunks are reduced to partial aggregates and merged as they stream in;
+        partial state beyond ``memory_budget`` bytes is hash-partitioned and
+        spilled to disk, then combined one partition at a time.
+
+        Args:
+            filename: Name or relative path of file to aggregate.
+            by: Group-by column(s); None aggregates over all rows.
+            aggs: Mapping of column to one or more of ``sum``, ``count``,
+                ``mean``, ``min``, ``max`` and ``approx_distinct``.
+            memory_budget: Bytes of partial state held before spilling
+                (defaults to ``AGGREGATE_MEMORY_BUDGET_BYTES``).
+            chunksize: Rows per chunk read from the source.
+
+        Returns:
+            pd.DataFrame with one row per group and ``<column>_<function>``
+            columns; ``spilled_bytes`` in attrs.
+
+        Raises:
+            ValueError: If ``aggs`` is empty or an aggregation is not supported.
+            FileNotFoundError: If file does not exist.
+            UnsupportedFormatError: If format is not supported.
+            DataLoadError: If reading fails.
+        """
+        keys = [by] if isinstance(by, str) else list(by or [])
+        plan = self.scan(filename).groupby(*keys).agg(aggs or {}, memory_budget=memory_budget)
+        if chunksize:
+            plan = plan.chunksize(chunksize)
+        try:
+            return plan.collect()
+        except (DataLoadError, ValueError):
+            raise
+        except Exception as e:
+            raise DataLoadError(filename, str(e)) from e
+
+    def join(
+        self,
+        left: str,
+        right: str,
+        on: Union[str, List[str]],
+        how: str = "inner",
+        output: Optional[str] = None,
+        memory_budget: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        suffixes: Tuple[str, str] = ("_x", "_y"),
+        **kwargs,
+    ) -> Optional[pd.DataFrame]:
+        """Join two files of any size without loading either one whole.
+
+        The smaller file (by size on disk) is held in memory as the build
+        side while the other is streamed through it in chunks. When the
+        build side exceeds ``memory_budget`` bytes, both files are
+        hash-partitioned by key to disk and joined one partition at a time.
+        Output row order is not guaranteed, and null keys never match.
+
+        Args:
+            left: Name or relative path of the left file.
+            right: Name or relative path of the right file.
+            on: Join key column(s), present in both files.
+            how: ``inner``, ``left``, ``right`` or ``outer``.
+            output: Optional output filename; result chunks are written to it
+                incrementally instead of being returned.
+            memory_budget: Build-side bytes held in memory before partitioning
+                (defaults to ``JOIN_MEMORY_BUDGET_BYTES``).
+            chunksize: Rows per chunk read from each input.
+            suffixes: Suffixes for non-key columns present in both files.
+            **kwargs: Format-specific arguments passed to the output writer.
+
+        Returns:
+            pd.DataFrame with ``join_strategy`` in attrs, or None when
+            ``output`` is given.
+
+        Raises:
+            ValueError: If ``how`` is not supported or no key is given.
+            FileNotFoundError: If an input file does not exist.
+            UnsupportedFormatError: If a format is not supported.
+            DataLoadError: If reading fails.
+            DataSaveError: If writing the output fails.
+        """
+        import pyarrow as pa
+
+        keys = [on] if isinstance(on, str) else list(on)
+        joiner = HashJoin(keys, how, memory_budget, suffixes)
+        left_path = self._resolve_read_path(left)
+        right_path = self._resolve_read_path(right)
+        build_side = "left" if left_path.stat().st_size < right_path.stat().st_size else "right"
+
+        def source(filename: str) -> Iterator[pa.Table]:
+            plan = self.scan(filename)
+            return plan.chunksize(chunksize).iter_tables() if chunksize else plan.iter_tables()
+
+        def run(sink: Callable[[pa.Table], None]) -> None:
+            try:
+                joiner.run(source(left), source(right), sink, build_side=build_side)
+            except (DataLoadError, DataSaveError, ValueError):
+                raise
+            except Exception as e:
+                raise DataLoadError(f"{left} + {right}", str(e)) from e
+
+        def attrs() -> Dict[str, Any]:
+            return {
+                "join_strategy": joiner.strategy,
+                "left_file": str(left_path),
+                "right_file": str(right_path),
             }
+
+        if output is None:
+            import pandas as pd
+
+            tables: List[pa.Table] = []
+            run(tables.append)
+            if tables:
+                df = pa.concat_tables(tables, promote_options="permissive").to_pandas()
+            else:
+                df = pd.DataFrame()
+            df.attrs.update(attrs())
+            return df
+
+        file_path = (self.base_path / output).resolve()
+        suffix = file_path.suffix.lower()
+        if suffix not in SUPPORTED_WRITE_FORMATS:
+            raise UnsupportedFormatError(suffix, list(SUPPORTED_WRITE_FORMATS))
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        logger.info("Joining %s and %s into %s...", left_path, right_path, file_path)
+        with self._lock(file_path, EXCLUSIVE), ChunkWriter(file_path, **kwargs) as writer:
+            run(writer.write)
+
+        if suffix in (".csv", ".json", ".jsonl"):
+            save_sidecar_metadata(attrs(), file_path)
+        if self.storage is not None:
+            self._upload(file_path)
+
+        logger.info("Saved %s joined rows to %s", joiner.rows_written, file_path)
+        return None
+
+    def diff(
+        self,
+        a: str,
+        b: str,
+        key: Union[str, List[str], None] = None,
+        output: str = "summary",
+        chunksize: Optional[int] = None,
+    ) -> Union[Dict[str, Any], pd.DataFrame]:
+        """Report rows added, removed and changed between two files.
+
+        Both files are streamed chunk by chunk and compared on 64-bit row
+        hashes, so they may be in different formats and larger than memory.
+        Only rows that differ are read a second time to build per-column
+        change masks. Numbers compare by value, so ``1`` and ``1.0`` match.
+
+        Args:
+            a: Name or relative path of the old file.
+            b: Name or relative path of the new file.
+            key: Column(s) identifying rows. Without a key, rows are compared
+                as whole-row multisets and none count as changed.
+            output: ``summary`` for counts only, or ``delta`` for a frame of
+                the differing rows.
+            chunksize: Rows per chunk read from each file.
+
+        Returns:
+            With ``summary``, a dict of counts (``added``, ``removed``,
+            ``changed``, ``unchanged``, ``changed_by_column`` and
+            more). With ``delta``, a DataFrame with a ``_change`` column and,
+            for changed rows, ``<column>_old`` values and ``<column>_changed``
+            masks; the summary is in ``attrs["diff_summary"]``.
+
+        Raises:
+            ValueError: If ``output`` is unknown, or a key is missing or not unique.
+            FileNotFoundError: If a file does not exist.
+            UnsupportedFormatError: If a format is not supported.
+            DataLoadError: If reading fails.
+        """
+        if output not in ("summary", "delta"):
+            raise ValueError(f"output must be 'summary' or 'delta', got {output!r}")
+        keys = [key] if isinstance(key, str) else list(key or [])
+        path_a = self._resolve_read_path(a)
+        path_b = self._resolve_read_path(b)
+
+        def source(filename: str) -> Callable[[], Iterator[Any]]:
+            plan = self.scan(filename)
+            if chunksize:
+                plan = plan.chunksize(chunksize)
+            return plan.iter_tables
+
+        try:
+            summary, delta = diff_tables(source(a), source(b), keys, delta=output == "delta")
+        except ValueError:
+            raise
+        except Exception as e:
+            raise DataLoadError(f"{a} vs {b}", str(e)) from e
+
+        logger.info(
+            "Diff %s -> %s: %s added, %s removed, %s changed",
+            path_a,
+            path_b,
+            summary["added"],
+            summary["removed"],
+            summary["changed"],
+        )
+        if delta is None:
+            return summary
+        delta.attrs["diff_summary"] = summary
+        return delta
+
+    def optimize(
+        self,
+        path: str,
+        sort_by: Union[str, List[str], None] = None,
+        row_group_size: Optional[int] = None,
+        target_file_size: Optional[int] = None,
+        compression: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Rewrite a Parquet file or dataset directory for faster scans.
+
+        Small files in each directory are compacted into files of about
+        ``target_file_size`` bytes, with full row groups, page statistics
+        and dictionary encoding on low-cardinality columns. With
+        ``sort_by``, rows are clustered by those columns, so filters on
+        them skip most files and row groups.
+
+        Args:
+            path: Parquet file or dataset directory, relative to base_path.
+            sort_by: Column(s) to sort and cluster rows by.
+            row_group_size: Rows per row group
+                (defaults to ``PARQUET_ROW_GROUP_ROWS``).
+            target_file_size: Output file size in bytes
+                (defaults to ``PARQUET_TARGET_FILE_BYTES``).
+            compression: Parquet codec (defaults to the writer default).
+
+        Returns:
+            Dictionary with file, row, row-group and byte counts before and after.
+
+        Raises:
+            FileNotFoundError: If path does not exist.
+            UnsupportedFormatError: If path is a file but not Parquet.
+            ValueError: If a ``sort_by`` column does not exist, or storage
+                is remote.
+            DataSaveError: If rewriting fails.
+        """
+        self._require_local("Parquet optimizations")
+        target = (self.base_path / path).resolve()
+        if not target.exists():
+            raise FileNotFoundError(str(target))
+        if target.is_file() and target.suffix.lower() != ".parquet":
+            raise UnsupportedFormatError(target.suffix.lower(), [".parquet"])
+
+        columns = [sort_by] if isinstance(sort_by, str) else sort_by
+        logger.info("Optimizing %s...", target)
+        with self._lock(target, EXCLUSIVE):
+            try:
+                report = optimize_parquet(
+                    target,
+                    sort_by=columns,
+                    row_group_size=row_group_size,
+                    target_file_bytes=target_file_size,
+                    compression=compression,
+                )
+            except ValueError:
+                raise
+            except Exception as e:
+                raise DataSaveError(str(target), f"Parquet optimize error: {e}") from e
+            self._refresh_key_index(target)
+
+        logger.info(
+            "Optimized %s: %s files -> %s, %s -> %s bytes",
+            target,
+            report["files_before"],
+            report["files_after"],
+            report["bytes_before"],
+            report["bytes_after"],
         )
+        return report
+
+    def read_rows(self, filename: str, start: int, stop: int, **kwargs) -> pd.DataFrame:
+        """Read the row window ``[start, stop)`` without loading the whole file.
+
+        CSV and JSONL files seek through a row-offset index sidecar (built on
+        first use and rebuilt when the file's checksum changes), so any page
+        costs about the same as the first. Parquet reads only the row groups
+        spanning the window; other formats are streamed up to ``stop``.
+
+        Args:
+            filename: Name or relative path of file to read.
+            start: First row (0-based, inclusive).
+            stop: Row after the last one to return (exclusive).
+            **kwargs: Format-specific arguments passed to the reader.
+
+        Returns:
+            pd.DataFrame indexed by absolute row number.
+
+        Raises:
+            ValueError: If the window is negative or reversed.
+            FileNotFoundError: If file does not exist.
+            UnsupportedFormatError: If format is not supported.
+            DataLoadError: If reading fails.
+        """
+        if start < 0 or stop < start:
+            raise ValueError(f"Invalid row window [{start}, {stop})")
+
+        file_path = self._resolve_read_path(filename)
+        suffix = file_path.suffix.lower()
 
-        logger.info("Loaded %s rows from %s", len(df), file_path)
+        with self._lock(file_path, SHARED):
+            try:
+                if suffix in ROW_INDEX_FORMATS and sniff_compression(file_path) is None:
+                    df = read_indexed_rows(file_path, start, stop, **kwargs)
+                elif suffix == ".parquet":
+                    df = read_parquet_rows(file_path, start, stop, **kwargs)
+                else:
+                    df = self._read_rows_streamed(filename, start, stop, **kwargs)
+            except DataLoadError:
+                raise
+            except Exception as e:
+                raise DataLoadError(str(file_path), str(e)) from e
+
+        df.attrs.update({"source_file": str(file_path), "row_start": start, "row_stop": stop})
         return df
 
-    def save(self, df: pd.DataFrame, filename: str, **kwargs) -> None:
+    def _read_rows_streamed(self, filename: str, start: int, stop: int, **kwargs) -> pd.DataFrame:
+        """Slice a row window out of ``iter_chunks``, stopping once it is covered."""
+        import pandas as pd
+
+        pieces = []
+        offset = 0
+        for chunk in self.iter_chunks(filename, **kwargs):
+            chunk_stop = offset + len(chunk)
+            if chunk_stop > start:
+                pieces.append(chunk.iloc[max(start - offset, 0) : stop - offset])
+            offset = chunk_stop
+            if offset >= stop:
+                break
+        if not pieces:
+            return pd.DataFrame()
+        df = pd.concat(pieces)
+        df.index = pd.RangeIndex(start, start + len(df))
+        return df
+
+    def sample(
+        self,
+        filename: str,
+        n: int,
+        seed: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Draw a uniform random sample of ``n`` rows without a full load.
+
+        Parquet decodes only the row groups holding sampled rows, Feather takes
+        rows from a memory map, uncompressed CSV/JSONL seek through the row
+        offset index, and everything else is reservoir-sampled chunk by chunk.
+
+        Args:
+            filename: Name or relative path of file to sample.
+            n: Number of rows (all rows are returned if the file has fewer).
+            seed: Seed for reproducible samples.
+            columns: Optional subset of columns to return.
+
+        Returns:
+            pd.DataFrame in file order, indexed by row number, with
+            ``sampling_method``, ``sample_size`` and ``sample_seed`` in attrs.
+
+        Raises:
+            ValueError: If ``n`` is negative.
+            FileNotFoundError: If file does not exist.
+            UnsupportedFormatError: If format is not supported.
+            DataLoadError: If reading fails.
+        """
+        import numpy as np
+
+        if n < 0:
+            raise ValueError(f"Sample size must be non-negative, got {n}")
+
+        file_path = self._resolve_read_path(filename)
+        suffix = file_path.suffix.lower()
+        rng = np.random.default_rng(seed)
+
+        with self._lock(file_path, SHARED):
+            try:
+                if suffix == ".parquet":
+                    method, df = "row_groups", sample_parquet(file_path, n, rng, columns)
+                elif suffix == ".feather":
+                    method, df = "feather_take", sample_feather(file_path, n, rng, columns)
+                elif suffix in ROW_INDEX_FORMATS and sniff_compression(file_path) is None:
+                    method, df = "byte_offset", sample_indexed(file_path, n, rng, columns)
+                else:
+                    chunks = self.iter_chunks(filename, columns=columns)
+                    method, df = "reservoir", reservoir_sample(chunks, n, rng)
+            except DataLoadError:
+                raise
+            except Exception as e:
+                raise DataLoadError(str(file_path), str(e)) from e
+
+        df.attrs = {
+            "source_file": str(file_path),
+            "sampling_method": method,
+            "sample_size": len(df),
+            "sample_seed": seed,
+        }
+        return df
+
+    def save(
+        self,
+        df: pd.DataFrame,
+        filename: str,
+        key: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        cancel: Optional[CancellationToken] = None,
+        **kwargs,
+    ) -> None:
         """Save DataFrame to any supported format.
 
+        With ``progress`` or ``cancel``, CSV, JSONL, Parquet and Feather are
+        written chunk by chunk to a temporary file that replaces the target
+        only once complete, so a cancelled save leaves the previous file as
+        it was.
+
         Args:
-            df: DataFrame to save.
+            df: DataFrame to save, or a dict of sheet name to DataFrame for Excel.
             filename: Output filename.
+            key: Parquet only: column to maintain a key index on for ``lookup``.
+                An existing key index is rebuilt on its key when omitted.
+            progress: Called with (bytes_written, None, rows) after each chunk.
+            cancel: Token that stops the save, removing partial output.
             **kwargs: Format-specific arguments passed to pandas writer.
 
         Raises:
             UnsupportedFormatError: If format is not supported.
+            ValueError: If ``key`` is given for a non-Parquet file or with
+                remote storage.
+            ContractViolationError: If ``df`` violates an enforced contract;
+                nothing is written.
+            OperationCancelledError: If ``cancel`` was cancelled.
             DataSaveError: If saving fails.
         """
         file_path = (self.base_path / filename).resolve()
@@ -97,21 +1180,314 @@ class DataManager:
         suffix = file_path.suffix.lower()
         if suffix not in SUPPORTED_WRITE_FORMATS:
             raise UnsupportedFormatError(suffix, list(SUPPORTED_WRITE_FORMATS))
+        if key is not None and suffix != ".parquet":
+            raise ValueError("Key indexes are only supported for Parquet files")
+        if key is not None:
+            self._require_local("Key indexes")
+        self._apply_contract(self.contract_for(filename), str(file_path), df)
+
+        if isinstance(df, dict):
+            # Excel targets accept {sheet_name: DataFrame} for multi-sheet output.
+            logger.info("Saving %s sheets to %s...", len(df), file_path)
+        else:
+            logger.info("Saving %s rows to %s...", len(df), file_path)
+
+        with self._lock(file_path, EXCLUSIVE):
+            if (
+                self.versioning
+                and file_path.is_file()
+                and not self.version_store.list_versions(self._dataset_name(file_path))
+            ):
+                # Keep the content written before versioning as the first version.
+                self._record_version(file_path)
+
+            writer = WRITER_MAP[suffix]
+            tracker = tracker_for(f"Saving {file_path}", progress, cancel)
+            try:
+                if tracker is None:
+                    writer(df, file_path, **kwargs)
+                else:
+                    self._write_tracked(df, file_path, tracker, **kwargs)
+            except (DataSaveError, OperationCancelledError):
+                raise
+            except Exception as e:
+                raise DataSaveError(str(file_path), str(e)) from e
 
-        logger.info("Saving %s rows to %s...", len(df), file_path)
+            if suffix in (".csv", ".json", ".jsonl"):
+                save_sidecar_metadata(df.attrs, file_path)
+            if self.storage is not None:
+                self._upload(file_path)
+                logger.info("Saved to %s", self.storage.url_for(filename))
+                return
+            self._refresh_key_index(file_path, key)
+            if self.versioning:
+                table = None
+                if suffix == ".parquet":
+                    # Chunk the frame in hand rather than read back the file just written.
+                    import pyarrow as pa
 
-        writer = WRITER_MAP[suffix]
+                    table = pa.Table.from_pandas(with_serializable_attrs(df), preserve_index=False)
+                self._record_version(file_path, table)
+
+            logger.info("Saved to %s", file_path)
+
+    @staticmethod
+    def _write_tracked(df: Any, file_path: Path, tracker: ProgressTracker, **kwargs) -> None:
+        """Write ``df`` in chunks to a temporary file, then move it over ``file_path``."""
+        from .config import WRITER_DEFAULTS
+
+        suffix = file_path.suffix.lower()
+        chunked = (
+            suffix in (".csv", ".jsonl", ".parquet", ".feather")
+            and not isinstance(df, dict)
+            and len(df)
+            and "append" not in kwargs
+        )
+        if not chunked:
+            tracker.check()
+            WRITER_MAP[suffix](df, file_path, **kwargs)
+            tracker.update(0 if isinstance(df, dict) else len(df), file_path.stat().st_size)
+            tracker.finish()
+            return
+
+        # Parquet chunks are whole row groups, so the layout matches an untracked save.
+        step = DEFAULT_CHUNK_SIZE
+        if suffix == ".parquet":
+            step = kwargs.get("row_group_size") or WRITER_DEFAULTS[suffix]["row_group_size"]
+        temp_path = file_path.with_name(f".{file_path.stem}.{uuid.uuid4().hex[:8]}{suffix}")
+        options = {k: v for k, v in kwargs.items() if k != "row_group_size"}
         try:
-            writer(df, file_path, **kwargs)
-        except DataSaveError:
-            raise
+            with ChunkWriter(temp_path, **options) as writer:
+                for start in range(0, len(df), step):
+                    tracker.check()
+                    writer.write(df.iloc[start : start + step])
+                    size = temp_path.stat().st_size if temp_path.exists() else 0
+                    tracker.update(min(step, len(df) - start), size)
+            os.replace(temp_path, file_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        tracker.finish()
+
+    def save_many(
+        self,
+        df: pd.DataFrame,
+        filenames: List[str],
+        writer_kwargs: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, str]:
+        """Save one DataFrame to several files at once, e.g. each published format.
+
+        The frame is converted to Arrow once for all Parquet and Feather
+        targets, and every target is written by its own thread and
+        checksummed as soon as it is complete. Metadata sidecars of the
+        text targets are written after all writes succeeded. Versioning,
+        existing key indexes and remote uploads are handled as by ``save``.
+
+        Args:
+            df: DataFrame to save.
+            filenames: Output filenames; their suffixes pick the formats.
+            writer_kwargs: Writer arguments per suffix, e.g.
+                ``{".csv": {"sep": ";"}}``.
+
+        Returns:
+            Dictionary of filename to MD5 checksum of the written file.
+
+        Raises:
+            UnsupportedFormatError: If a format is not supported.
+            ValueError: If a file appears twice.
+            ContractViolationError: If ``df`` violates the enforced contract
+                of a target; nothing is written.
+            DataSaveError: If saving any target fails.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        import pyarrow as pa
+
+        writer_kwargs = writer_kwargs or {}
+        targets: Dict[str, Path] = {}
+        for filename in filenames:
+            file_path = (self.base_path / filename).resolve()
+            suffix = file_path.suffix.lower()
+            if suffix not in SUPPORTED_WRITE_FORMATS:
+                raise UnsupportedFormatError(suffix, list(SUPPORTED_WRITE_FORMATS))
+            if file_path in targets.values():
+                raise ValueError(f"{filename} appears more than once")
+            targets[filename] = file_path
+        for contract in {id(c): c for c in map(self.contract_for, filenames) if c}.values():
+            self._apply_contract(contract, ", ".join(filenames), df)
+
+        table = None
+        if any(path.suffix.lower() in ARROW_WRITE_FORMATS for path in targets.values()):
+            try:
+                table = pa.Table.from_pandas(with_serializable_attrs(df), preserve_index=False)
+            except Exception as e:
+                raise DataSaveError(", ".join(filenames), f"Arrow conversion error: {e}") from e
+
+        def write(file_path: Path) -> str:
+            suffix = file_path.suffix.lower()
+            kwargs = writer_kwargs.get(suffix, {})
+            try:
+                if table is not None and suffix in ARROW_WRITE_FORMATS:
+                    write_table(table, file_path, **kwargs)
+                else:
+                    WRITER_MAP[suffix](df, file_path, **kwargs)
+                return calculate_checksum(file_path)
+            except DataSaveError:
+                raise
+            except Exception as e:
+                raise DataSaveError(str(file_path), str(e)) from e
+
+        logger.info("Saving %s rows to %s files...", len(df), len(targets))
+        with ExitStack() as stack:
+            # A fixed order keeps concurrent save_many calls from deadlocking.
+            for file_path in sorted(targets.values()):
+                stack.enter_context(self._lock(file_path, EXCLUSIVE))
+            for file_path in targets.values():
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                if (
+                    self.versioning
+                    and file_path.is_file()
+                    and not self.version_store.list_versions(self._dataset_name(file_path))
+                ):
+                    self._record_version(file_path)
+
+            workers = min(SAVE_MANY_MAX_WORKERS or len(targets), len(targets)) or 1
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {name: executor.submit(write, path) for name, path in targets.items()}
+                checksums = {name: future.result() for name, future in futures.items()}
+
+            for name, file_path in targets.items():
+                if file_path.suffix.lower() in (".csv", ".json", ".jsonl"):
+                    save_sidecar_metadata({**df.attrs, "checksum": checksums[name]}, file_path)
+            for file_path in targets.values():
+                if self.storage is not None:
+                    self._upload(file_path)
+                    continue
+                self._refresh_key_index(file_path)
+                if self.versioning:
+                    arrow = file_path.suffix.lower() == ".parquet"
+                    self._record_version(file_path, table if arrow else None)
+
+        logger.info("Saved %s", ", ".join(targets))
+        return checksums
+
+    def _refresh_key_index(self, path: Path, key: Optional[str] = None) -> None:
+        """Build the key index of ``path`` on ``key``, or rebuild an existing one."""
+        if key is None and not key_index_path_for(path).exists():
+            return
+        try:
+            get_key_index(path, key)
         except Exception as e:
-            raise DataSaveError(str(file_path), str(e)) from e
+            raise DataSaveError(str(path), f"Key index error: {e}") from e
+
+    def upsert(self, df: pd.DataFrame, filename: str, key: str) -> Dict[str, Any]:
+        """Merge rows into a Parquet file or dataset directory by key.
+
+        Rows whose key already exists take the values of the columns in
+        ``df`` (other columns keep their stored values); the rest are
+        inserted. Through the key index, only files with row groups that
+        can hold an incoming key are rewritten, and the index is updated
+        for those files alone. A missing target is created, as by
+        ``save(df, filename, key=key)``.
+
+        Args:
+            df: Changed and new rows; must include ``key``.
+            filename: Parquet file or dataset directory, relative to base_path.
+            key: Key column identifying rows.
+
+        Returns:
+            Dictionary with ``updated``, ``inserted``, ``files_rewritten``
+            and ``row_groups_modified`` counts.
+
+        Raises:
+            UnsupportedFormatError: If path is a file but not Parquet.
+            ValueError: If ``key`` or another column of ``df`` is not in the
+                dataset, or storage is remote.
+            DataSaveError: If writing fails.
+        """
+        self._require_local("Upserts")
+        path = (self.base_path / filename).resolve()
+        with self._lock(path, EXCLUSIVE):
+            if not path.exists():
+                self.save(df, filename, key=key)
+                return {
+                    "updated": 0,
+                    "inserted": len(df),
+                    "files_rewritten": 0,
+                    "row_groups_modified": 0,
+                }
+            if path.is_file() and path.suffix.lower() != ".parquet":
+                raise UnsupportedFormatError(path.suffix.lower(), [".parquet"])
+
+            logger.info("Upserting %s rows into %s...", len(df), path)
+            try:
+                report = upsert_parquet(path, df, key)
+            except ValueError:
+                raise
+            except Exception as e:
+                raise DataSaveError(str(path), f"Upsert error: {e}") from e
+            if self.versioning and path.is_file():
+                self._record_version(path)
+        logger.info(
+            "Upserted into %s: %s updated, %s inserted", path, report["updated"], report["inserted"]
+        )
+        return report
 
-        if suffix in (".csv", ".json"):
-            save_sidecar_metadata(df.attrs, file_path)
+    def lookup(
+        self,
+        filename: str,
+        keys: Union[Any, List[Any]],
+        key: Optional[str] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Fetch rows by key from a Parquet file or dataset directory.
 
-        logger.info("Saved to %s", file_path)
+        Only row groups whose key range covers a requested key and whose
+        bloom filter may contain it are read. The key index sidecar is built
+        on first use (``key`` names the column) and rebuilt when files change.
+
+        Args:
+            filename: Parquet file or dataset directory, relative to base_path.
+            keys: One key value or a list of them.
+            key: Key column; needed only when no index exists yet.
+            columns: Columns to return (defaults to all).
+
+        Returns:
+            pd.DataFrame of matching rows, with ``row_groups_read`` and
+            ``row_groups_total`` in attrs.
+
+        Raises:
+            FileNotFoundError: If path does not exist.
+            UnsupportedFormatError: If path is a file but not Parquet.
+            ValueError: If no index exists and ``key`` is not given, or
+                storage is remote.
+            DataLoadError: If reading fails.
+        """
+        self._require_local("Key lookups")
+        path = (self.base_path / filename).resolve()
+        if not path.exists():
+            raise FileNotFoundError(str(path))
+        if path.is_file() and path.suffix.lower() != ".parquet":
+            raise UnsupportedFormatError(path.suffix.lower(), [".parquet"])
+        if not isinstance(keys, (list, tuple, set)):
+            keys = [keys]
+
+        try:
+            with self._lock(path, SHARED):
+                index = load_key_index(path)
+                current = index is not None and key in (None, key_index_info(index)["key"])
+                if current:
+                    df = lookup_rows(path, keys, index, columns)
+            if not current:
+                # (Re)building the index writes its sidecar, so readers must wait.
+                with self._lock(path, EXCLUSIVE):
+                    index = get_key_index(path, key)
+                    df = lookup_rows(path, keys, index, columns)
+        except ValueError:
+            raise
+        except Exception as e:
+            raise DataLoadError(str(path), str(e)) from e
+        df.attrs["source_file"] = str(path)
+        return df
 
     def get_info(self, filename: str) -> Dict[str, Any]:
         """Get file metadata without loading full data.
@@ -121,7 +1497,11 @@ class DataManager:
 
         Returns:
             Dictionary with file info (path, size, modified, row_count, etc.).
+            For remote storage, row_count is given for Parquet files only
+            (read from the footer).
         """
+        if self.storage is not None:
+            return self._remote_info(filename)
         file_path = (self.base_path / filename).resolve()
 
         if not file_path.exists():
@@ -145,12 +1525,111 @@ class DataManager:
                 with open(file_path, "r", encoding="utf-8") as f:
                     info["row_count"] = max(sum(1 for _ in f) - 1, 0)
             elif suffix in (".xlsx", ".xls"):
+                import pandas as pd
+
                 info["row_count"] = pd.read_excel(file_path).shape[0]
         except Exception as e:
             info["row_count_error"] = str(e)
 
         return info
 
+    def _remote_info(self, filename: str) -> Dict[str, Any]:
+        url = self.storage.url_for(filename)
+        if not self.storage.exists(filename):
+            return {"error": f"File not found: {url}"}
+
+        remote = self.storage.info(filename)
+        modified = next(
+            (
+                remote[k]
+                for k in ("mtime", "LastModified", "last_modified", "created")
+                if k in remote
+            ),
+            None,
+        )
+        if isinstance(modified, (int, float)):
+            modified = datetime.fromtimestamp(modified)
+        suffix = Path(filename).suffix.lower()
+        info: Dict[str, Any] = {
+            "path": url,
+            "size_mb": round(remote["size"] / (1024 * 1024), 4),
+            "modified": modified,
+            "extension": suffix,
+        }
+        if suffix == ".parquet":
+            try:
+                info["row_count"] = self.storage.prefetch_parquet(filename, columns=[]).num_rows
+            except Exception as e:
+                info["row_count_error"] = str(e)
+        return info
+
+    def _resolve_read_path(self, filename: str) -> Path:
+        """Resolve ``filename`` and check it is a readable, existing data file.
+
+        With remote storage, the file is fetched into the local cache (if not
+        current there) and the cached copy's path is returned.
+        """
+        file_path = (self.base_path / filename).resolve()
+
+        suffix = file_path.suffix.lower()
+        if suffix not in SUPPORTED_READ_FORMATS:
+            raise UnsupportedFormatError(suffix, list(SUPPORTED_READ_FORMATS))
+
+        if self.storage is not None:
+            url = self.storage.url_for(filename)
+            try:
+                if not self.storage.exists(filename):
+                    raise FileNotFoundError(url)
+                return self.storage.fetch(filename)
+            except FileNotFoundError:
+                raise
+            except Exception as e:
+                raise DataLoadError(url, f"Fetch error: {e}") from e
+
+        if not file_path.exists():
+            raise FileNotFoundError(str(file_path))
+
+        return file_path
+
+    def search(
+        self,
+        query: str,
+        fields: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        refresh: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        """Find files by path, column name or string cell value.
+
+        Every word of ``query`` must occur in a file for it to match, e.g.
+        ``dm.search("mandi_code", fields=["column"])`` finds the files with
+        a column of that name. Cell values are searched only when
+        ``search_index`` indexes them (``SEARCH_INDEX_VALUES``).
+
+        Args:
+            query: Words to look for.
+            fields: Only match in these of ``"path"``, ``"column"`` and
+                ``"value"`` (defaults to all).
+            limit: Most results returned (defaults to ``SEARCH_RESULTS_LIMIT``).
+            offset: Ranked results skipped first, to page through them.
+            refresh: Update the index first: True always, False never, None
+                (default) only if it has never been built. An update stats
+                every file and reads the new and changed ones, so callers
+                serving many searches should refresh separately with
+                ``search_index.update()``.
+
+        Returns:
+            One dict per matching file with its ``path``, ``score`` and the
+            fields that matched (``matches``), best first.
+
+        Raises:
+            ValueError: If a field is unknown, or with remote storage.
+        """
+        self._require_local("Searches")
+        if refresh or (refresh is None and not self.search_index.built):
+            self.search_index.update()
+        return self.search_index.search(query, fields=fields, limit=limit, offset=offset)
+
     def list_files(self, pattern: str = "*") -> list:
         """List data files in base_path matching pattern.
 
@@ -158,6 +1637,16 @@ class DataManager:
             pattern: Glob pattern (e.g., "*.csv", "data/*.parquet").
 
         Returns:
-            List of Path objects.
+            List of Path objects, excluding the version store, lock files, the
+            search index and the bulk conversion state file (URL strings with
+            remote storage).
         """
-        return list(self.base_path.glob(pattern))
+        if self.storage is not None:
+            return self.storage.glob(pattern)
+        internal = (self.version_store.root, self.locks.lock_dir, self.search_index.directory)
+        return [
+            path
+            for path in self.base_path.glob(pattern)
+            if not any(path.is_relative_to(directory) for directory in internal)
+            and path.name != CONVERT_STATE_FILE
+        ]
@@ -0,0 +1,280 @@
+"""Memory estimates for loads, used by the DataManager ``max_memory`` budget.
+
+Estimates aim at the size of the resulting DataFrame, not of the file:
+
+* Parquet and Feather: row counts and column types come from the footer.
+  String payloads come from the uncompressed column chunk sizes (Parquet)
+  or the file size (Feather), plus pandas' per-value string overhead.
+* CSV: a leading sample is parsed (skipping malformed rows, as
+  ``readers.read_csv`` does), and its in-memory bytes per row and file bytes
+  per row are extrapolated to the whole file. A sample that does not parse
+  falls back to the file size heuristic below.
+* Other formats: the file size times a per-format factor.
+
+Estimates only decide whether a load is attempted, so they favour speed
+over precision.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .utils import list_parquet_files, open_text, sniff_compression
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+# CSV options that change how the leading sample parses
+_CSV_SAMPLE_OPTIONS = ("sep", "delimiter", "header", "usecols", "dtype", "quotechar", "na_values")
+
+
+@lru_cache(maxsize=1)
+def _string_overhead() -> int:
+    """Bytes pandas spends per string value beyond its characters."""
+    import pandas as pd
+
+    return int(pd.Series([""] * 1000).memory_usage(deep=True, index=False)) // 1000
+
+
+def _fixed_width(data_type: pa.DataType) -> Optional[int]:
+    """Bytes per value of a fixed-width Arrow type, None for variable-width ones."""
+    import pyarrow as pa
+
+    if pa.types.is_dictionary(data_type) or pa.types.is_nested(data_type):
+        return None
+    try:
+        return max(data_type.bit_width // 8, 1)
+    except ValueError:
+        return None
+
+
+def estimate_parquet_bytes(metadata: pq.FileMetaData, columns: Optional[List[str]] = None) -> int:
+    """Estimated in-memory bytes of one Parquet file, from its footer metadata."""
+    schema = metadata.schema.to_arrow_schema()
+    encoded: Dict[str, int] = {}
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        for j in range(row_group.num_columns):
+            chunk = row_group.column(j)
+            name = chunk.path_in_schema.split(".")[0]
+            encoded[name] = encoded.get(name, 0) + chunk.total_uncompressed_size
+    total = 0
+    for field in schema:
+        if columns is not None and field.name not in columns:
+            continue
+        width = _fixed_width(field.type)
+        if width is not None:
+            total += metadata.num_rows * width
+        else:
+            total += encoded.get(field.name, 0) + metadata.num_rows * _string_overhead()
+    return total
+
+
+def _estimate_parquet(path: Path, columns: Optional[List[str]]) -> Tuple[int, int]:
+    import pyarrow.parquet as pq
+
+    total, rows = 0, 0
+    for file_path in list_parquet_files(path):
+        metadata = pq.read_metadata(file_path)
+        total += estimate_parquet_bytes(metadata, columns)
+        rows += metadata.num_rows
+    return total, rows
+
+
+def _estimate_feather(path: Path, columns: Optional[List[str]]) -> Tuple[int, int]:
+    import pyarrow as pa
+
+    with pa.memory_map(str(path)) as source:
+        reader = pa.ipc.open_file(source)
+        rows = reader.count_rows()
+        schema = reader.schema
+    widths = {field.name: _fixed_width(field.type) for field in schema}
+    fixed_total = sum(rows * w for w in widths.values() if w is not None)
+    variable = [name for name, w in widths.items() if w is None]
+    # Whatever the fixed-width columns do not account for is variable-width payload.
+    payload = max(path.stat().st_size - fixed_total, 0) / max(len(variable), 1)
+    total = 0
+    for name, width in widths.items():
+        if columns is not None and name not in columns:
+            continue
+        total += rows * width if width is not None else payload + rows * _string_overhead()
+    return int(total), rows
+
+
+def _estimate_csv(path: Path, **kwargs) -> Tuple[int, int]:
+    import pandas as pd
+
+    from .config import MEMORY_COMPRESSION_RATIO, MEMORY_SIZE_FACTORS, MEMORY_SNIFF_BYTES
+
+    compression = sniff_compression(path)
+    with open_text(path, compression=compression) as f:
+        sample = f.read(MEMORY_SNIFF_BYTES)
+        complete = not f.read(1)
+    if not complete:
+        sample = sample[: sample.rfind("\n") + 1] or sample
+    options = {k: v for k, v in kwargs.items() if k in _CSV_SAMPLE_OPTIONS}
+    file_bytes = path.stat().st_size * (MEMORY_COMPRESSION_RATIO if compression else 1)
+    try:
+        frame = pd.read_csv(io.StringIO(sample), **options)
+    except Exception:
+        # Same fallback as readers.read_csv for files with inconsistent rows
+        try:
+            frame = pd.read_csv(
+                io.StringIO(sample), engine="python", on_bad_lines="skip", **options
+            )
+        except Exception:
+            return int(file_bytes * MEMORY_SIZE_FACTORS.get(".csv", 2.0)), None
+    if complete or not len(frame):
+        return int(frame.memory_usage(deep=True, index=False).sum()), len(frame)
+
+    sample_bytes = len(sample.encode("utf-8"))
+    rows = int(len(frame) * file_bytes / sample_bytes)
+    per_row = frame.memory_usage(deep=True, index=False).sum() / len(frame)
+    return int(rows * per_row), rows
+
+
+def estimate_load_bytes(path: Path, **kwargs) -> Tuple[int, Optional[int]]:
+    """Estimate the in-memory size of loading ``path`` with reader ``kwargs``.
+
+    ``columns`` (or ``usecols`` for CSV) narrows the estimate to a projection.
+
+    Returns:
+        Estimated bytes and rows; rows is None when only the size is guessed.
+    """
+    from .config import MEMORY_SIZE_FACTORS
+
+    suffix = path.suffix.lower()
+    columns = kwargs.get("columns")
+    if suffix == ".parquet":
+        return _estimate_parquet(path, columns)
+    if suffix == ".feather":
+        return _estimate_feather(path, columns)
+    if suffix == ".csv":
+        return _estimate_csv(path, **kwargs)
+    return int(path.stat().st_size * MEMORY_SIZE_FACTORS.get(suffix, 2.0)), None
+
+
+def frame_bytes(df: Any) -> int:
+    """In-memory size of a DataFrame, or of a dict of them (multi-sheet Excel)."""
+    if isinstance(df, dict):
+        return sum(frame_bytes(frame) for frame in df.values())
+    return int(df.memory_usage(deep=True).sum())
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Resident memory of this process right now, None where it cannot be read."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+class PeakMemory:
+    """Sample resident memory in a background thread while a block runs.
+
+    ``ru_maxrss`` is the process's lifetime high-water mark, so it says
+    nothing about one load once the process has been larger before; this
+    samples the current RSS every ``MEMORY_PEAK_SAMPLE_SECONDS`` instead.
+
+    Attributes:
+        growth: Highest sampled RSS above the RSS on entry, or None where RSS
+            cannot be read (non-Linux systems).
+    """
+
+    def __init__(self) -> None:
+        self.growth: Optional[int] = None
+        self._baseline: Optional[int] = None
+        self._peak = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        rss = current_rss_bytes()
+        if rss is not None:
+            self._peak = max(self._peak, rss)
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self._sample()
+
+    def start(self) -> None:
+        """Record the baseline RSS and start sampling."""
+        from .config import MEMORY_PEAK_SAMPLE_SECONDS
+
+        self._baseline = current_rss_bytes()
+        if self._baseline is not None:
+            self._peak = self._baseline
+            self._thread = threading.Thread(
+                target=self._run, args=(MEMORY_PEAK_SAMPLE_SECONDS,), daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and set ``growth``; a no-op if sampling never started."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+        self._thread = None
+        self.growth = self._peak - self._baseline
+
+    def __enter__(self) -> PeakMemory:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def concat_chunks(chunks: Any, ignore_index: bool = True) -> pd.DataFrame:
+    """Concatenate a stream of chunks into one frame (empty if there are none).
+
+    Pass ``ignore_index=False`` to keep the chunks' own index (``index_col``).
+    """
+    import pandas as pd
+
+    frames = list(chunks)
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=ignore_index)
+
+
+def read_head_within(
+    chunks: Any, budget: int, ignore_index: bool = True
+) -> Tuple[pd.DataFrame, bool]:
+    """Concatenate leading chunks until ``budget`` bytes are used.
+
+    Pass ``ignore_index=False`` to keep the chunks' own index (``index_col``).
+
+    Returns the rows read and whether the input was cut short.
+    """
+    import pandas as pd
+
+    frames: List[pd.DataFrame] = []
+    used = 0
+    truncated = False
+    for chunk in chunks:
+        size = frame_bytes(chunk)
+        if used + size > budget:
+            keep = int(len(chunk) * (budget - used) / size) if size else 0
+            frames.append(chunk.iloc[:keep])
+            truncated = True
+            break
+        frames.append(chunk)
+        used += size
+    close = getattr(chunks, "close", None)
+    if close is not None:
+        close()
+    if not frames:
+        return pd.DataFrame(), truncated
+    return pd.concat(frames, ignore_index=ignore_index), truncated
@@ -1,21 +1,40 @@
 """Metadata handling: checksums and sidecar files."""
 
+from __future__ import annotations
+
 import hashlib
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from .progress import CancellationToken, ProgressCallback
 
 logger = logging.getLogger(__name__)
 
 
-def calculate_checksum(path: Path, chunk_size: int = 8192) -> str:
-    """Calculate MD5 checksum of a file."""
+def calculate_checksum(
+    path: Path,
+    chunk_size: int = 8192,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[CancellationToken] = None,
+) -> str:
+    """Calculate MD5 checksum of a file, optionally reporting progress and honouring ``cancel``."""
+    from .progress import tracker_for
+
     hash_md5 = hashlib.md5()
+    tracker = tracker_for(f"Checksum of {path}", progress, cancel, Path(path).stat().st_size)
     with open(path, "rb") as f:
+        done = 0
         for chunk in iter(lambda: f.read(chunk_size), b""):
             hash_md5.update(chunk)
+            if tracker is not None:
+                done += len(chunk)
+                tracker.update(bytes_done=done)
+    if tracker is not None:
+        tracker.finish()
     return hash_md5.hexdigest()
 
 
@@ -36,6 +55,19 @@ def serialize_metadata(attrs: Dict[str, Any]) -> Dict[str, Any]:
     return serialized
 
 
+def with_serializable_attrs(df: Any) -> Any:
+    """Shallow copy of ``df`` whose attrs pass the JSON encoding of Arrow's pandas metadata.
+
+    Frames from ``DataManager.load`` carry datetimes in their attrs, which
+    pyarrow cannot embed as they are.
+    """
+    if not getattr(df, "attrs", None):
+        return df
+    df = df.copy(deep=False)
+    df.attrs = serialize_metadata(df.attrs)
+    return df
+
+
 def save_sidecar_metadata(attrs: Dict[str, Any], path: Path) -> None:
     """Save metadata to sidecar JSON file."""
     meta_path = path.with_suffix(path.suffix + ".meta.json")
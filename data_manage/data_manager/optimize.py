@@ -0,0 +1,309 @@
+"""Parquet layout optimisation and small-file compaction.
+
+:func:`optimize_parquet` rewrites one Parquet file, or each directory of
+Parquet files under a dataset root, into files of about
+``PARQUET_TARGET_FILE_BYTES``. Each output has full row groups of
+``PARQUET_ROW_GROUP_ROWS`` rows, page statistics and a page index, and uses
+dictionary encoding only on columns where it pays off.
+
+With ``sort_by``, rows are range-partitioned on the first sort column using
+sampled cut points. Each range is spilled to disk, sorted in memory and
+written in order, so min/max statistics of files and row groups barely
+overlap and filters prune most of them. Hive-style partition directories
+(``key=value/``) are compacted one directory at a time, keeping the layout.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
+
+from .utils import list_parquet_files
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+
+def _parquet_groups(path: Path) -> Dict[Path, List[Path]]:
+    """Map each directory to the Parquet files it holds directly."""
+    groups: Dict[Path, List[Path]] = {}
+    for file_path in list_parquet_files(path):
+        groups.setdefault(file_path.parent, []).append(file_path)
+    return groups
+
+
+def _dictionary_columns(sample: pa.Table, max_ratio: float) -> List[str]:
+    """Columns whose distinct-to-row ratio in ``sample`` is low enough to dictionary-encode."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if not sample.num_rows:
+        return []
+    columns = []
+    for field in sample.schema:
+        if pa.types.is_nested(field.type) or pa.types.is_floating(field.type):
+            continue
+        distinct = pc.count_distinct(sample.column(field.name)).as_py()
+        if distinct / sample.num_rows <= max_ratio:
+            columns.append(field.name)
+    return columns
+
+
+def _cut_points(dataset: Any, column: str, buckets: int, sample_rows: int) -> Optional[np.ndarray]:
+    """Approximate ``buckets``-quantiles of ``column`` from an evenly strided sample."""
+    import numpy as np
+    import pyarrow as pa
+
+    if buckets < 2:
+        return None
+    step = max(1, dataset.count_rows() // sample_rows)
+    samples = [
+        batch.column(0).take(pa.array(np.arange(0, batch.num_rows, step)))
+        for batch in dataset.to_batches(columns=[column])
+    ]
+    values = pa.chunked_array(samples, type=dataset.schema.field(column).type).drop_null()
+    if not len(values):
+        return None
+    ordered = np.sort(values.to_numpy(zero_copy_only=False))
+    positions = np.linspace(0, len(ordered), buckets + 1)[1:-1].astype(int)
+    return np.unique(ordered[positions])
+
+
+def _bucket_ids(table: pa.Table, column: str, cuts: np.ndarray) -> np.ndarray:
+    """Range bucket of each row; nulls go to the last bucket."""
+    import numpy as np
+
+    values = table.column(column)
+    ids = np.full(table.num_rows, len(cuts), dtype=np.int64)
+    valid = values.is_valid().to_numpy(zero_copy_only=False)
+    present = values.drop_null().to_numpy(zero_copy_only=False)
+    ids[valid] = np.searchsorted(cuts, present, side="right")
+    return ids
+
+
+class _RollingWriter:
+    """Write tables as full row groups, starting a new file past ``target_bytes``.
+
+    With ``single_file`` set, everything goes to that one path.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        schema: pa.Schema,
+        options: Dict[str, Any],
+        row_group_size: int,
+        target_bytes: int,
+        single_file: Optional[Path] = None,
+    ):
+        self.directory = directory
+        self.schema = schema
+        self.options = options
+        self.row_group_size = row_group_size
+        self.target_bytes = target_bytes
+        self.single_file = single_file
+        self.files: List[Path] = []
+        self.row_groups = 0
+        self._prefix = f"part-{uuid.uuid4().hex[:8]}"
+        self._writer = None
+        self._pending: List[pa.Table] = []
+        self._pending_rows = 0
+
+    def _open(self) -> None:
+        import pyarrow.parquet as pq
+
+        if self.single_file is not None:
+            path = self.single_file
+        else:
+            path = self.directory / f"{self._prefix}-{len(self.files):05d}.parquet"
+        self._writer = pq.ParquetWriter(path, self.schema, **self.options)
+        self.files.append(path)
+
+    def _flush(self, rows: int) -> None:
+        import pyarrow as pa
+
+        table = pa.concat_tables(self._pending).combine_chunks()
+        if self._writer is None:
+            self._open()
+        self._writer.write_table(table.slice(0, rows), row_group_size=self.row_group_size)
+        self.row_groups += 1
+        rest = table.slice(rows)
+        self._pending = [rest] if rest.num_rows else []
+        self._pending_rows = rest.num_rows
+        if self.single_file is None and os.path.getsize(self.files[-1]) >= self.target_bytes:
+            self._writer.close()
+            self._writer = None
+
+    def write(self, table: pa.Table) -> None:
+        if table.schema != self.schema:
+            table = table.cast(self.schema)
+        self._pending.append(table)
+        self._pending_rows += table.num_rows
+        while self._pending_rows >= self.row_group_size:
+            self._flush(self.row_group_size)
+
+    def close(self) -> None:
+        if self._pending_rows:
+            self._flush(self._pending_rows)
+        elif self._writer is None and not self.files:
+            # No rows at all: still leave a valid (empty) file behind.
+            self._open()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def _sorted_tables(
+    dataset: Any,
+    sort_by: List[str],
+    batch_size: int,
+    memory_bytes: int,
+    sample_rows: int,
+    spill_dir: Optional[Union[str, Path]],
+) -> Iterable[pa.Table]:
+    """Yield the dataset sorted by ``sort_by``, one range bucket at a time."""
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    keys = [(column, "ascending") for column in sort_by]
+    uncompressed = sum(
+        fragment.metadata.row_group(i).total_byte_size
+        for fragment in dataset.get_fragments()
+        for i in range(fragment.metadata.num_row_groups)
+    )
+    buckets = -(-uncompressed // memory_bytes)
+    cuts = _cut_points(dataset, sort_by[0], buckets, sample_rows)
+    if cuts is None:
+        table = dataset.to_table()
+        yield table.sort_by(keys)
+        return
+
+    with tempfile.TemporaryDirectory(prefix="dm-optimize-", dir=spill_dir) as tempdir:
+        pieces: Dict[int, List[Path]] = {}
+        for batch in dataset.to_batches(batch_size=batch_size):
+            table = pa.Table.from_batches([batch])
+            ids = _bucket_ids(table, sort_by[0], cuts)
+            for bucket in np.unique(ids):
+                paths = pieces.setdefault(int(bucket), [])
+                path = Path(tempdir) / f"{int(bucket)}-{len(paths)}.arrow"
+                feather.write_feather(table.take(np.flatnonzero(ids == bucket)), path)
+                paths.append(path)
+        for bucket in sorted(pieces):
+            table = pa.concat_tables(feather.read_table(path) for path in pieces[bucket])
+            yield table.sort_by(keys)
+
+
+def optimize_parquet(
+    path: Path,
+    *,
+    sort_by: Optional[List[str]] = None,
+    row_group_size: Optional[int] = None,
+    target_file_bytes: Optional[int] = None,
+    compression: Optional[str] = None,
+    spill_dir: Optional[Union[str, Path]] = None,
+) -> Dict[str, Any]:
+    """Rewrite a Parquet file or dataset directory in place with a tuned layout.
+
+    New files are written next to the old ones and moved into place before
+    the old ones are deleted, so an interruption can leave duplicates but
+    never loses rows.
+
+    Returns:
+        Counts of files, rows, row groups and bytes before and after.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    from .config import (
+        PARQUET_DICTIONARY_MAX_RATIO,
+        PARQUET_ROW_GROUP_ROWS,
+        PARQUET_SORT_MEMORY_BYTES,
+        PARQUET_SORT_SAMPLE_ROWS,
+        PARQUET_TARGET_FILE_BYTES,
+        WRITER_DEFAULTS,
+    )
+
+    row_group_size = row_group_size or PARQUET_ROW_GROUP_ROWS
+    target_file_bytes = target_file_bytes or PARQUET_TARGET_FILE_BYTES
+    compression = compression or WRITER_DEFAULTS[".parquet"].get("compression", "snappy")
+    sort_by = list(sort_by or [])
+
+    report = {
+        "path": str(path),
+        "files_before": 0,
+        "files_after": 0,
+        "rows": 0,
+        "row_groups": 0,
+        "bytes_before": 0,
+        "bytes_after": 0,
+    }
+    for directory, files in _parquet_groups(path).items():
+        schema = pa.unify_schemas(
+            [pq.read_schema(file_path) for file_path in files], promote_options="permissive"
+        )
+        missing = [column for column in sort_by if column not in schema.names]
+        if missing:
+            raise ValueError(f"sort_by columns not in {directory}: {missing}")
+        dataset = ds.dataset(files, schema=schema, format="parquet")
+        sample = dataset.head(row_group_size)
+
+        options: Dict[str, Any] = {
+            "compression": compression,
+            "use_dictionary": _dictionary_columns(sample, PARQUET_DICTIONARY_MAX_RATIO),
+            "write_statistics": True,
+            "write_page_index": True,
+        }
+        if sort_by:
+            options["sorting_columns"] = pq.SortingColumn.from_ordering(
+                schema, [(column, "ascending") for column in sort_by]
+            )
+            tables = _sorted_tables(
+                dataset,
+                sort_by,
+                row_group_size,
+                PARQUET_SORT_MEMORY_BYTES,
+                PARQUET_SORT_SAMPLE_ROWS,
+                spill_dir,
+            )
+        else:
+            tables = (
+                pa.Table.from_batches([batch])
+                for batch in dataset.to_batches(batch_size=row_group_size)
+            )
+
+        with tempfile.TemporaryDirectory(prefix=".optimize-", dir=directory) as staging:
+            single_file = Path(staging) / path.name if path.is_file() else None
+            writer = _RollingWriter(
+                Path(staging), schema, options, row_group_size, target_file_bytes, single_file
+            )
+            for table in tables:
+                writer.write(table)
+            writer.close()
+
+            report["files_before"] += len(files)
+            report["bytes_before"] += sum(file_path.stat().st_size for file_path in files)
+            report["rows"] += dataset.count_rows()
+            report["row_groups"] += writer.row_groups
+            if single_file is not None:
+                report["bytes_after"] += single_file.stat().st_size
+                os.replace(single_file, path)
+                report["files_after"] += 1
+                continue
+            for new_file in writer.files:
+                report["bytes_after"] += new_file.stat().st_size
+                os.replace(new_file, directory / new_file.name)
+            report["files_after"] += len(writer.files)
+            for old_file in files:
+                old_file.unlink()
+
+        logger.debug("Optimized %s: %s files -> %s", directory, len(files), len(writer.files))
+    return report
@@ -0,0 +1,122 @@
+"""Progress callbacks and cooperative cancellation for long operations.
+
+Loads, saves, chunked reads and checksums accept ``progress`` and
+``cancel`` arguments:
+
+* ``progress(bytes_done, bytes_total, rows)`` is called as work advances
+  (at most every ``PROGRESS_INTERVAL_SECONDS``, and once at the end).
+  ``bytes_total`` is None when it is unknown, as for saves. For reads that
+  cannot count bytes directly, ``bytes_done`` is extrapolated from the rows
+  read and the estimated row count.
+* ``cancel`` is a :class:`CancellationToken`. Work stops at the next chunk
+  boundary after :meth:`CancellationToken.cancel` with
+  OperationCancelledError, and partial output is removed.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from .exceptions import OperationCancelledError
+
+ProgressCallback = Callable[[int, Optional[int], int], None]
+
+
+class CancellationToken:
+    """Flag shared with a running operation to ask it to stop; safe across threads."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+
+    def cancel(self, reason: Optional[str] = None) -> None:
+        self.reason = reason
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class ProgressTracker:
+    """Reports progress of one operation and stops it once cancelled.
+
+    Args:
+        operation: Name used in the cancellation error.
+        bytes_total: Total bytes of work, if known.
+        progress: Callback receiving (bytes_done, bytes_total, rows).
+        cancel: Token checked at every chunk boundary.
+        rows_total: Expected rows, to extrapolate bytes from rows read.
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        bytes_total: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None,
+        cancel: Optional[CancellationToken] = None,
+        rows_total: Optional[int] = None,
+    ):
+        self.operation = operation
+        self.bytes_total = bytes_total
+        self.progress = progress
+        self.cancel = cancel
+        self.rows_total = rows_total
+        self.bytes_done = 0
+        self.rows = 0
+        self._reported = 0.0
+
+    def check(self) -> None:
+        """Raise OperationCancelledError if the operation was cancelled."""
+        if self.cancel is not None and self.cancel.cancelled:
+            raise OperationCancelledError(self.operation, self.cancel.reason)
+
+    def update(self, rows: int = 0, bytes_done: Optional[int] = None) -> None:
+        """Record ``rows`` more rows (and the bytes done so far), then check for cancellation."""
+        from .config import PROGRESS_INTERVAL_SECONDS
+
+        self.rows += rows
+        if bytes_done is not None:
+            self.bytes_done = bytes_done
+        elif self.bytes_total and self.rows_total:
+            self.bytes_done = min(self.bytes_total * self.rows // self.rows_total, self.bytes_total)
+        now = time.monotonic()
+        if self.progress is not None and now - self._reported >= PROGRESS_INTERVAL_SECONDS:
+            self._reported = now
+            self.progress(self.bytes_done, self.bytes_total, self.rows)
+        self.check()
+
+    def finish(self) -> None:
+        """Report completion."""
+        if self.bytes_total is not None:
+            self.bytes_done = self.bytes_total
+        if self.progress is not None:
+            self.progress(self.bytes_done, self.bytes_total, self.rows)
+
+    def track(self, chunks: Iterable[Any]) -> Iterator[Any]:
+        """Pass chunks through, counting their rows and stopping once cancelled."""
+        try:
+            self.check()
+            for chunk in chunks:
+                self.update(len(chunk))
+                yield chunk
+            self.finish()
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+
+
+def tracker_for(
+    operation: str,
+    progress: Optional[ProgressCallback],
+    cancel: Optional[CancellationToken],
+    bytes_total: Optional[int] = None,
+    rows_total: Optional[int] = None,
+) -> Optional[ProgressTracker]:
+    """A tracker if either ``progress`` or ``cancel`` is given, else None."""
+    if progress is None and cancel is None:
+        return None
+    return ProgressTracker(operation, bytes_total, progress, cancel, rows_total)
@@ -0,0 +1,382 @@
+"""Lazy query plans over DataManager sources.
+
+``DataManager.scan`` returns a :class:`LazyFrame`. Methods such as ``filter``
+and ``select`` only record steps in a plan. ``collect`` then streams the
+source chunk by chunk:
+
+    from data_manager import col
+
+    dm.scan("events.parquet").filter(col("amount") > 100).groupby("region").agg(
+        {"amount": ["sum", "mean"]}
+    ).collect()
+
+Only the columns the plan references are read. Parquet and Feather apply
+filters inside the pyarrow dataset scanner, so row groups are pruned using
+their statistics. For other formats the filter runs on each chunk, using
+pyarrow compute. Grouped aggregates are computed per chunk and combined
+by :class:`aggregate.GroupAggregator`, which spills partials to disk when
+they outgrow the memory budget.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .aggregate import GroupAggregator, normalize_aggs
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+    from .manager import DataManager
+
+
+class Expr:
+    """Column expression that compiles to a ``pyarrow.compute.Expression``.
+
+    Build expressions with :func:`col` and Python operators. Each expression
+    tracks the columns it references, so scans read only those columns.
+    """
+
+    __slots__ = ("_build", "columns")
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, build: Callable[[], Any], columns: FrozenSet[str]):
+        self._build = build
+        self.columns = columns
+
+    def to_arrow(self) -> Any:
+        """Compile to a ``pyarrow.compute.Expression``."""
+        return self._build()
+
+    def _call(self, function: str, *others: Any) -> Expr:
+        columns = self.columns.union(*(o.columns for o in others if isinstance(o, Expr)))
+
+        def build() -> Any:
+            import pyarrow.compute as pc
+
+            return getattr(pc, function)(self.to_arrow(), *(_to_arrow(o) for o in others))
+
+        return Expr(build, columns)
+
+    def _reflected(self, function: str, other: Any) -> Expr:
+        def build() -> Any:
+            import pyarrow.compute as pc
+
+            return getattr(pc, function)(_to_arrow(other), self.to_arrow())
+
+        return Expr(build, self.columns)
+
+    def __eq__(self, other: Any) -> Expr:  # type: ignore[override]
+        return self._call("equal", other)
+
+    def __ne__(self, other: Any) -> Expr:  # type: ignore[override]
+        return self._call("not_equal", other)
+
+    def __lt__(self, other: Any) -> Expr:
+        return self._call("less", other)
+
+    def __le__(self, other: Any) -> Expr:
+        return self._call("less_equal", other)
+
+    def __gt__(self, other: Any) -> Expr:
+        return self._call("greater", other)
+
+    def __ge__(self, other: Any) -> Expr:
+        return self._call("greater_equal", other)
+
+    def __and__(self, other: Any) -> Expr:
+        return self._call("and_kleene", other)
+
+    def __or__(self, other: Any) -> Expr:
+        return self._call("or_kleene", other)
+
+    def __invert__(self) -> Expr:
+        return self._call("invert")
+
+    def __add__(self, other: Any) -> Expr:
+        return self._call("add", other)
+
+    def __radd__(self, other: Any) -> Expr:
+        return self._reflected("add", other)
+
+    def __sub__(self, other: Any) -> Expr:
+        return self._call("subtract", other)
+
+    def __rsub__(self, other: Any) -> Expr:
+        return self._reflected("subtract", other)
+
+    def __mul__(self, other: Any) -> Expr:
+        return self._call("multiply", other)
+
+    def __rmul__(self, other: Any) -> Expr:
+        return self._reflected("multiply", other)
+
+    def __truediv__(self, other: Any) -> Expr:
+        return self._call("divide", other)
+
+    def __rtruediv__(self, other: Any) -> Expr:
+        return self._reflected("divide", other)
+
+    def isin(self, values: Iterable[Any]) -> Expr:
+        """True where the value is one of ``values``."""
+        values = list(values)
+
+        def build() -> Any:
+            import pyarrow.compute as pc
+
+            return pc.is_in(self.to_arrow(), value_set=_value_set(values))
+
+        return Expr(build, self.columns)
+
+    def is_null(self) -> Expr:
+        """True where the value is missing."""
+        return self._call("is_null")
+
+    def is_valid(self) -> Expr:
+        """True where the value is present."""
+        return self._call("is_valid")
+
+
+def col(name: str) -> Expr:
+    """Reference a column by name in a query expression."""
+
+    def build() -> Any:
+        import pyarrow.compute as pc
+
+        return pc.field(name)
+
+    return Expr(build, frozenset({name}))
+
+
+def _to_arrow(value: Any) -> Any:
+    if isinstance(value, Expr):
+        return value.to_arrow()
+    import pyarrow.compute as pc
+
+    return pc.scalar(value)
+
+
+def _value_set(values: List[Any]) -> Any:
+    import pyarrow as pa
+
+    return pa.array(values)
+
+
+class LazyFrame:
+    """An immutable query plan over one DataManager source.
+
+    Every method returns a new LazyFrame; nothing is read until
+    :meth:`collect` or :meth:`iter_batches`.
+    """
+
+    def __init__(
+        self,
+        manager: DataManager,
+        filename: str,
+        *,
+        predicate: Optional[Expr] = None,
+        columns: Optional[List[str]] = None,
+        keys: Optional[List[str]] = None,
+        aggs: Optional[List[Tuple[str, str]]] = None,
+        memory_budget: Optional[int] = None,
+        limit: Optional[int] = None,
+        chunksize: Optional[int] = None,
+    ):
+        self._manager = manager
+        self._filename = filename
+        self._predicate = predicate
+        self._columns = columns
+        self._keys = keys
+        self._aggs = aggs
+        self._memory_budget = memory_budget
+        self._limit = limit
+        self._chunksize = chunksize
+
+    def _replace(self, **changes: Any) -> LazyFrame:
+        state = {
+            "predicate": self._predicate,
+            "columns": self._columns,
+            "keys": self._keys,
+            "aggs": self._aggs,
+            "memory_budget": self._memory_budget,
+            "limit": self._limit,
+            "chunksize": self._chunksize,
+        }
+        state.update(changes)
+        return LazyFrame(self._manager, self._filename, **state)
+
+    def filter(self, predicate: Expr) -> LazyFrame:
+        """Keep rows where ``predicate`` is true; repeated filters are ANDed."""
+        if self._aggs is not None:
+            raise ValueError("filter() must come before agg()")
+        if self._predicate is not None:
+            predicate = self._predicate & predicate
+        return self._replace(predicate=predicate)
+
+    def select(self, *columns: str) -> LazyFrame:
+        """Project the output to ``columns``."""
+        if self._aggs is not None:
+            raise ValueError("select() must come before agg()")
+        return self._replace(columns=list(columns))
+
+    def groupby(self, *keys: str) -> LazyFrame:
+        """Group by ``keys`` for a following :meth:`agg`."""
+        return self._replace(keys=list(keys))
+
+    def agg(
+        self,
+        aggs: Dict[str, Union[str, Sequence[str]]],
+        memory_budget: Optional[int] = None,
+    ) -> LazyFrame:
+        """Aggregate per group (or over all rows without ``groupby``).
+
+        ``aggs`` maps columns to one or more of ``aggregate.AGGREGATIONS``;
+        outputs are named ``<column>_<function>``. Partial results beyond
+        ``memory_budget`` bytes are spilled to disk.
+        """
+        return self._replace(
+            aggs=normalize_aggs(aggs), keys=self._keys or [], memory_budget=memory_budget
+        )
+
+    def limit(self, n: int) -> LazyFrame:
+        """Stop after ``n`` output rows (ignored for aggregations)."""
+        return self._replace(limit=n)
+
+    def chunksize(self, rows: int) -> LazyFrame:
+        """Set the number of rows read per chunk."""
+        return self._replace(chunksize=rows)
+
+    def _read_columns(self) -> Optional[List[str]]:
+        """Columns the source must provide, or None for all of them."""
+        if self._aggs is not None:
+            wanted = list(self._keys or []) + [column for column, _ in self._aggs]
+        elif self._columns is not None:
+            wanted = list(self._columns)
+        else:
+            return None
+        if self._predicate is not None:
+            wanted += sorted(self._predicate.columns)
+        return list(dict.fromkeys(wanted))
+
+    def _iter_source(self) -> Tuple[Iterator[pa.Table], Callable[[], pa.Table]]:
+        """Stream filtered Arrow tables plus a factory for an empty result table."""
+        import pyarrow as pa
+
+        from .config import DEFAULT_CHUNK_SIZE
+
+        if self._keys is not None and self._aggs is None:
+            raise ValueError("groupby() must be followed by agg()")
+
+        file_path = self._manager._resolve_read_path(self._filename)
+        suffix = file_path.suffix.lower()
+        columns = self._read_columns()
+        chunksize = self._chunksize or DEFAULT_CHUNK_SIZE
+        expression = self._predicate.to_arrow() if self._predicate is not None else None
+
+        if suffix in (".parquet", ".feather"):
+            import pyarrow.dataset as ds
+
+            dataset = ds.dataset(file_path, format="parquet" if suffix == ".parquet" else "ipc")
+
+            def empty() -> pa.Table:
+                table = dataset.schema.empty_table()
+                return table if columns is None else table.select(columns)
+
+            batches = dataset.to_batches(columns=columns, filter=expression, batch_size=chunksize)
+            tables = (pa.Table.from_batches([batch]) for batch in batches)
+            return self._manager._iter_locked(file_path, tables), empty
+
+        schema: List[pa.Schema] = []
+
+        def tables() -> Iterator[pa.Table]:
+            for chunk in self._manager.iter_chunks(self._filename, chunksize, columns=columns):
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if not schema:
+                    schema.append(table.schema)
+                yield table if expression is None else table.filter(expression)
+
+        def empty() -> pa.Table:
+            return schema[0].empty_table() if schema else pa.table({c: [] for c in columns or []})
+
+        return tables(), empty
+
+    def _project(self, tables: Iterator[pa.Table]) -> Iterator[pa.Table]:
+        """Apply ``select`` and ``limit`` to a stream of filtered tables."""
+        remaining = self._limit
+        for table in tables:
+            if self._columns is not None:
+                table = table.select(self._columns)
+            if remaining is not None:
+                table = table.slice(0, remaining)
+                remaining -= table.num_rows
+            if table.num_rows:
+                yield table
+            if remaining is not None and remaining <= 0:
+                break
+
+    def iter_tables(self) -> Iterator[pa.Table]:
+        """Stream the (non-aggregated) result as Arrow tables, chunk by chunk."""
+        if self._aggs is not None:
+            raise ValueError("iter_tables() does not apply to aggregations; use collect()")
+        tables, _ = self._iter_source()
+        return self._project(tables)
+
+    def iter_batches(self) -> Iterator[pd.DataFrame]:
+        """Stream the (non-aggregated) result as DataFrames, chunk by chunk."""
+        if self._aggs is not None:
+            raise ValueError("iter_batches() does not apply to aggregations; use collect()")
+        for table in self.iter_tables():
+            yield table.to_pandas()
+
+    def collect(self) -> pd.DataFrame:
+        """Execute the plan and return the result as a DataFrame."""
+        import pyarrow as pa
+
+        tables, empty = self._iter_source()
+        if self._aggs is not None:
+            aggregator = GroupAggregator(self._keys or [], self._aggs, self._memory_budget)
+            for table in tables:
+                if table.num_rows:
+                    aggregator.add(table)
+            df = aggregator.result(empty())
+            df.attrs["spilled_bytes"] = aggregator.spilled_bytes
+        else:
+            results = list(self._project(tables))
+            if results:
+                table = pa.concat_tables(results, promote_options="permissive")
+            else:
+                table = empty()
+                if self._columns is not None:
+                    table = table.select(self._columns)
+            df = table.to_pandas()
+
+        df.attrs["source_file"] = str(self._manager._resolve_read_path(self._filename))
+        return df
+
+    def __repr__(self) -> str:
+        steps = [f"scan({self._filename!r})"]
+        if self._predicate is not None:
+            steps.append(f"filter({sorted(self._predicate.columns)})")
+        if self._columns is not None:
+            steps.append(f"select({self._columns})")
+        if self._aggs is not None:
+            steps.append(f"groupby({self._keys}).agg({self._aggs})")
+        elif self._keys is not None:
+            steps.append(f"groupby({self._keys})")
+        if self._limit is not None:
+            steps.append(f"limit({self._limit})")
+        return "LazyFrame<" + ".".join(steps) + ">"
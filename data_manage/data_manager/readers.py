@@ -1,21 +1,275 @@
-"""Format-specific reader functions."""
+"""Format-specific reader functions.
 
+pandas and the format engines are imported inside each reader so that
+``import data_manager`` stays cheap; they are loaded on first use.
+"""
+
+from __future__ import annotations
+
+import json
 import logging
+import os
+import re
 from pathlib import Path
-
-import pandas as pd
+from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Iterator, List, Optional, Union
 
 from .exceptions import DataLoadError
+from .utils import open_text, sniff_compression
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+_JSON_WS = re.compile(r"[ \t\r\n]*")
 
-def read_csv(path: Path, **kwargs) -> pd.DataFrame:
-    """Read CSV file."""
-    from .config import READER_DEFAULTS
+
+# read_csv options that break when the file is parsed as independent byte ranges
+_CSV_RANGE_UNSAFE_OPTIONS = frozenset(
+    {
+        "chunksize",
+        "compression",
+        "header",
+        "iterator",
+        "lineterminator",
+        "names",
+        "nrows",
+        "skipfooter",
+        "skiprows",
+    }
+)
+
+# Options needed to read the header row the same way as the data
+_CSV_DIALECT_OPTIONS = frozenset(
+    {"delimiter", "doublequote", "encoding", "escapechar", "quotechar", "sep", "skipinitialspace"}
+)
+
+
+def _csv_ranges_supported(path: Path, options: Dict[str, Any]) -> bool:
+    if _CSV_RANGE_UNSAFE_OPTIONS.intersection(options):
+        return False
+    if options.get("quotechar", '"') != '"' or options.get("escapechar"):
+        return False
+    encoding = (options.get("encoding") or "utf-8").lower().replace("_", "-")
+    if encoding.startswith(("utf-16", "utf-32")):
+        return False
+    return sniff_compression(path) is None
+
+
+def _count_quotes(path: Path, start: int, stop: int) -> int:
+    """Count the quote characters in bytes ``[start, stop)`` (runs in a worker process)."""
+    from .config import CSV_SCAN_BLOCK_SIZE
+
+    count = 0
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = stop - start
+        while remaining > 0:
+            block = f.read(min(CSV_SCAN_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            count += block.count(b'"')
+            remaining -= len(block)
+    return count
+
+
+def _next_record_start(f: BinaryIO, offset: int, in_quotes: bool) -> int:
+    """Offset just past the first unquoted newline at or after ``offset``.
+
+    ``in_quotes`` is the quote state at ``offset``. Returns the file size when
+    no record starts after ``offset``.
+    """
+    from .config import CSV_SCAN_BLOCK_SIZE
+
+    f.seek(offset)
+    position = offset
+    for block in iter(lambda: f.read(CSV_SCAN_BLOCK_SIZE), b""):
+        start = 0
+        while True:
+            newline = block.find(b"\n", start)
+            end = len(block) if newline == -1 else newline
+            in_quotes = bool((in_quotes + block.count(b'"', start, end)) % 2)
+            if newline == -1:
+                break
+            if not in_quotes:
+                return position + newline + 1
+            start = newline + 1
+        position += len(block)
+    return position
+
+
+def _csv_byte_ranges(path: Path, parts: int, pool: Executor) -> List[tuple]:
+    """Split the data rows of ``path`` into up to ``parts`` record-aligned byte ranges.
+
+    The file is cut at even byte offsets and each cut is moved forward to the
+    next record boundary. Quote characters are counted per piece in ``pool``,
+    so the quote state at every cut is known without a sequential scan, and a
+    range never starts inside a quoted field that spans lines.
+    """
+    size = path.stat().st_size
+    cuts = [size * part // parts for part in range(parts + 1)]
+    quotes = list(pool.map(_count_quotes, [path] * parts, cuts[:-1], cuts[1:]))
+
+    with open(path, "rb") as f:
+        bounds = [_next_record_start(f, 0, False)]
+        seen = quotes[0]
+        for cut, count in zip(cuts[1:-1], quotes[1:]):
+            bound = _next_record_start(f, cut, bool(seen % 2)) if cut > bounds[-1] else 0
+            if bounds[-1] < bound < size:
+                bounds.append(bound)
+            seen += count
+    if bounds[0] >= size:
+        return []
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _read_csv_range(
+    path: Path, start: int, stop: int, names: List[str], options: Dict[str, Any]
+) -> pd.DataFrame:
+    """Parse the records in bytes ``[start, stop)`` of a CSV (runs in a worker process)."""
+    import io
+
+    import pandas as pd
+
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(stop - start)
+    return pd.read_csv(io.BytesIO(data), header=None, names=names, **options)
+
+
+def _is_text(series: pd.Series) -> bool:
+    """Whether a parsed column holds strings (object columns of bools and NaN do not)."""
+    import pandas as pd
+
+    if not pd.api.types.is_string_dtype(series.dtype):
+        return False
+    return pd.api.types.infer_dtype(series, skipna=True) in ("string", "empty")
+
+
+def _unify_dtypes(frames: List[pd.DataFrame]) -> None:
+    """Cast columns whose numpy dtype differs between ranges to one common dtype.
+
+    Numeric columns take the widest type (an int range next to one with
+    blanks becomes float64); any other mix, such as bool next to object or
+    float, becomes object, as a single-pass parse would produce.
+    """
+    import numpy as np
+    import pandas as pd
+
+    for column in frames[0].columns:
+        dtypes = {frame[column].dtype for frame in frames}
+        if len(dtypes) < 2 or not all(isinstance(dtype, np.dtype) for dtype in dtypes):
+            continue
+        numeric = all(
+            pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+            for dtype in dtypes
+        )
+        common = np.result_type(*dtypes) if numeric else np.dtype(object)
+        for frame in frames:
+            if frame[column].dtype != common:
+                frame[column] = frame[column].astype(common)
+
+
+def _read_csv_parallel(path: Path, options: Dict[str, Any]) -> Optional[pd.DataFrame]:
+    """Parse record-aligned byte ranges of ``path`` in a process pool.
+
+    Ranges infer dtypes independently. A column that came out as strings in
+    one range but not in another is re-parsed as strings in the others, as
+    a single-pass parse would have done; other differences are resolved by
+    :func:`_unify_dtypes`. Returns None when the file has too few rows to
+    split.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    import pandas as pd
+
+    from .config import CSV_MAX_WORKERS, CSV_MIN_RANGE_BYTES
+
+    size = path.stat().st_size
+    workers = min(CSV_MAX_WORKERS or os.cpu_count() or 1, max(1, size // CSV_MIN_RANGE_BYTES))
+    if workers < 2:
+        return None
+
+    # Full header, so ``usecols`` and ``index_col`` resolve the same way in every range.
+    header_options = {k: v for k, v in options.items() if k in _CSV_DIALECT_OPTIONS}
+    names = list(pd.read_csv(path, nrows=0, **header_options).columns)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        ranges = _csv_byte_ranges(path, workers, pool)
+        if len(ranges) < 2:
+            return None
+        starts, stops = zip(*ranges)
+        frames = list(
+            pool.map(
+                _read_csv_range,
+                [path] * len(ranges),
+                starts,
+                stops,
+                [names] * len(ranges),
+                [options] * len(ranges),
+            )
+        )
+
+        text = [{column for column in frame.columns if _is_text(frame[column])} for frame in frames]
+        conflicts = [
+            column
+            for column in frames[0].columns
+            if len({str(frame[column].dtype) for frame in frames}) > 1
+            and any(column in columns for columns in text)
+        ]
+        redo = [
+            i
+            for i, columns in enumerate(text)
+            if any(column not in columns for column in conflicts)
+        ]
+        if redo:
+            dtype = options.get("dtype")
+            dtype = dict(dtype) if isinstance(dtype, dict) else {}
+            dtype.update({column: str for column in conflicts})
+            retry = {**options, "dtype": dtype}
+            reparsed = pool.map(
+                _read_csv_range,
+                [path] * len(redo),
+                [starts[i] for i in redo],
+                [stops[i] for i in redo],
+                [names] * len(redo),
+                [retry] * len(redo),
+            )
+            for i, frame in zip(redo, reparsed):
+                frames[i] = frame
+
+    _unify_dtypes(frames)
+    logger.debug("Parsed %s in %s byte ranges", path, len(frames))
+    return pd.concat(frames, ignore_index=options.get("index_col") is None)
+
+
+def read_csv(path: Path, *, parallel: Optional[bool] = None, **kwargs) -> pd.DataFrame:
+    """Read CSV file.
+
+    Uncompressed files of at least ``CSV_PARALLEL_THRESHOLD_BYTES`` (or any
+    file with ``parallel=True``) are split into record-aligned byte ranges
+    that are parsed in worker processes, so converters and date parsing run
+    in parallel too. Options must be picklable in that mode. Options that
+    depend on reading the file as a whole, such as ``nrows`` or ``skiprows``,
+    always use a single pass.
+    """
+    import pandas as pd
+
+    from .config import CSV_PARALLEL_THRESHOLD_BYTES, READER_DEFAULTS
 
     defaults = READER_DEFAULTS[".csv"].copy()
     defaults.update(kwargs)
+    if parallel is None:
+        parallel = path.stat().st_size >= CSV_PARALLEL_THRESHOLD_BYTES
+    if parallel and _csv_ranges_supported(path, defaults):
+        try:
+            df = _read_csv_parallel(path, defaults)
+            if df is not None:
+                return df
+        except Exception as e:
+            logger.warning("Parallel parse of %s failed (%s); reading in one pass", path, e)
     try:
         return pd.read_csv(path, **defaults)
     except Exception as e:
@@ -40,11 +294,179 @@ def read_csv(path: Path, **kwargs) -> pd.DataFrame:
             raise DataLoadError(str(path), f"CSV parse error: {fallback_error}") from fallback_error
 
 
-def read_json(path: Path, **kwargs) -> pd.DataFrame:
-    """Read JSON file (normal or NDJSON)."""
+def _first_significant_char(path: Path) -> str:
+    """Return the first non-whitespace character of a text file ('' if empty)."""
+    with open_text(path) as f:
+        while True:
+            block = f.read(4096)
+            if not block:
+                return ""
+            stripped = block.lstrip()
+            if stripped:
+                return stripped[0]
+
+
+def iter_json_array_records(path: Path, block_size: Optional[int] = None) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array one at a time.
+
+    The file is read in blocks of ``block_size`` characters and each element is
+    decoded with ``json.JSONDecoder.raw_decode``, so memory is bounded by the
+    largest single element rather than the size of the file.
+    """
+    from .config import JSON_STREAM_BLOCK_SIZE, JSON_STREAM_MAX_RECORD_CHARS
+
+    block_size = block_size or JSON_STREAM_BLOCK_SIZE
+    decoder = json.JSONDecoder()
+
+    with open_text(path) as f:
+        buf = ""
+        pos = 0
+        eof = False
+
+        def fill() -> bool:
+            nonlocal buf, pos, eof
+            if eof:
+                return False
+            block = f.read(block_size)
+            if not block:
+                eof = True
+                return False
+            buf = buf[pos:] + block
+            pos = 0
+            return True
+
+        def skip_ws() -> bool:
+            """Advance past whitespace; False if the input is exhausted."""
+            nonlocal pos
+            while True:
+                pos = _JSON_WS.match(buf, pos).end()
+                if pos < len(buf):
+                    return True
+                if not fill():
+                    return False
+
+        if not skip_ws() or buf[pos] != "[":
+            raise ValueError("Expected a top-level JSON array")
+        pos += 1
+
+        if not skip_ws():
+            raise ValueError("Unterminated JSON array")
+        if buf[pos] == "]":
+            return
+
+        while True:
+            if not skip_ws():
+                raise ValueError("Unterminated JSON array")
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    # More input completes a record split across blocks, but
+                    # malformed input must not be buffered to the end of the file.
+                    if len(buf) - pos > JSON_STREAM_MAX_RECORD_CHARS or not fill():
+                        raise
+                    continue
+                # A bare number at the very end of the buffer may be truncated.
+                if end == len(buf) and fill():
+                    continue
+                break
+            pos = end
+            yield value
+
+            if not skip_ws():
+                raise ValueError("Unterminated JSON array")
+            if buf[pos] == ",":
+                pos += 1
+            elif buf[pos] == "]":
+                return
+            else:
+                raise ValueError(f"Expected ',' or ']' in JSON array, got {buf[pos]!r}")
+
+
+def _records_to_frame(records: List[Any]) -> pd.DataFrame:
+    """Build a DataFrame column by column from a batch of JSON records."""
+    import pandas as pd
+
+    rows = [record if isinstance(record, dict) else {0: record} for record in records]
+    keys: Dict[Any, None] = {}
+    last_keys = None
+    for row in rows:
+        row_keys = row.keys()
+        if row_keys != last_keys:
+            keys.update(dict.fromkeys(row_keys))
+            last_keys = row_keys
+    return pd.DataFrame({key: [row.get(key) for row in rows] for key in keys})
+
+
+def _check_stream_options(path: Path, kwargs: Dict[str, Any]) -> None:
+    """Reject pandas options that the streaming JSON array parser would ignore."""
     from .config import READER_DEFAULTS
 
+    defaults = READER_DEFAULTS[".json"]
+    unsupported = sorted(key for key, value in kwargs.items() if defaults.get(key) != value)
+    if unsupported:
+        raise ValueError(
+            f"Options {unsupported} are not supported when streaming the JSON array in {path}"
+        )
+
+
+def iter_json_array(
+    path: Path, chunksize: Optional[int] = None, columns: Optional[List[str]] = None
+) -> Iterator[pd.DataFrame]:
+    """Stream a top-level JSON array as DataFrames of at most ``chunksize`` rows.
+
+    Records without one of ``columns`` get None there, but a column that no
+    record has raises ValueError once the array is read.
+    """
+    from .config import DEFAULT_CHUNK_SIZE
+
+    chunksize = chunksize or DEFAULT_CHUNK_SIZE
+    missing = set(columns or ())
+    batch: List[Any] = []
+    for record in iter_json_array_records(path):
+        if columns is not None and isinstance(record, dict):
+            if missing:
+                missing.difference_update(record.keys())
+            record = {key: record.get(key) for key in columns}
+        batch.append(record)
+        if len(batch) >= chunksize:
+            yield _records_to_frame(batch)
+            batch = []
+    if batch:
+        yield _records_to_frame(batch)
+    if missing:
+        raise ValueError(f"Columns not found in {path}: {sorted(missing)}")
+
+
+def read_json(path: Path, *, stream: bool = False, **kwargs) -> pd.DataFrame:
+    """Read JSON file (normal or NDJSON).
+
+    With ``stream=True``, a top-level array is parsed incrementally in
+    ``DEFAULT_CHUNK_SIZE`` row batches instead of by ``pd.read_json``, which
+    holds the raw text, Python objects and frame at once. The streaming path
+    keeps the decoded JSON types and does not apply pandas' date conversion or
+    dtype inference, so it is opt-in (as is ``iter_chunks``, which streams).
+    pandas options such as ``dtype`` or ``convert_dates`` raise ValueError
+    there rather than being ignored.
+    """
+    import pandas as pd
+
+    from .config import READER_DEFAULTS
+
+    if stream and _first_significant_char(path) == "[":
+        _check_stream_options(path, kwargs)
+        try:
+            frames = list(iter_json_array(path))
+        except ValueError as e:
+            raise DataLoadError(str(path), f"JSON parse error: {e}") from e
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True, copy=False) if len(frames) > 1 else frames[0]
+
     defaults = READER_DEFAULTS[".json"].copy()
+    compression = sniff_compression(path)
+    if compression is not None:
+        defaults["compression"] = compression
     defaults.update(kwargs)
 
     try:
@@ -53,6 +475,8 @@ def read_json(path: Path, **kwargs) -> pd.DataFrame:
         # Try as NDJSON
         logger.debug("Trying NDJSON fallback for %s", path)
         defaults_ndjson = READER_DEFAULTS[".jsonl"].copy()
+        if compression is not None:
+            defaults_ndjson["compression"] = compression
         defaults_ndjson.update(kwargs)
         defaults_ndjson["lines"] = True
         try:
@@ -63,30 +487,269 @@ def read_json(path: Path, **kwargs) -> pd.DataFrame:
         raise DataLoadError(str(path), f"JSON parse error: {e}") from e
 
 
-def read_excel(path: Path, **kwargs) -> pd.DataFrame:
-    """Read Excel file."""
-    from .config import READER_DEFAULTS
+def _excel_column_names(header: List[Any], width: int) -> List[Any]:
+    """Name header cells like pandas: blanks become 'Unnamed: i', repeats get '.n'."""
+    names: List[Any] = []
+    seen: Dict[Any, int] = {}
+    for i in range(width):
+        name = header[i] if i < len(header) else None
+        if name is None:
+            name = f"Unnamed: {i}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        seen.setdefault(name, 0)
+        names.append(name)
+    return names
+
+
+def _missing_as_nan(df: pd.DataFrame) -> pd.DataFrame:
+    """Use NaN for empty cells in object columns, as ``pd.read_excel`` does.
+
+    Columns with no values at all become float64 NaN columns, also as in pandas.
+    """
+    import numpy as np
+    import pandas as pd
+
+    for position, dtype in enumerate(df.dtypes):
+        if not pd.api.types.is_object_dtype(dtype):
+            continue
+        column = df.iloc[:, position]
+        missing = column.isna()
+        if missing.all():
+            df.isetitem(position, np.full(len(df), np.nan))
+        elif missing.any():
+            df.isetitem(position, column.where(~missing, np.nan))
+    return df
+
+
+def _iter_xlsx_rows(worksheet) -> Iterator[tuple]:
+    """Yield row value tuples from a read-only worksheet, dropping trailing blank rows."""
+    # Dimension tags written by some tools are wrong; pandas resets them too.
+    worksheet.reset_dimensions()
+    pending_blank = 0
+    for row in worksheet.iter_rows(values_only=True):
+        if all(value is None for value in row):
+            pending_blank += 1
+            continue
+        for _ in range(pending_blank):
+            yield ()
+        pending_blank = 0
+        yield row
+
+
+def iter_excel_sheet(
+    path: Path,
+    sheet_name: Union[int, str] = 0,
+    header: Optional[int] = 0,
+    nrows: Optional[int] = None,
+    chunksize: Optional[int] = None,
+) -> Iterator[pd.DataFrame]:
+    """Stream one ``.xlsx`` sheet with openpyxl in read-only mode.
+
+    Rows come straight from the worksheet's row iterator and are transposed
+    into column lists ``EXCEL_ROW_BATCH_SIZE`` rows at a time, so the workbook
+    object model is never built. With ``chunksize`` a frame is yielded every
+    ``chunksize`` rows; without it the whole sheet is yielded as one frame.
+    """
+    import pandas as pd
+    from openpyxl import load_workbook
+
+    from .config import EXCEL_ROW_BATCH_SIZE
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        if isinstance(sheet_name, int):
+            sheet_name = workbook.sheetnames[sheet_name]
+        rows = _iter_xlsx_rows(workbook[sheet_name])
+
+        header_row: List[Any] = []
+        if header is not None:
+            for _ in range(header):
+                next(rows, None)
+            header_row = list(next(rows, ()))
+
+        columns: List[List[Any]] = []
+        filled = 0
+        remaining = nrows
+        batch_size = min(chunksize or EXCEL_ROW_BATCH_SIZE, EXCEL_ROW_BATCH_SIZE)
+
+        def build_frame() -> pd.DataFrame:
+            width = max(len(columns), len(header_row) if header is not None else 0)
+            while len(columns) < width:
+                columns.append([None] * filled)
+            df = _missing_as_nan(
+                pd.DataFrame(dict(enumerate(columns)), index=pd.RangeIndex(filled))
+            )
+            if header is not None:
+                df.columns = _excel_column_names(header_row, width)
+            return df
+
+        while remaining is None or remaining > 0:
+            take = batch_size if remaining is None else min(batch_size, remaining)
+            batch = [row for _, row in zip(range(take), rows)]
+            if not batch:
+                break
+            if remaining is not None:
+                remaining -= len(batch)
+
+            width = max(len(columns), max(len(row) for row in batch))
+            while len(columns) < width:
+                columns.append([None] * filled)
+            padded = (row + (None,) * (width - len(row)) for row in batch)
+            for column, values in zip(columns, zip(*padded)):
+                column.extend(values)
+            filled += len(batch)
+
+            if chunksize and filled >= chunksize:
+                yield build_frame()
+                columns = [[] for _ in columns]
+                filled = 0
+
+        if filled or not chunksize:
+            yield build_frame()
+    finally:
+        workbook.close()
+
+
+def _read_excel_sheet(
+    path: Path, sheet_name: Union[int, str], stream: bool, kwargs: Dict[str, Any]
+) -> pd.DataFrame:
+    """Read a single sheet; module-level so worker processes can run it."""
+    import pandas as pd
+
+    if stream:
+        return next(
+            iter_excel_sheet(path, sheet_name, kwargs.get("header", 0), kwargs.get("nrows"))
+        )
+    return pd.read_excel(path, sheet_name=sheet_name, **kwargs)
+
+
+def _excel_sheet_names(path: Path, stream: bool) -> List[str]:
+    """List sheet names without loading any cell data."""
+    if stream:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(path, read_only=True)
+        try:
+            return list(workbook.sheetnames)
+        finally:
+            workbook.close()
+
+    import pandas as pd
+
+    with pd.ExcelFile(path) as excel_file:
+        return list(excel_file.sheet_names)
+
+
+def read_excel(
+    path: Path,
+    *,
+    stream: bool = False,
+    parallel: bool = False,
+    **kwargs,
+) -> Union[pd.DataFrame, Dict[Any, pd.DataFrame]]:
+    """Read Excel file with ``pd.read_excel``.
+
+    With ``stream=True``, ``.xlsx`` sheets are instead read through openpyxl's
+    read-only row iterator (see :func:`iter_excel_sheet`), unless options
+    beyond ``sheet_name``, ``header`` and ``nrows`` are given. Cell values
+    match pandas, but column dtypes are inferred from the values rather than
+    by pandas' parser (a boolean column with blanks stays object, where
+    pandas makes it float64).
+
+    As with pandas, ``sheet_name=None`` or a list returns a dict of frames.
+    With ``parallel=True``, multiple sheets are parsed concurrently in worker
+    processes.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from .config import EXCEL_MAX_WORKERS, READER_DEFAULTS
 
     suffix = path.suffix.lower()
     defaults = READER_DEFAULTS[suffix].copy()
     defaults.update(kwargs)
+    sheet_name = defaults.pop("sheet_name", 0)
+
+    if stream:
+        stream = (
+            suffix == ".xlsx"
+            and defaults.get("engine") == "openpyxl"
+            and set(defaults) <= {"engine", "header", "nrows"}
+        )
+    if stream:
+        defaults.pop("engine", None)
 
     try:
-        return pd.read_excel(path, **defaults)
+        if isinstance(sheet_name, (int, str)):
+            return _read_excel_sheet(path, sheet_name, stream, defaults)
+
+        sheets = _excel_sheet_names(path, stream) if sheet_name is None else list(sheet_name)
+        if not parallel or len(sheets) < 2:
+            return {sheet: _read_excel_sheet(path, sheet, stream, defaults) for sheet in sheets}
+
+        max_workers = min(len(sheets), EXCEL_MAX_WORKERS or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            frames = pool.map(
+                _read_excel_sheet,
+                [path] * len(sheets),
+                sheets,
+                [stream] * len(sheets),
+                [defaults] * len(sheets),
+            )
+            return dict(zip(sheets, frames))
     except Exception as e:
         raise DataLoadError(str(path), f"Excel parse error: {e}") from e
 
 
 def read_parquet(path: Path, **kwargs) -> pd.DataFrame:
     """Read Parquet file."""
+    import pandas as pd
+
     try:
         return pd.read_parquet(path, **kwargs)
     except Exception as e:
         raise DataLoadError(str(path), f"Parquet read error: {e}") from e
 
 
+def read_parquet_rows(
+    path: Path, start: int, stop: int, columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """Read rows ``[start, stop)`` of a Parquet file, decoding only the row groups they span."""
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    groups = []
+    first_row = None
+    group_start = 0
+    for i in range(metadata.num_row_groups):
+        group_stop = group_start + metadata.row_group(i).num_rows
+        if group_stop > start and group_start < stop:
+            groups.append(i)
+            if first_row is None:
+                first_row = group_start
+        group_start = group_stop
+
+    if not groups:
+        table = parquet_file.schema_arrow.empty_table()
+        if columns is not None:
+            table = table.select(columns)
+        return table.to_pandas()
+
+    table = pa.concat_tables([parquet_file.read_row_group(i, columns=columns) for i in groups])
+    table = table.slice(start - first_row, stop - start)
+    df = table.to_pandas()
+    df.index = pd.RangeIndex(start, start + len(df))
+    return df
+
+
 def read_feather(path: Path, **kwargs) -> pd.DataFrame:
     """Read Feather file."""
+    import pandas as pd
+
     try:
         return pd.read_feather(path, **kwargs)
     except Exception as e:
@@ -95,12 +758,158 @@ def read_feather(path: Path, **kwargs) -> pd.DataFrame:
 
 def read_pickle(path: Path, **kwargs) -> pd.DataFrame:
     """Read Pickle file (trusted sources only)."""
+    import pandas as pd
+
     try:
         return pd.read_pickle(path, **kwargs)
     except Exception as e:
         raise DataLoadError(str(path), f"Pickle read error: {e}") from e
 
 
+def iter_csv(
+    path: Path, chunksize: Optional[int] = None, columns: Optional[List[str]] = None, **kwargs
+) -> Iterator[pd.DataFrame]:
+    """Iterate over a CSV file in chunks of ``chunksize`` rows."""
+    import pandas as pd
+
+    from .config import DEFAULT_CHUNK_SIZE, READER_DEFAULTS
+
+    defaults = READER_DEFAULTS[".csv"].copy()
+    defaults.pop("low_memory", None)
+    defaults.update(kwargs)
+    if columns is not None:
+        defaults["usecols"] = columns
+    chunksize = chunksize or DEFAULT_CHUNK_SIZE
+    yielded = 0
+    try:
+        with pd.read_csv(path, chunksize=chunksize, **defaults) as reader:
+            for chunk in reader:
+                yielded += len(chunk)
+                yield chunk
+    except Exception as e:
+        # Same fallback as read_csv. Chunks before the bad line parsed the same
+        # way, so the fallback resumes after the rows already yielded.
+        logger.warning("Skipping malformed rows of %s after %s rows: %s", path, yielded, e)
+        fallback = defaults.copy()
+        fallback.update({"engine": "python"})
+        skip = yielded
+        try:
+            with pd.read_csv(path, chunksize=chunksize, on_bad_lines="skip", **fallback) as reader:
+                for chunk in reader:
+                    if skip:
+                        chunk, skip = chunk.iloc[skip:], max(0, skip - len(chunk))
+                        if chunk.empty:
+                            continue
+                    yield chunk
+        except Exception as fallback_error:
+            raise DataLoadError(str(path), f"CSV parse error: {fallback_error}") from fallback_error
+
+
+def combine_csv_chunks(path: Path, frames: List[pd.DataFrame], **kwargs) -> pd.DataFrame:
+    """Concatenate ``iter_csv`` chunks into the frame ``read_csv`` would return.
+
+    Chunks infer dtypes independently. Numeric and bool mixes are resolved by
+    :func:`_unify_dtypes`; a column that came out as text in some chunks but
+    not in others only parses like a single pass when read in one, so the
+    file is then read again with ``kwargs``.
+    """
+    import pandas as pd
+
+    if not frames:
+        return read_csv(path, **kwargs)
+    conflicts = [
+        column
+        for column in frames[0].columns
+        if len({str(frame[column].dtype) for frame in frames}) > 1
+        and any(_is_text(frame[column]) for frame in frames)
+    ]
+    if conflicts:
+        logger.debug("Re-reading %s in one pass for dtypes of %s", path, conflicts)
+        return read_csv(path, **kwargs)
+    _unify_dtypes(frames)
+    return pd.concat(frames, ignore_index=True)
+
+
+def iter_json(
+    path: Path, chunksize: Optional[int] = None, columns: Optional[List[str]] = None, **kwargs
+) -> Iterator[pd.DataFrame]:
+    """Iterate over a JSON array or NDJSON file in chunks of ``chunksize`` rows.
+
+    A top-level array is streamed by :func:`iter_json_array`, which takes no
+    pandas options. With ``columns``, rows without one of them get NaN there,
+    but a column that no row has raises ValueError once the file is read.
+    """
+    import pandas as pd
+
+    from .config import DEFAULT_CHUNK_SIZE, READER_DEFAULTS
+
+    chunksize = chunksize or DEFAULT_CHUNK_SIZE
+    if _first_significant_char(path) == "[":
+        _check_stream_options(path, kwargs)
+        yield from iter_json_array(path, chunksize, columns)
+        return
+
+    defaults = READER_DEFAULTS[".jsonl"].copy()
+    compression = sniff_compression(path)
+    if compression is not None:
+        defaults["compression"] = compression
+    defaults.update(kwargs)
+    missing = set(columns or ())
+    with pd.read_json(path, chunksize=chunksize, **defaults) as reader:
+        for chunk in reader:
+            if columns is None:
+                yield chunk
+                continue
+            missing.difference_update(chunk.columns)
+            yield chunk.reindex(columns=columns)
+    if missing:
+        raise ValueError(f"Columns not found in {path}: {sorted(missing)}")
+
+
+def iter_parquet(
+    path: Path, chunksize: Optional[int] = None, columns: Optional[List[str]] = None, **kwargs
+) -> Iterator[pd.DataFrame]:
+    """Iterate over a Parquet file one record batch at a time."""
+    import pyarrow.parquet as pq
+
+    from .config import DEFAULT_CHUNK_SIZE
+
+    parquet_file = pq.ParquetFile(path)
+    for batch in parquet_file.iter_batches(
+        batch_size=chunksize or DEFAULT_CHUNK_SIZE, columns=columns, **kwargs
+    ):
+        yield batch.to_pandas()
+
+
+def iter_feather(
+    path: Path, chunksize: Optional[int] = None, columns: Optional[List[str]] = None, **kwargs
+) -> Iterator[pd.DataFrame]:
+    """Iterate over a memory-mapped Feather file in chunks of ``chunksize`` rows."""
+    import pyarrow.feather as feather
+
+    from .config import DEFAULT_CHUNK_SIZE
+
+    table = feather.read_table(path, columns=columns, memory_map=True, **kwargs)
+    for batch in table.to_batches(max_chunksize=chunksize or DEFAULT_CHUNK_SIZE):
+        yield batch.to_pandas()
+
+
+def iter_excel(
+    path: Path, chunksize: Optional[int] = None, columns: Optional[List[str]] = None, **kwargs
+) -> Iterator[pd.DataFrame]:
+    """Iterate over one ``.xlsx`` sheet in chunks of ``chunksize`` rows."""
+    from .config import DEFAULT_CHUNK_SIZE
+
+    for chunk in iter_excel_sheet(
+        path,
+        kwargs.get("sheet_name", 0),
+        kwargs.get("header", 0),
+        kwargs.get("nrows"),
+        chunksize or DEFAULT_CHUNK_SIZE,
+    ):
+        yield chunk if columns is None else chunk[columns]
+
+
 # Reader mapping
 READER_MAP = {
     ".csv": read_csv,
@@ -112,3 +921,13 @@ READER_MAP = {
     ".feather": read_feather,
     ".pkl": read_pickle,
 }
+
+# Chunked reader mapping; formats missing here are loaded whole and sliced.
+CHUNK_READER_MAP = {
+    ".csv": iter_csv,
+    ".json": iter_json,
+    ".jsonl": iter_json,
+    ".parquet": iter_parquet,
+    ".feather": iter_feather,
+    ".xlsx": iter_excel,
+}
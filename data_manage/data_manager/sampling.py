@@ -0,0 +1,165 @@
+"""Uniform row sampling without loading whole files.
+
+Every sampler draws ``n`` distinct rows uniformly at random and returns them
+in file order, indexed by their absolute row number.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+def _choose_rows(total: int, n: int, rng: np.random.Generator) -> np.ndarray:
+    """Pick ``min(n, total)`` distinct row numbers in ascending order."""
+    import numpy as np
+
+    if n >= total:
+        return np.arange(total)
+    return np.sort(rng.choice(total, size=n, replace=False))
+
+
+def sample_parquet(
+    path: Path, n: int, rng: np.random.Generator, columns: Optional[list] = None
+) -> pd.DataFrame:
+    """Sample rows from a Parquet file, decoding only the row groups that hold them."""
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    rows = _choose_rows(metadata.num_rows, n, rng)
+
+    bounds = np.cumsum(
+        [0] + [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+    )
+    groups = np.searchsorted(bounds, rows, side="right") - 1
+
+    tables = []
+    for group in np.unique(groups):
+        local = rows[groups == group] - bounds[group]
+        tables.append(parquet_file.read_row_group(int(group), columns=columns).take(local))
+
+    if not tables:
+        schema = parquet_file.schema_arrow
+        table = schema.empty_table() if columns is None else schema.empty_table().select(columns)
+    else:
+        table = pa.concat_tables(tables)
+    df = table.to_pandas()
+    df.index = pd.Index(rows)
+    return df
+
+
+def sample_feather(
+    path: Path, n: int, rng: np.random.Generator, columns: Optional[list] = None
+) -> pd.DataFrame:
+    """Sample rows from a memory-mapped Feather file, one record batch at a time.
+
+    Batches of an uncompressed file are views of the mapping, so only the
+    taken rows are touched. Compressed batches (lz4, the Feather default)
+    are decompressed whole, but only for the selected columns and one batch
+    at a time, so memory stays bounded by a single batch.
+    """
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    with pa.memory_map(str(path)) as source:
+        options = None
+        if columns is not None:
+            schema = ipc.open_file(source).schema
+            options = ipc.IpcReadOptions(
+                included_fields=[schema.get_field_index(name) for name in columns]
+            )
+        reader = ipc.open_file(source, options=options)
+        rows = _choose_rows(reader.count_rows(), n, rng)
+
+        tables = []
+        offset = 0
+        for i in range(reader.num_record_batches):
+            if not len(rows) or offset > rows[-1]:
+                break
+            batch = reader.get_batch(i)
+            local = rows[(rows >= offset) & (rows < offset + batch.num_rows)] - offset
+            if len(local):
+                tables.append(pa.Table.from_batches([batch.take(local)]))
+            offset += batch.num_rows
+        table = pa.concat_tables(tables) if tables else reader.schema.empty_table()
+        df = table.to_pandas()
+    if columns is not None:
+        df = df[columns]
+    df.index = pd.Index(rows)
+    return df
+
+
+def sample_indexed(
+    path: Path, n: int, rng: np.random.Generator, columns: Optional[list] = None
+) -> pd.DataFrame:
+    """Sample rows from a CSV/JSONL file by seeking through its row-offset index."""
+    import numpy as np
+    import pandas as pd
+
+    from .index import get_row_index, read_indexed_rows
+
+    index = get_row_index(path)
+    stride = index["stride"]
+    rows = _choose_rows(index["row_count"], n, rng)
+
+    # Read the CSV header once rather than once per block.
+    names = None
+    if path.suffix.lower() == ".csv":
+        names = list(read_indexed_rows(path, 0, 0, index=index).columns)
+
+    pieces = []
+    for block in np.unique(rows // stride):
+        wanted = rows[rows // stride == block]
+        # Parse from the block's indexed offset up to the last wanted row only.
+        window = read_indexed_rows(
+            path, int(block * stride), int(wanted[-1]) + 1, index=index, names=names
+        )
+        pieces.append(window.loc[wanted])
+
+    if not pieces:
+        df = read_indexed_rows(path, 0, 0, index=index, names=names)
+    else:
+        df = pd.concat(pieces)
+    return df if columns is None else df[columns]
+
+
+def reservoir_sample(
+    chunks: Iterable[pd.DataFrame], n: int, rng: np.random.Generator
+) -> pd.DataFrame:
+    """Sample rows from a stream of chunks, holding at most ``n`` rows plus one chunk.
+
+    Each row gets a uniform random key and the ``n`` smallest keys are kept
+    (bottom-k sampling), which is a uniform sample without replacement.
+    """
+    import numpy as np
+    import pandas as pd
+
+    reservoir: Optional[pd.DataFrame] = None
+    keys = np.empty(0)
+    offset = 0
+    for chunk in chunks:
+        chunk = chunk.set_axis(pd.RangeIndex(offset, offset + len(chunk)))
+        offset += len(chunk)
+        chunk_keys = rng.random(len(chunk))
+        if reservoir is None:
+            candidates, candidate_keys = chunk, chunk_keys
+        else:
+            candidates = pd.concat([reservoir, chunk])
+            candidate_keys = np.concatenate([keys, chunk_keys])
+        if len(candidates) > n:
+            keep = np.argpartition(candidate_keys, n - 1)[:n] if n else np.empty(0, dtype=int)
+            candidates, candidate_keys = candidates.iloc[keep], candidate_keys[keep]
+        reservoir, keys = candidates, candidate_keys
+
+    if reservoir is None:
+        return pd.DataFrame()
+    return reservoir.sort_index()
@@ -0,0 +1,374 @@
+"""Inverted index over file paths, column names and string cell values.
+
+:class:`SearchIndex` maps tokens to the files under a ``DataManager``'s base
+path whose relative path, column names or (optionally) string cell values
+contain them, so finding "the file with a column called mandi_code" does not
+load every file in the tree.
+
+Text is lowercased and split into word tokens; words joined by underscores
+are indexed both whole and by part, so ``mandi_code`` is found by
+``"mandi_code"`` and by ``"mandi code"``. A query matches the files holding
+all of its tokens.
+
+The index lives in ``SEARCH_INDEX_DIR`` under the base path:
+
+* ``manifest.json``: size, modification time, checksum and columns of each
+  indexed file.
+* ``shards/``: the tokens of each file with the fields they occur in.
+* ``postings.json``: the merged inverted index, token to file to fields.
+
+Updates are incremental: files whose size and modification time are
+unchanged are not opened, and touched files whose checksum is unchanged are
+not read again. Only the postings of changed files are replaced. Updates
+hold an exclusive ``flock`` on ``index.lock``; files are replaced
+atomically, so searches need no lock.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from .locking import EXCLUSIVE, _try_lock, _unlock
+from .utils import is_data_file
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .manager import DataManager
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("path", "column", "value")
+
+# Score of a query token per field it matched, best field counted
+_WEIGHTS = {"path": 3, "column": 2, "value": 1}
+
+_WORD = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> Set[str]:
+    """Lowercased word tokens of ``text``, with underscored words also split into parts."""
+    from .config import SEARCH_MAX_TOKEN_LENGTH
+
+    tokens = set()
+    for word in _WORD.findall(text.lower()):
+        if len(word) > SEARCH_MAX_TOKEN_LENGTH:
+            continue
+        tokens.add(word)
+        if "_" in word:
+            tokens.update(part for part in word.split("_") if part)
+    return tokens
+
+
+def _value_tokens(series: pd.Series) -> Set[str]:
+    """Distinct tokens of a string column, tokenised in one vectorised pass."""
+    words = series.dropna().astype(str).str.lower().str.findall(_WORD.pattern).explode()
+    tokens: Set[str] = set()
+    for word in words.dropna().unique():
+        tokens.update(tokenize(word))
+    return tokens
+
+
+def _is_text(series: pd.Series) -> bool:
+    import pandas as pd
+
+    dtype = series.dtype
+    return pd.api.types.is_object_dtype(dtype) or isinstance(
+        dtype, (pd.StringDtype, pd.CategoricalDtype)
+    )
+
+
+class SearchIndex:
+    """Incrementally maintained search index of a ``DataManager``'s files.
+
+    Args:
+        manager: Manager whose base path is indexed.
+        directory: Index directory (defaults to ``SEARCH_INDEX_DIR`` under
+            the base path).
+        values: Also index string cell values (defaults to
+            ``SEARCH_INDEX_VALUES``). Reads every file in full on its first
+            indexing; without it only schemas are read.
+    """
+
+    def __init__(
+        self,
+        manager: DataManager,
+        directory: Optional[Path] = None,
+        values: Optional[bool] = None,
+    ):
+        from .config import SEARCH_INDEX_DIR, SEARCH_INDEX_VALUES
+
+        self.manager = manager
+        self.directory = Path(directory or manager.base_path / SEARCH_INDEX_DIR)
+        self.values = SEARCH_INDEX_VALUES if values is None else values
+        self.manifest_path = self.directory / "manifest.json"
+        self.postings_path = self.directory / "postings.json"
+        self._postings: Optional[Dict[str, Dict[str, List[str]]]] = None
+        self._postings_mtime: Optional[int] = None
+
+    def _read_json(self, path: Path) -> Any:
+        if not path.exists():
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write_json(self, path: Path, data: Any) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    def _shard_path(self, filename: str) -> Path:
+        name = hashlib.sha1(filename.encode("utf-8")).hexdigest()
+        return self.directory / "shards" / f"{name}.json"
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / "index.lock", "a+b") as lock:
+            _try_lock(lock, EXCLUSIVE, blocking=True)
+            try:
+                yield
+            finally:
+                _unlock(lock)
+
+    def _columns(self, filename: str, path: Path) -> List[str]:
+        """Column names, read from the schema where the format stores one."""
+        suffix = path.suffix.lower()
+        if suffix == ".parquet":
+            import pyarrow.parquet as pq
+
+            return list(pq.read_schema(path).names)
+        if suffix == ".feather":
+            import pyarrow as pa
+
+            with pa.memory_map(str(path)) as source:
+                return list(pa.ipc.open_file(source).schema.names)
+        chunks = self.manager.iter_chunks(filename, chunksize=1)
+        try:
+            first = next(chunks, None)
+        finally:
+            chunks.close()
+        return [] if first is None else [str(c) for c in first.columns]
+
+    def _file_terms(self, filename: str, path: Path) -> Dict[str, Any]:
+        """Columns of ``filename`` and its tokens with the fields they occur in."""
+        from .config import SEARCH_MAX_VALUE_TOKENS
+
+        terms: Dict[str, Set[str]] = {}
+
+        def add(tokens: Iterable[str], field: str) -> None:
+            for token in tokens:
+                terms.setdefault(token, set()).add(field)
+
+        add(tokenize(filename), "path")
+        if self.values:
+            columns: List[str] = []
+            value_tokens = 0
+            for chunk in self.manager.iter_chunks(filename):
+                if not columns:
+                    columns = [str(c) for c in chunk.columns]
+                if value_tokens >= SEARCH_MAX_VALUE_TOKENS:
+                    break
+                for name in chunk.columns:
+                    if not _is_text(chunk[name]):
+                        continue
+                    tokens = _value_tokens(chunk[name])
+                    add(tokens, f"value:{name}")
+                    value_tokens += len(tokens)
+            if value_tokens >= SEARCH_MAX_VALUE_TOKENS:
+                logger.info("Indexed the first %d value tokens of %s", value_tokens, filename)
+        else:
+            columns = self._columns(filename, path)
+        for name in columns:
+            add(tokenize(name), f"column:{name}")
+        return {"columns": columns, "terms": {t: sorted(f) for t, f in terms.items()}}
+
+    def update(self, pattern: str = "**/*") -> Dict[str, int]:
+        """Bring the index up to date with the files matching ``pattern``.
+
+        Indexed files that no longer match are removed from the index. The
+        index files are rewritten only when something changed.
+
+        Returns:
+            Counts of files ``indexed``, ``unchanged``, ``removed`` and ``failed``.
+        """
+        from .metadata import calculate_checksum
+
+        base_path = self.manager.base_path
+        summary = {"indexed": 0, "unchanged": 0, "removed": 0, "failed": 0}
+        changed = False
+        with self._locked():
+            manifest: Dict[str, Dict[str, Any]] = self._read_json(self.manifest_path)
+            postings: Optional[Dict[str, Dict[str, List[str]]]] = None
+            current = {
+                path.relative_to(base_path).as_posix(): path
+                for path in self.manager.list_files(pattern)
+                if is_data_file(path)
+            }
+
+            def drop(filename: str) -> None:
+                shard_path = self._shard_path(filename)
+                for token in self._read_json(shard_path):
+                    files = postings.get(token, {})
+                    files.pop(filename, None)
+                    if not files:
+                        postings.pop(token, None)
+                shard_path.unlink(missing_ok=True)
+
+            for filename in sorted(set(manifest) - set(current)):
+                if postings is None:
+                    postings = self._read_json(self.postings_path)
+                drop(filename)
+                del manifest[filename]
+                summary["removed"] += 1
+                changed = True
+
+            for filename, path in sorted(current.items()):
+                stat = path.stat()
+                entry = manifest.get(filename)
+                identity = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+                complete = entry is not None and (entry.get("values") or not self.values)
+                if complete and all(entry.get(k) == v for k, v in identity.items()):
+                    summary["unchanged"] += 1
+                    continue
+                checksum = calculate_checksum(path)
+                changed = True
+                if complete and entry.get("checksum") == checksum and "error" not in entry:
+                    entry.update(identity)
+                    summary["unchanged"] += 1
+                    continue
+
+                if postings is None:
+                    postings = self._read_json(self.postings_path)
+                if entry is not None:
+                    drop(filename)
+                try:
+                    indexed = self._file_terms(filename, path)
+                except Exception as e:
+                    # Recorded so the file is retried only once it changes
+                    logger.warning("Could not index %s: %s", filename, e)
+                    manifest[filename] = {
+                        **identity,
+                        "checksum": checksum,
+                        "values": self.values,
+                        "error": str(e),
+                    }
+                    summary["failed"] += 1
+                    continue
+                for token, fields in indexed["terms"].items():
+                    postings.setdefault(token, {})[filename] = fields
+                self._write_json(self._shard_path(filename), indexed["terms"])
+                manifest[filename] = {
+                    **identity,
+                    "checksum": checksum,
+                    "columns": indexed["columns"],
+                    "values": self.values,
+                }
+                summary["indexed"] += 1
+
+            if postings is not None:
+                self._write_json(self.postings_path, postings)
+                self._postings = postings
+                self._postings_mtime = self.postings_path.stat().st_mtime_ns
+            if changed or not self.manifest_path.exists():
+                self._write_json(self.manifest_path, manifest)
+        logger.debug("Search index of %s updated: %s", base_path, summary)
+        return summary
+
+    @property
+    def built(self) -> bool:
+        """Whether the index has been built at least once."""
+        return self.manifest_path.exists()
+
+    def _load_postings(self) -> Dict[str, Dict[str, List[str]]]:
+        """The postings, re-read only when another process has replaced them."""
+        try:
+            mtime = self.postings_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        if self._postings is None or mtime != self._postings_mtime:
+            self._postings = self._read_json(self.postings_path)
+            self._postings_mtime = mtime
+        return self._postings
+
+    def search(
+        self,
+        query: str,
+        fields: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """Files matching every token of ``query``, best first.
+
+        Args:
+            query: Words to look for.
+            fields: Only match in these of ``"path"``, ``"column"`` and
+                ``"value"`` (defaults to all).
+            limit: Most results returned (defaults to ``SEARCH_RESULTS_LIMIT``).
+            offset: Ranked results skipped first, to page through them.
+
+        Returns:
+            One dict per file with its ``path`` (relative to the base path),
+            ``score`` and ``matches``: the fields the query matched, each with
+            ``field`` and, for columns and values, ``column``.
+
+        Raises:
+            ValueError: If a field is unknown.
+        """
+        from .config import SEARCH_RESULTS_LIMIT
+
+        fields = set(FIELDS if fields is None else fields)
+        unknown = fields - set(FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown search fields: {sorted(unknown)}; expected {FIELDS}")
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        postings = self._load_postings()
+        scores: Optional[Dict[str, int]] = None
+        matches: Dict[str, Set[str]] = {}
+        for token in tokens:
+            token_scores = {}
+            for filename, hits in postings.get(token, {}).items():
+                hits = [hit for hit in hits if hit.split(":", 1)[0] in fields]
+                if hits:
+                    token_scores[filename] = max(_WEIGHTS[hit.split(":", 1)[0]] for hit in hits)
+                    matches.setdefault(filename, set()).update(hits)
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {f: s + token_scores[f] for f, s in scores.items() if f in token_scores}
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        results = []
+        for filename, score in ranked[offset : offset + (limit or SEARCH_RESULTS_LIMIT)]:
+            found = []
+            for hit in sorted(matches[filename]):
+                field, _, column = hit.partition(":")
+                found.append({"field": field, "column": column} if column else {"field": field})
+            results.append({"path": filename, "score": score, "matches": found})
+        return results
+
+    def clear(self) -> None:
+        """Remove the index."""
+        import shutil
+
+        with self._locked():
+            shutil.rmtree(self.directory / "shards", ignore_errors=True)
+            self.manifest_path.unlink(missing_ok=True)
+            self.postings_path.unlink(missing_ok=True)
+        self._postings = None
+        self._postings_mtime = None
@@ -0,0 +1,247 @@
+"""Cross-process cache of loaded DataFrames in shared memory.
+
+Worker processes on one host (e.g. gunicorn/uvicorn workers) each keep
+their own copy of every frame they load. A :class:`SharedCache` lets them
+share one: the first process to load a file publishes the frame as an
+uncompressed Arrow IPC file in a tmpfs directory (``/dev/shm`` where
+available), and the others memory-map it instead of parsing the file again.
+Fixed-width columns without nulls and Arrow-backed strings (pandas' default
+``str`` dtype) are used in place, so the pages are shared rather than copied.
+Other columns are converted in each process that maps the entry: object
+columns holding Python objects, nested types, and numeric columns with nulls
+(which pandas fills with NaN) still cost their full size per process, though
+the file itself is parsed only once.
+
+Entries are keyed by the file's path, size and modification time plus the
+reader arguments, so a changed file is never served stale. An ``index.json``
+next to the entries records each entry's size and last use, under an
+exclusive ``flock`` on ``index.lock``.
+
+Frames served from the cache are writable: the mapped pages are read-only,
+but pandas' copy-on-write copies a column before the first write to it.
+Every frame served from the cache holds a shared ``flock`` on its entry
+until it is garbage collected. Once the cache exceeds its byte budget,
+least recently used entries are evicted, but only those no process holds.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import tempfile
+import time
+import uuid
+import weakref
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
+
+from .locking import EXCLUSIVE, SHARED, _try_lock, _unlock
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def _release(pin: Any, shared: pd.DataFrame) -> None:
+    """Close the pin of a cache entry once the frame served from it is collected."""
+    pin.close()
+
+
+def default_directory() -> Path:
+    """``/dev/shm/data_manager`` where /dev/shm exists, else under the temp directory."""
+    shm = Path("/dev/shm")
+    root = shm if shm.is_dir() else Path(tempfile.gettempdir())
+    return root / "data_manager"
+
+
+class SharedCache:
+    """Loaded frames shared between processes through memory-mapped Arrow files.
+
+    Args:
+        directory: Cache directory, ideally on tmpfs (defaults to
+            ``SHARED_CACHE_DIR``, or :func:`default_directory`).
+        max_bytes: Byte budget of all entries (defaults to
+            ``SHARED_CACHE_MAX_BYTES``).
+
+    Attributes:
+        stats: This process's ``hits``, ``misses``, ``stored`` and
+            ``evicted`` counts.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: Optional[int] = None):
+        from .config import SHARED_CACHE_DIR, SHARED_CACHE_MAX_BYTES
+
+        self.directory = Path(directory or SHARED_CACHE_DIR or default_directory())
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = SHARED_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.index_path = self.directory / "index.json"
+        self.stats = {"hits": 0, "misses": 0, "stored": 0, "evicted": 0}
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.arrow"
+
+    @staticmethod
+    def key(path: Path, options: Dict[str, Any]) -> Optional[str]:
+        """Cache key of loading ``path`` with reader ``options``; None if uncacheable."""
+        try:
+            encoded = json.dumps(options, sort_keys=True)
+            stat = path.stat()
+        except (TypeError, ValueError, OSError):
+            return None
+        identity = f"{path}|{stat.st_size}|{stat.st_mtime_ns}|{encoded}"
+        return hashlib.sha256(identity.encode()).hexdigest()[:32]
+
+    @contextmanager
+    def _index(self) -> Iterator[Dict[str, Dict[str, Any]]]:
+        """The index, locked exclusively; changes are written back on exit."""
+        with open(self.directory / "index.lock", "a+b") as lock:
+            _try_lock(lock, EXCLUSIVE, blocking=True)
+            try:
+                index = {}
+                if self.index_path.exists():
+                    with open(self.index_path, "r", encoding="utf-8") as f:
+                        index = json.load(f)
+                yield index
+                temp_path = self.index_path.with_name(f".index.{uuid.uuid4().hex[:8]}.tmp")
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(index, f)
+                os.replace(temp_path, self.index_path)
+            finally:
+                _unlock(lock)
+
+    def get(
+        self, key: str, max_bytes: Optional[int] = None
+    ) -> Optional[Tuple[pd.DataFrame, Dict[str, Any]]]:
+        """Map the frame cached under ``key``.
+
+        Args:
+            key: Entry key from :meth:`key`.
+            max_bytes: Ignore entries whose frame is larger than this.
+
+        Returns:
+            The frame and the metadata stored with it, or None on a miss.
+        """
+        import pyarrow as pa
+
+        with self._index() as index:
+            entry = index.get(key)
+            if entry is not None and (max_bytes is None or entry["memory_bytes"] <= max_bytes):
+                entry["last_used"] = time.time()
+            else:
+                entry = None
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        path = self._entry_path(key)
+        try:
+            pin = open(path, "rb")
+        except FileNotFoundError:
+            self.stats["misses"] += 1
+            return None
+        try:
+            _try_lock(pin, SHARED, blocking=True)
+            # Map through the pinned descriptor: the entry may have been
+            # evicted (unlinked) before the lock was taken, but its pages stay
+            # readable for as long as the descriptor is open.
+            mapped = mmap.mmap(pin.fileno(), 0, access=mmap.ACCESS_READ)
+            table = pa.ipc.open_file(pa.BufferReader(pa.py_buffer(mapped))).read_all()
+            shared = table.to_pandas(split_blocks=True)
+        except (OSError, ValueError, pa.ArrowException) as e:
+            pin.close()
+            logger.debug("Shared cache entry %s unreadable: %s", key, e)
+            self.stats["misses"] += 1
+            return None
+        # A shallow copy references the read-only mapped blocks, so
+        # copy-on-write copies a block before writing to it. The pin and the
+        # mapped frame live as long as the copy, which keeps the entry from
+        # eviction.
+        df = shared.copy(deep=False)
+        weakref.finalize(df, _release, pin, shared)
+        self.stats["hits"] += 1
+        return df, entry
+
+    def put(self, key: str, df: pd.DataFrame, source: Path, **metadata: Any) -> bool:
+        """Publish ``df`` under ``key``, evicting entries beyond the budget.
+
+        Args:
+            key: Entry key from :meth:`key`.
+            df: Loaded frame.
+            source: The file it was loaded from; older entries of it are dropped.
+            **metadata: JSON-serializable values returned with the frame by ``get``.
+
+        Returns:
+            Whether the frame was stored (frames Arrow cannot represent, or
+            larger than the whole budget, are not).
+        """
+        import pyarrow as pa
+
+        from .memory import frame_bytes
+        from .metadata import with_serializable_attrs
+
+        memory_bytes = frame_bytes(df)
+        path = self._entry_path(key)
+        temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            table = pa.Table.from_pandas(with_serializable_attrs(df))
+            if table.nbytes > self.max_bytes:
+                return False
+            with pa.OSFile(str(temp_path), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(temp_path, path)
+        except (pa.ArrowException, ValueError, TypeError) as e:
+            logger.debug("Not caching %s: %s", source, e)
+            return False
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+        with self._index() as index:
+            for old_key, entry in list(index.items()):
+                if entry["source"] == str(source) and old_key != key:
+                    self._evict(index, old_key)
+            index[key] = {
+                **metadata,
+                "source": str(source),
+                "bytes": path.stat().st_size,
+                "memory_bytes": memory_bytes,
+                "last_used": time.time(),
+            }
+            total = sum(entry["bytes"] for entry in index.values())
+            for old_key in sorted(index, key=lambda k: index[k]["last_used"]):
+                if total <= self.max_bytes:
+                    break
+                size = index[old_key]["bytes"]
+                if self._evict(index, old_key):
+                    total -= size
+        stored = key in index
+        self.stats["stored"] += stored
+        return stored
+
+    def _evict(self, index: Dict[str, Dict[str, Any]], key: str) -> bool:
+        """Delete an entry unless a process holds it; called with the index locked."""
+        path = self._entry_path(key)
+        try:
+            handle = open(path, "rb")
+        except FileNotFoundError:
+            del index[key]
+            return True
+        with handle:
+            if not _try_lock(handle, EXCLUSIVE, blocking=False):
+                return False
+            path.unlink()
+            _unlock(handle)
+        del index[key]
+        self.stats["evicted"] += 1
+        return True
+
+    def clear(self) -> None:
+        """Remove every entry no process holds."""
+        with self._index() as index:
+            for key in list(index):
+                self._evict(index, key)
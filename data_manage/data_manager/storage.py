@@ -0,0 +1,326 @@
+"""fsspec-backed remote storage with a local block cache.
+
+:class:`RemoteStorage` serves files under an fsspec URL (``s3://``,
+``gs://``, ``memory://``, ``file://``, ...) through a cache on local disk.
+Each remote file gets a sparse local copy, filled one fixed-size block at a
+time, and a state file recording which blocks are present and the remote
+fingerprint (size plus ETag or modification time) they came from. A changed
+fingerprint discards the entry.
+
+* :meth:`RemoteStorage.open` returns a seekable file object that fetches
+  missing blocks on demand, for readers that need only parts of a file.
+* :meth:`RemoteStorage.fetch` completes the copy and returns its local path,
+  so hot files are read at local-disk speed by the ordinary readers.
+* :meth:`RemoteStorage.prefetch_parquet` fetches a Parquet footer and then
+  only the column chunks of the selected columns.
+
+Missing blocks are coalesced into ranges of at most
+``STORAGE_MAX_RANGE_BYTES`` and fetched concurrently.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import os
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# Parquet files end with a 4-byte footer length and the magic bytes "PAR1"
+_PARQUET_TAIL_BYTES = 8
+
+
+def is_url(value: Any) -> bool:
+    """True if ``value`` is a URL string (``<protocol>://...``) rather than a local path."""
+    return isinstance(value, str) and "://" in value
+
+
+class _CacheEntry:
+    """Local sparse copy of one remote file and the set of blocks it holds."""
+
+    def __init__(self, directory: Path, suffix: str, fingerprint: str, size: int):
+        self.directory = directory
+        self.data_path = directory / f"data{suffix}"
+        self.state_path = directory / "state.json"
+        self.fingerprint = fingerprint
+        self.size = size
+        self.blocks: Set[int] = set()
+
+    def load(self, block_size: int) -> None:
+        """Adopt the saved state if it matches; otherwise start an empty copy."""
+        if self.state_path.exists() and self.data_path.exists():
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if (
+                state["fingerprint"] == self.fingerprint
+                and state["block_size"] == block_size
+                and state["size"] == self.size
+            ):
+                self.blocks = set(state["blocks"])
+                return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.data_path, "wb") as f:
+            f.truncate(self.size)
+        self.blocks = set()
+        self.save(block_size)
+
+    def save(self, block_size: int) -> None:
+        state = {
+            "fingerprint": self.fingerprint,
+            "size": self.size,
+            "block_size": block_size,
+            "blocks": sorted(self.blocks),
+        }
+        temp_path = self.state_path.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.state_path)
+
+
+class CachedFile(io.RawIOBase):
+    """Read-only, seekable view of a remote file that fetches blocks as they are read."""
+
+    def __init__(self, storage: RemoteStorage, filename: str, entry: _CacheEntry):
+        super().__init__()
+        self._storage = storage
+        self._filename = filename
+        self._entry = entry
+        self._data = open(entry.data_path, "rb")
+        self._position = 0
+
+    @property
+    def size(self) -> int:
+        return self._entry.size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._entry.size
+        self._position = max(offset, 0)
+        return self._position
+
+    def readinto(self, buffer: Any) -> int:
+        count = min(len(buffer), self._entry.size - self._position)
+        if count <= 0:
+            return 0
+        self._storage.ensure_range(self._filename, self._entry, self._position, count)
+        self._data.seek(self._position)
+        read = self._data.readinto(memoryview(buffer)[:count])
+        self._position += read
+        return read
+
+    def close(self) -> None:
+        if not self.closed:
+            self._data.close()
+        super().close()
+
+
+class RemoteStorage:
+    """Files under an fsspec URL, read through a local block cache.
+
+    Args:
+        url: Root URL; filenames are resolved relative to it.
+        storage_options: Options for the fsspec filesystem (credentials, ...).
+        cache_dir: Local cache root (defaults to ``STORAGE_CACHE_DIR``).
+
+    Attributes:
+        url: Root URL without a trailing slash.
+        fs: The fsspec filesystem.
+        cache_dir: Cache directory for this root URL.
+        staging_dir: Local directory where writes are prepared before upload.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        storage_options: Optional[Dict[str, Any]] = None,
+        cache_dir: Optional[Path] = None,
+    ):
+        from fsspec.core import url_to_fs
+
+        from .config import STORAGE_CACHE_DIR
+
+        self.url = url.rstrip("/")
+        self.fs, self.root = url_to_fs(self.url, **(storage_options or {}))
+        digest = hashlib.sha256(self.url.encode()).hexdigest()[:16]
+        self.cache_dir = Path(cache_dir or STORAGE_CACHE_DIR) / digest
+        self.staging_dir = self.cache_dir / "staging"
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        self._entries: Dict[str, _CacheEntry] = {}
+
+    def remote_path(self, filename: str) -> str:
+        return posixpath.join(self.root, filename.replace(os.sep, "/"))
+
+    def url_for(self, filename: str) -> str:
+        """Full URL of ``filename``."""
+        return f"{self.url}/{filename.replace(os.sep, '/')}"
+
+    def exists(self, filename: str) -> bool:
+        return self.fs.isfile(self.remote_path(filename))
+
+    def info(self, filename: str) -> Dict[str, Any]:
+        """fsspec metadata (``size``, ``mtime``/``created``/``ETag``, ...) of ``filename``."""
+        return self.fs.info(self.remote_path(filename))
+
+    def glob(self, pattern: str) -> List[str]:
+        """URLs of remote files matching ``pattern`` relative to the root."""
+        matches = self.fs.glob(self.remote_path(pattern))
+        return [self.url_for(posixpath.relpath(match, self.root)) for match in sorted(matches)]
+
+    @property
+    def block_size(self) -> int:
+        from .config import STORAGE_BLOCK_SIZE
+
+        return STORAGE_BLOCK_SIZE
+
+    def _entry(self, filename: str) -> _CacheEntry:
+        """Cache entry of ``filename``, reset if the remote file changed."""
+        info = self.info(filename)
+        version = next(
+            (info[k] for k in ("ETag", "etag", "mtime", "LastModified", "created") if k in info),
+            None,
+        )
+        fingerprint = json.dumps([info["size"], version], default=str)
+        cached = self._entries.get(filename)
+        if cached is not None and cached.fingerprint == fingerprint:
+            return cached
+        key = hashlib.sha256(self.remote_path(filename).encode()).hexdigest()
+        entry = _CacheEntry(
+            self.cache_dir / "blocks" / key[:2] / key,
+            Path(filename).suffix.lower(),
+            fingerprint,
+            info["size"],
+        )
+        entry.load(self.block_size)
+        self._entries[filename] = entry
+        return entry
+
+    def _fetch_blocks(self, filename: str, entry: _CacheEntry, blocks: Iterable[int]) -> None:
+        """Fetch the missing ones of ``blocks`` with concurrent range requests."""
+        from .config import STORAGE_MAX_RANGE_BYTES, STORAGE_MAX_WORKERS
+
+        block_size = self.block_size
+        per_range = max(STORAGE_MAX_RANGE_BYTES // block_size, 1)
+        ranges: List[Tuple[int, int]] = []
+        for block in sorted(set(blocks) - entry.blocks):
+            if ranges and ranges[-1][1] == block and ranges[-1][1] - ranges[-1][0] < per_range:
+                ranges[-1] = (ranges[-1][0], block + 1)
+            else:
+                ranges.append((block, block + 1))
+        if not ranges:
+            return
+
+        remote = self.remote_path(filename)
+
+        def fetch(block_range: Tuple[int, int]) -> Tuple[int, bytes]:
+            start = block_range[0] * block_size
+            end = min(block_range[1] * block_size, entry.size)
+            return start, self.fs.cat_file(remote, start, end)
+
+        workers = min(STORAGE_MAX_WORKERS, len(ranges))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            with open(entry.data_path, "r+b") as data:
+                # In waves, so at most one range per worker is held in memory.
+                for i in range(0, len(ranges), workers):
+                    wave = ranges[i : i + workers]
+                    for (start, payload), block_range in zip(executor.map(fetch, wave), wave):
+                        data.seek(start)
+                        data.write(payload)
+                        entry.blocks.update(range(*block_range))
+        entry.save(block_size)
+        logger.debug(
+            "Fetched %s blocks of %s in %s range requests",
+            sum(end - start for start, end in ranges),
+            remote,
+            len(ranges),
+        )
+
+    def ensure_range(self, filename: str, entry: _CacheEntry, start: int, length: int) -> None:
+        """Make bytes ``[start, start + length)`` of ``filename`` available locally."""
+        if length <= 0:
+            return
+        first, last = start // self.block_size, (start + length - 1) // self.block_size
+        self._fetch_blocks(filename, entry, range(first, last + 1))
+
+    def open(self, filename: str) -> CachedFile:
+        """Open ``filename`` for reading through the block cache."""
+        return CachedFile(self, filename, self._entry(filename))
+
+    def cached_path(self, filename: str) -> Optional[Path]:
+        """Local path of ``filename`` if it is cached completely and current, else None."""
+        entry = self._entry(filename)
+        blocks = -(-entry.size // self.block_size)
+        return entry.data_path if len(entry.blocks) >= blocks else None
+
+    def fetch(self, filename: str) -> Path:
+        """Complete the local copy of ``filename`` and return its path."""
+        entry = self._entry(filename)
+        self._fetch_blocks(filename, entry, range(-(-entry.size // self.block_size)))
+        return entry.data_path
+
+    def prefetch_parquet(
+        self, filename: str, columns: Optional[List[str]] = None
+    ) -> pq.FileMetaData:
+        """Fetch the footer, then the column chunks of ``columns``, of a Parquet file.
+
+        Returns:
+            The file's metadata.
+        """
+        import pyarrow.parquet as pq
+
+        entry = self._entry(filename)
+        with self.open(filename) as f:
+            f.seek(-_PARQUET_TAIL_BYTES, io.SEEK_END)
+            footer_length = int.from_bytes(f.read(4), "little")
+            self.ensure_range(
+                filename,
+                entry,
+                entry.size - _PARQUET_TAIL_BYTES - footer_length,
+                footer_length + _PARQUET_TAIL_BYTES,
+            )
+            metadata = pq.read_metadata(f)
+
+        blocks: Set[int] = set()
+        for i in range(metadata.num_row_groups):
+            row_group = metadata.row_group(i)
+            for j in range(row_group.num_columns):
+                chunk = row_group.column(j)
+                if columns is not None and chunk.path_in_schema.split(".")[0] not in columns:
+                    continue
+                start = chunk.data_page_offset
+                if chunk.has_dictionary_page and chunk.dictionary_page_offset:
+                    start = min(start, chunk.dictionary_page_offset)
+                end = start + chunk.total_compressed_size
+                blocks.update(range(start // self.block_size, (end - 1) // self.block_size + 1))
+        self._fetch_blocks(filename, entry, blocks)
+        return metadata
+
+    def upload(self, local_path: Path, filename: str) -> None:
+        """Upload ``local_path`` as ``filename``; the local file becomes its cached copy."""
+        remote = self.remote_path(filename)
+        self.fs.makedirs(posixpath.dirname(remote), exist_ok=True)
+        self.fs.put_file(str(local_path), remote)
+        self._entries.pop(filename, None)
+        entry = self._entry(filename)
+        os.replace(local_path, entry.data_path)
+        entry.blocks = set(range(-(-entry.size // self.block_size)))
+        entry.save(self.block_size)
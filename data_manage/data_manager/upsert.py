@@ -0,0 +1,201 @@
+"""Key-based upserts into Parquet files and datasets.
+
+:func:`upsert_parquet` uses the key index (see :mod:`keyindex`) to find the
+row groups that may hold an incoming key. Only files containing such row
+groups are rewritten, and in them only those row groups are modified; the
+others are copied with their boundaries intact. Keys found nowhere are
+inserted: appended to a single file, or written as a new file in a dataset
+directory. Every rewrite goes to a temporary file that atomically replaces
+the original, and the key index is refreshed for the changed files only.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from .keyindex import candidate_row_groups, get_key_index, key_index_info, update_key_index
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Reorder and cast ``table`` to ``schema``, adding missing columns as nulls."""
+    import pyarrow as pa
+
+    columns = [
+        (
+            table.column(field.name).cast(field.type)
+            if field.name in table.column_names
+            else pa.nulls(table.num_rows, field.type)
+        )
+        for field in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _apply_updates(table: pa.Table, updates: pa.Table, key: str) -> Tuple[pa.Table, pa.Array]:
+    """Overwrite the columns given in ``updates`` on rows whose key matches.
+
+    Returns the updated table and the keys that matched.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    keys = table.column(key)
+    update_keys = updates.column(key).cast(keys.type)
+    positions = pc.index_in(keys, value_set=update_keys)
+    mask = pc.is_valid(positions)
+    if not pc.any(mask).as_py():
+        return table, pa.array([], keys.type)
+
+    for name in updates.column_names:
+        if name == key:
+            continue
+        index = table.schema.get_field_index(name)
+        current = table.column(index)
+        incoming = updates.column(name).cast(current.type).take(pc.fill_null(positions, 0))
+        table = table.set_column(index, name, pc.if_else(mask, incoming, current))
+    return table, keys.filter(mask)
+
+
+def _rewrite(
+    file_path: Path,
+    row_groups: List[int],
+    updates: pa.Table,
+    key: str,
+    append_unmatched: bool = False,
+) -> Tuple[int, List[Any], int]:
+    """Rewrite one file, updating candidate ``row_groups``.
+
+    Candidates are first confirmed on the key column alone, so bloom filter
+    false positives cost no rewrite. With ``append_unmatched``, update rows
+    whose key matched nothing are appended as new rows.
+
+    Returns the number of modified row groups, the keys that matched and
+    the number of appended rows.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    from .config import WRITER_DEFAULTS
+
+    parquet_file = pq.ParquetFile(file_path)
+    schema = parquet_file.schema_arrow
+    key_type = schema.field(key).type
+    update_keys = updates.column(key).cast(key_type)
+    row_groups = [
+        i
+        for i in row_groups
+        if pc.any(
+            pc.is_in(parquet_file.read_row_group(i, columns=[key]).column(key), update_keys)
+        ).as_py()
+    ]
+    if not row_groups and not append_unmatched:
+        return 0, [], 0
+
+    compression = WRITER_DEFAULTS[".parquet"].get("compression", "snappy")
+    matched: List[Any] = []
+    inserted = 0
+    temp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        with pq.ParquetWriter(temp_path, schema, compression=compression) as writer:
+            for i in range(parquet_file.num_row_groups):
+                table = parquet_file.read_row_group(i)
+                if i in row_groups:
+                    table, found = _apply_updates(table, updates, key)
+                    matched.extend(found.to_pylist())
+                writer.write_table(table, row_group_size=max(table.num_rows, 1))
+            if append_unmatched:
+                seen = pa.array(matched, key_type)
+                inserts = updates.filter(pc.invert(pc.is_in(update_keys, value_set=seen)))
+                if inserts.num_rows:
+                    writer.write_table(_conform(inserts, schema))
+                inserted = inserts.num_rows
+        if row_groups or inserted:
+            os.replace(temp_path, file_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    return len(row_groups), matched, inserted
+
+
+def upsert_parquet(path: Path, df: pd.DataFrame, key: str) -> Dict[str, Any]:
+    """Merge ``df`` into the Parquet file or dataset directory at ``path`` by ``key``.
+
+    Matching rows take the values of the columns present in ``df``; other
+    columns keep their stored values. When ``df`` repeats a key, its last
+    row wins.
+
+    Returns:
+        Counts of updated and inserted rows, rewritten files and modified
+        row groups.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    from .config import WRITER_DEFAULTS
+
+    if key not in df.columns:
+        raise ValueError(f"Key column '{key}' not in DataFrame")
+    df = df.drop_duplicates(subset=[key], keep="last")
+    df = df[df[key].notna()]
+    updates = pa.Table.from_pandas(df, preserve_index=False)
+
+    index = get_key_index(path, key)
+    root = path if path.is_dir() else path.parent
+    files = [root / name for name in key_index_info(index)["files"]]
+    if not files:
+        raise ValueError(f"No Parquet files under {path}")
+    schema = pq.read_schema(files[0])
+    unknown = [name for name in updates.column_names if name not in schema.names]
+    if unknown:
+        raise ValueError(f"Columns not in {path}: {unknown}")
+
+    key_type = schema.field(key).type
+    candidates = candidate_row_groups(index, updates.column(key).cast(key_type).combine_chunks())
+
+    report = {"updated": 0, "inserted": 0, "files_rewritten": 0, "row_groups_modified": 0}
+    changed: List[Path] = []
+    matched: List[Any] = []
+    if path.is_file():
+        targets = {path.name: candidates.get(path.name, [])}
+    else:
+        targets = candidates
+    for name, row_groups in targets.items():
+        file_path = root / name
+        modified, found, inserted = _rewrite(
+            file_path, row_groups, updates, key, append_unmatched=path.is_file()
+        )
+        if modified or inserted:
+            changed.append(file_path)
+        report["row_groups_modified"] += modified
+        report["inserted"] += inserted
+        matched.extend(found)
+
+    if path.is_dir():
+        seen = pa.array(matched, key_type)
+        inserts = updates.filter(
+            pc.invert(pc.is_in(updates.column(key).cast(key_type), value_set=seen))
+        )
+        if inserts.num_rows:
+            new_file = path / f"part-{uuid.uuid4().hex[:8]}-upsert.parquet"
+            compression = WRITER_DEFAULTS[".parquet"].get("compression", "snappy")
+            pq.write_table(_conform(inserts, schema), new_file, compression=compression)
+            changed.append(new_file)
+            report["inserted"] = inserts.num_rows
+
+    report["updated"] = len(matched)
+    report["files_rewritten"] = sum(1 for file_path in changed if file_path in files)
+    if changed:
+        update_key_index(path, changed)
+    logger.debug("Upserted into %s: %s", path, report)
+    return report
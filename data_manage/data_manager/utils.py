@@ -1,9 +1,148 @@
 """Utility helpers for Data Manager."""
 
+from __future__ import annotations
+
+import bz2
+import gzip
+import lzma
 from pathlib import Path
-from typing import Union
+from typing import IO, TYPE_CHECKING, List, Optional, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pyarrow as pa
+
+# Stream openers for the compression codecs the text formats accept
+COMPRESSION_OPENERS = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open,
+}
+
+_COMPRESSION_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+)
 
 
 def resolve_path(base_path: Path, filename: Union[str, Path]) -> Path:
     """Resolve a filename against a base path."""
     return (base_path / filename).resolve()
+
+
+def is_data_file(path: Path) -> bool:
+    """True for a data file rather than a sidecar or state file of this package."""
+    from .config import (
+        CONVERT_STATE_FILE,
+        KEY_INDEX_SUFFIX,
+        METADATA_SUFFIX,
+        ROW_INDEX_SUFFIX,
+        SUPPORTED_READ_FORMATS,
+    )
+
+    name = path.name
+    if name == CONVERT_STATE_FILE or name.endswith(
+        (METADATA_SUFFIX, ROW_INDEX_SUFFIX, KEY_INDEX_SUFFIX)
+    ):
+        return False
+    return path.is_file() and path.suffix.lower() in SUPPORTED_READ_FORMATS
+
+
+def list_parquet_files(path: Path) -> List[Path]:
+    """Return ``path`` if it is a file, else the Parquet files under it, sorted.
+
+    Hidden and underscore-prefixed entries (``_metadata``, staging dirs,
+    index sidecars) are skipped, as dataset readers skip them.
+    """
+    if path.is_file():
+        return [path]
+    return [
+        file_path
+        for file_path in sorted(path.rglob("*.parquet"))
+        if not any(part.startswith((".", "_")) for part in file_path.relative_to(path).parts)
+    ]
+
+
+def sniff_compression(path: Path) -> Optional[str]:
+    """Detect gzip/bz2/xz content from magic bytes, regardless of file extension."""
+    with open(path, "rb") as f:
+        head = f.read(6)
+    for magic, name in _COMPRESSION_MAGIC:
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def open_text(path: Path, mode: str = "r", compression: Optional[str] = None) -> IO[str]:
+    """Open a (possibly compressed) UTF-8 text file; reads sniff the codec."""
+    if compression is None and "r" in mode:
+        compression = sniff_compression(path)
+    if compression is None:
+        return open(path, mode, encoding="utf-8-sig" if "r" in mode else "utf-8")
+    if compression not in COMPRESSION_OPENERS:
+        raise ValueError(
+            f"Unsupported compression: '{compression}'. "
+            f"Supported: {', '.join(COMPRESSION_OPENERS)}"
+        )
+    text_mode = mode.replace("b", "").rstrip("t") + "t"
+    return COMPRESSION_OPENERS[compression](path, text_mode, encoding="utf-8")
+
+
+def hash_key_columns(table: pa.Table, keys: List[str]) -> np.ndarray:
+    """Hash key columns row-wise to uint64, independent of numeric width.
+
+    Numeric keys are hashed as float64 so chunks (or join sides) that
+    inferred int64 for one part and float64 for another agree on each key.
+    Distinct integers beyond 2**53 can therefore share a hash: use this only
+    to bucket rows whose matches are checked on the real values afterwards
+    (joins, key lookups, aggregation partitions), and :func:`hash_rows`
+    where the hash itself stands for the values.
+    """
+    import pandas as pd
+
+    frame = table.select(keys).to_pandas()
+    for key in keys:
+        column = frame[key]
+        if pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+            frame[key] = column.astype("float64")
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+
+def _exact_hashes(column: pa.ChunkedArray) -> np.ndarray:
+    """Hash one column to uint64 per value, treating 1 and 1.0 alike but no wider."""
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    nulls = column.is_null().to_numpy(zero_copy_only=False)
+    if pa.types.is_integer(column.type):
+        hashes = pd.util.hash_array(column.fill_null(0).to_numpy().astype(np.int64))
+    elif pa.types.is_floating(column.type):
+        values = pc.cast(column, pa.float64()).fill_null(0).to_numpy()
+        # Integral floats hash as the int64 they equal, so 2.0 matches 2.
+        integral = np.isfinite(values) & (values == np.floor(values)) & (np.abs(values) < 2**63)
+        as_int = np.where(integral, values, 0).astype(np.int64)
+        hashes = np.where(integral, pd.util.hash_array(as_int), pd.util.hash_array(values))
+    else:
+        return pd.util.hash_pandas_object(column.to_pandas(), index=False).to_numpy()
+    # Nulls of any numeric type hash alike (as NaN, which is how pandas reads them).
+    return np.where(nulls, pd.util.hash_array(np.array([np.nan]))[0], hashes)
+
+
+def hash_rows(table: pa.Table, columns: List[str]) -> np.ndarray:
+    """Hash the values of ``columns`` row-wise to uint64, exactly.
+
+    Integers are hashed as int64 rather than float64, so 2**53 and 2**53 + 1
+    differ, while a float holding an integral value hashes like that integer
+    (a column read as int64 in one file and float64 in another compares
+    equal). Use this where equal hashes are taken to mean equal values.
+    """
+    import pandas as pd
+
+    hashes = pd.DataFrame(
+        {i: _exact_hashes(table.column(name)) for i, name in enumerate(columns)},
+        index=pd.RangeIndex(table.num_rows),
+    )
+    return pd.util.hash_pandas_object(hashes, index=False).to_numpy()
@@ -0,0 +1,238 @@
+"""Dataset version history with structural sharing.
+
+A :class:`VersionStore` keeps, under ``<base_path>/.versions``:
+
+* ``objects/``: content-addressed data objects, shared by every dataset
+  and version;
+* ``datasets/<filename>/v000001.json``, ...: one manifest per saved
+  version, listing its objects in order.
+
+Parquet data is cut into chunks at content-defined boundaries: a row ends a
+chunk when its hash hits a fixed bit pattern, within size limits. Each chunk
+is stored once as a small Parquet object. An edit therefore only creates
+objects for the chunks it touches, and appends or inserts do not shift the
+boundaries of the chunks around them. Other formats are stored as whole-file
+objects, so only byte-identical saves are shared.
+
+The current version remains an ordinary file at its usual path, and the
+store holds a copy of it too. That is deliberate: any tool may overwrite the
+working file, so the store cannot rely on it to keep the head version. The
+copy is compressed chunks that the next versions share, so the head costs
+one compressed copy of its data, not one copy per version. Nothing is ever
+deleted from the store.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+from .utils import hash_rows
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+
+def chunk_boundaries(row_hashes: np.ndarray, average_rows: int) -> List[int]:
+    """Content-defined chunk ends (exclusive row offsets) for a sequence of row hashes.
+
+    ``average_rows`` must be a power of two. Chunks hold between a quarter
+    and four times that many rows, except possibly the last one.
+    """
+    import numpy as np
+
+    minimum, maximum = max(1, average_rows // 4), average_rows * 4
+    candidates = np.flatnonzero((row_hashes & np.uint64(average_rows - 1)) == 0) + 1
+    ends: List[int] = []
+    start = 0
+    for end in candidates.tolist():
+        while end - start > maximum:
+            start += maximum
+            ends.append(start)
+        if end - start >= minimum:
+            ends.append(end)
+            start = end
+    total = len(row_hashes)
+    while total - start > maximum:
+        start += maximum
+        ends.append(start)
+    if start < total:
+        ends.append(total)
+    return ends
+
+
+def _chunk_id(chunk: pa.Table) -> str:
+    """Content address of a chunk: sha256 of its schema and values in Arrow IPC form.
+
+    Row hashes only place chunk boundaries; the id covers the exact bytes, so
+    chunks differing in any value (e.g. int64 beyond 2**53) never share one.
+    """
+    import pyarrow as pa
+
+    chunk = chunk.replace_schema_metadata(None).combine_chunks()
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, chunk.schema) as writer:
+        writer.write_table(chunk)
+    return hashlib.sha256(sink.getvalue()).hexdigest()
+
+
+class VersionStore:
+    """Version manifests and shared data objects under one directory.
+
+    Args:
+        root: Store directory (``<base_path>/.versions``).
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.objects = root / "objects"
+
+    def _dataset_dir(self, name: str) -> Path:
+        return self.root / "datasets" / name
+
+    def _object_path(self, object_id: str, suffix: str) -> Path:
+        return self.objects / object_id[:2] / f"{object_id}{suffix}"
+
+    def _put(self, object_id: str, suffix: str, write: Any) -> int:
+        """Store an object unless present; ``write(path)`` creates it. Returns bytes added."""
+        path = self._object_path(object_id, suffix)
+        if path.exists():
+            return 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            write(temp_path)
+            os.replace(temp_path, path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        return path.stat().st_size
+
+    def _put_table_chunks(self, table: pa.Table) -> tuple:
+        import numpy as np
+        import pyarrow.parquet as pq
+
+        from .config import VERSION_CHUNK_ROWS, WRITER_DEFAULTS
+
+        compression = WRITER_DEFAULTS[".parquet"].get("compression", "snappy")
+        row_hashes = (
+            hash_rows(table, table.column_names)
+            if table.num_columns and table.num_rows
+            else np.zeros(table.num_rows, np.uint64)
+        )
+
+        objects, written = [], 0
+        start = 0
+        for end in chunk_boundaries(row_hashes, VERSION_CHUNK_ROWS) or [0]:
+            chunk = table.slice(start, end - start)
+            object_id = _chunk_id(chunk)
+            written += self._put(
+                object_id,
+                ".parquet",
+                lambda path, chunk=chunk: pq.write_table(chunk, path, compression=compression),
+            )
+            objects.append({"id": object_id, "rows": chunk.num_rows})
+            start = end
+        return objects, written
+
+    def commit(self, name: str, path: Path, table: Optional[pa.Table] = None) -> Dict[str, Any]:
+        """Record the file at ``path`` as the next version of dataset ``name``.
+
+        For Parquet, pass the saved data as ``table`` to chunk it without
+        re-reading the file; ``DataManager`` does for ``save`` and
+        ``save_many``.
+        """
+        import pyarrow.parquet as pq
+
+        from .metadata import calculate_checksum
+
+        suffix = path.suffix.lower()
+        if suffix == ".parquet":
+            if table is None:
+                table = pq.read_table(path)
+            objects, written = self._put_table_chunks(table)
+            rows: Optional[int] = table.num_rows
+        else:
+            object_id = calculate_checksum(path)
+            written = self._put(object_id, suffix, lambda target: shutil.copyfile(path, target))
+            objects, rows = [{"id": object_id}], None
+
+        history = self.list_versions(name)
+        manifest = {
+            "version": history[-1]["version"] + 1 if history else 1,
+            "created": datetime.now().isoformat(),
+            "format": suffix,
+            "rows": rows,
+            "objects": objects,
+            "bytes_written": written,
+        }
+        directory = self._dataset_dir(name)
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / f"v{manifest['version']:06d}.json", "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        logger.debug(
+            "Version %s of %s: %s objects, %s new bytes",
+            manifest["version"],
+            name,
+            len(objects),
+            written,
+        )
+        return manifest
+
+    def list_versions(self, name: str) -> List[Dict[str, Any]]:
+        """Manifests of every version of ``name``, oldest first."""
+        directory = self._dataset_dir(name)
+        if not directory.exists():
+            return []
+        manifests = []
+        for manifest_path in sorted(directory.glob("v*.json")):
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifests.append(json.load(f))
+        return manifests
+
+    def resolve(
+        self,
+        name: str,
+        version: Optional[int] = None,
+        as_of: Union[datetime, str, None] = None,
+    ) -> Dict[str, Any]:
+        """Find the manifest for ``version``, or the latest one created at or before ``as_of``."""
+        history = self.list_versions(name)
+        if version is not None:
+            for manifest in history:
+                if manifest["version"] == version:
+                    return manifest
+            raise ValueError(f"{name} has no version {version}")
+        if isinstance(as_of, str):
+            as_of = datetime.fromisoformat(as_of)
+        eligible = [
+            manifest
+            for manifest in history
+            if as_of is None or datetime.fromisoformat(manifest["created"]) <= as_of
+        ]
+        if not eligible:
+            raise ValueError(f"{name} has no version as of {as_of}")
+        return eligible[-1]
+
+    def read(self, manifest: Dict[str, Any], reader: Any, **kwargs) -> pd.DataFrame:
+        """Load the data of one version; ``reader`` reads whole-file objects."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        suffix = manifest["format"]
+        paths = [self._object_path(obj["id"], suffix) for obj in manifest["objects"]]
+        if suffix != ".parquet":
+            return reader(paths[0], **kwargs)
+        columns = kwargs.get("columns")
+        tables = [pq.read_table(path, columns=columns) for path in paths]
+        return pa.concat_tables(tables, promote_options="permissive").to_pandas()
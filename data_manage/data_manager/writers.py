@@ -1,10 +1,17 @@
 """Format-specific writer functions."""
 
-from pathlib import Path
+from __future__ import annotations
 
-import pandas as pd
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Mapping, Optional, Union
 
 from .exceptions import DataSaveError
+from .metadata import with_serializable_attrs
+from .utils import open_text
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
 
 
 def write_csv(df: pd.DataFrame, path: Path, **kwargs) -> None:
@@ -33,15 +40,130 @@ def write_json(df: pd.DataFrame, path: Path, **kwargs) -> None:
         raise DataSaveError(str(path), f"JSON write error: {e}") from e
 
 
-def write_excel(df: pd.DataFrame, path: Path, **kwargs) -> None:
-    """Write DataFrame to Excel."""
+def write_jsonl(
+    df: pd.DataFrame,
+    path: Path,
+    *,
+    compression: Optional[str] = None,
+    append: bool = False,
+    chunksize: Optional[int] = None,
+    **kwargs,
+) -> None:
+    """Write DataFrame to JSON Lines (NDJSON), one batch at a time.
+
+    Each ``chunksize``-row batch is encoded with pandas' C JSON encoder
+    (NaN/NaT become ``null``, datetimes ISO 8601) and written straight to the
+    file, so output never needs the whole document in memory. ``compression``
+    may be ``"gzip"``, ``"bz2"`` or ``"xz"``; ``append=True`` adds rows to an
+    existing file.
+    """
+    from .config import DEFAULT_CHUNK_SIZE, WRITER_DEFAULTS
+
+    defaults = WRITER_DEFAULTS[".jsonl"].copy()
+    defaults.update(kwargs)
+    chunksize = chunksize or DEFAULT_CHUNK_SIZE
+
+    try:
+        with open_text(path, "a" if append else "w", compression) as f:
+            for start in range(0, len(df), chunksize):
+                text = df.iloc[start : start + chunksize].to_json(**defaults)
+                f.write(text if text.endswith("\n") else text + "\n")
+    except Exception as e:
+        raise DataSaveError(str(path), f"JSONL write error: {e}") from e
+
+
+def _excel_split_sheet_name(sheet_name: str, part: int) -> str:
+    """Name the ``part``-th sheet of a split frame: 'data', 'data_2', 'data_3', ..."""
+    if part == 1:
+        return sheet_name[:31]
+    suffix = f"_{part}"
+    return sheet_name[: 31 - len(suffix)] + suffix
+
+
+def _iter_excel_rows(df: pd.DataFrame, index: bool, batch_size: int) -> Iterator[tuple]:
+    """Yield cell tuples with missing values as None, converting one batch at a time."""
+    if index:
+        df = df.reset_index()
+    for start in range(0, len(df), batch_size):
+        chunk = df.iloc[start : start + batch_size].astype(object)
+        chunk = chunk.where(chunk.notna(), None)
+        yield from chunk.itertuples(index=False, name=None)
+
+
+def _write_excel_stream(
+    sheets: Mapping[str, pd.DataFrame], path: Path, index: bool, header: bool
+) -> None:
+    """Write frames with openpyxl's write-only workbook, splitting oversize sheets."""
+    from openpyxl import Workbook
+
+    from .config import EXCEL_MAX_ROWS, EXCEL_ROW_BATCH_SIZE
+
+    rows_per_sheet = EXCEL_MAX_ROWS - (1 if header else 0)
+    workbook = Workbook(write_only=True)
+    for sheet_name, df in sheets.items():
+        columns = df.head(0).reset_index().columns if index else df.columns
+        header_row = [str(column) for column in columns]
+
+        worksheet = None
+        part = 0
+        written = rows_per_sheet
+        for row in _iter_excel_rows(df, index, EXCEL_ROW_BATCH_SIZE):
+            if written >= rows_per_sheet:
+                part += 1
+                worksheet = workbook.create_sheet(_excel_split_sheet_name(sheet_name, part))
+                if header:
+                    worksheet.append(header_row)
+                written = 0
+            worksheet.append(row)
+            written += 1
+
+        if worksheet is None:
+            worksheet = workbook.create_sheet(_excel_split_sheet_name(sheet_name, 1))
+            if header:
+                worksheet.append(header_row)
+    workbook.save(path)
+
+
+def write_excel(
+    df: Union[pd.DataFrame, Mapping[str, pd.DataFrame]],
+    path: Path,
+    *,
+    stream: Optional[bool] = None,
+    **kwargs,
+) -> None:
+    """Write DataFrame to Excel.
+
+    Pass a mapping of sheet name to DataFrame to write several sheets in one
+    pass. Unless options beyond ``sheet_name``, ``index`` and ``header`` are
+    given (or ``stream=False``), rows are emitted incrementally through a
+    write-only openpyxl workbook, and frames longer than ``EXCEL_MAX_ROWS``
+    continue on numbered sheets (``Sheet1``, ``Sheet1_2``, ...).
+    """
+    import pandas as pd
+
     from .config import WRITER_DEFAULTS
 
     defaults = WRITER_DEFAULTS[".xlsx"].copy()
     defaults.update(kwargs)
+    sheet_name = defaults.pop("sheet_name", "Sheet1")
+    sheets = dict(df) if isinstance(df, Mapping) else {sheet_name: df}
+
+    if stream is None:
+        stream = defaults.get("engine") == "openpyxl" and set(defaults) <= {
+            "engine",
+            "index",
+            "header",
+        }
 
     try:
-        df.to_excel(path, **defaults)
+        if stream:
+            _write_excel_stream(
+                sheets, path, bool(defaults.get("index", False)), bool(defaults.get("header", True))
+            )
+            return
+        with pd.ExcelWriter(path, engine=defaults.pop("engine", None)) as writer:
+            for name, frame in sheets.items():
+                frame.to_excel(writer, sheet_name=name, **defaults)
     except Exception as e:
         raise DataSaveError(str(path), f"Excel write error: {e}") from e
 
@@ -54,7 +176,7 @@ def write_parquet(df: pd.DataFrame, path: Path, **kwargs) -> None:
     defaults.update(kwargs)
 
     try:
-        df.to_parquet(path, **defaults)
+        with_serializable_attrs(df).to_parquet(path, **defaults)
     except Exception as e:
         raise DataSaveError(str(path), f"Parquet write error: {e}") from e
 
@@ -67,15 +189,165 @@ def write_feather(df: pd.DataFrame, path: Path, **kwargs) -> None:
     defaults.update(kwargs)
 
     try:
-        df.to_feather(path, **defaults)
+        with_serializable_attrs(df).to_feather(path, **defaults)
     except Exception as e:
         raise DataSaveError(str(path), f"Feather write error: {e}") from e
 
 
+def write_table(table: pa.Table, path: Path, **kwargs) -> None:
+    """Write an Arrow table to Parquet or Feather, with that format's writer defaults.
+
+    Lets several outputs share one pandas-to-Arrow conversion.
+    """
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    from .config import WRITER_DEFAULTS
+
+    suffix = path.suffix.lower()
+    defaults = WRITER_DEFAULTS[suffix].copy()
+    defaults.update(kwargs)
+    defaults.pop("index", None)
+
+    try:
+        if suffix == ".parquet":
+            pq.write_table(table, path, **defaults)
+        else:
+            feather.write_feather(table, path, **defaults)
+    except Exception as e:
+        raise DataSaveError(str(path), f"{suffix[1:].title()} write error: {e}") from e
+
+
+def _as_pandas(chunk: Union[pd.DataFrame, pa.Table]) -> pd.DataFrame:
+    return chunk.to_pandas() if hasattr(chunk, "to_batches") else chunk
+
+
+class ChunkWriter:
+    """Write a stream of DataFrames or Arrow tables to one file incrementally.
+
+    CSV and JSONL append each chunk; Parquet and Feather stream record
+    batches through pyarrow writers. The first chunks fix the schema, held
+    back while a column is still all null so a later chunk can type it. JSON
+    and Excel have no appendable layout, so their chunks are buffered and
+    written on close. Used as a context manager, a failed write removes the
+    partial output.
+    """
+
+    def __init__(self, path: Path, **kwargs):
+        self.path = path
+        self.suffix = path.suffix.lower()
+        self.kwargs = kwargs
+        self.rows_written = 0
+        self._writer = None
+        self._schema = None
+        self._buffer: list = []
+
+    def write(self, chunk: Union[pd.DataFrame, pa.Table]) -> None:
+        """Append one chunk to the output."""
+        from .config import WRITER_DEFAULTS
+
+        try:
+            if self.suffix in (".parquet", ".feather"):
+                self._write_arrow(chunk)
+            elif self.suffix == ".csv":
+                defaults = WRITER_DEFAULTS[".csv"].copy()
+                defaults.update(self.kwargs)
+                defaults.update(
+                    mode="a" if self.rows_written else "w", header=not self.rows_written
+                )
+                _as_pandas(chunk).to_csv(self.path, **defaults)
+            elif self.suffix == ".jsonl":
+                write_jsonl(
+                    _as_pandas(chunk), self.path, append=bool(self.rows_written), **self.kwargs
+                )
+            else:
+                self._buffer.append(_as_pandas(chunk))
+        except DataSaveError:
+            raise
+        except Exception as e:
+            raise DataSaveError(str(self.path), f"Chunk write error: {e}") from e
+        self.rows_written += len(chunk)
+
+    def _write_arrow(self, chunk: Union[pd.DataFrame, pa.Table]) -> None:
+        import pyarrow as pa
+
+        from .config import DEFAULT_CHUNK_SIZE
+
+        if isinstance(chunk, pa.Table):
+            table = chunk
+        else:
+            table = pa.Table.from_pandas(with_serializable_attrs(chunk), preserve_index=False)
+        if self._writer is not None:
+            if table.schema != self._schema:
+                table = table.cast(self._schema)
+            self._writer.write_table(table)
+            return
+
+        # Columns that are all null so far have no type yet: hold chunks back
+        # (up to DEFAULT_CHUNK_SIZE rows) until later ones settle it.
+        self._buffer.append(table)
+        schema = pa.unify_schemas([t.schema for t in self._buffer], promote_options="permissive")
+        if any(pa.types.is_null(field.type) for field in schema):
+            if sum(t.num_rows for t in self._buffer) < DEFAULT_CHUNK_SIZE:
+                return
+        self._open_arrow(schema)
+
+    def _open_arrow(self, schema: pa.Schema) -> None:
+        """Start the Parquet or Feather writer and write the chunks held back so far."""
+        import pyarrow as pa
+
+        if self.suffix == ".parquet":
+            import pyarrow.parquet as pq
+
+            compression = self.kwargs.get("compression", "snappy")
+            self._writer = pq.ParquetWriter(self.path, schema, compression=compression)
+        else:
+            compression = self.kwargs.get("compression", "lz4")
+            options = pa.ipc.IpcWriteOptions(compression=compression)
+            self._writer = pa.ipc.new_file(self.path, schema, options=options)
+        self._schema = schema
+        buffered, self._buffer = self._buffer, []
+        for table in buffered:
+            self._writer.write_table(table.cast(schema) if table.schema != schema else table)
+
+    def close(self) -> None:
+        """Finish the file, writing buffered formats (or an empty file) now."""
+        import pandas as pd
+        import pyarrow as pa
+
+        if self.suffix in (".parquet", ".feather") and self._buffer:
+            self._open_arrow(
+                pa.unify_schemas([t.schema for t in self._buffer], promote_options="permissive")
+            )
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        elif self._buffer or not self.rows_written:
+            df = pd.concat(self._buffer, ignore_index=True) if self._buffer else pd.DataFrame()
+            self._buffer = []
+            WRITER_MAP[self.suffix](df, self.path, **self.kwargs)
+
+    def __enter__(self) -> ChunkWriter:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self.path.unlink(missing_ok=True)
+
+
+# Formats write_table accepts
+ARROW_WRITE_FORMATS = frozenset({".parquet", ".feather"})
+
 # Writer mapping
 WRITER_MAP = {
     ".csv": write_csv,
     ".json": write_json,
+    ".jsonl": write_jsonl,
     ".xlsx": write_excel,
     ".xls": write_excel,
     ".parquet": write_parquet,
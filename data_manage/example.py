@@ -27,10 +27,11 @@ print(f"Sales checksum: {sales.attrs['checksum']}")
 merged = sales.merge(customers, on="customer_id", how="left")
 merged["total"] = merged["quantity"] * merged["price"]
 
-# Save in different formats
-dm.save(merged, "processed/merged.parquet")  # Best for storage
-dm.save(merged, "processed/merged.csv")  # For sharing
-dm.save(merged, "processed/merged.xlsx")  # For Excel users
+# Save in different formats: Parquet for storage, CSV for sharing, XLSX for
+# Excel users (written concurrently, converting the frame once)
+checksums = dm.save_many(
+    merged, ["processed/merged.parquet", "processed/merged.csv", "processed/merged.xlsx"]
+)
 
 # Quick file info (without loading)
 info = dm.get_info("processed/merged.parquet")
@@ -0,0 +1,67 @@
+"""Tests for out-of-core aggregation."""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from data_manager.aggregate import GroupAggregator, normalize_aggs
+
+
+def _frame(rows: int, groups: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "key": rng.integers(0, groups, rows),
+            "value": rng.normal(size=rows),
+            "user": rng.integers(0, 500, rows),
+        }
+    )
+
+
+def _run(df: pd.DataFrame, aggs: dict, chunk: int, **kwargs) -> GroupAggregator:
+    aggregator = GroupAggregator(["key"], normalize_aggs(aggs), **kwargs)
+    for start in range(0, len(df), chunk):
+        aggregator.add(pa.Table.from_pandas(df.iloc[start : start + chunk], preserve_index=False))
+    return aggregator
+
+
+def test_spilled_result_matches_in_memory(tmp_path):
+    df = _frame(20_000, 300)
+    aggs = {"value": ["sum", "mean", "min", "max", "count"]}
+
+    spilling = _run(df, aggs, 1_000, memory_budget=2_000, spill_dir=tmp_path)
+    result = spilling.result(pa.Table.from_pandas(df.head(0), preserve_index=False))
+
+    assert spilling.spilled_bytes > 0
+    assert list(tmp_path.iterdir()) == []
+    expected = df.groupby("key")["value"].agg(["sum", "mean", "min", "max", "count"])
+    assert result["key"].tolist() == expected.index.tolist()
+    for function in expected.columns:
+        assert np.allclose(result[f"value_{function}"], expected[function])
+
+
+def test_approx_distinct_within_error():
+    df = _frame(50_000, 4)
+    df["user"] = np.random.default_rng(1).integers(0, 20_000, len(df))
+
+    aggregator = _run(df, {"user": "approx_distinct"}, 7_000, memory_budget=50_000)
+    result = aggregator.result(pa.Table.from_pandas(df.head(0), preserve_index=False))
+
+    expected = df.groupby("key")["user"].nunique()
+    relative = np.abs(result["user_approx_distinct"].to_numpy() / expected.to_numpy() - 1)
+    assert relative.max() < 0.06
+
+
+def test_approx_distinct_small_counts_exactish():
+    df = pd.DataFrame({"key": [1, 1, 1, 2, 2], "user": ["a", "b", "a", "c", None]})
+
+    aggregator = _run(df, {"user": "approx_distinct"}, 2)
+    result = aggregator.result(pa.Table.from_pandas(df.head(0), preserve_index=False))
+
+    assert result["user_approx_distinct"].tolist() == [2, 1]
+
+
+def test_unknown_aggregation_rejected():
+    with pytest.raises(ValueError):
+        normalize_aggs({"value": "median"})
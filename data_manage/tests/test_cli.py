@@ -0,0 +1,71 @@
+"""Tests for the python -m data_manager command line."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from data_manager.cli import main
+from data_manager.convert import load_state
+
+
+def _tree(root):
+    for i, name in enumerate(["a.csv", "sub/b.csv", "sub/deeper/c.csv"]):
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame({"id": range(i, i + 3), "name": list("xyz")}).to_csv(path, index=False)
+
+
+def test_convert_resumes_and_verify_detects_changes(tmp_path, capsys):
+    src, out = tmp_path / "src", tmp_path / "out"
+    _tree(src)
+    args = ["-b", str(src), "convert", "**/*.csv", "--to", "parquet", "-o", str(out), "-j", "1"]
+
+    assert main(args) == 0
+    captured = capsys.readouterr()
+    assert "3 files: 3 converted, 0 skipped, 0 failed" in captured.out
+    assert captured.err.count("converted") == 3
+    assert pd.read_parquet(out / "sub/deeper/c.parquet")["id"].tolist() == [2, 3, 4]
+    assert set(load_state(out)) == {"a.parquet", "sub/b.parquet", "sub/deeper/c.parquet"}
+
+    pd.DataFrame({"id": [9], "name": ["q"]}).to_csv(src / "sub/b.csv", index=False)
+    assert main(args) == 0
+    assert "1 converted, 2 skipped" in capsys.readouterr().out
+    assert pd.read_parquet(out / "sub/b.parquet")["id"].tolist() == [9]
+
+    assert main(["-b", str(out), "verify", "-q"]) == 0
+    assert "3 ok, 0 failed" in capsys.readouterr().out
+    pd.DataFrame({"id": [0]}).to_parquet(out / "a.parquet")
+    assert main(["-b", str(out), "verify", "-q"]) == 1
+    assert "FAILED a.parquet: ValueError: checksum differs" in capsys.readouterr().out
+
+
+def test_convert_in_process_pool_and_info(tmp_path, capsys):
+    _tree(tmp_path)
+    (tmp_path / "broken.json").write_text("{not json")
+
+    assert main(["-b", str(tmp_path), "convert", "**/*", "--to", ".feather", "-q", "-j", "2"]) == 1
+    out = capsys.readouterr().out
+    assert "3 converted, 0 skipped, 1 failed" in out
+    assert "FAILED broken.json" in out
+
+    assert main(["-b", str(tmp_path), "info", "**/*.feather"]) == 0
+    infos = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [info["file"] for info in infos] == [
+        "a.feather",
+        "sub/b.feather",
+        "sub/deeper/c.feather",
+    ]
+
+
+def test_module_entry_point(tmp_path):
+    result = subprocess.run(
+        [sys.executable, "-m", "data_manager", "-b", str(tmp_path), "verify"],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0
+    assert "0 files" in result.stdout
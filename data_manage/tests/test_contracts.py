@@ -0,0 +1,69 @@
+"""Tests for schema contracts."""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from data_manager.contracts import SchemaContract
+
+CONTRACT = SchemaContract(
+    {
+        "id": {"dtype": "integer", "nullable": False, "unique": True, "min": 1},
+        "status": {"dtype": "string", "categories": ["open", "closed"]},
+        "amount": {"dtype": "float", "min": 0.0, "max": 100.0},
+    },
+    strict=True,
+)
+
+
+def _violations(report):
+    return {(v["column"], v["rule"]): v for v in report["violations"]}
+
+
+def test_validate_reports_each_rule_once_per_column():
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 2, 0],
+            "status": ["open", "lost", "closed", None],
+            "amount": [5.0, -1.0, 250.0, None],
+            "extra": [1, 2, 3, 4],
+        }
+    )
+    report = CONTRACT.validate(df)
+
+    violations = _violations(report)
+    assert not report["valid"] and report["rows"] == 4
+    assert violations[("id", "unique")]["examples"] == [2]
+    assert violations[("id", "min")]["count"] == 1
+    assert violations[("status", "categories")]["examples"] == ["lost"]
+    assert violations[("amount", "min")]["examples"] == [-1.0]
+    assert violations[("amount", "max")]["examples"] == [250.0]
+    assert ("extra", "unexpected") in violations
+    assert len(violations) == 6
+
+
+def test_validate_dtype_missing_and_projection():
+    df = pd.DataFrame({"id": ["a", "b"]})
+    violations = _violations(CONTRACT.validate(df))
+    assert "expected integer" in violations[("id", "dtype")]["detail"]
+    assert ("status", "missing") in violations
+
+    assert CONTRACT.validate(pd.DataFrame({"id": [1, 2]}), columns=["id"])["valid"]
+
+
+def test_parquet_statistics_prove_bounds_and_nulls(tmp_path):
+    path = tmp_path / "t.parquet"
+    table = pa.table({"id": [1, 2, 3, 4], "amount": [0.0, 1.5, None, 99.0]})
+    pq.write_table(table, path, row_group_size=2)
+
+    proven = CONTRACT.proven_by_statistics([pq.read_metadata(path)])
+    assert proven == {("id", "nullable"), ("id", "min"), ("amount", "min"), ("amount", "max")}
+
+    pq.write_table(table, path, write_statistics=False)
+    assert CONTRACT.proven_by_statistics([pq.read_metadata(path)]) == set()
+
+
+def test_unknown_rule_rejected():
+    with pytest.raises(ValueError, match="regex"):
+        SchemaContract({"id": {"regex": ".*"}})
@@ -0,0 +1,103 @@
+"""Tests for chunked dataset diffs."""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from data_manager.diff import diff_tables
+
+
+def _source(df, chunk=3):
+    def tables():
+        for start in range(0, len(df), chunk):
+            yield pa.Table.from_pandas(df.iloc[start : start + chunk], preserve_index=False)
+
+    return tables
+
+
+OLD = pd.DataFrame(
+    {"id": [1, 2, 3, 4, 5], "name": ["a", "b", "c", "d", "e"], "score": [1.0, 2, 3, 4, None]}
+)
+NEW = pd.DataFrame(
+    {"id": [5, 4, 3, 2, 6], "name": ["e", "D", "c", "b", "f"], "score": [None, 4, 3.5, 2, 6]}
+)
+
+
+def test_keyed_summary_counts():
+    summary, delta = diff_tables(_source(OLD), _source(NEW, chunk=2), ["id"])
+
+    assert delta is None
+    assert (summary["added"], summary["removed"], summary["changed"]) == (1, 1, 2)
+    assert summary["unchanged"] == 2
+    assert summary["changed_by_column"] == {"name": 1, "score": 1}
+
+
+def test_keyed_delta_has_masks():
+    _, delta = diff_tables(_source(OLD), _source(NEW), ["id"], delta=True)
+
+    by_id = delta.set_index("id")
+    assert by_id.loc[6, "_change"] == "added"
+    assert by_id.loc[1, "_change"] == "removed"
+    assert by_id.loc[4, "name"] == "D"
+    assert by_id.loc[4, "name_old"] == "d"
+    assert by_id.loc[4, "name_changed"] == True  # noqa: E712
+    assert by_id.loc[4, "score_changed"] == False  # noqa: E712
+    assert by_id.loc[3, "score_old"] == 3.0
+
+
+def test_int_and_float_values_compare_equal():
+    a = pd.DataFrame({"id": [1, 2], "v": [1, 2]})
+    b = pd.DataFrame({"id": [1, 2], "v": [1.0, 2.0]})
+
+    summary, _ = diff_tables(_source(a), _source(b), ["id"])
+
+    assert summary["changed"] == 0
+
+
+def test_large_integer_value_change_is_detected():
+    a = pd.DataFrame({"k": [1, 2], "v": [2**53, 5]})
+    b = pd.DataFrame({"k": [1, 2], "v": [2**53 + 1, 5]})
+
+    summary, _ = diff_tables(_source(a), _source(b), ["k"])
+
+    assert (summary["changed"], summary["unchanged"]) == (1, 1)
+    assert summary["changed_by_column"] == {"v": 1}
+
+
+def test_large_integer_keys_stay_distinct():
+    a = pd.DataFrame({"k": [2**53, 2**53 + 1], "v": [1, 2]})
+    b = pd.DataFrame({"k": [2**53, 2**53 + 1], "v": [1, 3]})
+
+    summary, _ = diff_tables(_source(a), _source(b), ["k"])
+
+    assert (summary["added"], summary["removed"], summary["changed"]) == (0, 0, 1)
+
+
+def test_keyless_diff_uses_row_multisets():
+    a = pd.DataFrame({"x": [1, 1, 2, 3]})
+    b = pd.DataFrame({"x": [1, 2, 2, 4]})
+
+    summary, delta = diff_tables(_source(a), _source(b), delta=True)
+
+    assert (summary["added"], summary["removed"], summary["changed"]) == (2, 2, 0)
+    assert sorted(delta.loc[delta["_change"] == "added", "x"]) == [2, 4]
+    assert sorted(delta.loc[delta["_change"] == "removed", "x"]) == [1, 3]
+
+
+def test_duplicate_keys_rejected():
+    a = pd.DataFrame({"id": [1, 1], "v": [1, 2]})
+
+    with pytest.raises(ValueError):
+        diff_tables(_source(a), _source(a), ["id"])
+
+
+def test_large_diff_is_consistent():
+    rng = np.random.default_rng(0)
+    a = pd.DataFrame({"id": np.arange(5_000), "v": rng.integers(0, 100, 5_000)})
+    b = a.sample(frac=1, random_state=1).iloc[:4_900].copy()
+    b.loc[b.index[:50], "v"] += 1
+
+    summary, _ = diff_tables(_source(a, 700), _source(b, 900), ["id"])
+
+    assert (summary["added"], summary["removed"], summary["changed"]) == (0, 100, 50)
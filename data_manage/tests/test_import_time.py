@@ -0,0 +1,42 @@
+"""Cold-start checks: importing data_manager must stay cheap."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+# Generous enough for slow CI runners; pandas alone takes several times this.
+IMPORT_TIME_BUDGET_SECONDS = 0.25
+
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "openpyxl", "xlrd", "fsspec")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import data_manager  # noqa: F401
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _probe() -> dict:
+    root = Path(__file__).resolve().parents[1]
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def test_import_does_not_load_heavy_dependencies():
+    loaded = set(_probe()["modules"])
+    assert not loaded.intersection(HEAVY_MODULES)
+
+
+def test_import_time_within_budget():
+    # Best of three to damp scheduler noise.
+    elapsed = min(_probe()["elapsed"] for _ in range(3))
+    assert elapsed < IMPORT_TIME_BUDGET_SECONDS
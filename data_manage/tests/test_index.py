@@ -0,0 +1,89 @@
+"""Tests for row-offset index sidecars."""
+
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from data_manager.index import build_row_index, get_row_index, index_path_for, read_indexed_rows
+from data_manager.metadata import calculate_checksum
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id": range(rows),
+            "text": [
+                f'line {i}\nwith "quotes", commas' if i % 3 == 0 else f"t{i}" for i in range(rows)
+            ],
+        }
+    )
+
+
+def test_build_row_index_csv_quoted_newlines(tmp_path: Path):
+    path = tmp_path / "rows.csv"
+    _frame(10).to_csv(path, index=False)
+
+    index = build_row_index(path, stride=3)
+
+    assert index["row_count"] == 10
+    assert len(index["offsets"]) == 4
+    assert index["checksum"] == calculate_checksum(path)
+    assert index_path_for(path).exists()
+    with open(path, "rb") as f:
+        f.seek(index["offsets"][1])
+        assert f.read(2) == b"3,"
+
+
+def test_read_indexed_rows_matches_full_load(tmp_path: Path):
+    df = _frame(25)
+    csv_path = tmp_path / "rows.csv"
+    jsonl_path = tmp_path / "rows.jsonl"
+    df.to_csv(csv_path, index=False)
+    df.to_json(jsonl_path, orient="records", lines=True)
+
+    for path in (csv_path, jsonl_path):
+        build_row_index(path, stride=4)
+        for start, stop in ((0, 3), (5, 13), (22, 40), (30, 35)):
+            window = read_indexed_rows(path, start, stop)
+            expected = df.iloc[start:stop]
+            assert window["id"].tolist() == expected["id"].tolist()
+            assert window["text"].tolist() == expected["text"].tolist()
+            assert list(window.index) == list(expected.index)
+
+
+def test_get_row_index_rebuilds_on_change(tmp_path: Path):
+    path = tmp_path / "rows.csv"
+    _frame(5).to_csv(path, index=False)
+    first = get_row_index(path)
+
+    os.utime(path, ns=(first["mtime_ns"] + 10**9, first["mtime_ns"] + 10**9))
+    touched = get_row_index(path)
+    assert touched["checksum"] == first["checksum"]
+
+    _frame(8).to_csv(path, index=False)
+    changed = get_row_index(path)
+    assert changed["row_count"] == 8
+
+
+def test_blank_lines_are_not_rows(tmp_path: Path):
+    df = _frame(12)
+    csv_rows = [df.iloc[[i]].to_csv(index=False, header=False) for i in range(12)]
+    json_rows = [df.iloc[[i]].to_json(orient="records", lines=True) for i in range(12)]
+    # Blank lines after the header, in a run ("\r\n" too) and at the end
+    csv_path = tmp_path / "rows.csv"
+    csv_path.write_text(
+        "id,text\n\n" + "".join(csv_rows[:5] + ["\n", "\r\n"] + csv_rows[5:]) + "\n"
+    )
+    jsonl_path = tmp_path / "rows.jsonl"
+    jsonl_path.write_text(
+        "".join(json_rows[:1] + ["\n"] + json_rows[1:5] + ["\n\n"] + json_rows[5:])
+    )
+
+    for path in (csv_path, jsonl_path):
+        index = build_row_index(path, stride=4)
+        assert index["row_count"] == 12
+        for start, stop in ((0, 3), (3, 9), (8, 12)):
+            window = read_indexed_rows(path, start, stop)
+            assert window["id"].tolist() == list(range(start, stop))
+            assert window["text"].tolist() == df["text"].iloc[start:stop].tolist()
@@ -0,0 +1,111 @@
+"""Tests for out-of-core hash joins."""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from data_manager.join import HashJoin
+
+
+def _sides(seed: int = 0):
+    rng = np.random.default_rng(seed)
+    left = pd.DataFrame(
+        {
+            "id": rng.integers(0, 400, 3_000),
+            "qty": rng.integers(1, 10, 3_000),
+            "note": rng.choice(["a", "b", "c"], 3_000),
+        }
+    )
+    right = pd.DataFrame(
+        {"id": np.arange(100, 600), "note": [f"r{i}" for i in range(500)], "price": 1.5}
+    )
+    return left, right
+
+
+def _chunks(df: pd.DataFrame, size: int):
+    for start in range(0, len(df), size):
+        yield pa.Table.from_pandas(df.iloc[start : start + size], preserve_index=False)
+
+
+def _run(left, right, how, build_side="right", **kwargs):
+    joiner = HashJoin(["id"], how, **kwargs)
+    tables = []
+    joiner.run(_chunks(left, 250), _chunks(right, 70), tables.append, build_side=build_side)
+    return joiner, pa.concat_tables(tables, promote_options="permissive").to_pandas()
+
+
+def _canonical(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.astype({"id": "float64", "qty": "float64"})
+    return df.sort_values(list(df.columns), ignore_index=True)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+@pytest.mark.parametrize("build_side", ["left", "right"])
+def test_join_matches_pandas_merge(how, build_side):
+    left, right = _sides()
+
+    joiner, result = _run(left, right, how, build_side)
+
+    assert joiner.strategy == "in_memory"
+    expected = left.merge(right, on="id", how=how)
+    assert list(result.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(_canonical(result), _canonical(expected))
+
+
+@pytest.mark.parametrize("how", ["inner", "outer"])
+def test_partitioned_join_matches_in_memory(how, tmp_path):
+    left, right = _sides(1)
+
+    joiner, result = _run(left, right, how, memory_budget=1_000, spill_dir=tmp_path)
+
+    assert joiner.strategy == "partitioned"
+    assert joiner.spilled_bytes > 0
+    assert list(tmp_path.iterdir()) == []
+    expected = left.merge(right, on="id", how=how)
+    pd.testing.assert_frame_equal(_canonical(result), _canonical(expected))
+
+
+def test_int_and_float_keys_match():
+    left = pd.DataFrame({"id": [1, 2, 3], "a": [10, 20, 30]})
+    right = pd.DataFrame({"id": [2.0, 3.0, 4.0], "b": ["x", "y", "z"]})
+
+    _, result = _run(left, right, "inner")
+
+    assert sorted(result["b"]) == ["x", "y"]
+
+
+def test_unknown_join_type_rejected():
+    with pytest.raises(ValueError):
+        HashJoin(["id"], "cross")
+
+
+@pytest.mark.parametrize("memory_budget", [None, 1])
+def test_int_and_string_keys_match_in_both_strategies(memory_budget, tmp_path):
+    left = pd.DataFrame({"id": list(range(200)), "a": range(200)})
+    right = pd.DataFrame({"id": [str(i) for i in range(100, 300)], "b": range(200)})
+
+    joiner, result = _run(left, right, "inner", memory_budget=memory_budget, spill_dir=tmp_path)
+
+    assert joiner.strategy == ("partitioned" if memory_budget else "in_memory")
+    assert sorted(result["id"].astype(int)) == list(range(100, 200))
+
+
+def test_multi_key_join_matches_pandas_merge():
+    rng = np.random.default_rng(2)
+    left = pd.DataFrame({"k1": rng.integers(0, 20, 2_000), "k2": rng.choice(list("abcd"), 2_000)})
+    left["v"] = np.arange(len(left))
+    right = pd.DataFrame({"k1": rng.integers(0, 25, 300), "k2": rng.choice(list("abce"), 300)})
+    right["w"] = np.arange(len(right))
+    joiner = HashJoin(["k1", "k2"], "outer")
+    tables = []
+    joiner.run(_chunks(left, 128), _chunks(right, 64), tables.append)
+    result = pa.concat_tables(tables).to_pandas()
+
+    expected = left.merge(right, on=["k1", "k2"], how="outer")
+    columns = ["k1", "k2", "v", "w"]
+    pd.testing.assert_frame_equal(
+        result[columns].sort_values(columns, ignore_index=True),
+        expected[columns].sort_values(columns, ignore_index=True),
+        check_dtype=False,
+    )
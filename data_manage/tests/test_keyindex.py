@@ -0,0 +1,75 @@
+"""Tests for key index sidecars and point lookups."""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from data_manager.keyindex import (
+    build_key_index,
+    candidate_row_groups,
+    get_key_index,
+    key_index_path_for,
+    load_key_index,
+    lookup_rows,
+)
+
+
+def _customers(tmp_path, rows=10_000, row_group_size=1_000, shuffle=False):
+    ids = np.arange(rows) * 3
+    if shuffle:
+        ids = np.random.default_rng(0).permutation(ids)
+    df = pd.DataFrame({"customer_id": ids, "name": [f"c{i}" for i in ids]})
+    path = tmp_path / "customers.parquet"
+    df.to_parquet(path, index=False, row_group_size=row_group_size)
+    return path, df
+
+
+def test_lookup_reads_only_matching_row_groups(tmp_path):
+    path, _ = _customers(tmp_path)
+    index = build_key_index(path, "customer_id")
+
+    result = lookup_rows(path, [30, 29_997, 31], index)
+
+    assert sorted(result["customer_id"]) == [30, 29_997]
+    assert result.set_index("customer_id").loc[30, "name"] == "c30"
+    assert result.attrs["row_groups_read"] == 2
+    assert result.attrs["row_groups_total"] == 10
+
+
+def test_bloom_filter_prunes_overlapping_ranges(tmp_path):
+    path, df = _customers(tmp_path, shuffle=True)
+    index = build_key_index(path, "customer_id")
+    present = pa.array(df["customer_id"].iloc[:20].to_numpy())
+    absent = pa.array(np.arange(1, 60, 3))
+
+    # Every row group spans nearly the whole key range, so only blooms prune.
+    assert len(candidate_row_groups(index, absent).get(path.name, [])) <= 2
+    hits = lookup_rows(path, present.to_pylist(), index)
+    assert sorted(hits["customer_id"]) == sorted(present.to_pylist())
+
+
+def test_index_goes_stale_when_file_changes(tmp_path):
+    path, _ = _customers(tmp_path, rows=100)
+    build_key_index(path, "customer_id")
+    assert load_key_index(path) is not None
+
+    pd.DataFrame({"customer_id": [1], "name": ["x"]}).to_parquet(path, index=False)
+
+    assert load_key_index(path) is None
+    index = get_key_index(path)
+    assert lookup_rows(path, [1], index)["name"].tolist() == ["x"]
+
+
+def test_dataset_directory_index(tmp_path):
+    directory = tmp_path / "ds"
+    directory.mkdir()
+    for part in range(3):
+        ids = np.arange(part * 100, (part + 1) * 100)
+        pd.DataFrame({"k": ids, "v": ids * 2}).to_parquet(directory / f"p{part}.parquet")
+
+    index = get_key_index(directory, "k")
+
+    assert key_index_path_for(directory).name.startswith("_")
+    result = lookup_rows(directory, [150, 250.0], index, columns=["v"])
+    assert sorted(result["v"]) == [300, 500]
+    assert result.attrs["row_groups_read"] == 2
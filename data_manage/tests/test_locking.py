@@ -0,0 +1,202 @@
+"""Tests for cross-process reader-writer file locks."""
+
+import contextvars
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from data_manager import DataManager, LockError, LockTimeoutError
+from data_manager.locking import EXCLUSIVE, SHARED, LockManager
+
+HOLD_LOCK = """
+import sys, time
+from pathlib import Path
+from data_manager.locking import LockManager
+with LockManager(Path(sys.argv[1])).acquire(Path(sys.argv[2]), sys.argv[3]):
+    print("locked", flush=True)
+    time.sleep(float(sys.argv[4]))
+"""
+
+
+def _hold_in_subprocess(lock_dir, path, mode, seconds):
+    process = subprocess.Popen(
+        [sys.executable, "-c", HOLD_LOCK, str(lock_dir), str(path), mode, str(seconds)],
+        stdout=subprocess.PIPE,
+        text=True,
+        cwd=Path(__file__).resolve().parents[1],
+    )
+    assert process.stdout.readline().strip() == "locked"
+    return process
+
+
+def test_readers_share_and_writers_exclude_across_processes(tmp_path):
+    locks = LockManager(tmp_path / ".locks", timeout=0.2)
+    path = tmp_path / "t.csv"
+    path.write_text("a\n1\n")
+
+    reader = _hold_in_subprocess(tmp_path / ".locks", path, SHARED, 5)
+    try:
+        with locks.acquire(path, SHARED) as waited:
+            assert waited < 0.2
+        with pytest.raises(LockTimeoutError):
+            with locks.acquire(path, EXCLUSIVE):
+                pass
+    finally:
+        reader.kill()
+        reader.wait()
+
+    with locks.acquire(path, EXCLUSIVE):
+        pass
+    stats = locks.snapshot()
+    assert stats[SHARED]["acquired"] == 1
+    assert stats[EXCLUSIVE]["acquired"] == 1
+    assert stats[EXCLUSIVE]["timeouts"] == 1
+    assert stats[EXCLUSIVE]["max_wait_seconds"] >= 0.2
+
+
+def test_waiting_writer_holds_back_new_readers(tmp_path):
+    locks = LockManager(tmp_path / ".locks")
+    path = tmp_path / "t.csv"
+    errors = []
+
+    def write():
+        with locks.acquire(path, EXCLUSIVE):
+            pass
+
+    def read():
+        try:
+            with locks.acquire(path, SHARED, timeout=0.1):
+                pass
+        except LockTimeoutError as e:
+            errors.append(e)
+
+    with locks.acquire(path, SHARED):
+        writer = threading.Thread(target=write)
+        writer.start()
+        time.sleep(0.1)
+        reader = threading.Thread(target=read)
+        reader.start()
+        reader.join()
+    writer.join()
+
+    assert len(errors) == 1
+    assert locks.snapshot()[EXCLUSIVE]["acquired"] == 1
+
+
+def test_immutable_files_are_read_without_locking(tmp_path):
+    path = tmp_path / "frozen.csv"
+    pd.DataFrame({"a": [1, 2]}).to_csv(path, index=False)
+    path.chmod(0o444)
+    dm = DataManager(tmp_path, lock_timeout=0.1)
+
+    writer = _hold_in_subprocess(dm.locks.lock_dir, path, EXCLUSIVE, 5)
+    try:
+        assert dm.load("frozen.csv")["a"].tolist() == [1, 2]
+    finally:
+        writer.kill()
+        writer.wait()
+    assert dm.lock_stats()["lock_free_reads"] == 1
+
+
+def test_load_waits_for_save_and_reports_wait(tmp_path):
+    dm = DataManager(tmp_path, lock_timeout=5)
+    dm.save(pd.DataFrame({"a": [1]}), "t.csv")
+    path = (tmp_path / "t.csv").resolve()
+
+    writer = _hold_in_subprocess(dm.locks.lock_dir, path, EXCLUSIVE, 0.3)
+    df = dm.load("t.csv")
+    writer.wait()
+
+    assert df.attrs["lock_wait_seconds"] > 0.1
+    assert dm.lock_stats()[SHARED]["max_wait_seconds"] > 0.1
+    assert all(".locks" not in p.parts for p in dm.list_files("**/*"))
+
+
+def test_locked_iteration_can_move_between_threads(tmp_path):
+    # Like Starlette's iterate_in_threadpool: every step runs in a worker
+    # thread under a copy of the caller's context.
+    dm = DataManager(tmp_path, lock_timeout=0.1)
+    dm.save(pd.DataFrame({"a": range(6)}), "t.csv")
+    path = (tmp_path / "t.csv").resolve()
+    chunks = dm.iter_chunks("t.csv", chunksize=2)
+
+    def in_worker(pool, function, *args):
+        return pool.submit(contextvars.copy_context().run, function, *args).result()
+
+    def write():
+        with dm.locks.acquire(path, EXCLUSIVE):
+            pass
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        assert in_worker(pool, next, chunks)["a"].tolist() == [0, 1]
+        # The same worker thread serves an unrelated write, which waits for
+        # the reader rather than being mistaken for a nested upgrade.
+        with pytest.raises(LockTimeoutError):
+            in_worker(pool, write)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        assert in_worker(pool, next, chunks)["a"].tolist() == [2, 3]
+        in_worker(pool, chunks.close)
+
+    write()  # released by the thread that closed the iteration
+    assert dm.lock_stats()[EXCLUSIVE]["timeouts"] == 1
+
+
+def test_upgrade_in_same_context_is_rejected(tmp_path):
+    locks = LockManager(tmp_path / ".locks")
+    path = tmp_path / "t.csv"
+
+    with locks.acquire(path, SHARED):
+        with locks.acquire(path, SHARED):
+            pass
+        with pytest.raises(RuntimeError, match="Cannot upgrade"):
+            with locks.acquire(path, EXCLUSIVE):
+                pass
+    with locks.acquire(path, EXCLUSIVE):
+        with locks.acquire(path, SHARED):
+            pass
+
+
+def test_unusable_lock_dir_reads_unlocked_and_rejects_writes(tmp_path):
+    DataManager(tmp_path).save(pd.DataFrame({"a": [1, 2]}), "t.csv")
+    (tmp_path / "not-a-dir").write_text("")
+    dm = DataManager(tmp_path, lock_dir=tmp_path / "not-a-dir" / "locks")
+
+    assert dm.load("t.csv")["a"].tolist() == [1, 2]
+    assert dm.lock_stats()["unlocked_reads"] == 1
+    with pytest.raises(LockError):
+        dm.save(pd.DataFrame({"a": [3]}), "t.csv")
+
+
+def test_lock_files_are_removed_once_released(tmp_path):
+    dm = DataManager(tmp_path, lock_dir=tmp_path / "locks")
+    dm.save(pd.DataFrame({"a": [1]}), "t.csv")
+    dm.load("t.csv")
+    with dm.locks.acquire((tmp_path / "t.csv").resolve(), SHARED):
+        assert len(list((tmp_path / "locks").iterdir())) == 1
+
+    assert list((tmp_path / "locks").iterdir()) == []
+    assert not (tmp_path / ".locks").exists()
+
+
+def test_writer_waiting_on_removed_lock_file_retakes_it(tmp_path):
+    locks = LockManager(tmp_path / ".locks", timeout=5)
+    path = tmp_path / "t.csv"
+    reader = _hold_in_subprocess(locks.lock_dir, path, SHARED, 0.3)
+
+    with locks.acquire(path, EXCLUSIVE) as waited:
+        assert waited > 0.1
+        assert locks.lock_path(path).exists()
+
+        def read():
+            with LockManager(locks.lock_dir, timeout=0.1).acquire(path, SHARED):
+                pass
+
+        with pytest.raises(LockTimeoutError):
+            contextvars.Context().run(read)
+    reader.wait()
@@ -3,7 +3,15 @@
 import pandas as pd
 import pytest
 
-from data_manager import DataManager, FileNotFoundError, UnsupportedFormatError
+from data_manager import (
+    ContractViolationError,
+    DataManager,
+    FileNotFoundError,
+    MemoryBudgetError,
+    SchemaContract,
+    UnsupportedFormatError,
+)
+from data_manager.metadata import load_sidecar_metadata
 
 HAS_PARQUET = False
 try:
@@ -96,3 +104,311 @@ def test_get_info_parquet(dm, sample_df, tmp_path):
     info = dm.get_info("test.parquet")
     assert info["row_count"] == 3
     assert "size_mb" in info
+
+
+def test_iter_chunks_csv(dm, tmp_path):
+    pd.DataFrame({"id": range(10), "v": range(10)}).to_csv(tmp_path / "big.csv", index=False)
+
+    chunks = list(dm.iter_chunks("big.csv", chunksize=4, columns=["id"]))
+
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    assert list(chunks[0].columns) == ["id"]
+    assert chunks[2].attrs["chunk_index"] == 2
+
+
+def test_iter_chunks_pickle_falls_back_to_slicing(dm, sample_df, tmp_path):
+    sample_df.to_pickle(tmp_path / "test.pkl")
+
+    chunks = list(dm.iter_chunks("test.pkl", chunksize=2))
+
+    assert [len(c) for c in chunks] == [2, 1]
+
+
+def test_load_excel_all_sheets(dm, sample_df, tmp_path):
+    with pd.ExcelWriter(tmp_path / "book.xlsx") as writer:
+        sample_df.to_excel(writer, sheet_name="one", index=False)
+        sample_df.head(2).to_excel(writer, sheet_name="two", index=False)
+
+    sheets = dm.load("book.xlsx", sheet_name=None)
+
+    assert list(sheets) == ["one", "two"]
+    assert sheets["two"].attrs["row_count"] == 2
+    assert sheets["one"].attrs["sheet_name"] == "one"
+
+
+def test_save_jsonl_roundtrip_with_metadata(dm, sample_df, tmp_path):
+    dm.save(sample_df, "out.jsonl", compression="gzip")
+
+    assert (tmp_path / "out.jsonl.meta.json").exists()
+    df = dm.load("out.jsonl")
+    assert df["name"].tolist() == ["Alice", "Bob", "Charlie"]
+    assert sum(len(c) for c in dm.iter_chunks("out.jsonl", chunksize=2)) == 3
+
+
+@pytest.mark.skipif(not HAS_PARQUET, reason="Parquet engine not installed")
+def test_read_rows_parquet_and_csv(dm, tmp_path):
+    df = pd.DataFrame({"id": range(50)})
+    df.to_parquet(tmp_path / "rows.parquet", row_group_size=8)
+    df.to_csv(tmp_path / "rows.csv", index=False)
+
+    for name in ("rows.parquet", "rows.csv"):
+        window = dm.read_rows(name, 10, 20)
+        assert window["id"].tolist() == list(range(10, 20))
+        assert window.attrs["row_start"] == 10
+
+    assert (tmp_path / "rows.csv.idx.json").exists()
+
+
+def test_read_rows_streamed_fallback(dm, sample_df, tmp_path):
+    sample_df.to_json(tmp_path / "rows.json", orient="records")
+
+    window = dm.read_rows("rows.json", 1, 5)
+
+    assert window["name"].tolist() == ["Bob", "Charlie"]
+
+
+def test_sample_records_method(dm, tmp_path):
+    pd.DataFrame({"id": range(30)}).to_csv(tmp_path / "rows.csv", index=False)
+    pd.DataFrame({"id": range(30)}).to_json(tmp_path / "rows.json", orient="records")
+
+    first = dm.sample("rows.csv", 5, seed=7)
+    again = dm.sample("rows.csv", 5, seed=7)
+    streamed = dm.sample("rows.json", 5, seed=7)
+
+    assert first["id"].tolist() == again["id"].tolist()
+    assert first.attrs["sampling_method"] == "byte_offset"
+    assert streamed.attrs["sampling_method"] == "reservoir"
+    assert len(streamed) == 5
+
+
+def test_aggregate_csv(dm, tmp_path):
+    df = pd.DataFrame({"mandi": ["a", "b", "a", "c", "a"], "price": [1.0, 2.0, 3.0, 4.0, 5.0]})
+    df.to_csv(tmp_path / "prices.csv", index=False)
+
+    result = dm.aggregate(
+        "prices.csv", by="mandi", aggs={"price": ["sum", "approx_distinct"]}, chunksize=2
+    )
+
+    assert result["mandi"].tolist() == ["a", "b", "c"]
+    assert result["price_sum"].tolist() == [9.0, 2.0, 4.0]
+    assert result["price_approx_distinct"].tolist() == [3, 1, 1]
+
+
+@pytest.mark.parametrize("aggs", [None, {}, {"price": []}])
+def test_aggregate_requires_aggregations(dm, tmp_path, aggs):
+    pd.DataFrame({"mandi": ["a"], "price": [1.0]}).to_parquet(tmp_path / "p.parquet")
+
+    with pytest.raises(ValueError, match="aggregation"):
+        dm.aggregate("p.parquet", by="mandi", aggs=aggs)
+
+
+def test_join_writes_output_incrementally(dm, tmp_path):
+    sales = pd.DataFrame({"customer_id": [1, 2, 2, 3, 9], "quantity": [1, 2, 3, 4, 5]})
+    customers = pd.DataFrame({"customer_id": [1, 2, 3], "name": ["ann", "bo", "cy"]})
+    sales.to_csv(tmp_path / "sales.csv", index=False)
+    customers.to_parquet(tmp_path / "customers.parquet", index=False)
+
+    dm.join(
+        "sales.csv",
+        "customers.parquet",
+        on="customer_id",
+        how="left",
+        output="processed/merged.parquet",
+        chunksize=2,
+    )
+    merged = dm.load("processed/merged.parquet").sort_values("quantity", ignore_index=True)
+
+    assert merged.columns.tolist() == ["customer_id", "quantity", "name"]
+    assert merged["name"].tolist()[:4] == ["ann", "bo", "bo", "cy"]
+    assert pd.isna(merged["name"].iloc[4])
+
+
+def test_join_returns_frame(dm, tmp_path):
+    pd.DataFrame({"k": [1, 2], "a": [1, 2]}).to_csv(tmp_path / "l.csv", index=False)
+    pd.DataFrame({"k": [2, 3], "a": [5, 6]}).to_csv(tmp_path / "r.csv", index=False)
+
+    result = dm.join("l.csv", "r.csv", on="k", how="outer", memory_budget=1)
+
+    assert result.attrs["join_strategy"] == "partitioned"
+    assert sorted(result["k"].tolist()) == [1, 2, 3]
+    assert result.columns.tolist() == ["k", "a_x", "a_y"]
+
+
+def test_optimize_parquet_file_in_place(dm, tmp_path):
+    df = pd.DataFrame({"k": [3, 1, 2] * 100, "v": range(300)})
+    df.to_parquet(tmp_path / "t.parquet", index=False, row_group_size=10)
+
+    report = dm.optimize("t.parquet", sort_by="k")
+
+    assert report["files_after"] == 1
+    result = dm.load("t.parquet")
+    assert result["k"].is_monotonic_increasing
+    assert sorted(result["v"]) == list(range(300))
+
+
+def test_optimize_rejects_non_parquet(dm, sample_df, tmp_path):
+    sample_df.to_csv(tmp_path / "t.csv", index=False)
+
+    with pytest.raises(UnsupportedFormatError):
+        dm.optimize("t.csv")
+
+
+def test_save_with_key_and_lookup(dm, tmp_path):
+    df = pd.DataFrame({"customer_id": range(1_000), "name": [f"c{i}" for i in range(1_000)]})
+    dm.save(df, "customers.parquet", key="customer_id", row_group_size=100)
+
+    result = dm.lookup("customers.parquet", 512)
+
+    assert result["name"].tolist() == ["c512"]
+    assert result.attrs["row_groups_read"] == 1
+
+    dm.save(df.assign(name="renamed"), "customers.parquet", row_group_size=100)
+    assert dm.lookup("customers.parquet", [512])["name"].tolist() == ["renamed"]
+
+
+def test_lookup_without_index_requires_key(dm, tmp_path):
+    pd.DataFrame({"k": [1, 2]}).to_parquet(tmp_path / "t.parquet", index=False)
+
+    with pytest.raises(ValueError):
+        dm.lookup("t.parquet", [1])
+    assert dm.lookup("t.parquet", [2], key="k")["k"].tolist() == [2]
+
+
+def test_upsert_creates_then_merges(dm, tmp_path):
+    dm.upsert(pd.DataFrame({"id": [1, 2], "v": [10, 20]}), "t.parquet", key="id")
+
+    report = dm.upsert(pd.DataFrame({"id": [2, 3], "v": [21, 30]}), "t.parquet", key="id")
+
+    assert report["updated"] == 1 and report["inserted"] == 1
+    assert dm.lookup("t.parquet", [2, 3])["v"].tolist() == [21, 30]
+
+
+def test_diff_across_formats(dm, tmp_path):
+    old = pd.DataFrame({"id": [1, 2, 3], "v": [1, 2, 3]})
+    old.to_csv(tmp_path / "old.csv", index=False)
+    old.assign(v=[1, 20, 3]).iloc[1:].to_parquet(tmp_path / "new.parquet", index=False)
+
+    summary = dm.diff("old.csv", "new.parquet", key="id")
+    delta = dm.diff("old.csv", "new.parquet", key="id", output="delta")
+
+    assert (summary["removed"], summary["changed"]) == (1, 1)
+    assert delta.attrs["diff_summary"]["changed_by_column"] == {"v": 1}
+    assert sorted(delta["_change"]) == ["changed", "removed"]
+
+
+def test_versioned_saves_and_time_travel(tmp_path):
+    dm = DataManager(base_path=tmp_path, versioning=True)
+    dm.save(pd.DataFrame({"id": [1, 2], "v": [1, 2]}), "t.parquet")
+    first = dm.versions("t.parquet")[0]["created"]
+    dm.save(pd.DataFrame({"id": [1, 2, 3], "v": [1, 2, 3]}), "t.parquet")
+
+    assert [v["version"] for v in dm.versions("t.parquet")] == [1, 2]
+    assert dm.load("t.parquet")["id"].tolist() == [1, 2, 3]
+    old = dm.load("t.parquet", version=1)
+    assert old["id"].tolist() == [1, 2] and old.attrs["version"] == 1
+    assert dm.load("t.parquet", as_of=first).attrs["version"] == 1
+    assert all(".versions" not in path.parts for path in dm.list_files("**/*"))
+    with pytest.raises(ValueError):
+        dm.load("t.parquet", version=3)
+
+
+def test_versioning_keeps_unversioned_content_and_csv(dm, sample_df, tmp_path):
+    sample_df.to_csv(tmp_path / "t.csv", index=False)
+    versioned = DataManager(base_path=tmp_path, versioning=True)
+
+    versioned.save(sample_df.iloc[:1], "t.csv")
+
+    assert len(versioned.load("t.csv", version=1)) == 3
+    assert len(versioned.load("t.csv", version=2)) == 1
+    assert dm.versions("t.csv")[1]["rows"] is None
+
+
+def test_load_over_memory_budget_fails_fast_or_truncates(tmp_path):
+    df = pd.DataFrame({"id": range(20_000), "name": [f"n{i}" for i in range(20_000)]})
+    df.to_csv(tmp_path / "big.csv", index=False)
+    dm = DataManager(base_path=tmp_path, max_memory=100_000)
+
+    with pytest.raises(MemoryBudgetError):
+        dm.load("big.csv")
+
+    head = dm.load("big.csv", on_exceed="head")
+    assert 0 < len(head) < len(df) and head.attrs["truncated"]
+    assert head.attrs["memory_bytes"] <= 100_000
+    assert head.attrs["row_count_estimate"] == pytest.approx(len(df), rel=0.1)
+
+    full = dm.load("big.csv", max_memory=10**9)
+    assert len(full) == len(df) and not full.attrs["truncated"]
+    assert full.attrs["memory_peak_bytes"] >= full.attrs["memory_bytes"] > 0
+
+
+def test_load_head_keeps_index_col(tmp_path):
+    df = pd.DataFrame({"id": range(1_000, 21_000), "name": [f"n{i}" for i in range(20_000)]})
+    df.to_csv(tmp_path / "big.csv", index=False)
+    dm = DataManager(base_path=tmp_path, max_memory=100_000)
+
+    head = dm.load("big.csv", on_exceed="head", index_col="id")
+
+    assert head.attrs["truncated"]
+    assert head.index.name == "id"
+    assert head.index[0] == 1_000 and list(head.columns) == ["name"]
+
+
+def test_budgeted_load_of_ragged_csv(tmp_path):
+    lines = ["id,name"] + [f"{i},n{i}" for i in range(100)]
+    lines[10] += ",extra"
+    (tmp_path / "ragged.csv").write_text("\n".join(lines) + "\n")
+    dm = DataManager(base_path=tmp_path, max_memory=10**9)
+
+    df = dm.load("ragged.csv")
+
+    assert len(df) == 99 and not df.attrs["truncated"]
+
+
+def test_iter_chunks_sized_by_memory_budget(tmp_path):
+    pd.DataFrame({"id": range(10_000)}).to_parquet(tmp_path / "t.parquet", index=False)
+    dm = DataManager(base_path=tmp_path, max_memory=40_000)
+
+    chunks = list(dm.iter_chunks("t.parquet"))
+
+    assert max(len(chunk) for chunk in chunks) <= 1_250
+    assert sum(len(chunk) for chunk in chunks) == 10_000
+
+
+def test_save_many_writes_every_format_once(dm, sample_df, tmp_path):
+    sample_df.attrs["source"] = "unit"
+    names = ["pub/x.parquet", "pub/x.feather", "pub/x.csv", "pub/x.xlsx"]
+    checksums = dm.save_many(sample_df, names, writer_kwargs={".csv": {"sep": ";"}})
+
+    assert list(checksums) == names
+    for name in names:
+        loaded = dm.load(name, **({"sep": ";"} if name.endswith(".csv") else {}))
+        assert loaded.attrs["checksum"] == checksums[name]
+        pd.testing.assert_frame_equal(loaded, sample_df, check_dtype=False)
+    sidecar = load_sidecar_metadata(tmp_path / "pub" / "x.csv")
+    assert sidecar == {"source": "unit", "checksum": checksums["pub/x.csv"]}
+
+    with pytest.raises(ValueError):
+        dm.save_many(sample_df, ["a.csv", "./a.csv"])
+
+
+def test_contracts_checked_on_load_and_save(dm, tmp_path):
+    dm.set_contract(
+        "sales/*.parquet",
+        {"columns": {"id": {"nullable": False, "min": 1, "unique": True}}},
+    )
+    dm.save(pd.DataFrame({"id": [1, 2, 3]}), "sales/a.parquet")
+    loaded = dm.load("sales/a.parquet")
+    report = loaded.attrs["contract_report"]
+    assert report["valid"]
+    assert report["proven_by_statistics"] == ["id.min", "id.nullable"]
+
+    df = pd.DataFrame({"id": [1, 1]})
+    dm.save(df, "sales/b.parquet")
+    assert df.attrs["contract_report"]["violations"][0]["rule"] == "unique"
+
+    dm.set_contract("sales/*.parquet", SchemaContract({"id": {"unique": True}}, enforce=True))
+    with pytest.raises(ContractViolationError):
+        dm.load("sales/b.parquet")
+    with pytest.raises(ContractViolationError):
+        dm.save(df, "sales/c.parquet")
+    assert not (tmp_path / "sales" / "c.parquet").exists()
@@ -0,0 +1,86 @@
+"""Tests for load memory estimates."""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_manager.memory import (
+    PeakMemory,
+    current_rss_bytes,
+    estimate_load_bytes,
+    read_head_within,
+)
+
+
+@pytest.fixture
+def frame():
+    rows = 50_000
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "value": np.random.default_rng(0).random(rows),
+            "name": [f"name-{i}" for i in range(rows)],
+        }
+    )
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".feather", ".csv"])
+def test_estimates_track_loaded_size(tmp_path, frame, suffix, monkeypatch):
+    monkeypatch.setattr("data_manager.config.MEMORY_SNIFF_BYTES", 64 * 1024)
+    path = tmp_path / f"t{suffix}"
+    if suffix == ".csv":
+        frame.to_csv(path, index=False)
+    else:
+        getattr(frame, f"to_{suffix[1:]}")(path)
+
+    estimate, rows = estimate_load_bytes(path)
+
+    actual = frame.memory_usage(deep=True, index=False).sum()
+    assert 0.5 * actual < estimate < 3 * actual
+    assert abs(rows - len(frame)) < len(frame) * 0.1
+
+
+def test_projection_narrows_parquet_estimate(tmp_path, frame):
+    path = tmp_path / "t.parquet"
+    frame.to_parquet(path, index=False)
+
+    narrow, _ = estimate_load_bytes(path, columns=["id"])
+
+    assert narrow == len(frame) * 8
+    assert narrow < estimate_load_bytes(path)[0] / 2
+
+
+def test_csv_estimate_skips_malformed_rows(tmp_path):
+    path = tmp_path / "ragged.csv"
+    lines = ["id,name"] + [f"{i},n{i}" for i in range(1_000)]
+    lines[10] += ",extra"
+    path.write_text("\n".join(lines) + "\n")
+
+    estimate, rows = estimate_load_bytes(path)
+
+    assert estimate > 0
+    assert rows == pytest.approx(1_000, rel=0.1)
+
+
+def test_peak_memory_sees_transient_allocations():
+    if current_rss_bytes() is None:
+        pytest.skip("resident memory is not readable on this platform")
+    with PeakMemory() as peak:
+        block = np.ones(64 * 1024 * 1024 // 8)
+        time.sleep(0.1)
+        del block
+
+    assert peak.growth >= 32 * 1024 * 1024
+
+
+def test_read_head_within_cuts_at_budget(frame):
+    chunks = (frame.iloc[i : i + 1_000] for i in range(0, len(frame), 1_000))
+    per_chunk = frame.iloc[:1_000].memory_usage(deep=True).sum()
+
+    head, truncated = read_head_within(chunks, int(per_chunk * 2.5))
+
+    assert truncated
+    assert 2_000 <= len(head) < 3_000
+    assert head["id"].tolist() == list(range(len(head)))
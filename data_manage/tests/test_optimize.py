@@ -0,0 +1,91 @@
+"""Tests for Parquet optimisation and compaction."""
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from data_manager.optimize import optimize_parquet
+
+
+def _write_small_files(directory, count, rows=50, seed=0):
+    directory.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    frames = []
+    for i in range(count):
+        df = pd.DataFrame(
+            {
+                "ts": rng.integers(0, 10_000, rows),
+                "region": rng.choice(["north", "south"], rows),
+                "value": rng.normal(size=rows),
+            }
+        )
+        if i >= count // 2:
+            df["extra"] = i
+        df.to_parquet(directory / f"append-{i:03d}.parquet", index=False)
+        frames.append(df)
+    return pd.concat(frames, ignore_index=True)
+
+
+def _canonical(df):
+    return df.sort_values(["ts", "value"], ignore_index=True)[["ts", "region", "value", "extra"]]
+
+
+def test_compacts_small_files_into_one(tmp_path):
+    expected = _write_small_files(tmp_path / "events", 20)
+
+    report = optimize_parquet(tmp_path / "events", row_group_size=300)
+
+    files = list((tmp_path / "events").glob("*.parquet"))
+    assert report["files_before"] == 20
+    assert report["files_after"] == len(files) == 1
+    assert report["rows"] == len(expected)
+    metadata = pq.read_metadata(files[0])
+    assert metadata.num_row_groups == report["row_groups"] == 4
+    assert metadata.row_group(0).column(0).statistics.has_min_max
+    result = pd.read_parquet(files[0])
+    pd.testing.assert_frame_equal(
+        _canonical(result), _canonical(expected), check_dtype=False, check_like=True
+    )
+
+
+def test_sort_by_clusters_row_groups(tmp_path, monkeypatch):
+    monkeypatch.setattr("data_manager.config.PARQUET_SORT_MEMORY_BYTES", 4_000)
+    monkeypatch.setattr("data_manager.config.PARQUET_SORT_SAMPLE_ROWS", 100)
+    expected = _write_small_files(tmp_path / "events", 10)
+
+    optimize_parquet(
+        tmp_path / "events", sort_by=["ts"], row_group_size=100, target_file_bytes=3_000
+    )
+
+    files = sorted((tmp_path / "events").glob("*.parquet"))
+    assert len(files) > 1
+    result = pd.concat([pd.read_parquet(path) for path in files], ignore_index=True)
+    assert result["ts"].is_monotonic_increasing
+    assert len(result) == len(expected)
+
+    stats = [
+        (group.column(0).statistics.min, group.column(0).statistics.max)
+        for metadata in (pq.read_metadata(path) for path in files)
+        for group in (metadata.row_group(i) for i in range(metadata.num_row_groups))
+    ]
+    assert all(prev[1] <= cur[0] for prev, cur in zip(stats, stats[1:]))
+    assert pq.read_metadata(files[0]).row_group(0).sorting_columns
+
+
+def test_hive_partitions_compacted_separately(tmp_path):
+    _write_small_files(tmp_path / "ds" / "year=2023", 5, seed=1)
+    _write_small_files(tmp_path / "ds" / "year=2024", 5, seed=2)
+
+    report = optimize_parquet(tmp_path / "ds")
+
+    assert report["files_after"] == 2
+    assert len(list((tmp_path / "ds" / "year=2023").glob("*.parquet"))) == 1
+    assert not [p for p in (tmp_path / "ds").rglob("*") if p.name.startswith(".")]
+
+
+def test_unknown_sort_column_rejected(tmp_path):
+    _write_small_files(tmp_path / "events", 2)
+
+    with pytest.raises(ValueError):
+        optimize_parquet(tmp_path / "events", sort_by=["missing"])
@@ -0,0 +1,136 @@
+"""Tests for progress callbacks and cancellation."""
+
+import pandas as pd
+import pytest
+
+from data_manager import CancellationToken, DataManager, OperationCancelledError
+from data_manager.metadata import calculate_checksum
+from data_manager.progress import ProgressTracker
+
+
+@pytest.fixture(autouse=True)
+def report_every_update(monkeypatch):
+    monkeypatch.setattr("data_manager.config.PROGRESS_INTERVAL_SECONDS", 0)
+
+
+def _frame(rows=10_000):
+    return pd.DataFrame({"id": range(rows), "name": [f"n{i}" for i in range(rows)]})
+
+
+def test_tracker_extrapolates_bytes_from_rows():
+    calls = []
+    tracker = ProgressTracker(
+        "op", bytes_total=1000, progress=lambda *a: calls.append(a), rows_total=100
+    )
+    list(tracker.track([[0] * 25, [0] * 25]))
+
+    assert calls == [(250, 1000, 25), (500, 1000, 50), (1000, 1000, 50)]
+
+
+def test_tracker_stops_once_cancelled():
+    token = CancellationToken()
+    tracker = ProgressTracker("Reading t.csv", cancel=token)
+    chunks = tracker.track(iter([[1], [2], [3]]))
+    next(chunks)
+    token.cancel("enough")
+
+    with pytest.raises(OperationCancelledError, match="Reading t.csv cancelled: enough"):
+        next(chunks)
+
+
+def test_load_reports_progress_to_completion(tmp_path):
+    dm = DataManager(tmp_path)
+    dm.save(_frame(), "t.csv")
+    calls = []
+
+    df = dm.load("t.csv", progress=lambda *a: calls.append(a))
+
+    assert len(df) == 10_000
+    size = (tmp_path / "t.csv").stat().st_size
+    assert calls[-1] == (size, size, 10_000)
+    assert [c[0] for c in calls] == sorted(c[0] for c in calls)
+
+
+def _ragged(rows):
+    lines = ["id,name"] + [f"{i},n{i}" for i in range(rows)]
+    lines[250] += ",extra"
+    return "\n".join(lines) + "\n"
+
+
+def _mixed(rows):
+    codes = [str(i) if i < 250 else f"c{i}" for i in range(rows)]
+    amounts = ["" if i == 300 else str(i) for i in range(rows)]
+    lines = ["id,code,amount"] + [f"{i},{c},{a}" for i, c, a in zip(range(rows), codes, amounts)]
+    return "\n".join(lines) + "\n"
+
+
+@pytest.mark.parametrize(
+    "name, write, kwargs",
+    [
+        ("t.csv", lambda path: _frame(500).to_csv(path, index=False), {"index_col": "id"}),
+        ("t.csv", lambda path: path.write_text(_ragged(500)), {}),
+        ("t.csv", lambda path: path.write_text(_mixed(500)), {}),
+        ("t.xlsx", lambda path: _frame(500).to_excel(path, index=False), {}),
+    ],
+)
+def test_load_with_progress_matches_plain_load(tmp_path, monkeypatch, name, write, kwargs):
+    monkeypatch.setattr("data_manager.config.DEFAULT_CHUNK_SIZE", 100)
+    write(tmp_path / name)
+    dm = DataManager(tmp_path)
+    calls = []
+
+    tracked = dm.load(name, progress=lambda *a: calls.append(a), **kwargs)
+
+    pd.testing.assert_frame_equal(tracked, dm.load(name, **kwargs))
+    assert calls
+
+
+def test_cancel_during_iter_chunks(tmp_path):
+    dm = DataManager(tmp_path)
+    dm.save(_frame(), "t.parquet", row_group_size=1000)
+    token = CancellationToken()
+    seen = 0
+
+    with pytest.raises(OperationCancelledError):
+        for chunk in dm.iter_chunks("t.parquet", chunksize=1000, cancel=token):
+            seen += len(chunk)
+            token.cancel()
+    assert seen == 1000
+
+
+@pytest.mark.parametrize("name, kwargs", [("t.csv", {}), ("t.parquet", {"row_group_size": 100})])
+def test_cancelled_save_keeps_previous_file(tmp_path, name, kwargs):
+    dm = DataManager(tmp_path)
+    dm.save(_frame(10), name)
+    before = (tmp_path / name).read_bytes()
+    token = CancellationToken()
+
+    def cancel_after_first_chunk(bytes_done, bytes_total, rows):
+        token.cancel()
+
+    with pytest.raises(OperationCancelledError):
+        dm.save(_frame(), name, progress=cancel_after_first_chunk, cancel=token, **kwargs)
+
+    assert (tmp_path / name).read_bytes() == before
+    assert [p.name for p in tmp_path.glob("*t.*") if not p.name.endswith(".json")] == [name]
+
+
+def test_tracked_save_matches_plain_save(tmp_path):
+    dm = DataManager(tmp_path)
+    calls = []
+    dm.save(_frame(), "t.parquet", progress=lambda *a: calls.append(a))
+
+    pd.testing.assert_frame_equal(dm.load("t.parquet"), _frame(), check_dtype=False)
+    assert calls[-1][2] == 10_000
+    assert calls[-1][1] is None
+
+
+def test_checksum_progress(tmp_path):
+    path = tmp_path / "blob.bin"
+    path.write_bytes(b"x" * 50_000)
+    calls = []
+
+    calculate_checksum(path, chunk_size=10_000, progress=lambda *a: calls.append(a))
+
+    assert [c[0] for c in calls[:5]] == [10_000, 20_000, 30_000, 40_000, 50_000]
+    assert calls[-1] == (50_000, 50_000, 0)
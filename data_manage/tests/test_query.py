@@ -0,0 +1,100 @@
+"""Tests for lazy query plans."""
+
+import pandas as pd
+import pytest
+
+from data_manager import DataManager, col
+
+
+@pytest.fixture
+def dm(tmp_path):
+    return DataManager(base_path=tmp_path)
+
+
+@pytest.fixture
+def events():
+    return pd.DataFrame(
+        {
+            "region": ["n", "s", "n", "e", "s", "n", "e", "s"],
+            "amount": [10.0, 20.0, 30.0, None, 50.0, 60.0, 70.0, 80.0],
+            "qty": [1, 2, 3, 4, 5, 6, 7, 8],
+        }
+    )
+
+
+@pytest.mark.parametrize("filename", ["events.parquet", "events.csv", "events.json"])
+def test_filter_select_matches_pandas(dm, events, filename):
+    dm.save(events, filename)
+
+    result = (
+        dm.scan(filename)
+        .filter((col("qty") > 2) & (col("region") != "e"))
+        .select("region", "amount")
+        .chunksize(3)
+        .collect()
+    )
+
+    expected = events[(events["qty"] > 2) & (events["region"] != "e")][["region", "amount"]]
+    assert result["region"].tolist() == expected["region"].tolist()
+    assert result["amount"].tolist() == expected["amount"].tolist()
+
+
+@pytest.mark.parametrize("filename", ["events.parquet", "events.csv"])
+def test_groupby_agg_matches_pandas(dm, events, filename):
+    dm.save(events, filename)
+
+    result = (
+        dm.scan(filename)
+        .filter(col("region").isin(["n", "s", "e"]))
+        .groupby("region")
+        .agg({"amount": ["sum", "mean", "count"], "qty": ["min", "max"]})
+        .chunksize(3)
+        .collect()
+    )
+
+    expected = events.groupby("region").agg(
+        amount_sum=("amount", "sum"),
+        amount_mean=("amount", "mean"),
+        amount_count=("amount", "count"),
+        qty_min=("qty", "min"),
+        qty_max=("qty", "max"),
+    )
+    result = result.set_index("region")
+    for column in expected.columns:
+        assert result[column].tolist() == pytest.approx(expected[column].tolist(), nan_ok=True)
+
+
+def test_global_agg_and_limit(dm, events):
+    dm.save(events, "events.parquet")
+
+    total = dm.scan("events.parquet").agg({"qty": "sum"}).collect()
+    first = dm.scan("events.parquet").filter(col("qty") * 2 >= 6).limit(2).collect()
+
+    assert total["qty_sum"].tolist() == [36]
+    assert first["qty"].tolist() == [3, 4]
+
+
+def test_empty_result_keeps_columns(dm, events):
+    dm.save(events, "events.csv")
+
+    result = dm.scan("events.csv").filter(col("qty") > 100).select("qty").collect()
+
+    assert list(result.columns) == ["qty"]
+    assert result.empty
+
+
+def test_unsupported_aggregation(dm, events):
+    dm.save(events, "events.csv")
+
+    with pytest.raises(ValueError):
+        dm.scan("events.csv").agg({"qty": "median"})
+
+
+def test_groupby_without_agg_is_rejected(dm, events):
+    dm.save(events, "events.parquet")
+    plan = dm.scan("events.parquet").groupby("region")
+
+    with pytest.raises(ValueError, match="groupby\\(\\) must be followed by agg\\(\\)"):
+        plan.collect()
+    with pytest.raises(ValueError, match="agg"):
+        list(plan.iter_batches())
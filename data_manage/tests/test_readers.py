@@ -5,7 +5,16 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from data_manager.readers import read_csv, read_json, read_parquet
+from data_manager.exceptions import DataLoadError
+from data_manager.readers import (
+    iter_excel,
+    iter_json,
+    iter_json_array_records,
+    read_csv,
+    read_excel,
+    read_json,
+    read_parquet,
+)
 
 HAS_PARQUET = False
 try:
@@ -58,3 +67,196 @@ def test_read_csv_fallback_skips_bad_lines(tmp_path: Path):
     df = read_csv(path)
     assert len(df) == 3
     assert list(df["id"]) == [1, 2, 4]
+
+
+def test_iter_json_array_records_small_blocks(tmp_path: Path):
+    path = tmp_path / "records.json"
+    path.write_text(
+        '[ {"a": 1, "s": "x,]y"}, {"a": 12345, "s": "\\"q\\""},\n 7, [1, 2] ]',
+        encoding="utf-8",
+    )
+
+    records = list(iter_json_array_records(path, block_size=3))
+
+    assert records == [{"a": 1, "s": "x,]y"}, {"a": 12345, "s": '"q"'}, 7, [1, 2]]
+
+
+def test_iter_json_array_records_rejects_truncated(tmp_path: Path):
+    path = tmp_path / "broken.json"
+    path.write_text('[{"a": 1}, {"a": 2}', encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        list(iter_json_array_records(path, block_size=4))
+
+
+def test_read_json_stream_matches_pandas(tmp_path: Path):
+    path = tmp_path / "sample.json"
+    path.write_text(
+        '[{"a": 1, "b": "x", "c": 0.5}, {"a": 2, "b": "y"}, {"a": 3, "b": null, "c": 3.5}]',
+        encoding="utf-8",
+    )
+
+    pd.testing.assert_frame_equal(read_json(path, stream=True), pd.read_json(path))
+
+
+def test_read_json_streams_only_on_request(tmp_path: Path):
+    path = tmp_path / "dates.json"
+    path.write_text('[{"id": 1, "created_at": "2024-01-02"}]', encoding="utf-8")
+
+    assert str(read_json(path)["created_at"].dtype).startswith("datetime64")
+    assert read_json(path, stream=True)["created_at"].tolist() == ["2024-01-02"]
+
+
+def test_iter_json_array_records_bounds_lookahead(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr("data_manager.config.JSON_STREAM_MAX_RECORD_CHARS", 16)
+    path = tmp_path / "broken.json"
+    path.write_text('[{"a": 1 ' + " " * 1_000 + "}]", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        next(iter_json_array_records(path, block_size=4))
+
+
+def test_read_json_stream_malformed_raises(tmp_path: Path):
+    path = tmp_path / "broken.json"
+    path.write_text('[{"a": 1} {"a": 2}]', encoding="utf-8")
+
+    with pytest.raises(DataLoadError):
+        read_json(path, stream=True)
+
+
+def test_iter_json_chunks_array_and_ndjson(tmp_path: Path):
+    df = pd.DataFrame({"a": range(5), "b": list("vwxyz")})
+    array_path = tmp_path / "rows.json"
+    lines_path = tmp_path / "rows.jsonl"
+    df.to_json(array_path, orient="records")
+    df.to_json(lines_path, orient="records", lines=True)
+
+    for path in (array_path, lines_path):
+        chunks = list(iter_json(path, chunksize=2))
+        assert [len(c) for c in chunks] == [2, 2, 1]
+        assert pd.concat(chunks, ignore_index=True)["a"].tolist() == list(range(5))
+
+
+def _write_ragged_workbook(path: Path) -> None:
+    from openpyxl import Workbook
+
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "first"
+    for row in (["a", None, "a", "d"], [1, 2, 3], [], [None, "x", 4.5, None, 9], []):
+        sheet.append(row)
+    second = workbook.create_sheet("second")
+    for row in (["k", "v"], [1, "one"], [2, "two"]):
+        second.append(row)
+    workbook.save(path)
+
+
+def test_read_excel_stream_matches_pandas(tmp_path: Path):
+    path = tmp_path / "ragged.xlsx"
+    _write_ragged_workbook(path)
+
+    streamed = read_excel(path, stream=True)
+    expected = pd.read_excel(path)
+
+    pd.testing.assert_frame_equal(read_excel(path), expected)
+    pd.testing.assert_frame_equal(streamed, expected)
+    # Blank cells in mixed columns are NaN, not None
+    assert streamed["Unnamed: 1"].tolist()[1] is not None
+
+
+def test_read_excel_multiple_sheets_parallel(tmp_path: Path):
+    path = tmp_path / "book.xlsx"
+    _write_ragged_workbook(path)
+
+    sheets = read_excel(path, sheet_name=None, parallel=True)
+
+    assert list(sheets) == ["first", "second"]
+    assert sheets["second"]["v"].tolist() == ["one", "two"]
+    assert read_excel(path, sheet_name=["second"])["second"].shape == (2, 2)
+
+
+def test_iter_excel_chunks(tmp_path: Path):
+    path = tmp_path / "rows.xlsx"
+    pd.DataFrame({"a": range(5), "b": list("vwxyz")}).to_excel(path, index=False)
+
+    chunks = list(iter_excel(path, chunksize=2))
+
+    assert [len(c) for c in chunks] == [2, 2, 1]
+    assert list(chunks[-1].columns) == ["a", "b"]
+    assert chunks[-1]["b"].tolist() == ["z"]
+
+
+def _small_ranges(monkeypatch):
+    monkeypatch.setattr("data_manager.config.CSV_MIN_RANGE_BYTES", 256)
+    monkeypatch.setattr("data_manager.config.CSV_SCAN_BLOCK_SIZE", 16)
+    monkeypatch.setattr("data_manager.config.CSV_MAX_WORKERS", 3)
+
+
+def test_read_csv_parallel_matches_single_pass(tmp_path: Path, monkeypatch):
+    _small_ranges(monkeypatch)
+    path = tmp_path / "big.csv"
+    df = pd.DataFrame(
+        {
+            "id": range(300),
+            "text": [f'line {i}\nwith "quotes", commas' for i in range(300)],
+            "code": [str(i) for i in range(299)] + ["x9"],
+        }
+    )
+    df.to_csv(path, index=False)
+
+    result = read_csv(path, parallel=True)
+
+    pd.testing.assert_frame_equal(result, pd.read_csv(path, low_memory=False))
+    assert result["code"].iloc[0] == "0"
+    assert not (tmp_path / "big.csv.idx.json").exists()
+
+
+def test_read_csv_parallel_unifies_numeric_and_bool_dtypes(tmp_path: Path, monkeypatch):
+    _small_ranges(monkeypatch)
+    path = tmp_path / "big.csv"
+    df = pd.DataFrame(
+        {
+            "count": list(range(299)) + [None],
+            "flag": [i % 2 == 0 for i in range(299)] + [None],
+            "ratio": [0.5] * 300,
+        }
+    )
+    df.to_csv(path, index=False)
+
+    result = read_csv(path, parallel=True)
+
+    pd.testing.assert_frame_equal(result, pd.read_csv(path, low_memory=False))
+    assert result["count"].dtype == "float64"
+    assert result["flag"].dtype == object
+
+
+def test_read_csv_parallel_skipped_for_nrows(tmp_path: Path, monkeypatch):
+    _small_ranges(monkeypatch)
+    path = tmp_path / "big.csv"
+    pd.DataFrame({"a": range(300)}).to_csv(path, index=False)
+
+    assert len(read_csv(path, parallel=True, nrows=5)) == 5
+    assert not (tmp_path / "big.csv.idx.json").exists()
+
+
+def test_json_array_stream_rejects_pandas_options(tmp_path: Path):
+    path = tmp_path / "rows.json"
+    path.write_text('[{"id": 1, "created_at": "2024-01-02"}]', encoding="utf-8")
+
+    assert len(read_json(path, stream=True, orient="records")) == 1
+    with pytest.raises(ValueError, match="convert_dates"):
+        read_json(path, stream=True, convert_dates=["created_at"])
+    with pytest.raises(ValueError, match="dtype"):
+        list(iter_json(path, dtype={"id": "float64"}))
+
+
+@pytest.mark.parametrize("name", ["rows.json", "rows.jsonl"])
+def test_iter_json_rejects_columns_no_row_has(tmp_path: Path, name: str):
+    path = tmp_path / name
+    rows = ['{"a": 1}', '{"a": 2}', '{"a": 3, "b": 4}']
+    path.write_text("\n".join(rows) if name.endswith("l") else f"[{', '.join(rows)}]")
+
+    chunks = list(iter_json(path, chunksize=2, columns=["a", "b"]))
+    assert pd.concat(chunks, ignore_index=True)["b"].isna().tolist() == [True, True, False]
+    with pytest.raises(ValueError, match="Columns not found"):
+        list(iter_json(path, chunksize=2, columns=["a", "c"]))
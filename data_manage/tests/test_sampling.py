@@ -0,0 +1,104 @@
+"""Tests for row sampling."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_manager.sampling import reservoir_sample, sample_feather, sample_indexed, sample_parquet
+
+HAS_PARQUET = False
+try:
+    import pyarrow  # noqa: F401
+
+    HAS_PARQUET = True
+except Exception:
+    HAS_PARQUET = False
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({"id": range(rows), "sq": [i * i for i in range(rows)]})
+
+
+@pytest.mark.skipif(not HAS_PARQUET, reason="Parquet engine not installed")
+def test_sample_parquet_reads_rows_across_groups(tmp_path: Path):
+    path = tmp_path / "rows.parquet"
+    _frame(100).to_parquet(path, row_group_size=7)
+
+    df = sample_parquet(path, 15, np.random.default_rng(1))
+
+    assert len(df) == 15
+    assert df["id"].is_unique and df["id"].is_monotonic_increasing
+    assert (df["sq"] == df["id"] ** 2).all()
+    assert list(df.index) == df["id"].tolist()
+
+
+def test_sample_indexed_csv(tmp_path: Path):
+    path = tmp_path / "rows.csv"
+    _frame(60).to_csv(path, index=False)
+
+    df = sample_indexed(path, 10, np.random.default_rng(2))
+
+    assert len(df) == 10
+    assert list(df.index) == df["id"].tolist()
+    assert (df["sq"] == df["id"] ** 2).all()
+
+
+@pytest.mark.skipif(not HAS_PARQUET, reason="Feather engine not installed")
+@pytest.mark.parametrize("compression", ["lz4", "uncompressed"])
+def test_sample_feather_reads_rows_across_batches(tmp_path: Path, compression):
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    path = tmp_path / "rows.feather"
+    table = pa.Table.from_pandas(_frame(100), preserve_index=False)
+    feather.write_feather(table, path, compression=compression, chunksize=7)
+
+    df = sample_feather(path, 15, np.random.default_rng(1), columns=["sq", "id"])
+
+    assert list(df.columns) == ["sq", "id"]
+    assert len(df) == 15
+    assert df["id"].is_unique and df["id"].is_monotonic_increasing
+    assert (df["sq"] == df["id"] ** 2).all()
+    assert list(df.index) == df["id"].tolist()
+    assert sample_feather(path, 0, np.random.default_rng(1)).columns.tolist() == ["id", "sq"]
+
+
+def test_sample_indexed_reads_csv_header_once(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr("data_manager.config.ROW_INDEX_STRIDE", 5)
+    path = tmp_path / "rows.csv"
+    _frame(60).to_csv(path, index=False)
+    read_csv = pd.read_csv
+    header_reads = []
+
+    def counting_read_csv(source, *args, **kwargs):
+        if kwargs.get("nrows") == 0:
+            header_reads.append(source)
+        return read_csv(source, *args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_csv", counting_read_csv)
+    df = sample_indexed(path, 30, np.random.default_rng(2))
+
+    assert len(df) == 30
+    assert len(header_reads) == 1
+
+
+def test_reservoir_sample_is_roughly_uniform():
+    frame = _frame(40)
+    counts = np.zeros(40)
+    rng = np.random.default_rng(3)
+    for _ in range(400):
+        chunks = (frame.iloc[i : i + 9] for i in range(0, 40, 9))
+        counts[reservoir_sample(chunks, 10, rng)["id"].to_numpy()] += 1
+
+    # Each row is expected 100 times; a biased reservoir drifts far from that.
+    assert counts.min() > 60 and counts.max() < 140
+
+
+def test_reservoir_sample_returns_everything_when_small():
+    chunks = [_frame(3)]
+
+    df = reservoir_sample(chunks, 10, np.random.default_rng(0))
+
+    assert df["id"].tolist() == [0, 1, 2]
@@ -0,0 +1,89 @@
+"""Tests for the search index over paths, column names and cell values."""
+
+import json
+
+import pandas as pd
+import pytest
+
+from data_manager import DataManager, SearchIndex
+from data_manager.cli import main
+from data_manager.search import tokenize
+
+
+def _tree(tmp_path):
+    dm = DataManager(tmp_path)
+    dm.save(
+        pd.DataFrame({"mandi_code": [1, 2], "name": ["Azadpur", "Vashi"]}),
+        "markets/mandis.parquet",
+    )
+    dm.save(
+        pd.DataFrame({"speaker": ["a", "b"], "text": ["Onion prices rose", "Rain was late"]}),
+        "transcripts/day1.csv",
+    )
+    dm.save(pd.DataFrame({"code": [1], "mandi": ["x"]}), "other.feather")
+    return dm
+
+
+def test_tokenize_splits_underscored_words():
+    assert tokenize("Mandi_Code 2024") == {"mandi_code", "mandi", "code", "2024"}
+
+
+def test_search_finds_columns_and_paths(tmp_path):
+    dm = _tree(tmp_path)
+
+    results = dm.search("mandi_code", fields=["column"])
+    assert [r["path"] for r in results] == ["markets/mandis.parquet"]
+    assert results[0]["matches"] == [{"field": "column", "column": "mandi_code"}]
+
+    # "mandi code" also matches the file holding both words in separate columns
+    assert [r["path"] for r in dm.search("mandi code")] == [
+        "markets/mandis.parquet",
+        "other.feather",
+    ]
+    assert [r["path"] for r in dm.search("transcripts")] == ["transcripts/day1.csv"]
+    assert dm.search("onion") == []
+    with pytest.raises(ValueError, match="Unknown search fields"):
+        dm.search("x", fields=["cells"])
+
+
+def test_value_index_is_updated_incrementally(tmp_path):
+    dm = _tree(tmp_path)
+    dm.search_index = SearchIndex(dm, values=True)
+    assert dm.search_index.update() == {"indexed": 3, "unchanged": 0, "removed": 0, "failed": 0}
+
+    results = dm.search("onion prices", refresh=False)
+    assert results[0]["path"] == "transcripts/day1.csv"
+    assert results[0]["matches"] == [{"field": "value", "column": "text"}]
+
+    dm.save(pd.DataFrame({"text": ["Garlic only"]}), "transcripts/day1.csv")
+    (tmp_path / "other.feather").unlink()
+    assert dm.search_index.update() == {"indexed": 1, "unchanged": 1, "removed": 1, "failed": 0}
+    assert dm.search("onion") == []
+    assert [r["path"] for r in dm.search("garlic")] == ["transcripts/day1.csv"]
+
+    # Another process reading the same index sees the update
+    other = DataManager(tmp_path)
+    assert [r["path"] for r in other.search("garlic", refresh=False)] == ["transcripts/day1.csv"]
+    assert all(not p.is_relative_to(tmp_path / ".search") for p in other.list_files("**/*"))
+
+
+def test_cli_search(tmp_path, capsys):
+    _tree(tmp_path)
+
+    assert main(["-b", str(tmp_path), "search", "rain", "--values"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["path"] for line in lines] == ["transcripts/day1.csv"]
+
+
+def test_unchanged_update_writes_nothing_and_results_page(tmp_path):
+    dm = _tree(tmp_path)
+    dm.search_index.update()
+    index_files = [dm.search_index.manifest_path, dm.search_index.postings_path]
+    before = [path.stat().st_mtime_ns for path in index_files]
+
+    assert dm.search_index.update()["unchanged"] == 3
+    assert [path.stat().st_mtime_ns for path in index_files] == before
+
+    ranked = [r["path"] for r in dm.search("mandi", refresh=False)]
+    assert len(ranked) == 2
+    assert [r["path"] for r in dm.search("mandi", limit=1, offset=1)] == ranked[1:]
@@ -0,0 +1,129 @@
+"""Tests for the cross-process shared-memory frame cache."""
+
+import gc
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+from data_manager import DataManager, SharedCache
+
+LOAD_IN_CHILD = """
+import sys
+from data_manager import DataManager, SharedCache
+dm = DataManager(sys.argv[1], shared_cache=SharedCache(sys.argv[2]))
+df = dm.load("t.csv")
+print(df.attrs["shared_cache"], len(df), df.attrs["checksum"])
+"""
+
+
+def _csv(tmp_path, name="t.csv", rows=100):
+    path = tmp_path / "data" / name
+    path.parent.mkdir(exist_ok=True)
+    pd.DataFrame({"id": range(rows), "name": [f"n{i}" for i in range(rows)]}).to_csv(
+        path, index=False
+    )
+    return path
+
+
+def test_other_process_maps_published_frame(tmp_path):
+    _csv(tmp_path)
+    cache = SharedCache(tmp_path / "shm")
+    dm = DataManager(tmp_path / "data", shared_cache=cache)
+
+    first = dm.load("t.csv")
+    assert first.attrs["shared_cache"] == "stored"
+
+    child = subprocess.run(
+        [sys.executable, "-c", LOAD_IN_CHILD, str(tmp_path / "data"), str(tmp_path / "shm")],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert child.stdout.split() == ["hit", "100", first.attrs["checksum"]]
+
+    second = dm.load("t.csv")
+    assert second.attrs["shared_cache"] == "hit"
+    pd.testing.assert_frame_equal(second, first, check_dtype=False)
+
+
+def test_changed_file_and_reader_options_miss(tmp_path):
+    path = _csv(tmp_path)
+    dm = DataManager(tmp_path / "data", shared_cache=SharedCache(tmp_path / "shm"))
+    dm.load("t.csv")
+
+    assert dm.load("t.csv", usecols=["id"]).attrs["shared_cache"] == "stored"
+    _csv(tmp_path, rows=5)
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1))
+    reloaded = dm.load("t.csv")
+    assert reloaded.attrs["shared_cache"] == "stored"
+    assert len(reloaded) == 5
+    # Entries of the old file content were dropped when the new one was stored.
+    assert len(list((tmp_path / "shm").glob("*.arrow"))) == 1
+
+
+def test_lru_eviction_skips_frames_in_use(tmp_path):
+    for name in ("a.csv", "b.csv", "c.csv"):
+        _csv(tmp_path, name, rows=1000)
+    probe = SharedCache(tmp_path / "probe")
+    dm = DataManager(tmp_path / "data", shared_cache=probe)
+    dm.load("a.csv")
+    entry_bytes = next((tmp_path / "probe").glob("*.arrow")).stat().st_size
+
+    cache = SharedCache(tmp_path / "shm", max_bytes=int(entry_bytes * 1.5))
+    dm = DataManager(tmp_path / "data", shared_cache=cache)
+    dm.load("a.csv")
+    held = dm.load("a.csv")  # maps the entry and pins it
+    assert held.attrs["shared_cache"] == "hit"
+    dm.load("b.csv")
+    # a.csv is least recently used but pinned, so b.csv could not be kept.
+    assert cache.stats["evicted"] == 1
+    assert dm.load("a.csv").attrs["shared_cache"] == "hit"
+
+    del held
+    gc.collect()
+    dm.load("c.csv")
+    assert dm.load("c.csv").attrs["shared_cache"] == "hit"
+    assert dm.load("a.csv").attrs["shared_cache"] == "stored"
+
+
+def test_entry_evicted_before_pinning_is_still_served(tmp_path, monkeypatch):
+    import data_manager.shared_cache as shared_cache
+
+    _csv(tmp_path)
+    cache = SharedCache(tmp_path / "shm")
+    dm = DataManager(tmp_path / "data", shared_cache=cache)
+    first = dm.load("t.csv")
+    try_lock = shared_cache._try_lock
+
+    def evict_then_lock(handle, mode, blocking=False):
+        if mode == shared_cache.SHARED:
+            cache.clear()  # another process evicts between open() and the shared lock
+        return try_lock(handle, mode, blocking)
+
+    monkeypatch.setattr(shared_cache, "_try_lock", evict_then_lock)
+    second = dm.load("t.csv")
+
+    assert second.attrs["shared_cache"] == "hit"
+    assert not list((tmp_path / "shm").glob("*.arrow"))
+    pd.testing.assert_frame_equal(second, first, check_dtype=False)
+
+
+def test_frames_from_cache_hits_are_writable(tmp_path):
+    _csv(tmp_path)
+    dm = DataManager(tmp_path / "data", shared_cache=SharedCache(tmp_path / "shm"))
+    dm.load("t.csv")
+
+    df = dm.load("t.csv")
+    assert df.attrs["shared_cache"] == "hit"
+    df.loc[0, "id"] = 100
+    df["name"] = df["name"].str.upper()
+    gc.collect()
+
+    assert df.loc[0, "id"] == 100 and df.loc[1, "name"] == "N1"
+    again = dm.load("t.csv")
+    assert again.attrs["shared_cache"] == "hit"
+    assert again.loc[0, "id"] == 0 and again.loc[1, "name"] == "n1"
@@ -0,0 +1,100 @@
+"""Tests for fsspec remote storage and its block cache."""
+
+import uuid
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_manager import DataManager
+from data_manager.storage import RemoteStorage
+
+
+@pytest.fixture(params=["memory", "file"])
+def url(request, tmp_path):
+    if request.param == "memory":
+        return f"memory://dm-{uuid.uuid4().hex[:8]}"
+    (tmp_path / "remote").mkdir()
+    return f"file://{tmp_path / 'remote'}"
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    monkeypatch.setattr("data_manager.config.STORAGE_BLOCK_SIZE", 4096)
+    monkeypatch.setattr("data_manager.config.STORAGE_MAX_RANGE_BYTES", 4 * 4096)
+
+
+def _count_requests(storage, monkeypatch):
+    requests = []
+    cat_file = storage.fs.cat_file
+
+    def counting(path, start=None, end=None, **kwargs):
+        requests.append((start, end))
+        return cat_file(path, start, end, **kwargs)
+
+    monkeypatch.setattr(storage.fs, "cat_file", counting)
+    return requests
+
+
+def test_block_cache_serves_repeat_reads_locally(url, tmp_path, small_blocks, monkeypatch):
+    storage = RemoteStorage(url, cache_dir=tmp_path / "cache")
+    payload = bytes(range(256)) * 200
+    storage.fs.pipe_file(storage.remote_path("blob.bin"), payload)
+    requests = _count_requests(storage, monkeypatch)
+
+    with storage.open("blob.bin") as f:
+        f.seek(10_000)
+        assert f.read(100) == payload[10_000:10_100]
+    assert requests == [(8192, 12288)]
+    assert storage.cached_path("blob.bin") is None
+
+    assert storage.fetch("blob.bin").read_bytes() == payload
+    fetched = len(requests)
+    again = RemoteStorage(url, cache_dir=tmp_path / "cache")
+    monkeypatch.setattr(again.fs, "cat_file", storage.fs.cat_file)
+    assert again.fetch("blob.bin").read_bytes() == payload
+    assert len(requests) == fetched
+
+
+def test_cache_entry_resets_when_remote_changes(url, tmp_path, small_blocks):
+    storage = RemoteStorage(url, cache_dir=tmp_path / "cache")
+    storage.fs.pipe_file(storage.remote_path("t.csv"), b"a\n1\n")
+    assert storage.fetch("t.csv").read_bytes() == b"a\n1\n"
+
+    storage.fs.pipe_file(storage.remote_path("t.csv"), b"a\n1\n2\n")
+
+    assert storage.fetch("t.csv").read_bytes() == b"a\n1\n2\n"
+
+
+def test_parquet_prefetch_fetches_only_selected_columns(url, tmp_path, small_blocks, monkeypatch):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({name: rng.random(20_000) for name in "abcdefgh"})
+    DataManager(url, cache_dir=tmp_path / "writer").save(df, "wide.parquet", compression=None)
+    dm = DataManager(url, cache_dir=tmp_path / "cache")
+    requests = _count_requests(dm.storage, monkeypatch)
+
+    result = dm.load("wide.parquet", columns=["c"])
+
+    pd.testing.assert_series_equal(result["c"], df["c"])
+    fetched = sum(end - start for start, end in requests)
+    assert fetched < dm.storage.info("wide.parquet")["size"] / 4
+    assert result.attrs["source_file"] == f"{url}/wide.parquet"
+
+
+def test_manager_round_trip_through_remote_storage(url, tmp_path):
+    dm = DataManager(url, cache_dir=tmp_path / "cache")
+    df = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+
+    dm.save(df, "sub/t.csv")
+    dm.save(df, "t.parquet")
+
+    assert sorted(dm.list_files("**/*.csv")) == [f"{url}/sub/t.csv"]
+    pd.testing.assert_frame_equal(dm.load("sub/t.csv"), df, check_dtype=False)
+    assert dm.get_info("t.parquet")["row_count"] == 3
+    assert sum(len(chunk) for chunk in dm.iter_chunks("t.parquet", chunksize=2)) == 3
+    assert dm.storage.exists("sub/t.csv.meta.json")
+
+    fresh = DataManager(url, cache_dir=tmp_path / "other-cache")
+    assert fresh.load("t.parquet")["name"].tolist() == ["a", "b", "c"]
+    with pytest.raises(ValueError):
+        fresh.upsert(df, "t.parquet", key="id")
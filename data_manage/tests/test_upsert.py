@@ -0,0 +1,72 @@
+"""Tests for key-based upserts."""
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from data_manager.keyindex import build_key_index, load_key_index
+from data_manager.upsert import upsert_parquet
+
+
+def _dataset(directory, files=4, rows=100):
+    directory.mkdir()
+    for part in range(files):
+        ids = np.arange(part * rows, (part + 1) * rows)
+        df = pd.DataFrame({"id": ids, "status": "old", "amount": ids * 1.0})
+        df.to_parquet(directory / f"p{part}.parquet", index=False)
+    return pd.concat(
+        [pd.read_parquet(directory / f"p{part}.parquet") for part in range(files)],
+        ignore_index=True,
+    )
+
+
+def test_upsert_rewrites_only_overlapping_files(tmp_path):
+    directory = tmp_path / "ds"
+    _dataset(directory)
+    build_key_index(directory, "id")
+    untouched = {p.name: p.stat().st_mtime_ns for p in directory.glob("p[023].parquet")}
+    changes = pd.DataFrame({"id": [150, 120, 1_000], "status": ["new", "new", "fresh"]})
+
+    report = upsert_parquet(directory, changes, "id")
+
+    assert report == {
+        "updated": 2,
+        "inserted": 1,
+        "files_rewritten": 1,
+        "row_groups_modified": 1,
+    }
+    assert {p.name: p.stat().st_mtime_ns for p in directory.glob("p[023].parquet")} == untouched
+    result = pd.concat(
+        [pd.read_parquet(path) for path in sorted(directory.glob("*.parquet"))],
+        ignore_index=True,
+    ).set_index("id")
+    assert len(result) == 401
+    assert result.loc[150, "status"] == "new"
+    assert result.loc[150, "amount"] == 150.0
+    assert result.loc[1_000, "status"] == "fresh"
+    assert pd.isna(result.loc[1_000, "amount"])
+    assert result.loc[151, "status"] == "old"
+    assert load_key_index(directory) is not None
+
+
+def test_upsert_single_file_keeps_row_groups(tmp_path):
+    path = tmp_path / "t.parquet"
+    pd.DataFrame({"id": range(100), "v": 0}).to_parquet(path, index=False, row_group_size=10)
+
+    report = upsert_parquet(path, pd.DataFrame({"id": [5, 5, 200], "v": [1, 2, 3]}), "id")
+
+    assert report["updated"] == 1 and report["inserted"] == 1
+    assert pq.read_metadata(path).num_row_groups == 11
+    result = pd.read_parquet(path).set_index("id")["v"]
+    assert result[5] == 2
+    assert result[200] == 3
+    assert result.sum() == 5
+
+
+def test_upsert_rejects_unknown_columns(tmp_path):
+    path = tmp_path / "t.parquet"
+    pd.DataFrame({"id": [1]}).to_parquet(path, index=False)
+
+    with pytest.raises(ValueError):
+        upsert_parquet(path, pd.DataFrame({"id": [1], "other": [2]}), "id")
@@ -0,0 +1,86 @@
+"""Tests for the dataset version store."""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from data_manager.versions import VersionStore, chunk_boundaries
+
+
+def _table(rows, start=0):
+    ids = np.arange(start, start + rows)
+    return pa.table({"id": ids, "name": [f"n{i}" for i in ids]})
+
+
+def _write(tmp_path, table):
+    path = tmp_path / "t.parquet"
+    pq.write_table(table, path)
+    return path
+
+
+def test_chunk_boundaries_resist_shifts():
+    hashes = np.random.default_rng(0).integers(0, 2**63, 10_000, dtype=np.uint64)
+
+    ends = chunk_boundaries(hashes, 64)
+    shifted = chunk_boundaries(hashes[7:], 64)
+
+    sizes = np.diff([0] + ends)
+    assert ends[-1] == len(hashes)
+    assert sizes[:-1].min() >= 16 and sizes.max() <= 256
+    # Past the first chunk, boundaries line up again despite the shift.
+    assert len(set(ends) & {end + 7 for end in shifted}) >= len(ends) - 2
+
+
+def test_edits_and_appends_share_unchanged_chunks(tmp_path, monkeypatch):
+    monkeypatch.setattr("data_manager.config.VERSION_CHUNK_ROWS", 256)
+    store = VersionStore(tmp_path / ".versions")
+    table = _table(20_000)
+    v1 = store.commit("t.parquet", _write(tmp_path, table))
+
+    edited = table.set_column(1, "name", pa.array(["x"] + table.column("name").to_pylist()[1:]))
+    v2 = store.commit("t.parquet", _write(tmp_path, edited))
+    v3 = store.commit(
+        "t.parquet", _write(tmp_path, pa.concat_tables([edited, _table(500, 20_000)]))
+    )
+
+    ids = [{obj["id"] for obj in v["objects"]} for v in (v1, v2, v3)]
+    assert len(ids[1] - ids[0]) == 1
+    # The append only rewrites the 500 new rows and the chunk they extend.
+    appended = [obj for obj in v3["objects"] if obj["id"] not in ids[1]]
+    assert sum(obj["rows"] for obj in appended) <= 500 + 4 * 256
+    assert v2["bytes_written"] < v1["bytes_written"] / 10
+
+    old = store.read(store.resolve("t.parquet", version=1), reader=None)
+    pd.testing.assert_frame_equal(old, table.to_pandas())
+    assert store.read(store.resolve("t.parquet"), reader=None)["name"].iloc[0] == "x"
+    assert [v["rows"] for v in store.list_versions("t.parquet")] == [20_000, 20_000, 20_500]
+
+
+def test_versioned_save_does_not_read_back_parquet(tmp_path, monkeypatch):
+    from data_manager import DataManager
+
+    dm = DataManager(tmp_path, versioning=True)
+
+    def read_table(*args, **kwargs):
+        raise AssertionError("saved Parquet file was read back")
+
+    monkeypatch.setattr(pq, "read_table", read_table)
+    df = pd.DataFrame({"id": range(100)})
+    dm.save(df, "t.parquet")
+    dm.save_many(df, ["u.parquet", "u.csv"])
+
+    assert [v["rows"] for v in dm.versions("t.parquet")] == [100]
+    assert [v["rows"] for v in dm.versions("u.parquet")] == [100]
+
+
+def test_large_int_edit_gets_its_own_chunk(tmp_path):
+    from data_manager import DataManager
+
+    dm = DataManager(tmp_path, versioning=True)
+    dm.save(pd.DataFrame({"id": [2**53]}), "t.parquet")
+    dm.save(pd.DataFrame({"id": [2**53 + 1]}), "t.parquet")
+
+    assert dm.versions("t.parquet")[1]["bytes_written"] > 0
+    assert dm.load("t.parquet", version=1)["id"].tolist() == [2**53]
+    assert dm.load("t.parquet", version=2)["id"].tolist() == [2**53 + 1]
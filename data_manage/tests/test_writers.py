@@ -1,11 +1,20 @@
 """Tests for format writers."""
 
+import json
+from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
-from data_manager.writers import write_csv, write_json, write_parquet
+from data_manager.writers import (
+    ChunkWriter,
+    write_csv,
+    write_excel,
+    write_json,
+    write_jsonl,
+    write_parquet,
+)
 
 HAS_PARQUET = False
 try:
@@ -38,3 +47,123 @@ def test_write_parquet(tmp_path: Path):
     path = tmp_path / "out.parquet"
     write_parquet(pd.DataFrame({"a": [1]}), path)
     assert path.exists()
+
+
+@pytest.mark.skipif(not HAS_PARQUET, reason="Parquet engine not installed")
+def test_write_parquet_with_loaded_attrs(tmp_path: Path):
+    path = tmp_path / "out.parquet"
+    df = pd.DataFrame({"a": [1]})
+    df.attrs["loaded_at"] = datetime(2024, 1, 2, 3, 4, 5)
+    write_parquet(df, path)
+    assert pd.read_parquet(path).attrs["loaded_at"] == "2024-01-02T03:04:05"
+    assert isinstance(df.attrs["loaded_at"], datetime)
+
+
+def test_write_excel_stream_roundtrip(tmp_path: Path):
+    path = tmp_path / "out.xlsx"
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, None],
+            "when": pd.to_datetime(["2026-01-01", None, "2026-01-03"]),
+            "s": ["x", None, "z"],
+        }
+    )
+
+    write_excel(df, path)
+    loaded = pd.read_excel(path)
+
+    assert list(loaded.columns) == ["a", "when", "s"]
+    assert loaded["a"].isna().tolist() == [False, False, True]
+    assert loaded["when"].iloc[2] == pd.Timestamp("2026-01-03")
+
+
+def test_write_excel_splits_sheets_at_row_limit(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr("data_manager.config.EXCEL_MAX_ROWS", 4)
+    path = tmp_path / "split.xlsx"
+
+    write_excel(pd.DataFrame({"a": range(7)}), path, sheet_name="data")
+    sheets = pd.read_excel(path, sheet_name=None)
+
+    assert list(sheets) == ["data", "data_2", "data_3"]
+    assert [len(s) for s in sheets.values()] == [3, 3, 1]
+    assert sheets["data_3"]["a"].tolist() == [6]
+
+
+def test_write_excel_multiple_named_sheets(tmp_path: Path):
+    path = tmp_path / "book.xlsx"
+
+    write_excel({"summary": pd.DataFrame({"n": [2]}), "detail": pd.DataFrame({"a": [1, 2]})}, path)
+    sheets = pd.read_excel(path, sheet_name=None)
+
+    assert list(sheets) == ["summary", "detail"]
+    assert sheets["detail"]["a"].tolist() == [1, 2]
+
+
+def test_write_jsonl_nulls_and_dates(tmp_path: Path):
+    path = tmp_path / "out.jsonl"
+    df = pd.DataFrame(
+        {
+            "a": [1.5, float("nan"), 3.0],
+            "when": pd.to_datetime(["2026-01-01 00:00:00", None, "2026-01-03 04:05:06"]),
+            "s": ["x", None, "ü"],
+        }
+    )
+
+    write_jsonl(df, path, chunksize=2)
+    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+    assert len(rows) == 3
+    assert rows[1] == {"a": None, "when": None, "s": None}
+    assert rows[2]["when"].startswith("2026-01-03T04:05:06")
+    assert rows[2]["s"] == "ü"
+
+
+def test_write_jsonl_append_gzip(tmp_path: Path):
+    path = tmp_path / "out.jsonl"
+
+    write_jsonl(pd.DataFrame({"a": [1, 2]}), path, compression="gzip")
+    write_jsonl(pd.DataFrame({"a": [3]}), path, compression="gzip", append=True)
+
+    assert path.read_bytes()[:2] == b"\x1f\x8b"
+    assert pd.read_json(path, lines=True, compression="gzip")["a"].tolist() == [1, 2, 3]
+
+
+@pytest.mark.skipif(not HAS_PARQUET, reason="parquet engine not installed")
+@pytest.mark.parametrize("suffix", [".csv", ".jsonl", ".parquet", ".json"])
+def test_chunk_writer_appends_chunks(tmp_path: Path, suffix: str):
+    path = tmp_path / f"out{suffix}"
+
+    with ChunkWriter(path) as writer:
+        writer.write(pd.DataFrame({"a": [1, 2], "b": ["x", "y"]}))
+        writer.write(pd.DataFrame({"a": [3], "b": ["z"]}))
+
+    assert writer.rows_written == 3
+    reader = {".csv": pd.read_csv, ".parquet": pd.read_parquet, ".json": pd.read_json}
+    df = pd.read_json(path, lines=True) if suffix == ".jsonl" else reader[suffix](path)
+    assert df["a"].tolist() == [1, 2, 3]
+    assert df["b"].tolist() == ["x", "y", "z"]
+
+
+@pytest.mark.skipif(not HAS_PARQUET, reason="parquet engine not installed")
+@pytest.mark.parametrize("suffix", [".parquet", ".feather"])
+def test_chunk_writer_types_columns_null_in_first_chunk(tmp_path: Path, suffix: str):
+    path = tmp_path / f"out{suffix}"
+
+    with ChunkWriter(path) as writer:
+        writer.write(pd.DataFrame({"a": [1], "b": [None]}))
+        writer.write(pd.DataFrame({"a": [2], "b": ["x"]}))
+
+    df = pd.read_parquet(path) if suffix == ".parquet" else pd.read_feather(path)
+    assert df["b"].isna().tolist() == [True, False]
+    assert df["b"].iloc[1] == "x"
+
+
+def test_chunk_writer_removes_partial_output_on_error(tmp_path: Path):
+    path = tmp_path / "out.csv"
+
+    with pytest.raises(RuntimeError):
+        with ChunkWriter(path) as writer:
+            writer.write(pd.DataFrame({"a": [1]}))
+            raise RuntimeError("boom")
+
+    assert not path.exists()